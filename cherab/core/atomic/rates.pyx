@@ -18,6 +18,129 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+cimport cython
+
+
+ctypedef double (*evaluate2_t)(object rate, double a, double b) except? -1e999
+ctypedef double (*evaluate3_t)(object rate, double a, double b, double c) except? -1e999
+ctypedef double (*evaluate5_t)(object rate, double a, double b, double c, double d, double e) except? -1e999
+
+
+cdef tuple _broadcast_arrays(tuple arrays):
+    """
+    Broadcasts the arrays against each other.
+
+    :param arrays: Array-like objects.
+    :return: The broadcast shape and a list of flattened contiguous float64 arrays.
+    """
+
+    arrays = tuple(np.broadcast_arrays(*[np.asarray(array, dtype=np.float64) for array in arrays]))
+    return arrays[0].shape, [np.ascontiguousarray(array).ravel() for array in arrays]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _evaluate_array2(evaluate2_t evaluate, object rate, object a, object b):
+    """
+    Calls the two-argument evaluate() for each element of the broadcast arrays.
+    """
+
+    cdef:
+        const double[::1] a_mv, b_mv
+        double[::1] result_mv
+        Py_ssize_t i
+
+    shape, (a_mv, b_mv) = _broadcast_arrays((a, b))
+    result = np.empty(a_mv.shape[0])
+    result_mv = result
+    for i in range(a_mv.shape[0]):
+        result_mv[i] = evaluate(rate, a_mv[i], b_mv[i])
+
+    return result.reshape(shape)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _evaluate_array3(evaluate3_t evaluate, object rate, object a, object b, object c):
+    """
+    Calls the three-argument evaluate() for each element of the broadcast arrays.
+    """
+
+    cdef:
+        const double[::1] a_mv, b_mv, c_mv
+        double[::1] result_mv
+        Py_ssize_t i
+
+    shape, (a_mv, b_mv, c_mv) = _broadcast_arrays((a, b, c))
+    result = np.empty(a_mv.shape[0])
+    result_mv = result
+    for i in range(a_mv.shape[0]):
+        result_mv[i] = evaluate(rate, a_mv[i], b_mv[i], c_mv[i])
+
+    return result.reshape(shape)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _evaluate_array5(evaluate5_t evaluate, object rate, object a, object b, object c, object d, object e):
+    """
+    Calls the five-argument evaluate() for each element of the broadcast arrays.
+    """
+
+    cdef:
+        const double[::1] a_mv, b_mv, c_mv, d_mv, e_mv
+        double[::1] result_mv
+        Py_ssize_t i
+
+    shape, (a_mv, b_mv, c_mv, d_mv, e_mv) = _broadcast_arrays((a, b, c, d, e))
+    result = np.empty(a_mv.shape[0])
+    result_mv = result
+    for i in range(a_mv.shape[0]):
+        result_mv[i] = evaluate(rate, a_mv[i], b_mv[i], c_mv[i], d_mv[i], e_mv[i])
+
+    return result.reshape(shape)
+
+
+# C-level dispatch to the evaluate() methods of the rate classes
+
+cdef double _ionisation_rate(object rate, double a, double b) except? -1e999:
+    return (<IonisationRate> rate).evaluate(a, b)
+
+
+cdef double _recombination_rate(object rate, double a, double b) except? -1e999:
+    return (<RecombinationRate> rate).evaluate(a, b)
+
+
+cdef double _thermal_cx_rate(object rate, double a, double b) except? -1e999:
+    return (<ThermalCXRate> rate).evaluate(a, b)
+
+
+cdef double _pec_rate(object rate, double a, double b) except? -1e999:
+    return (<_PECRate> rate).evaluate(a, b)
+
+
+cdef double _thermal_cx_pec(object rate, double a, double b, double c) except? -1e999:
+    return (<ThermalCXPEC> rate).evaluate(a, b, c)
+
+
+cdef double _beam_cx_pec(object rate, double a, double b, double c, double d, double e) except? -1e999:
+    return (<BeamCXPEC> rate).evaluate(a, b, c, d, e)
+
+
+cdef double _beam_rate(object rate, double a, double b, double c) except? -1e999:
+    return (<_BeamRate> rate).evaluate(a, b, c)
+
+
+cdef double _total_radiated_power(object rate, double a, double b) except? -1e999:
+    return (<TotalRadiatedPower> rate).evaluate(a, b)
+
+
+cdef double _radiated_power(object rate, double a, double b) except? -1e999:
+    return (<_RadiatedPower> rate).evaluate(a, b)
+
+
+cdef double _fractional_abundance(object rate, double a, double b) except? -1e999:
+    return (<FractionalAbundance> rate).evaluate(a, b)
 
 
 cdef class IonisationRate:
@@ -41,6 +164,19 @@ cdef class IonisationRate:
         """
         raise NotImplementedError("The evaluate() virtual method must be implemented.")
 
+    def evaluate_array(self, density, temperature):
+        """Returns effective ionisation rate coefficients for arrays of plasma conditions.
+
+        The arguments are broadcast against each other and evaluate() is called
+        for each element.
+
+        :param density: Array of electron densities in m^-3.
+        :param temperature: Array of electron temperatures in eV.
+        :return: Array of effective ionisation rates in m^3.s^-1.
+        """
+
+        return _evaluate_array2(_ionisation_rate, self, density, temperature)
+
 
 cdef class RecombinationRate:
     """
@@ -63,6 +199,19 @@ cdef class RecombinationRate:
         """
         raise NotImplementedError("The evaluate() virtual method must be implemented.")
 
+    def evaluate_array(self, density, temperature):
+        """Returns effective recombination rate coefficients for arrays of plasma conditions.
+
+        The arguments are broadcast against each other and evaluate() is called
+        for each element.
+
+        :param density: Array of electron densities in m^-3.
+        :param temperature: Array of electron temperatures in eV.
+        :return: Array of effective recombination rates in m^3.s^-1.
+        """
+
+        return _evaluate_array2(_recombination_rate, self, density, temperature)
+
 
 cdef class ThermalCXRate:
     """
@@ -85,6 +234,19 @@ cdef class ThermalCXRate:
         """
         raise NotImplementedError("The evaluate() virtual method must be implemented.")
 
+    def evaluate_array(self, density, temperature):
+        """Returns effective charge exchange rate coefficients for arrays of plasma conditions.
+
+        The arguments are broadcast against each other and evaluate() is called
+        for each element.
+
+        :param density: Array of electron densities in m^-3.
+        :param temperature: Array of electron temperatures in eV.
+        :return: Array of effective charge exchange rates in m^3.s^-1.
+        """
+
+        return _evaluate_array2(_thermal_cx_rate, self, density, temperature)
+
 
 cdef class _PECRate:
     """
@@ -107,6 +269,19 @@ cdef class _PECRate:
         """
         raise NotImplementedError("The evaluate() virtual method must be implemented.")
 
+    def evaluate_array(self, density, temperature):
+        """Returns photon emissivity coefficients for arrays of plasma conditions.
+
+        The arguments are broadcast against each other and evaluate() is called
+        for each element.
+
+        :param density: Array of electron densities in m^-3.
+        :param temperature: Array of electron temperatures in eV.
+        :return: Array of effective PEC rates in W.m^3.
+        """
+
+        return _evaluate_array2(_pec_rate, self, density, temperature)
+
     def plot_temperature(self, temp_low=1, temp_high=1000, num_points=100, dens=1E19):
 
         temp = [10**x for x in np.linspace(np.log10(temp_low), np.log10(temp_high), num=num_points)]
@@ -152,6 +327,20 @@ cdef class ThermalCXPEC:
         """
         raise NotImplementedError("The evaluate() virtual method must be implemented.")
 
+    def evaluate_array(self, electron_density, electron_temperature, donor_temperature):
+        """Returns CX photon emissivity coefficients for arrays of plasma conditions.
+
+        The arguments are broadcast against each other and evaluate() is called
+        for each element.
+
+        :param electron_density: Array of electron densities in m^-3.
+        :param electron_temperature: Array of electron temperatures in eV.
+        :param donor_temperature: Array of donor temperatures in eV.
+        :return: Array of effective CX PEC rates in W.m^3.
+        """
+
+        return _evaluate_array3(_thermal_cx_pec, self, electron_density, electron_temperature, donor_temperature)
+
 
 cdef class BeamCXPEC:
     r""":math:`q^{eff}_{n\rightarrow n'}` [:math:`W.m^{3}`]
@@ -186,6 +375,22 @@ cdef class BeamCXPEC:
         """
         raise NotImplementedError("The evaluate() virtual method must be implemented.")
 
+    def evaluate_array(self, energy, temperature, density, z_effective, b_field):
+        """Returns the Beam CX rates for arrays of plasma conditions.
+
+        The arguments are broadcast against each other and evaluate() is called
+        for each element.
+
+        :param energy: Array of interaction energies in eV/amu.
+        :param temperature: Array of receiver ion temperatures in eV.
+        :param density: Array of plasma total ion densities in m^-3.
+        :param z_effective: Array of plasma Z-effective values.
+        :param b_field: Array of magnetic field magnitudes in Tesla.
+        :return: Array of effective rates.
+        """
+
+        return _evaluate_array5(_beam_cx_pec, self, energy, temperature, density, z_effective, b_field)
+
 
 cdef class _BeamRate:
     """
@@ -203,6 +408,20 @@ cdef class _BeamRate:
         """
         raise NotImplementedError("The evaluate() virtual method must be implemented.")
 
+    def evaluate_array(self, energy, density, temperature):
+        """Returns the beam coefficients for arrays of parameters.
+
+        The arguments are broadcast against each other and evaluate() is called
+        for each element.
+
+        :param energy: Array of interaction energies in eV/amu.
+        :param density: Array of target electron densities in m^-3.
+        :param temperature: Array of target temperatures in eV.
+        :return: Array of beam coefficients.
+        """
+
+        return _evaluate_array3(_beam_rate, self, energy, density, temperature)
+
     def __call__(self, double energy, double density, double temperature):
         return self.evaluate(energy, density, temperature)
 
@@ -267,6 +486,19 @@ cdef class TotalRadiatedPower():
         """
         raise NotImplementedError("The evaluate() virtual method must be implemented.")
 
+    def evaluate_array(self, electron_density, electron_temperature):
+        """Returns the total radiated power rates for arrays of plasma conditions.
+
+        The arguments are broadcast against each other and evaluate() is called
+        for each element.
+
+        :param electron_density: Array of electron densities in m^-3.
+        :param electron_temperature: Array of electron temperatures in eV.
+        :return: Array of total radiated power rates in W.m^3.
+        """
+
+        return _evaluate_array2(_total_radiated_power, self, electron_density, electron_temperature)
+
 
 cdef class _RadiatedPower:
     """Base class for ionisation-resolved radiated powers."""
@@ -295,6 +527,19 @@ cdef class _RadiatedPower:
         """
         raise NotImplementedError("The evaluate() virtual method must be implemented.")
 
+    def evaluate_array(self, electron_density, electron_temperature):
+        """Returns the radiated power rates for arrays of plasma conditions.
+
+        The arguments are broadcast against each other and evaluate() is called
+        for each element.
+
+        :param electron_density: Array of electron densities in m^-3.
+        :param electron_temperature: Array of electron temperatures in eV.
+        :return: Array of radiated power rates in W.m^3.
+        """
+
+        return _evaluate_array2(_radiated_power, self, electron_density, electron_temperature)
+
 
 cdef class LineRadiationPower(_RadiatedPower):
     """
@@ -352,6 +597,19 @@ cdef class FractionalAbundance:
         """
         raise NotImplementedError("The evaluate() virtual method must be implemented.")
 
+    def evaluate_array(self, electron_density, electron_temperature):
+        """Returns the fractional abundances of this ionisation stage for arrays of plasma conditions.
+
+        The arguments are broadcast against each other and evaluate() is called
+        for each element.
+
+        :param electron_density: Array of electron densities in m^-3.
+        :param electron_temperature: Array of electron temperatures in eV.
+        :return: Array of fractional abundances.
+        """
+
+        return _evaluate_array2(_fractional_abundance, self, electron_density, electron_temperature)
+
     def __call__(self, double electron_density, double electron_temperature):
         """
         Evaluate the fractional abundance of this ionisation stage at the given plasma conditions.
@@ -16,6 +16,7 @@
 # See the Licence for the specific language governing permissions and limitations
 # under the Licence.
 
+from raysect.optical cimport Vector3D, AffineMatrix3D
 from raysect.optical.material.emitter cimport InhomogeneousVolumeEmitter
 
 from cherab.core.plasma cimport Plasma
@@ -30,4 +31,10 @@ cdef class BeamMaterial(InhomogeneousVolumeEmitter):
         Plasma _plasma
         AtomicData _atomic_data
         list _models
+        AffineMatrix3D _beam_to_plasma
+        Vector3D _direction, _observation_direction
+
+    cdef object __weakref__
+
+    cdef AffineMatrix3D _get_beam_to_plasma(self)
 
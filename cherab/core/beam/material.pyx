@@ -46,6 +46,29 @@ cdef class BeamMaterial(InhomogeneousVolumeEmitter):
 
         self._models = models
 
+        # the beam to plasma transform is cached, any change to either node invalidates it
+        self._beam_to_plasma = None
+        self._direction = None
+        self._observation_direction = None
+        self._beam.notifier.add(self._transform_changed)
+        self._plasma.notifier.add(self._transform_changed)
+
+    def _transform_changed(self):
+        """
+        Called when the beam or the plasma notifies a change, this may have modified the
+        relative position of the nodes in the scene-graph.
+        """
+
+        self._beam_to_plasma = None
+        self._direction = None
+        self._observation_direction = None
+
+    cdef AffineMatrix3D _get_beam_to_plasma(self):
+
+        if self._beam_to_plasma is None:
+            self._beam_to_plasma = self._beam.to(self._plasma)
+        return self._beam_to_plasma
+
     cpdef Spectrum emission_function(self, Point3D point, Vector3D direction, Spectrum spectrum,
                                      World world, Ray ray, Primitive primitive,
                                      AffineMatrix3D to_local, AffineMatrix3D to_world):
@@ -54,18 +77,25 @@ cdef class BeamMaterial(InhomogeneousVolumeEmitter):
             BeamModel model
             Point3D plasma_point
             Vector3D beam_direction, observation_direction
+            AffineMatrix3D beam_to_plasma
 
         beam_direction = self._beam.direction(point.x, point.y, point.z)
 
         # transform points and directions
-        # todo: cache this transform and rebuild if beam or plasma notifies
-        beam_to_plasma = self._beam.to(self._plasma)
+        beam_to_plasma = self._get_beam_to_plasma()
         plasma_point = point.transform(beam_to_plasma)
         beam_direction = beam_direction.transform(beam_to_plasma)
-        observation_direction = direction.transform(beam_to_plasma)
 
-        # call each model and accumulate spectrum
+        # the integrator passes the same direction object for all samples along a ray segment
+        if direction is not self._direction:
+            self._direction = direction
+            self._observation_direction = direction.transform(beam_to_plasma)
+        observation_direction = self._observation_direction
+
+        # call each model that can contribute to the spectral range and accumulate spectrum
         for model in self._models:
+            if not model.contributes(spectrum.min_wavelength, spectrum.max_wavelength):
+                continue
             spectrum = model.emission(point, plasma_point, beam_direction, observation_direction, spectrum)
 
         return spectrum
@@ -34,6 +34,8 @@ cdef class BeamModel:
 
     cpdef Spectrum emission(self, Point3D beam_point, Point3D plasma_point, Vector3D beam_direction, Vector3D observation_direction, Spectrum spectrum)
 
+    cpdef bint contributes(self, double min_wavelength, double max_wavelength) except -1
+
 
 cdef class BeamAttenuator:
 
@@ -101,6 +101,21 @@ cdef class BeamModel:
 
         raise NotImplementedError('Virtual method must be implemented in a sub-class.')
 
+    cpdef bint contributes(self, double min_wavelength, double max_wavelength) except -1:
+        """
+        Returns False if the model cannot add emission within the specified wavelength range.
+
+        BeamMaterial skips the models that cannot contribute to the wavelength range of
+        a ray before the emission is calculated. The default implementation always
+        returns True.
+
+        :param min_wavelength: Lower bound of the wavelength range in nm.
+        :param max_wavelength: Upper bound of the wavelength range in nm.
+        :return: False if the emission of the model is negligible in the wavelength range.
+        """
+
+        return True
+
     def _change(self):
         """
         Called if the plasma, beam or the atomic data source properties change.
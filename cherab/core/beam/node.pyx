@@ -134,6 +134,8 @@ cdef class Beam(Node):
     :ivar VolumeIntegrator integrator: The configurable method for doing
       volumetric integration through the beam along a Ray's path. Defaults to
       a numerical integrator with 1mm step size, NumericalIntegrator(step=0.001).
+      AdaptiveVolumeIntegrator from cherab.core.math.integrators adapts the step size
+      to the local variation of the emission.
     :ivar float length: The approximate length of this beam from source to extinction
       in the plasma. This is used for setting the bounding geometry over which calculations
       will occur. Units of m.
@@ -571,7 +573,7 @@ cdef class Beam(Node):
         self._attenuator.plasma = self._plasma
         self._attenuator.atomic_data = self._atomic_data
 
-    cdef int _modified(self) except -1:
+    def _modified(self):
         """
         Called when a scene-graph change occurs that modifies this Node's root
         transforms. This will occur if the Node's transform is modified, a
@@ -0,0 +1,38 @@
+# cython: language_level=3
+
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+from raysect.optical cimport Spectrum, Point3D, Vector3D
+from raysect.optical.material.emitter.inhomogeneous cimport VolumeIntegrator
+from raysect.core.math.function.float cimport Function3D
+
+
+cdef class AdaptiveVolumeIntegrator(VolumeIntegrator):
+
+    cdef:
+        double _rtol, _atol, _min_step, _max_step
+        Function3D _step_function
+
+    cdef double _limit_step(self, double step, Point3D point) except? -1e999
+
+    cdef double _total_emission(self, Spectrum emission)
+
+    cdef Point3D _sample_point(self, Point3D start, Vector3D direction, double t)
+
+    cdef int _check_dimensions(self, Spectrum spectrum, int bins) except -1
@@ -0,0 +1,300 @@
+# cython: language_level=3
+
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+from raysect.optical cimport World, Primitive, Ray, Spectrum, Point3D, Vector3D, AffineMatrix3D, new_point3d
+from raysect.optical.material.emitter.inhomogeneous cimport InhomogeneousVolumeEmitter
+from raysect.core.math.function.float cimport autowrap_function3d
+
+from libc.math cimport fabs
+cimport cython
+
+
+cdef class AdaptiveVolumeIntegrator(VolumeIntegrator):
+    r"""
+    Trapezium integration of the volume emission with an adaptive step size.
+
+    Each step is integrated with one interval and with two intervals of half the step
+    size, the difference :math:`\Delta` between the two estimates, summed over the
+    spectral bins, is the error estimate. The step :math:`h` is halved until
+    :math:`\Delta \le (\epsilon_{rel} \varepsilon_{max} + \epsilon_{abs}) h`, where
+    :math:`\varepsilon_{max}` is the peak spectrally integrated emissivity sampled so far
+    along the ray, and is doubled after a step with an error below a quarter of this
+    tolerance. The emission is thus sampled densely only where it changes rapidly,
+    while the regions with little or no emission are crossed with the maximum step.
+
+    The maximum step must be smaller than the narrowest emission feature crossed by
+    the rays, a feature falling between the samples of a step is not detected. The step
+    can be further limited along the ray with a step function returning the maximum step
+    size at any point in the local coordinate system of the primitive, e.g. a fraction
+    of the gradient scale length of the plasma profiles or a step derived from the
+    normalised poloidal flux.
+
+    :param float relative_tolerance: Tolerance relative to the peak emissivity.
+      Default is 0.001.
+    :param float absolute_tolerance: Absolute tolerance of the emissivity
+      in W/m^3/str. Default is 0.
+    :param float min_step: Minimum step size in meters. Default is 0.001.
+    :param float max_step: Maximum step size in meters. Default is 0.05.
+    :param object step_function: A Function3D or a Python function returning the maximum
+      step size in meters at a point. Default is None (the step is limited by max_step only).
+
+    .. code-block:: pycon
+
+       >>> from cherab.core.math.integrators import AdaptiveVolumeIntegrator
+       >>>
+       >>> plasma.integrator = AdaptiveVolumeIntegrator(relative_tolerance=0.001, min_step=0.001, max_step=0.05)
+    """
+
+    def __init__(self, double relative_tolerance=0.001, double absolute_tolerance=0, double min_step=0.001,
+                 double max_step=0.05, object step_function=None):
+
+        if min_step <= 0:
+            raise ValueError("Minimum step size must be positive.")
+
+        if max_step < min_step:
+            raise ValueError("Maximum step size must be greater than or equal to the minimum step size.")
+
+        self._min_step = min_step
+        self._max_step = max_step
+        self.relative_tolerance = relative_tolerance
+        self.absolute_tolerance = absolute_tolerance
+        self.step_function = step_function
+
+    @property
+    def relative_tolerance(self):
+        """
+        Tolerance relative to the peak emissivity.
+
+        :rtype: float
+        """
+        return self._rtol
+
+    @relative_tolerance.setter
+    def relative_tolerance(self, double value):
+
+        if value < 0:
+            raise ValueError("Relative tolerance must be non-negative.")
+
+        self._rtol = value
+
+    @property
+    def absolute_tolerance(self):
+        """
+        Absolute tolerance of the emissivity in W/m^3/str.
+
+        :rtype: float
+        """
+        return self._atol
+
+    @absolute_tolerance.setter
+    def absolute_tolerance(self, double value):
+
+        if value < 0:
+            raise ValueError("Absolute tolerance must be non-negative.")
+
+        self._atol = value
+
+    @property
+    def min_step(self):
+        """
+        Minimum step size in meters.
+
+        :rtype: float
+        """
+        return self._min_step
+
+    @min_step.setter
+    def min_step(self, double value):
+
+        if value <= 0:
+            raise ValueError("Minimum step size must be positive.")
+
+        if value > self._max_step:
+            raise ValueError("Minimum step size must be less than or equal to the maximum step size.")
+
+        self._min_step = value
+
+    @property
+    def max_step(self):
+        """
+        Maximum step size in meters.
+
+        :rtype: float
+        """
+        return self._max_step
+
+    @max_step.setter
+    def max_step(self, double value):
+
+        if value < self._min_step:
+            raise ValueError("Maximum step size must be greater than or equal to the minimum step size.")
+
+        self._max_step = value
+
+    @property
+    def step_function(self):
+        """
+        Function returning the maximum step size in meters at a point, or None.
+
+        :rtype: Function3D
+        """
+        return self._step_function
+
+    @step_function.setter
+    def step_function(self, object value):
+
+        if value is None:
+            self._step_function = None
+        else:
+            self._step_function = autowrap_function3d(value)
+
+    @cython.cdivision(True)
+    cdef double _limit_step(self, double step, Point3D point) except? -1e999:
+
+        if self._step_function is not None:
+            step = min(step, self._step_function.evaluate(point.x, point.y, point.z))
+
+        return min(self._max_step, max(self._min_step, step))
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    @cython.cdivision(True)
+    @cython.initializedcheck(False)
+    cpdef Spectrum integrate(self, Spectrum spectrum, World world, Ray ray, Primitive primitive,
+                             InhomogeneousVolumeEmitter material, Point3D start_point, Point3D end_point,
+                             AffineMatrix3D world_to_primitive, AffineMatrix3D primitive_to_world):
+
+        cdef:
+            Point3D start, end, point
+            Vector3D integration_direction, ray_direction
+            double length, t, step, coarse, fine, error, tolerance, peak_emission
+            Spectrum emission_start, emission_middle, emission_end, temp
+            bint last
+            int index
+
+        # convert start and end points to local space
+        start = start_point.transform(world_to_primitive)
+        end = end_point.transform(world_to_primitive)
+
+        # obtain local space ray direction and integration length
+        integration_direction = start.vector_to(end)
+        length = integration_direction.get_length()
+
+        # nothing to contribute?
+        if length == 0.0:
+            return spectrum
+
+        integration_direction = integration_direction.normalise()
+        ray_direction = integration_direction.neg()
+
+        # create working buffers
+        emission_start = ray.new_spectrum()
+        emission_middle = ray.new_spectrum()
+        emission_end = ray.new_spectrum()
+
+        # sample point and sanity check as bounds checking is disabled
+        emission_start = material.emission_function(start, ray_direction, emission_start, world, ray, primitive, world_to_primitive, primitive_to_world)
+        self._check_dimensions(emission_start, spectrum.bins)
+
+        peak_emission = self._total_emission(emission_start)
+
+        t = 0
+        step = self._limit_step(self._max_step, start)
+        last = False
+        while not last:
+
+            # the last step absorbs the remainder of the integration length
+            if length - t <= step * (1 + 1.e-9):
+                step = length - t
+                last = True
+
+            point = self._sample_point(start, integration_direction, t + step)
+            emission_end.clear()
+            emission_end = material.emission_function(point, ray_direction, emission_end, world, ray, primitive, world_to_primitive, primitive_to_world)
+            self._check_dimensions(emission_end, spectrum.bins)
+
+            while True:
+
+                point = self._sample_point(start, integration_direction, t + 0.5 * step)
+                emission_middle.clear()
+                emission_middle = material.emission_function(point, ray_direction, emission_middle, world, ray, primitive, world_to_primitive, primitive_to_world)
+                self._check_dimensions(emission_middle, spectrum.bins)
+
+                peak_emission = max(peak_emission, self._total_emission(emission_middle), self._total_emission(emission_end))
+
+                # compare the trapezium rule estimates with one and two intervals
+                error = 0
+                for index in range(spectrum.bins):
+                    coarse = 0.5 * (emission_start.samples_mv[index] + emission_end.samples_mv[index])
+                    fine = 0.25 * (emission_start.samples_mv[index] + 2 * emission_middle.samples_mv[index] + emission_end.samples_mv[index])
+                    error += fabs(fine - coarse)
+                error *= step * spectrum.delta_wavelength
+
+                tolerance = (self._rtol * peak_emission + self._atol) * step
+                if error <= tolerance or 0.5 * step < self._min_step:
+                    break
+
+                # halve the step, the middle sample becomes the end of the step
+                step *= 0.5
+                last = False
+                temp = emission_end
+                emission_end = emission_middle
+                emission_middle = temp
+
+            # accumulate the two interval estimate
+            for index in range(spectrum.bins):
+                spectrum.samples_mv[index] += 0.25 * step * (emission_start.samples_mv[index] + 2 * emission_middle.samples_mv[index] + emission_end.samples_mv[index])
+
+            t += step
+
+            # the end of the step is the start of the next one
+            temp = emission_start
+            emission_start = emission_end
+            emission_end = temp
+
+            # coarsen the step if the emission changes slowly
+            if error <= 0.25 * tolerance:
+                step *= 2
+            step = self._limit_step(step, self._sample_point(start, integration_direction, t))
+
+        return spectrum
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    @cython.initializedcheck(False)
+    cdef double _total_emission(self, Spectrum emission):
+
+        cdef:
+            double total = 0
+            int index
+
+        for index in range(emission.bins):
+            total += fabs(emission.samples_mv[index])
+
+        return total * emission.delta_wavelength
+
+    cdef Point3D _sample_point(self, Point3D start, Vector3D direction, double t):
+
+        return new_point3d(start.x + t * direction.x, start.y + t * direction.y, start.z + t * direction.z)
+
+    cdef int _check_dimensions(self, Spectrum spectrum, int bins) except -1:
+
+        if spectrum.samples.ndim != 1 or spectrum.samples.shape[0] != bins:
+            raise ValueError("Spectrum returned by emission function has the wrong number of samples.")
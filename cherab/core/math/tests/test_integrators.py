@@ -17,8 +17,12 @@
 # under the Licence.
 
 from raysect.core.math.function.float import Exp1D, Arg1D
-from cherab.core.math.integrators import GaussianQuadrature
-from math import sqrt, pi
+from raysect.optical import World, Ray, Point3D, Vector3D
+from raysect.optical.material.emitter import InhomogeneousVolumeEmitter
+from raysect.optical.material.emitter.inhomogeneous import NumericalIntegrator
+from raysect.primitive import Box
+from cherab.core.math.integrators import GaussianQuadrature, AdaptiveVolumeIntegrator
+from math import sqrt, pi, exp
 from scipy.special import erf
 import unittest
 
@@ -76,5 +80,83 @@ class TestGaussianQuadrature(unittest.TestCase):
         self.assertAlmostEqual(quadrature(a, b), exact_integral, places=8)
 
 
+class PeakedEmitter(InhomogeneousVolumeEmitter):
+    """Emission peaked at x = 0.1 and x = 1.85 on top of a weak plateau, counts the samples."""
+
+    def __init__(self, integrator):
+        super().__init__(integrator)
+        self.samples = 0
+
+    def emission_function(self, point, direction, spectrum, world, ray, primitive, to_local, to_world):
+        self.samples += 1
+        x = point.x
+        spectrum.samples[:] = exp(-((x - 0.1) / 0.02)**2) + exp(-((x - 1.85) / 0.05)**2) + 0.01 * (0.5 < x < 1.5)
+        return spectrum
+
+
+class TestAdaptiveVolumeIntegrator(unittest.TestCase):
+    """Adaptive volume integrator tests."""
+
+    exact_integral = sqrt(pi) * (0.02 + 0.05) + 0.01
+
+    def trace(self, integrator):
+
+        world = World()
+        material = PeakedEmitter(integrator)
+        Box(Point3D(0, -1, -1), Point3D(2, 1, 1), parent=world, material=material)
+        ray = Ray(origin=Point3D(-1, 0, 0), direction=Vector3D(1, 0, 0), min_wavelength=400, max_wavelength=401, bins=4)
+        spectrum = ray.trace(world)
+
+        return spectrum.samples[0], material.samples
+
+    def test_properties(self):
+        """Test property assignment."""
+
+        integrator = AdaptiveVolumeIntegrator(relative_tolerance=1.e-4, absolute_tolerance=1.e-2, min_step=0.002, max_step=0.02)
+
+        self.assertEqual(integrator.relative_tolerance, 1.e-4)
+        self.assertEqual(integrator.absolute_tolerance, 1.e-2)
+        self.assertEqual(integrator.min_step, 0.002)
+        self.assertEqual(integrator.max_step, 0.02)
+        self.assertIsNone(integrator.step_function)
+
+        with self.assertRaises(ValueError):
+            integrator.relative_tolerance = -1
+        with self.assertRaises(ValueError):
+            integrator.absolute_tolerance = -1
+        with self.assertRaises(ValueError):
+            integrator.min_step = 0
+        with self.assertRaises(ValueError):
+            integrator.min_step = 0.03
+        with self.assertRaises(ValueError):
+            integrator.max_step = 0.001
+        with self.assertRaises(ValueError):
+            AdaptiveVolumeIntegrator(min_step=0.1, max_step=0.01)
+
+    def test_integrate(self):
+        """Test integration accuracy and number of samples."""
+
+        integral, samples = self.trace(AdaptiveVolumeIntegrator(relative_tolerance=1.e-4, min_step=1.e-4))
+        reference_integral, reference_samples = self.trace(NumericalIntegrator(0.001))
+
+        # more accurate than the 1 mm numerical integrator with fewer samples
+        self.assertLess(abs(integral - self.exact_integral), abs(reference_integral - self.exact_integral))
+        self.assertLess(samples, reference_samples / 2)
+
+        integral, samples = self.trace(AdaptiveVolumeIntegrator(relative_tolerance=1.e-3))
+        self.assertAlmostEqual(integral / self.exact_integral, 1, delta=1.e-3)
+        self.assertLess(samples, reference_samples / 5)
+
+    def test_step_function(self):
+        """Test the limitation of the step size by the step function."""
+
+        _, samples = self.trace(AdaptiveVolumeIntegrator(relative_tolerance=1.e-3))
+        integral, limited_samples = self.trace(AdaptiveVolumeIntegrator(relative_tolerance=1.e-3, step_function=lambda x, y, z: 0.005))
+
+        self.assertGreaterEqual(limited_samples, 2 / 0.005)
+        self.assertGreater(limited_samples, samples)
+        self.assertAlmostEqual(integral / self.exact_integral, 1, delta=1.e-3)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1 +1 @@
-from .singleray import SingleRayAttenuator
+from .singleray import SingleRayAttenuator, precalculate_attenuation
@@ -17,7 +17,6 @@
 # under the Licence.
 
 cimport numpy as np
-from raysect.optical cimport Vector3D
 from cherab.core.math cimport Function1D
 from cherab.core.beam cimport BeamAttenuator
 
@@ -30,13 +29,18 @@ cdef class SingleRayAttenuator(BeamAttenuator):
         double _step, _clamp_sigma_sqr, _tanxdiv, _tanydiv, _source_density
         bint clamp_to_zero
 
+    cdef:
+        np.ndarray _sample_points
+        dict _species_samples
+
     cpdef calculate_attenuation(self)
 
     cdef void _calc_attenuation(self)
 
-    cdef np.ndarray _beam_attenuation(self, np.ndarray axis, np.ndarray x, np.ndarray y, np.ndarray z,
-                                          double energy, double power, double mass, Vector3D direction)
+    cdef tuple _sample_axis(self)
+
+    cdef void _set_attenuation(self, np.ndarray axis, np.ndarray stopping_coeff)
 
-    cdef double _beam_stopping(self, double x, double y, double z, Vector3D beam_velocity)
+    cdef list _sample_plasma(self, np.ndarray points)
 
     cdef int _populate_stopping_data_cache(self) except -1
@@ -23,6 +23,7 @@ try:
 except ImportError:
     from scipy.integrate import cumtrapz as cumulative_trapezoid
 
+import multiprocessing
 import numpy as np
 cimport numpy as np
 
@@ -33,13 +34,13 @@ from cherab.core.atomic cimport BeamStoppingRate, AtomicData
 from cherab.core.plasma cimport Plasma
 from cherab.core.beam cimport Beam
 from cherab.core.species cimport Species
+from cherab.core.distribution cimport DistributionFunction
 from cherab.core.utility.constants cimport DEGREES_TO_RADIANS
 
 from libc.math cimport exp, sqrt, tan, M_PI
 cimport cython
 
 
-# todo: attenuation calculation could be optimised further using memory views etc...
 cdef class SingleRayAttenuator(BeamAttenuator):
     r"""
     Calculates beam attenuation in the single-ray approximation.
@@ -64,6 +65,8 @@ cdef class SingleRayAttenuator(BeamAttenuator):
         self._source_density = 0.
         self._density = None
         self._stopping_data = None
+        self._sample_points = None
+        self._species_samples = {}
 
         # spacing of density sample points along the beam
         if step <= 0.0:
@@ -176,9 +179,6 @@ cdef class SingleRayAttenuator(BeamAttenuator):
             self._populate_stopping_data_cache()
         self._calc_attenuation()
 
-    @cython.cdivision(True)
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
     cdef void _calc_attenuation(self):
         """
         Attenuation is calculated along the beam axis and extrapolated across the beam.
@@ -187,130 +187,111 @@ cdef class SingleRayAttenuator(BeamAttenuator):
         and returning a linear density in m^-1, calculated along the beam axis.
         """
 
+        cdef np.ndarray beam_z, points, beam_velocity, stopping_coeff
+
+        beam_z, points, beam_velocity = self._sample_axis()
+        stopping_coeff = _beam_stopping(self._stopping_data, self._sample_plasma(points), beam_z.size, beam_velocity)[0]
+        self._set_attenuation(beam_z, stopping_coeff)
+
+    cdef tuple _sample_axis(self):
+        """
+        Returns the sample points along the beam axis and the beam velocity.
+
+        :return: a tuple of (axis, points, velocity), where axis holds the distances
+            along the beam axis in meters, points is the Nx3 array of the corresponding
+            points in plasma space and velocity is the 1x3 array of the beam velocity
+            in plasma space in m/s.
+        """
+
         cdef:
             AffineMatrix3D beam_to_plasma
             Vector3D direction
+            Point3D paxis
             int nbeam, i
-            np.ndarray beam_z, xaxis, yaxis, zaxis, beam_density
-            double bzv
+            double speed
+            np.ndarray beam_z, points
+            double[:, ::1] points_mv
 
         # calculate transform to plasma space
         beam_to_plasma = self._beam.to(self._plasma)
-        direction = self._beam.BEAM_AXIS.transform(beam_to_plasma)
+        direction = self._beam.BEAM_AXIS.transform(beam_to_plasma).normalise()
+        speed = EvAmuToMS.to(self._beam.energy)
 
         # sample points along the beam
         nbeam = max(1 + int(np.ceil(self._beam.length / self._step)), 4)
         beam_z = np.linspace(0.0, self._beam.length, nbeam)
 
-        xaxis = np.zeros(nbeam)
-        yaxis = np.zeros(nbeam)
-        zaxis = np.zeros(nbeam)
-
-        for i, bzv in enumerate(beam_z):
+        points = np.empty((nbeam, 3))
+        points_mv = points
+        for i in range(nbeam):
+            paxis = new_point3d(0.0, 0.0, beam_z[i]).transform(beam_to_plasma)
+            points_mv[i, 0] = paxis.x
+            points_mv[i, 1] = paxis.y
+            points_mv[i, 2] = paxis.z
 
-            paxis = new_point3d(0.0, 0.0, bzv).transform(beam_to_plasma)
-            xaxis[i] = paxis.x
-            yaxis[i] = paxis.y
-            zaxis[i] = paxis.z
-
-        beam_density = self._beam_attenuation(beam_z, xaxis, yaxis, zaxis,
-                                              self._beam.energy, self._beam.power,
-                                              self._beam.element.atomic_weight, direction)
-
-        self._tanxdiv = tan(DEGREES_TO_RADIANS * self._beam.divergence_x)
-        self._tanydiv = tan(DEGREES_TO_RADIANS * self._beam.divergence_y)
-
-        # a tiny degree of extrapolation is permitted to handle numerical accuracy issues with the end of the array
-        self._density = Interpolator1DArray(beam_z, beam_density, 'linear', 'nearest', extrapolation_range=1e-9)
+        return beam_z, points, np.array([[direction.x * speed, direction.y * speed, direction.z * speed]])
 
     @cython.cdivision(True)
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
-    cdef np.ndarray _beam_attenuation(self, np.ndarray axis, np.ndarray x, np.ndarray y, np.ndarray z,
-                                          double energy, double power, double mass, Vector3D direction):
-        """
-        axis has to be sorted
-
-        :param axis:
-        :param x: list of positions in meters
-        :param y: list of positions in meters
-        :param z: list of positions in meters
-        :param energy: beam energy in eV/amu
-        :param power: beam power in W
-        :param mass: atomic mass in amu
-        :param direction:
-        :return: a list of linear densities in m^-1
+    cdef void _set_attenuation(self, np.ndarray axis, np.ndarray stopping_coeff):
         """
+        Integrates the stopping coefficients along the beam axis and caches the resulting
+        linear beam density.
 
-        cdef:
-            np.ndarray stopping_coeff
-            double speed, beam_particle_rate, beam_density
-            Vector3D beam_velosity
-            int i, naxis
+        :param axis: sorted distances along the beam axis in meters
+        :param stopping_coeff: stopping coefficients at the axis points in s^-1
+        """
 
-        naxis = axis.size
+        cdef double energy, speed, beam_particle_rate, beam_density
 
+        energy = self._beam.energy
         speed = EvAmuToMS.to(energy)
-        beam_velocity = direction.normalise() * speed
-
-        beam_particle_rate = power / EvToJ.to(energy * mass)
+        beam_particle_rate = self._beam.power / EvToJ.to(energy * self._beam.element.atomic_weight)
         beam_density = beam_particle_rate / speed
         self._source_density = beam_density
 
-        stopping_coeff = np.zeros(naxis)
-        for i in range(naxis):
-            stopping_coeff[i] = self._beam_stopping(x[i], y[i], z[i], beam_velocity)
+        self._tanxdiv = tan(DEGREES_TO_RADIANS * self._beam.divergence_x)
+        self._tanydiv = tan(DEGREES_TO_RADIANS * self._beam.divergence_y)
 
-        return beam_density * np.exp(-cumulative_trapezoid(stopping_coeff, axis, initial=0) / speed)
+        # a tiny degree of extrapolation is permitted to handle numerical accuracy issues with the end of the array
+        self._density = Interpolator1DArray(axis, beam_density * np.exp(-cumulative_trapezoid(stopping_coeff, axis, initial=0) / speed),
+                                            'linear', 'nearest', extrapolation_range=1e-9)
 
-    @cython.cdivision(True)
-    cdef double _beam_stopping(self, double x, double y, double z, Vector3D beam_velocity):
+    cdef list _sample_plasma(self, np.ndarray points):
         """
+        Returns the density, temperature and bulk velocity profiles of the plasma species
+        sampled at the given points.
 
-        :param x: position in meters
-        :param y: position in meters
-        :param z: position in meters
-        :param beam_velocity: beam velocity in m/s
-        :return: a stopping coefficient in s^-1
-        """
+        Species are immutable, so the profiles of the species that remain in the plasma
+        composition are reused while the sample points do not change.
 
-        # see www.adas.ac.uk/man/chap3-04.pdf equation 4.4.7
-        # note: we have access to ni for each species so we have done away with
-        # the impurity fractions used in the above document
+        :param points: Nx3 array of sample points in plasma space.
+        :return: a list of (density, temperature, velocity) tuples in the order of
+            the stopping data.
+        """
 
         cdef:
-            double density_sum, stopping_coeff, target_ne, target_ti, interaction_speed, interaction_energy, target_equiv_ne
             Species species
-            BeamStoppingRate coeff
-            int target_z
-            Vector3D target_velocity, interaction_velocity
-
-        # z-weighted density sum
-        density_sum = 0
-        for species, _ in self._stopping_data:
-            density_sum += species.charge**2 * species.distribution.density(x, y, z)
-
-        # stopping coefficient
-        stopping_coeff = 0
-        for species, coeff in self._stopping_data:
-
-            # sample species distribution
-            target_z = species.charge
-            target_ne = species.distribution.density(x, y, z) * target_z
-            target_ti = species.distribution.effective_temperature(x, y, z)
-            target_velocity = species.distribution.bulk_velocity(x, y, z)
+            dict species_samples
+            list samples
 
-            # calculate mean beam interaction energy
-            interaction_velocity = beam_velocity - target_velocity
-            interaction_speed = interaction_velocity.length
-            interaction_energy = EvAmuToMS.inv(interaction_speed)
+        if self._sample_points is None or not np.array_equal(points, self._sample_points):
+            self._sample_points = points
+            self._species_samples = {}
 
-            # species equivalent electron density
-            target_equiv_ne = density_sum / target_z
+        species_samples = {}
+        samples = []
+        for species, _ in self._stopping_data:
+            try:
+                profiles = self._species_samples[species]
+            except KeyError:
+                profiles = _sample_species(species, points)
+            species_samples[species] = profiles
+            samples.append(profiles)
 
-            stopping_coeff += target_ne * coeff.evaluate(interaction_energy, target_equiv_ne, target_ti)
+        # drop the profiles of the species no longer present in the plasma
+        self._species_samples = species_samples
 
-        return stopping_coeff
+        return samples
 
     cdef int _populate_stopping_data_cache(self) except -1:
         """
@@ -344,3 +325,217 @@ cdef class SingleRayAttenuator(BeamAttenuator):
         # reset cached data
         self._density = None
         self._stopping_data = None
+
+
+def precalculate_attenuation(beams, int processes=1):
+    """
+    Calculates the attenuation of several beams ahead of rendering.
+
+    Each SingleRayAttenuator otherwise calculates the attenuation of its beam lazily,
+    on the first density request. During a parallel render this happens separately
+    in every worker process. Calling this function before rendering stores the
+    results in the attenuators, which are then inherited by the render workers.
+
+    Beams sampling the same points along their axes (e.g. the energy components of
+    a neutral beam injector modelled as separate Beam objects) and interacting with
+    the same plasma share a single sampling of the plasma species. The stopping
+    coefficients for all their velocities are calculated in one pass.
+
+    :param list beams: A list of Beam objects with SingleRayAttenuator attenuators.
+    :param int processes: The number of worker processes used to calculate the
+      attenuation of the groups of beams sharing the sample points. Defaults to 1,
+      the attenuation is calculated in the calling process.
+
+    .. code-block:: pycon
+
+       >>> from cherab.core.model import precalculate_attenuation
+       >>> precalculate_attenuation([full_energy, half_energy, third_energy], processes=3)
+    """
+
+    cdef:
+        Beam beam
+        SingleRayAttenuator attenuator
+        np.ndarray beam_z, points, beam_velocity, stopping_coeff
+        dict groups
+        list group_list, results
+        int i
+
+    if processes < 1:
+        raise ValueError("The number of processes must be at least 1.")
+
+    groups = {}
+    group_list = []
+    for beam in beams:
+
+        if beam.attenuator is None:
+            raise ValueError("Beam {} does not have an attenuator model.".format(beam.name))
+        if not isinstance(beam.attenuator, SingleRayAttenuator):
+            raise TypeError("Beam {} does not have a SingleRayAttenuator attenuator model.".format(beam.name))
+
+        attenuator = beam.attenuator
+        if attenuator._stopping_data is None:
+            attenuator._populate_stopping_data_cache()
+
+        beam_z, points, beam_velocity = attenuator._sample_axis()
+
+        key = (id(attenuator._plasma), id(attenuator._atomic_data), beam.element, points.tobytes())
+        try:
+            group = groups[key]
+        except KeyError:
+            group = groups[key] = {'axis': beam_z, 'points': points, 'attenuators': [], 'velocities': []}
+            group_list.append(group)
+        group['attenuators'].append(attenuator)
+        group['velocities'].append(beam_velocity)
+
+    for group in group_list:
+        group['velocities'] = np.concatenate(group['velocities'])
+
+    if processes > 1 and len(group_list) > 1:
+        # plasma and atomic data objects are not guaranteed to be picklable,
+        # the worker processes are forked so that they inherit the beam groups
+        context = multiprocessing.get_context('fork')
+        with context.Pool(min(processes, len(group_list)), initializer=_init_worker, initargs=(group_list,)) as pool:
+            results = pool.map(_worker_calculate, range(len(group_list)))
+    else:
+        results = [_calculate_group(group) for group in group_list]
+
+    for group, (samples, stopping_coeff) in zip(group_list, results):
+        for i, attenuator in enumerate(group['attenuators']):
+            # share the species profiles, so the attenuators do not resample the plasma on recalculation
+            attenuator._sample_points = group['points']
+            attenuator._species_samples = {species: profiles for (species, _), profiles in zip(attenuator._stopping_data, samples)}
+            attenuator._set_attenuation(group['axis'], stopping_coeff[i])
+
+
+_worker_state = {}
+
+
+def _init_worker(group_list):
+    _worker_state['groups'] = group_list
+
+
+def _worker_calculate(index):
+    return _calculate_group(_worker_state['groups'][index])
+
+
+def _calculate_group(dict group):
+
+    cdef:
+        SingleRayAttenuator attenuator
+        list samples
+
+    attenuator = group['attenuators'][0]
+    samples = attenuator._sample_plasma(group['points'])
+    return samples, _beam_stopping(attenuator._stopping_data, samples, group['axis'].size, group['velocities'])
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef tuple _sample_species(Species species, double[:, ::1] points):
+    """
+    Samples the density, effective temperature and bulk velocity of the species distribution.
+
+    :param species: plasma species
+    :param points: Nx3 array of sample points in plasma space
+    :return: a tuple of (density, temperature, velocity) arrays, the velocity array has shape Nx3
+    """
+
+    cdef:
+        int i, npoints
+        DistributionFunction distribution
+        Vector3D velocity
+        np.ndarray density, temperature, bulk_velocity
+        double[::1] density_mv, temperature_mv
+        double[:, ::1] bulk_velocity_mv
+
+    distribution = species.distribution
+    npoints = points.shape[0]
+
+    density = np.empty(npoints)
+    temperature = np.empty(npoints)
+    bulk_velocity = np.empty((npoints, 3))
+    density_mv = density
+    temperature_mv = temperature
+    bulk_velocity_mv = bulk_velocity
+
+    for i in range(npoints):
+        density_mv[i] = distribution.density(points[i, 0], points[i, 1], points[i, 2])
+        temperature_mv[i] = distribution.effective_temperature(points[i, 0], points[i, 1], points[i, 2])
+        velocity = distribution.bulk_velocity(points[i, 0], points[i, 1], points[i, 2])
+        bulk_velocity_mv[i, 0] = velocity.x
+        bulk_velocity_mv[i, 1] = velocity.y
+        bulk_velocity_mv[i, 2] = velocity.z
+
+    return density, temperature, bulk_velocity
+
+
+@cython.cdivision(True)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.ndarray _beam_stopping(list stopping_data, list samples, int npoints, double[:, ::1] beam_velocities):
+    """
+    Calculates the beam stopping coefficients along the beam axis for several beam velocities
+    (e.g. the energy components of the beam) in one pass.
+
+    :param stopping_data: list of (species, beam stopping rate) tuples
+    :param samples: list of sampled (density, temperature, velocity) profiles of the species
+    :param npoints: number of sample points along the beam axis
+    :param beam_velocities: Mx3 array of beam velocities in m/s
+    :return: MxN array of stopping coefficients in s^-1
+    """
+
+    # see www.adas.ac.uk/man/chap3-04.pdf equation 4.4.7
+    # note: we have access to ni for each species so we have done away with
+    # the impurity fractions used in the above document
+
+    cdef:
+        int i, k, ncomponents, target_z
+        double target_ne, target_ti, interaction_speed, interaction_energy, target_equiv_ne, vx, vy, vz
+        double conversion_factor
+        np.ndarray stopping_coeff, density_sum
+        double[:, ::1] stopping_coeff_mv, target_velocity
+        double[::1] density_sum_mv, target_density, target_temperature
+        Species species
+        BeamStoppingRate coeff
+
+    ncomponents = beam_velocities.shape[0]
+    conversion_factor = EvAmuToMS.conversion_factor
+
+    # z-weighted density sum
+    density_sum = np.zeros(npoints)
+    density_sum_mv = density_sum
+    for (species, _), profiles in zip(stopping_data, samples):
+        target_density = profiles[0]
+        for i in range(npoints):
+            density_sum_mv[i] += species.charge**2 * target_density[i]
+
+    # stopping coefficient
+    stopping_coeff = np.zeros((ncomponents, npoints))
+    stopping_coeff_mv = stopping_coeff
+    for (species, coeff), profiles in zip(stopping_data, samples):
+
+        target_z = species.charge
+        target_density = profiles[0]
+        target_temperature = profiles[1]
+        target_velocity = profiles[2]
+
+        for i in range(npoints):
+
+            target_ne = target_density[i] * target_z
+            target_ti = target_temperature[i]
+
+            # species equivalent electron density
+            target_equiv_ne = density_sum_mv[i] / target_z
+
+            for k in range(ncomponents):
+
+                # calculate mean beam interaction energy
+                vx = beam_velocities[k, 0] - target_velocity[i, 0]
+                vy = beam_velocities[k, 1] - target_velocity[i, 1]
+                vz = beam_velocities[k, 2] - target_velocity[i, 2]
+                interaction_speed = sqrt(vx * vx + vy * vy + vz * vz)
+                interaction_energy = interaction_speed * interaction_speed / conversion_factor
+
+                stopping_coeff_mv[k, i] += target_ne * coeff.evaluate(interaction_energy, target_equiv_ne, target_ti)
+
+    return stopping_coeff
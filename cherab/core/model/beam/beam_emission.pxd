@@ -28,7 +28,7 @@ cdef class BeamEmissionLine(BeamModel):
 
     cdef:
         Line _line
-        double _wavelength
+        double _wavelength, _lower_wavelength, _upper_wavelength
         list _rates_list
         BeamLineShapeModel _lineshape
         Function2D _sigma_to_pi
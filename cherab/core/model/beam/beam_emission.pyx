@@ -175,6 +175,14 @@ cdef class BeamEmissionLine(BeamModel):
 
         return rate
 
+    cpdef bint contributes(self, double min_wavelength, double max_wavelength) except -1:
+
+        # cache data on first run
+        if self._rates_list is None:
+            self._populate_cache()
+
+        return self._lower_wavelength <= max_wavelength and self._upper_wavelength >= min_wavelength
+
     cdef int _populate_cache(self) except -1:
 
         cdef:
@@ -215,6 +223,9 @@ cdef class BeamEmissionLine(BeamModel):
         self._lineshape = BeamEmissionMultiplet(self._line, self._wavelength, self._beam, self._atomic_data,
                                                 self._sigma_to_pi, self._sigma1_to_sigma0, self._pi2_to_pi3, self._pi4_to_pi3)
 
+        # spectral extent of the line, used to skip the rays outside of it
+        self._lower_wavelength, self._upper_wavelength = self._lineshape.spectral_range()
+
     def _change(self):
 
         # clear cache to force regeneration on first use
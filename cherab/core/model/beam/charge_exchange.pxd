@@ -29,7 +29,7 @@ cdef class BeamCXLine(BeamModel):
     cdef:
         Line _line
         Species _target_species
-        double _wavelength
+        double _wavelength, _lower_wavelength, _upper_wavelength
         BeamCXPEC _ground_beam_rate
         list _excited_beam_data
         LineShapeModel _lineshape
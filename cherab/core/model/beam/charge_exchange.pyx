@@ -291,6 +291,14 @@ cdef class BeamCXLine(BeamModel):
         # normalise charge density weighted sum
         return pop_coeff / total_ne
 
+    cpdef bint contributes(self, double min_wavelength, double max_wavelength) except -1:
+
+        # cache data on first run
+        if self._target_species is None:
+            self._populate_cache()
+
+        return self._lower_wavelength <= max_wavelength and self._upper_wavelength >= min_wavelength
+
     cdef int _populate_cache(self) except -1:
 
         cdef:
@@ -365,6 +373,9 @@ cdef class BeamCXLine(BeamModel):
         self._lineshape = self._lineshape_class(self._line, self._wavelength, self._target_species, self._plasma, self._atomic_data,
                                                 *self._lineshape_args, **self._lineshape_kwargs)
 
+        # spectral extent of the line, used to skip the rays outside of it
+        self._lower_wavelength, self._upper_wavelength = self._lineshape.spectral_range()
+
     def _change(self):
 
         # clear cache to force regeneration on first use
@@ -27,6 +27,12 @@ cdef class SeldenMatobaThomsonSpectrum(LaserModel):
     
     cdef:
         double _CONST_ALPHA, _RATE_TS, _RECIP_M_PI
+        bint _tabulated
+        double _log_te_min, _angle_resolution
+        int _te_table_size
+        tuple _te_range
+        dict _kernel_tables
+        object _kernel_laser_power
 
     cpdef Spectrum emission(self, Point3D point_plasma, Vector3D observation_plasma, Point3D point_laser,
                             Vector3D observation_laser, Spectrum spectrum)
@@ -37,4 +43,9 @@ cdef class SeldenMatobaThomsonSpectrum(LaserModel):
                                              double angle_polarization, double laser_wavelength, Spectrum spectrum)
 
     cpdef Spectrum calculate_spectrum(self, double ne, double te, double laser_energy_density, double laser_wavelength,
-                                      double observation_angle, double angle_polarization, Spectrum spectrum)
\ No newline at end of file
+                                      double observation_angle, double angle_polarization, Spectrum spectrum)
+
+    cdef Spectrum _add_tabulated_contribution(self, double ne, double position, double laser_energy_density, double angle_scattering,
+                                              double angle_polarization, Spectrum spectrum)
+
+    cdef double[:, ::1] _get_kernel_table(self, double angle_scattering, Spectrum spectrum)
@@ -17,7 +17,9 @@
 # under the Licence.
 
 
-from libc.math cimport exp, sqrt, cos, M_PI, sin
+import numpy as np
+
+from libc.math cimport exp, sqrt, cos, M_PI, sin, log10, round
 cimport cython
 
 from raysect.optical cimport Vector3D, Point3D
@@ -29,6 +31,13 @@ from cherab.core.utility.constants cimport DEGREES_TO_RADIANS
 from cherab.core.utility.constants cimport SPEED_OF_LIGHT, ELECTRON_CLASSICAL_RADIUS, ELECTRON_REST_MASS, ELEMENTARY_CHARGE
 
 
+# electron temperature grid density of the tabulated scattering kernel
+cdef double TE_TABLE_POINTS_PER_DECADE = 50
+
+# maximum number of kernel tables kept in memory, the least recently used table is discarded first
+cdef int KERNEL_TABLE_CACHE_SIZE = 64
+
+
 cdef class SeldenMatobaThomsonSpectrum(LaserModel):
     r"""
     Thomson Scattering based on Selden-Matoba.
@@ -56,12 +65,37 @@ cdef class SeldenMatobaThomsonSpectrum(LaserModel):
                   Japanese Journal of Applied Physics, 18(6), p.1127.`
          :Prunty: `Prunty, S.L., 2014. A primer on the theory of Thomson scattering for high-temperature fusion plasmas. Physica Scripta, 89(12), p.128001.`
 
+    :param LaserProfile laser_profile: Laser profile object.
+    :param LaserSpectrum laser_spectrum: Laser spectrum object.
+    :param Plasma plasma: Plasma object.
+    :param bool tabulated: If True, the scattered spectrum is taken from precomputed tables instead of
+      being calculated for every laser spectral bin at every sample point. For each scattering angle
+      (rounded to angle_resolution) and spectral layout (min_wavelength, max_wavelength, bins), the
+      scattering function convolved with the laser spectrum is tabulated on a logarithmic electron
+      temperature grid (50 points per decade) and is linearly interpolated in log(Te). Electron
+      temperatures outside te_range are calculated directly. At most 64 tables are kept in memory,
+      the least recently used table is discarded first. Defaults to False.
+    :param tuple te_range: The electron temperature range (min, max) of the tables in eV.
+      Defaults to (1, 2e4).
+    :param float angle_resolution: The scattering angle resolution of the tables in degrees.
+      Defaults to 0.1.
+
+    :ivar bool tabulated: Use the precomputed scattering tables.
+    :ivar tuple te_range: The electron temperature range of the tables in eV.
+    :ivar float angle_resolution: The scattering angle resolution of the tables in degrees.
     """
 
-    def __init__(self, LaserProfile laser_profile=None, LaserSpectrum laser_spectrum=None, Plasma plasma=None):
+    def __init__(self, LaserProfile laser_profile=None, LaserSpectrum laser_spectrum=None, Plasma plasma=None,
+                 bint tabulated=False, tuple te_range=(1, 2e4), double angle_resolution=0.1):
 
         super().__init__(laser_profile, laser_spectrum, plasma)
 
+        self._kernel_tables = {}
+        self._kernel_laser_power = None
+        self.tabulated = tabulated
+        self.te_range = te_range
+        self.angle_resolution = angle_resolution
+
         # Selden, A.C., 1980. Simple analytic form of the relativistic Thomson scattering spectrum. Physics Letters A, 79(5-6), pp.405-406.
         self._CONST_ALPHA = ELECTRON_REST_MASS * SPEED_OF_LIGHT ** 2 / (2 * ELEMENTARY_CHARGE)  #constant alpha, rewritten for Te in eV
         
@@ -74,6 +108,49 @@ cdef class SeldenMatobaThomsonSpectrum(LaserModel):
 
         self._RECIP_M_PI = 1 / M_PI
 
+    @property
+    def tabulated(self):
+        return self._tabulated
+
+    @tabulated.setter
+    def tabulated(self, bint value):
+        self._tabulated = value
+
+    @property
+    def te_range(self):
+        return self._te_range
+
+    @te_range.setter
+    def te_range(self, tuple value):
+
+        cdef int size
+
+        te_min, te_max = value
+        if te_min <= 0:
+            raise ValueError("The minimum electron temperature must be greater than zero.")
+
+        size = int(np.floor((np.log10(te_max) - np.log10(te_min)) * TE_TABLE_POINTS_PER_DECADE)) + 1
+        if size < 2:
+            raise ValueError("The electron temperature range is too narrow.")
+
+        self._te_range = (te_min, te_max)
+        self._log_te_min = np.log10(te_min)
+        self._te_table_size = size
+        self._kernel_tables = {}
+
+    @property
+    def angle_resolution(self):
+        return self._angle_resolution
+
+    @angle_resolution.setter
+    def angle_resolution(self, double value):
+
+        if value <= 0:
+            raise ValueError("The angle resolution must be greater than zero.")
+
+        self._angle_resolution = value
+        self._kernel_tables = {}
+
     @cython.cdivision(True)
     cdef double seldenmatoba_spectral_shape(self, double epsilon, double const_theta, double alpha):
 
@@ -93,7 +170,7 @@ cdef class SeldenMatobaThomsonSpectrum(LaserModel):
     cpdef Spectrum emission(self, Point3D point_plasma, Vector3D observation_plasma, Point3D point_laser,
                             Vector3D observation_laser, Spectrum spectrum):
         cdef:
-            double angle_scattering, angle_pointing, angle_polarization
+            double angle_scattering, angle_pointing, angle_polarization, position
             double te, ne, laser_energy_density, laser_energy
             double plasma_x, plasma_y, plasma_z, laser_x, laser_y, laser_z
             double[::1] laser_wavelength_mv, laser_spectrum_power_mv
@@ -140,6 +217,12 @@ cdef class SeldenMatobaThomsonSpectrum(LaserModel):
         polarisation_vector = self._laser_profile.get_polarization(laser_x, laser_y, laser_z)
         angle_polarization = observation_laser.angle(polarisation_vector) # scattering direction is the opposite to obervation direction
 
+        if self._tabulated:
+            position = (log10(te) - self._log_te_min) * TE_TABLE_POINTS_PER_DECADE
+            if 0 <= position <= self._te_table_size - 1:
+                return self._add_tabulated_contribution(ne, position, laser_energy_density, angle_scattering,
+                                                        angle_polarization, spectrum)
+
         laser_wavelength_mv = self._laser_spectrum.wavelengths_mv
         laser_spectrum_power_mv = self._laser_spectrum.power_mv  # power in spectral bins (PSD * delta wavelength)
         bins = self._laser_spectrum.get_spectral_bins()
@@ -189,6 +272,83 @@ cdef class SeldenMatobaThomsonSpectrum(LaserModel):
 
         return spectrum
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    @cython.initializedcheck(False)
+    cdef Spectrum _add_tabulated_contribution(self, double ne, double position, double laser_energy_density, double angle_scattering,
+                                              double angle_polarization, Spectrum spectrum):
+        """
+        Adds the scattered spectrum interpolated from the kernel table of the scattering angle.
+
+        :param position: Position of the electron temperature on the table grid.
+        """
+
+        cdef:
+            double[:, ::1] kernel
+            double scattered_power, weight
+            int index, i
+
+        kernel = self._get_kernel_table(angle_scattering, spectrum)
+
+        index = min(<int> position, self._te_table_size - 2)
+        weight = position - index
+
+        # dipole radiation has a cos ** 2 characteristic, here angle shifted by 90 deg
+        scattered_power = ne * self._RATE_TS * laser_energy_density * sin(angle_polarization * DEGREES_TO_RADIANS) ** 2
+
+        for i in range(spectrum.bins):
+            spectrum.samples_mv[i] += scattered_power * ((1 - weight) * kernel[index, i] + weight * kernel[index + 1, i])
+
+        return spectrum
+
+    cdef double[:, ::1] _get_kernel_table(self, double angle_scattering, Spectrum spectrum):
+        """
+        Returns the scattering function convolved with the laser spectrum,
+        sum(P_L * S(wavelength / wavelength_L - 1) / wavelength_L), tabulated on
+        the electron temperature grid for the spectral bins.
+        """
+
+        cdef:
+            long angle_index
+            double const_theta
+
+        # the laser spectrum allocates new arrays whenever its parameters change
+        if self._laser_spectrum._power is not self._kernel_laser_power:
+            self._kernel_tables = {}
+            self._kernel_laser_power = self._laser_spectrum._power
+
+        angle_index = <long> round(angle_scattering / self._angle_resolution)
+        key = (angle_index, spectrum.min_wavelength, spectrum.max_wavelength, spectrum.bins)
+        try:
+            # move the table to the end of the (insertion ordered) dict, marking it as most recently used
+            kernel = self._kernel_tables.pop(key)
+            self._kernel_tables[key] = kernel
+            return kernel
+        except KeyError:
+            pass
+
+        const_theta = 2 * (1 - cos(angle_index * self._angle_resolution * DEGREES_TO_RADIANS))
+
+        te = 10 ** (self._log_te_min + np.arange(self._te_table_size) / TE_TABLE_POINTS_PER_DECADE)
+        alpha = self._CONST_ALPHA / te[:, np.newaxis]
+        c = np.sqrt(alpha * self._RECIP_M_PI) * (1 - 15. / (16. * alpha) + 345. / (512. * alpha ** 2))
+
+        wavelengths = spectrum.min_wavelength + (0.5 + np.arange(spectrum.bins)) * spectrum.delta_wavelength
+
+        kernel = np.zeros((self._te_table_size, spectrum.bins))
+        for laser_wavelength, laser_power in zip(self._laser_spectrum.wavelengths, self._laser_spectrum._power):
+            if laser_power > 0:
+                epsilon = wavelengths / laser_wavelength - 1
+                a = (1 + epsilon) ** 3 * np.sqrt(const_theta * (1 + epsilon) + epsilon ** 2)
+                b = np.sqrt(1 + epsilon ** 2 / (const_theta * (1 + epsilon))) - 1
+                kernel += laser_power / laser_wavelength * c / a * np.exp(-2 * alpha * b)
+
+        if len(self._kernel_tables) >= KERNEL_TABLE_CACHE_SIZE:
+            del self._kernel_tables[next(iter(self._kernel_tables))]
+
+        self._kernel_tables[key] = kernel
+        return kernel
+
     cpdef Spectrum calculate_spectrum(self, double ne, double te, double laser_energy_density, double laser_wavelength,
                                       double observation_angle, double angle_polarization, Spectrum spectrum):
         """
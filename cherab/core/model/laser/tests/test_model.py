@@ -86,6 +86,40 @@ class TestScatteringModel(unittest.TestCase):
                                             .format(180 - obsangle, vte, traced_spectrum.wavelengths[index]))
 
 
+    def test_tabulated_scattered_spectrum(self):
+
+        ray_origin = Point3D(0, 0, 0)
+        ray_direction = Vector3D(1, 0, 1).normalise()
+
+        # the highest temperature is outside the temperature range of the tables
+        for vte in [10, 1e3, 1e4, 5e4]:
+            world = World()
+            plasma = build_constant_slab_plasma(length=1, width=1, height=1, electron_density=8e19,
+                                                electron_temperature=vte, plasma_species=[], parent=world)
+
+            laser = Laser()
+            laser.parent = world
+            laser.transform = translate(0.05, 0, -0.5)
+            laser.laser_profile = UniformEnergyDensity(laser_length=1, laser_radius=0.015)
+            laser.laser_spectrum = ConstantSpectrum(1055, 1065, 20)
+            laser.plasma = plasma
+
+            ray = Ray(origin=ray_origin, direction=ray_direction, min_wavelength=600, max_wavelength=1200, bins=800)
+
+            laser.models = [SeldenMatobaThomsonSpectrum()]
+            test_spectrum = ray.trace(world).samples
+
+            laser.models = [SeldenMatobaThomsonSpectrum(tabulated=True)]
+            for _ in range(2):  # the second trace uses the cached tables
+                traced_spectrum = ray.trace(world).samples
+                np.testing.assert_allclose(traced_spectrum, test_spectrum, rtol=0, atol=1.e-3 * test_spectrum.max(),
+                                           err_msg="Tabulated and calculated spectra do not match: Te = {} eV.".format(vte))
+
+        with self.assertRaises(ValueError):
+            SeldenMatobaThomsonSpectrum(te_range=(1, 1.01))
+        with self.assertRaises(ValueError):
+            SeldenMatobaThomsonSpectrum(angle_resolution=0)
+
 def _selden_matoba_shape(wavelength, te, obsangle, laser_wavelength):
     """
     Returns Selden-Matoba Spectral shape
@@ -21,7 +21,7 @@
 from raysect.optical cimport Spectrum, Point3D, Vector3D
 from cherab.core.atomic cimport Line
 from cherab.core.species cimport Species
-from cherab.core.plasma cimport Plasma
+from cherab.core.plasma cimport Plasma, PlasmaState
 from cherab.core.atomic cimport AtomicData
 from cherab.core.math.integrators cimport Integrator1D
 
@@ -37,3 +37,7 @@ cdef class LineShapeModel:
         Integrator1D integrator
 
     cpdef Spectrum add_line(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum)
+
+    cpdef Spectrum add_line_with_state(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum, PlasmaState state)
+
+    cpdef tuple spectral_range(self)
@@ -18,6 +18,8 @@
 # See the Licence for the specific language governing permissions and limitations
 # under the Licence.
 
+from libc.math cimport INFINITY
+
 
 cdef class LineShapeModel:
     """
@@ -43,3 +45,25 @@ cdef class LineShapeModel:
 
     cpdef Spectrum add_line(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum):
         raise NotImplementedError('Child lineshape class must implement this method.')
+
+    cpdef Spectrum add_line_with_state(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum, PlasmaState state):
+        """
+        Adds the line to the spectrum, reading the plasma parameters from a shared plasma state.
+
+        The default implementation ignores the state and calls add_line().
+        """
+
+        return self.add_line(radiance, point, direction, spectrum)
+
+    cpdef tuple spectral_range(self):
+        """
+        Returns the wavelength range outside of which the line shape adds negligible emission.
+
+        The range is estimated from the plasma parameter bounds (Plasma.max_temperature,
+        Plasma.max_velocity and Plasma.max_b_field). The default implementation returns
+        an unbounded range.
+
+        :return: A tuple (lower, upper) with the wavelength bounds in nm.
+        """
+
+        return 0., INFINITY
@@ -35,3 +35,5 @@ cdef class BeamLineShapeModel:
 
     cpdef Spectrum add_line(self, double radiance, Point3D beam_point, Point3D plasma_point,
                             Vector3D beam_direction, Vector3D observation_direction, Spectrum spectrum)
+
+    cpdef tuple spectral_range(self)
@@ -18,6 +18,8 @@
 # See the Licence for the specific language governing permissions and limitations
 # under the Licence.
 
+from libc.math cimport INFINITY
+
 
 cdef class BeamLineShapeModel:
     """
@@ -39,3 +41,14 @@ cdef class BeamLineShapeModel:
     cpdef Spectrum add_line(self, double radiance, Point3D beam_point, Point3D plasma_point,
                             Vector3D beam_direction, Vector3D observation_direction, Spectrum spectrum):
         raise NotImplementedError('Child lineshape class must implement this method.')
+
+    cpdef tuple spectral_range(self):
+        """
+        Returns the wavelength range outside of which the line shape adds negligible emission.
+
+        The default implementation returns an unbounded range.
+
+        :return: A tuple (lower, upper) with the wavelength bounds in nm.
+        """
+
+        return 0., INFINITY
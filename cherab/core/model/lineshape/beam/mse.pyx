@@ -27,7 +27,7 @@ from cherab.core.atomic cimport AtomicData
 from cherab.core.atomic cimport Line
 from cherab.core.math.function cimport autowrap_function1d, autowrap_function2d
 from cherab.core.utility.constants cimport ATOMIC_MASS, ELEMENTARY_CHARGE
-from cherab.core.model.lineshape.gaussian cimport add_gaussian_line
+from cherab.core.model.lineshape.gaussian cimport add_gaussian_line, gaussian_line_range
 from cherab.core.model.lineshape.doppler cimport thermal_broadening, doppler_shift
 
 cimport cython
@@ -133,3 +133,17 @@ cdef class BeamEmissionMultiplet(BeamLineShapeModel):
         spectrum = add_gaussian_line(intensity_pi * intensity_pi4, central_wavelength - 4 * stark_split, sigma, spectrum)
 
         return spectrum
+
+    cpdef tuple spectral_range(self):
+
+        cdef double speed, sigma, stark_split, lower_wavelength, upper_wavelength
+
+        # the beam emission is Doppler shifted by up to the full beam speed
+        speed = evamu_to_ms(self.beam.get_energy())
+        sigma = thermal_broadening(self.wavelength, self.beam.get_temperature(), self.beam.get_element().atomic_weight)
+        lower_wavelength, upper_wavelength = gaussian_line_range(self.wavelength, self.wavelength, speed, sigma)
+
+        # the outermost pi components are split by four times the Stark splitting
+        stark_split = 4 * fabs(STARK_SPLITTING_FACTOR * speed * self.beam.get_plasma().max_b_field)
+
+        return lower_wavelength - stark_split, upper_wavelength + stark_split
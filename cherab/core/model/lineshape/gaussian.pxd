@@ -24,6 +24,8 @@ from cherab.core.model.lineshape.base cimport LineShapeModel
 
 cpdef Spectrum add_gaussian_line(double radiance, double wavelength, double sigma, Spectrum spectrum)
 
+cdef tuple gaussian_line_range(double lower_wavelength, double upper_wavelength, double max_velocity, double sigma)
+
 
 cdef class GaussianLine(LineShapeModel):
     pass
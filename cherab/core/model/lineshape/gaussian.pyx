@@ -18,13 +18,14 @@
 # See the Licence for the specific language governing permissions and limitations
 # under the Licence.
 
-from libc.math cimport erf, M_SQRT2, floor, ceil
+from libc.math cimport erf, M_SQRT2, floor, ceil, INFINITY
 from raysect.optical cimport Point3D, Vector3D
 
 from cherab.core.atomic cimport Line, AtomicData
 from cherab.core.species cimport Species
-from cherab.core.plasma cimport Plasma
+from cherab.core.plasma cimport Plasma, PlasmaState, new_plasma_state
 from cherab.core.model.lineshape.doppler cimport doppler_shift, thermal_broadening
+from cherab.core.utility.constants cimport SPEED_OF_LIGHT
 
 cimport cython
 
@@ -90,6 +91,28 @@ cpdef Spectrum add_gaussian_line(double radiance, double wavelength, double sigm
     return spectrum
 
 
+@cython.cdivision(True)
+cdef tuple gaussian_line_range(double lower_wavelength, double upper_wavelength, double max_velocity, double sigma):
+    """
+    Returns the wavelength range covered by Gaussian lines of width sigma, centred between
+    the lower and upper wavelengths and Doppler shifted by a velocity of up to max_velocity.
+    """
+
+    cdef double cutoff, lower, upper
+
+    cutoff = GAUSSIAN_CUTOFF_SIGMA * sigma
+    lower = max(0, lower_wavelength) * (1 - max_velocity / SPEED_OF_LIGHT) - cutoff
+    upper = upper_wavelength * (1 + max_velocity / SPEED_OF_LIGHT) + cutoff
+
+    # unbounded plasma parameters give an unbounded range (the comparisons also catch NaNs)
+    if not lower > 0:
+        lower = 0
+    if not upper < INFINITY:
+        upper = INFINITY
+
+    return lower, upper
+
+
 cdef class GaussianLine(LineShapeModel):
     """
     Produces Gaussian line shape.
@@ -115,20 +138,23 @@ cdef class GaussianLine(LineShapeModel):
 
         super().__init__(line, wavelength, target_species, plasma, atomic_data)
 
+    cpdef Spectrum add_line(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum):
+        return self.add_line_with_state(radiance, point, direction, spectrum, new_plasma_state(self.plasma, point))
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.initializedcheck(False)
     @cython.cdivision(True)
-    cpdef Spectrum add_line(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum):
+    cpdef Spectrum add_line_with_state(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum, PlasmaState state):
 
         cdef double ts, sigma, shifted_wavelength
         cdef Vector3D ion_velocity
 
-        ts = self.target_species.distribution.effective_temperature(point.x, point.y, point.z)
+        ts = state.species_temperature(self.target_species)
         if ts <= 0.0:
             return spectrum
 
-        ion_velocity = self.target_species.distribution.bulk_velocity(point.x, point.y, point.z)
+        ion_velocity = state.species_velocity(self.target_species)
 
         # calculate emission line central wavelength, doppler shifted along observation direction
         shifted_wavelength = doppler_shift(self.wavelength, direction, ion_velocity)
@@ -137,3 +163,11 @@ cdef class GaussianLine(LineShapeModel):
         sigma = thermal_broadening(self.wavelength, ts, self.line.element.atomic_weight)
 
         return add_gaussian_line(radiance, shifted_wavelength, sigma, spectrum)
+
+    cpdef tuple spectral_range(self):
+
+        cdef double sigma
+
+        sigma = thermal_broadening(self.wavelength, self.plasma.max_temperature, self.line.element.atomic_weight)
+
+        return gaussian_line_range(self.wavelength, self.wavelength, self.plasma.max_velocity, sigma)
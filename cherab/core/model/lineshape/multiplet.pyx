@@ -24,9 +24,9 @@ from raysect.optical cimport Spectrum, Point3D, Vector3D
 
 from cherab.core.atomic cimport Line, AtomicData
 from cherab.core.species cimport Species
-from cherab.core.plasma cimport Plasma
+from cherab.core.plasma cimport Plasma, PlasmaState, new_plasma_state
 from cherab.core.model.lineshape.doppler cimport doppler_shift, thermal_broadening
-from cherab.core.model.lineshape.gaussian cimport add_gaussian_line
+from cherab.core.model.lineshape.gaussian cimport add_gaussian_line, gaussian_line_range
 
 cimport cython
 
@@ -87,19 +87,22 @@ cdef class MultipletLineShape(LineShapeModel):
         self._multiplet = multiplet
         self._multiplet_mv = self._multiplet
 
+    cpdef Spectrum add_line(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum):
+        return self.add_line_with_state(radiance, point, direction, spectrum, new_plasma_state(self.plasma, point))
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.initializedcheck(False)
-    cpdef Spectrum add_line(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum):
+    cpdef Spectrum add_line_with_state(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum, PlasmaState state):
 
         cdef double ts, sigma, shifted_wavelength, component_wavelength, component_radiance
         cdef Vector3D ion_velocity
 
-        ts = self.target_species.distribution.effective_temperature(point.x, point.y, point.z)
+        ts = state.species_temperature(self.target_species)
         if ts <= 0.0:
             return spectrum
 
-        ion_velocity = self.target_species.distribution.bulk_velocity(point.x, point.y, point.z)
+        ion_velocity = state.species_velocity(self.target_species)
 
         # calculate the line width
         sigma = thermal_broadening(self.wavelength, ts, self.line.element.atomic_weight)
@@ -115,3 +118,12 @@ cdef class MultipletLineShape(LineShapeModel):
             spectrum = add_gaussian_line(component_radiance, shifted_wavelength, sigma, spectrum)
 
         return spectrum
+
+    cpdef tuple spectral_range(self):
+
+        cdef double sigma
+
+        sigma = thermal_broadening(self.wavelength, self.plasma.max_temperature, self.line.element.atomic_weight)
+
+        return gaussian_line_range(self._multiplet[MULTIPLET_WAVELENGTH].min(), self._multiplet[MULTIPLET_WAVELENGTH].max(),
+                                   self.plasma.max_velocity, sigma)
@@ -26,7 +26,7 @@ from raysect.optical cimport Point3D, Vector3D
 
 from cherab.core.atomic cimport Line, AtomicData
 from cherab.core.species cimport Species
-from cherab.core.plasma cimport Plasma
+from cherab.core.plasma cimport Plasma, PlasmaState, new_plasma_state
 from cherab.core.atomic.elements import hydrogen, deuterium, tritium
 from cherab.core.math.function cimport autowrap_function1d, autowrap_function2d
 from cherab.core.math.integrators cimport GaussianQuadrature
@@ -244,11 +244,14 @@ cdef class StarkBroadenedLine(ZeemanLineShapeModel):
 
         self._weight_poly_coeff = [5.14820e-04, 1.38821e+00, -9.60424e-02, -3.83995e-02, -7.40042e-03, -5.47626e-04]
 
+    cpdef Spectrum add_line(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum):
+        return self.add_line_with_state(radiance, point, direction, spectrum, new_plasma_state(self.plasma, point))
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.initializedcheck(False)
     @cython.cdivision(True)
-    cpdef Spectrum add_line(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum):
+    cpdef Spectrum add_line_with_state(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum, PlasmaState state):
 
         cdef:
             double ne, te, ts, shifted_wavelength, photon_energy, b_magn, comp_radiance, cos_sqr, sin_sqr
@@ -256,13 +259,13 @@ cdef class StarkBroadenedLine(ZeemanLineShapeModel):
             cdef Vector3D ion_velocity, b_field
             int i
 
-        ne = self.plasma.get_electron_distribution().density(point.x, point.y, point.z)
+        ne = state.electron_density()
 
-        te = self.plasma.get_electron_distribution().effective_temperature(point.x, point.y, point.z)
+        te = state.electron_temperature()
 
         fwhm_lorentz = self._cij * ne**self._aij / (te**self._bij) if ne > 0 and te > 0 else 0
 
-        ts = self.target_species.distribution.effective_temperature(point.x, point.y, point.z)
+        ts = state.species_temperature(self.target_species)
 
         fwhm_gauss = _SIGMA2FWHM * thermal_broadening(self.wavelength, ts, self.line.element.atomic_weight) if ts > 0 else 0
 
@@ -302,13 +305,13 @@ cdef class StarkBroadenedLine(ZeemanLineShapeModel):
 
         gauss_weight = 1 - lorentz_weight
 
-        ion_velocity = self.target_species.distribution.bulk_velocity(point.x, point.y, point.z)
+        ion_velocity = state.species_velocity(self.target_species)
 
         # calculate emission line central wavelength, doppler shifted along observation direction
         shifted_wavelength = doppler_shift(self.wavelength, direction, ion_velocity)
 
         # obtain magnetic field
-        b_field = self.plasma.get_b_field().evaluate(point.x, point.y, point.z)
+        b_field = state.b_field()
         b_magn = b_field.get_length()
 
         if b_magn == 0:
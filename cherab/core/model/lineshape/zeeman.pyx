@@ -18,17 +18,17 @@
 # See the Licence for the specific language governing permissions and limitations
 # under the Licence.
 
-from libc.math cimport sqrt
+from libc.math cimport sqrt, pow, INFINITY
 from raysect.optical cimport Spectrum, Point3D, Vector3D
 
 from cherab.core.atomic cimport Line, AtomicData
 from cherab.core.species cimport Species
-from cherab.core.plasma cimport Plasma
+from cherab.core.plasma cimport Plasma, PlasmaState, new_plasma_state
 from cherab.core.atomic.elements import hydrogen, deuterium, tritium, helium, helium3, beryllium, boron, carbon, nitrogen, oxygen, neon
 from cherab.core.math.integrators cimport Integrator1D
 from cherab.core.utility.constants cimport BOHR_MAGNETON, HC_EV_NM
 from cherab.core.model.lineshape.doppler cimport doppler_shift, thermal_broadening
-from cherab.core.model.lineshape.gaussian cimport add_gaussian_line
+from cherab.core.model.lineshape.gaussian cimport add_gaussian_line, gaussian_line_range
 
 cimport cython
 
@@ -106,20 +106,23 @@ cdef class ZeemanTriplet(ZeemanLineShapeModel):
 
         super().__init__(line, wavelength, target_species, plasma, atomic_data, polarisation)
 
+    cpdef Spectrum add_line(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum):
+        return self.add_line_with_state(radiance, point, direction, spectrum, new_plasma_state(self.plasma, point))
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.initializedcheck(False)
     @cython.cdivision(True)
-    cpdef Spectrum add_line(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum):
+    cpdef Spectrum add_line_with_state(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum, PlasmaState state):
 
         cdef double ts, sigma, shifted_wavelength, photon_energy, b_magn, component_radiance, cos_sqr, sin_sqr
         cdef Vector3D ion_velocity, b_field
 
-        ts = self.target_species.distribution.effective_temperature(point.x, point.y, point.z)
+        ts = state.species_temperature(self.target_species)
         if ts <= 0.0:
             return spectrum
 
-        ion_velocity = self.target_species.distribution.bulk_velocity(point.x, point.y, point.z)
+        ion_velocity = state.species_velocity(self.target_species)
 
         # calculate emission line central wavelength, doppler shifted along observation direction
         shifted_wavelength = doppler_shift(self.wavelength, direction, ion_velocity)
@@ -128,7 +131,7 @@ cdef class ZeemanTriplet(ZeemanLineShapeModel):
         sigma = thermal_broadening(self.wavelength, ts, self.line.element.atomic_weight)
 
         # obtain magnetic field
-        b_field = self.plasma.get_b_field().evaluate(point.x, point.y, point.z)
+        b_field = state.b_field()
         b_magn = b_field.get_length()
 
         if b_magn == 0:
@@ -161,6 +164,21 @@ cdef class ZeemanTriplet(ZeemanLineShapeModel):
 
         return spectrum
 
+    @cython.cdivision(True)
+    cpdef tuple spectral_range(self):
+
+        cdef double sigma, photon_energy, zeeman_energy, lower_wavelength, upper_wavelength
+
+        sigma = thermal_broadening(self.wavelength, self.plasma.max_temperature, self.line.element.atomic_weight)
+
+        # the sigma components are the outermost components of the triplet
+        photon_energy = HC_EV_NM / self.wavelength
+        zeeman_energy = BOHR_MAGNETON * self.plasma.max_b_field
+        lower_wavelength = HC_EV_NM / (photon_energy + zeeman_energy)
+        upper_wavelength = HC_EV_NM / (photon_energy - zeeman_energy) if zeeman_energy < photon_energy else INFINITY
+
+        return gaussian_line_range(lower_wavelength, upper_wavelength, self.plasma.max_velocity, sigma)
+
 
 cdef class ParametrisedZeemanTriplet(ZeemanLineShapeModel):
     r"""
@@ -212,20 +230,23 @@ cdef class ParametrisedZeemanTriplet(ZeemanLineShapeModel):
         except KeyError:
             raise ValueError('Data for {} is not available.'.format(self.line))
 
+    cpdef Spectrum add_line(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum):
+        return self.add_line_with_state(radiance, point, direction, spectrum, new_plasma_state(self.plasma, point))
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.initializedcheck(False)
     @cython.cdivision(True)
-    cpdef Spectrum add_line(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum):
+    cpdef Spectrum add_line_with_state(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum, PlasmaState state):
 
         cdef double ts, sigma, shifted_wavelength, b_magn, component_radiance, cos_sqr, sin_sqr
         cdef Vector3D ion_velocity, b_field
 
-        ts = self.target_species.distribution.effective_temperature(point.x, point.y, point.z)
+        ts = state.species_temperature(self.target_species)
         if ts <= 0.0:
             return spectrum
 
-        ion_velocity = self.target_species.distribution.bulk_velocity(point.x, point.y, point.z)
+        ion_velocity = state.species_velocity(self.target_species)
 
         # calculate emission line central wavelength, doppler shifted along observation direction
         shifted_wavelength = doppler_shift(self.wavelength, direction, ion_velocity)
@@ -237,7 +258,7 @@ cdef class ParametrisedZeemanTriplet(ZeemanLineShapeModel):
         sigma *= sqrt(1. + self._beta * self._beta * ts**(2. * self._gamma))
 
         # obtain magnetic field
-        b_field = self.plasma.get_b_field().evaluate(point.x, point.y, point.z)
+        b_field = state.b_field()
         b_magn = b_field.get_length()
 
         if b_magn == 0:
@@ -267,6 +288,26 @@ cdef class ParametrisedZeemanTriplet(ZeemanLineShapeModel):
 
         return spectrum
 
+    @cython.cdivision(True)
+    cpdef tuple spectral_range(self):
+
+        cdef double ts, sigma, split
+
+        # the fine structure broadening is unbounded at low temperature if (1 + 2 gamma) < 0
+        if 1. + 2. * self._gamma < 0:
+            return 0., INFINITY
+
+        ts = self.plasma.max_temperature
+        if ts > 0:
+            sigma = thermal_broadening(self.wavelength, ts, self.line.element.atomic_weight)
+            sigma *= sqrt(1. + self._beta * self._beta * pow(ts, 2. * self._gamma))
+        else:
+            sigma = 0
+
+        split = 0.5 * self._alpha * self.plasma.max_b_field
+
+        return gaussian_line_range(self.wavelength - split, self.wavelength + split, self.plasma.max_velocity, sigma)
+
 
 cdef class ZeemanMultiplet(ZeemanLineShapeModel):
     r"""
@@ -301,28 +342,31 @@ cdef class ZeemanMultiplet(ZeemanLineShapeModel):
 
         self._zeeman_structure = zeeman_structure or self.atomic_data.zeeman_structure(line)
 
+    cpdef Spectrum add_line(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum):
+        return self.add_line_with_state(radiance, point, direction, spectrum, new_plasma_state(self.plasma, point))
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.initializedcheck(False)
     @cython.cdivision(True)
-    cpdef Spectrum add_line(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum):
+    cpdef Spectrum add_line_with_state(self, double radiance, Point3D point, Vector3D direction, Spectrum spectrum, PlasmaState state):
 
         cdef int i
         cdef double ts, sigma, shifted_wavelength, component_radiance, b_magn, cos_sqr, sin_sqr
         cdef Vector3D ion_velocity, b_field
         cdef double[:, :] multiplet_mv
 
-        ts = self.target_species.distribution.effective_temperature(point.x, point.y, point.z)
+        ts = state.species_temperature(self.target_species)
         if ts <= 0.0:
             return spectrum
 
-        ion_velocity = self.target_species.distribution.bulk_velocity(point.x, point.y, point.z)
+        ion_velocity = state.species_velocity(self.target_species)
 
         # calculate the line width
         sigma = thermal_broadening(self.wavelength, ts, self.line.element.atomic_weight)
 
         # obtain magnetic field
-        b_field = self.plasma.get_b_field().evaluate(point.x, point.y, point.z)
+        b_field = state.b_field()
         b_magn = b_field.get_length()
 
         if b_magn == 0:
@@ -19,6 +19,7 @@
 # cython: language_level=3
 
 from numpy cimport ndarray
+from raysect.optical cimport Spectrum
 from cherab.core.math cimport Function1D
 from cherab.core.math.integrators cimport Integrator1D
 from cherab.core.atomic cimport FreeFreeGauntFactor
@@ -35,11 +36,26 @@ cdef class BremsFunction(Function1D):
         double[::1] species_charge_mv
 
 
+cdef class _SpectralTable:
+
+    cdef:
+        double[::1] inv_upper_wavelength, inv_wavelength_width, centre_wavelength, work
+        dict gaunt_factor
+
+
 cdef class Bremsstrahlung(PlasmaModel):
 
     cdef:
         BremsFunction _brems_func
         bint _user_provided_gaunt_factor
         Integrator1D _integrator
+        bint _tabulated
+        dict _spectral_tables
 
     cdef int _populate_cache(self) except -1
+
+    cdef Spectrum _add_tabulated_emission(self, Spectrum spectrum)
+
+    cdef _SpectralTable _get_spectral_table(self, Spectrum spectrum)
+
+    cdef double[:, ::1] _get_gaunt_table(self, _SpectralTable table, double z)
@@ -21,10 +21,11 @@
 import numpy as np
 from raysect.optical cimport Spectrum, Point3D, Vector3D
 from cherab.core cimport Plasma, AtomicData
+from cherab.core.plasma cimport PlasmaState, new_plasma_state
 from cherab.core.math.integrators cimport GaussianQuadrature
 from cherab.core.species cimport Species
 from cherab.core.utility.constants cimport RECIP_4_PI, ELEMENTARY_CHARGE, SPEED_OF_LIGHT, PLANCK_CONSTANT, ELECTRON_REST_MASS, VACUUM_PERMITTIVITY
-from libc.math cimport sqrt, log, exp, M_PI
+from libc.math cimport sqrt, log, log10, exp, expm1, M_PI
 cimport cython
 
 
@@ -35,6 +36,11 @@ BREMS_CONST *= 32 * M_PI**2 / (3 * sqrt(3) * ELECTRON_REST_MASS**2 * SPEED_OF_LI
 BREMS_CONST *= sqrt(2 * ELECTRON_REST_MASS / (M_PI * ELEMENTARY_CHARGE))
 BREMS_CONST *= SPEED_OF_LIGHT * 1e9 * RECIP_4_PI
 
+# electron temperature grid of the tabulated Gaunt factor: 0.1 eV - 100 keV
+cdef double GAUNT_TABLE_LOG_TE_MIN = -1
+cdef double GAUNT_TABLE_POINTS_PER_DECADE = 20
+cdef int GAUNT_TABLE_SIZE = 121
+
 
 cdef class BremsFunction(Function1D):
     """
@@ -90,6 +96,14 @@ cdef class BremsFunction(Function1D):
         return radiance
 
 
+cdef class _SpectralTable:
+    """
+    Wavelength-dependent factors of the tabulated bremsstrahlung calculation for a spectral layout.
+    """
+
+    pass
+
+
 # todo: doppler shift?
 cdef class Bremsstrahlung(PlasmaModel):
     """
@@ -124,12 +138,23 @@ cdef class Bremsstrahlung(PlasmaModel):
                                             the `atomic_data` is used.
     :ivar Integrator1D integrator: Integrator1D instance to integrate Bremsstrahlung radiation
                                    over the spectral bin. Default is `GaussianQuadrature`.
+    :ivar bool tabulated: If True, the fast tabulated calculation is used instead of
+                          the integrator. The Gaunt factor is tabulated for every species
+                          charge at the centres of the spectral bins on a logarithmic
+                          electron temperature grid (0.1 eV - 100 keV, 20 points per decade)
+                          and is linearly interpolated in :math:`\\log T_\\mathrm{e}`, the
+                          rest of the bremsstrahlung equation is integrated over the bins
+                          analytically. The tables are cached for each spectral layout
+                          (min_wavelength, max_wavelength, bins). Default is False.
     """
 
-    def __init__(self, Plasma plasma=None, AtomicData atomic_data=None, FreeFreeGauntFactor gaunt_factor=None, Integrator1D integrator=None):
+    def __init__(self, Plasma plasma=None, AtomicData atomic_data=None, FreeFreeGauntFactor gaunt_factor=None, Integrator1D integrator=None,
+                 bint tabulated=False):
 
         super().__init__(plasma, atomic_data)
 
+        self._spectral_tables = {}
+        self._tabulated = tabulated
         self._brems_func = BremsFunction.__new__(BremsFunction)
         self.gaunt_factor = gaunt_factor
         self.integrator = integrator or GaussianQuadrature()
@@ -147,6 +172,7 @@ cdef class Bremsstrahlung(PlasmaModel):
 
         self._brems_func.gaunt_factor = value
         self._user_provided_gaunt_factor = True if value else False
+        self._spectral_tables = {}
 
     @property
     def integrator(self):
@@ -159,14 +185,27 @@ cdef class Bremsstrahlung(PlasmaModel):
         self._integrator = value
         self._integrator.function = self._brems_func
 
+    @property
+    def tabulated(self):
+
+        return self._tabulated
+
+    @tabulated.setter
+    def tabulated(self, bint value):
+
+        self._tabulated = value
+
     def __repr__(self):
         return '<PlasmaModel - Bremsstrahlung>'
 
+    cpdef Spectrum emission(self, Point3D point, Vector3D direction, Spectrum spectrum):
+        return self.emission_with_state(point, direction, spectrum, new_plasma_state(self._plasma, point))
+
     @cython.cdivision(True)
     @cython.initializedcheck(False)
     @cython.boundscheck(False)
     @cython.wraparound(False)
-    cpdef Spectrum emission(self, Point3D point, Vector3D direction, Spectrum spectrum):
+    cpdef Spectrum emission_with_state(self, Point3D point, Vector3D direction, Spectrum spectrum, PlasmaState state):
 
         cdef:
             double ne, te
@@ -178,10 +217,10 @@ cdef class Bremsstrahlung(PlasmaModel):
         if self._brems_func.species_charge is None:
             self._populate_cache()
 
-        ne = self._plasma.get_electron_distribution().density(point.x, point.y, point.z)
+        ne = state.electron_density()
         if ne <= 0:
             return spectrum
-        te = self._plasma.get_electron_distribution().effective_temperature(point.x, point.y, point.z)
+        te = state.electron_temperature()
         if te <= 0:
             return spectrum
 
@@ -192,9 +231,12 @@ cdef class Bremsstrahlung(PlasmaModel):
         i = 0
         for species in self._plasma.get_composition():
             if species.charge > 0:
-                self._brems_func.species_density_mv[i] = species.distribution.density(point.x, point.y, point.z)
+                self._brems_func.species_density_mv[i] = state.species_density(species)
                 i += 1
 
+        if self._tabulated:
+            return self._add_tabulated_emission(spectrum)
+
         # add bremsstrahlung to spectrum
         lower_wavelength = spectrum.min_wavelength
         for i in range(spectrum.bins):
@@ -207,6 +249,111 @@ cdef class Bremsstrahlung(PlasmaModel):
 
         return spectrum
 
+    @cython.cdivision(True)
+    @cython.initializedcheck(False)
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef Spectrum _add_tabulated_emission(self, Spectrum spectrum):
+        """
+        Adds bremsstrahlung to the spectrum using the spectral table of the spectrum layout.
+
+        The Gaunt factor is taken at the bin centre, the rest of the bremsstrahlung
+        equation is integrated over the bin analytically:
+        :math:`\\int \\lambda^{-2} e^{-a / \\lambda} d\\lambda = e^{-a / \\lambda} / a`.
+        """
+
+        cdef:
+            _SpectralTable table
+            double[:, ::1] gaunt_table
+            double ne, te, ni, z, position, weight, exp_factor, pre_factor
+            int i, j, index, bins
+            bint in_table
+
+        table = self._get_spectral_table(spectrum)
+        bins = spectrum.bins
+        ne = self._brems_func.ne
+        te = self._brems_func.te
+
+        # position of the electron temperature on the Gaunt factor table grid
+        position = (log10(te) - GAUNT_TABLE_LOG_TE_MIN) * GAUNT_TABLE_POINTS_PER_DECADE
+        in_table = 0 <= position <= GAUNT_TABLE_SIZE - 1
+        index = 0
+        weight = 0
+        if in_table:
+            index = min(<int> position, GAUNT_TABLE_SIZE - 2)
+            weight = position - index
+
+        # sum of ni * gff * Z^2 over the charged species in each bin
+        table.work[:] = 0
+        for i in range(self._brems_func.species_charge_mv.shape[0]):
+            z = self._brems_func.species_charge_mv[i]
+            ni = self._brems_func.species_density_mv[i]
+            if ni <= 0:
+                continue
+
+            if in_table:
+                gaunt_table = self._get_gaunt_table(table, z)
+                for j in range(bins):
+                    table.work[j] += ni * z * z * ((1 - weight) * gaunt_table[index, j] + weight * gaunt_table[index + 1, j])
+            else:
+                for j in range(bins):
+                    table.work[j] += ni * z * z * self._brems_func.gaunt_factor.evaluate(z, te, table.centre_wavelength[j])
+
+        # exp(-a / upper) - exp(-a / lower) is calculated with expm1() to avoid the loss of precision at high Te
+        exp_factor = EXP_FACTOR / te
+        pre_factor = BREMS_CONST * ne / (sqrt(te) * exp_factor * spectrum.delta_wavelength)
+        for j in range(bins):
+            spectrum.samples_mv[j] -= pre_factor * table.work[j] * exp(-exp_factor * table.inv_upper_wavelength[j]) * expm1(-exp_factor * table.inv_wavelength_width[j])
+
+        return spectrum
+
+    cdef _SpectralTable _get_spectral_table(self, Spectrum spectrum):
+
+        cdef _SpectralTable table
+
+        key = (spectrum.min_wavelength, spectrum.max_wavelength, spectrum.bins)
+        try:
+            return self._spectral_tables[key]
+        except KeyError:
+            pass
+
+        edges = spectrum.min_wavelength + spectrum.delta_wavelength * np.arange(spectrum.bins + 1)
+        lower = edges[:-1]
+        upper = edges[1:]
+
+        table = _SpectralTable.__new__(_SpectralTable)
+        table.inv_upper_wavelength = 1 / upper
+        table.inv_wavelength_width = (upper - lower) / (upper * lower)  # 1 / lower - 1 / upper
+        table.centre_wavelength = 0.5 * (lower + upper)
+        table.work = np.zeros(spectrum.bins)
+        table.gaunt_factor = {}
+
+        self._spectral_tables[key] = table
+        return table
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef double[:, ::1] _get_gaunt_table(self, _SpectralTable table, double z):
+
+        cdef:
+            int i, j
+            double te
+            double[:, ::1] gaunt_table
+
+        try:
+            return table.gaunt_factor[z]
+        except KeyError:
+            pass
+
+        gaunt_table = np.empty((GAUNT_TABLE_SIZE, table.centre_wavelength.shape[0]))
+        for i in range(GAUNT_TABLE_SIZE):
+            te = 10 ** (GAUNT_TABLE_LOG_TE_MIN + i / GAUNT_TABLE_POINTS_PER_DECADE)
+            for j in range(table.centre_wavelength.shape[0]):
+                gaunt_table[i, j] = self._brems_func.gaunt_factor.evaluate(z, te, table.centre_wavelength[j])
+
+        table.gaunt_factor[z] = gaunt_table
+        return gaunt_table
+
     cdef int _populate_cache(self) except -1:
 
         cdef list species_charge
@@ -243,3 +390,4 @@ cdef class Bremsstrahlung(PlasmaModel):
         self._brems_func.species_charge_mv = None
         self._brems_func.species_density = None
         self._brems_func.species_density_mv = None
+        self._spectral_tables = {}
@@ -26,7 +26,7 @@ cdef class ExcitationLine(PlasmaModel):
 
     cdef:
         Line _line
-        double _wavelength
+        double _wavelength, _lower_wavelength, _upper_wavelength
         Species _target_species
         ImpactExcitationPEC _rates
         LineShapeModel _lineshape
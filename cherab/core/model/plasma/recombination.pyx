@@ -20,6 +20,7 @@
 
 from raysect.optical cimport Spectrum, Point3D, Vector3D
 from cherab.core cimport Plasma, AtomicData
+from cherab.core.plasma cimport PlasmaState, new_plasma_state
 from cherab.core.model.lineshape cimport doppler_shift, thermal_broadening, GaussianLine
 from cherab.core.utility.constants cimport RECIP_4_PI
 
@@ -76,6 +77,9 @@ cdef class RecombinationLine(PlasmaModel):
         return '<RecombinationLine: element={}, charge={}, transition={}>'.format(self._line.element.name, self._line.charge, self._line.transition)
 
     cpdef Spectrum emission(self, Point3D point, Vector3D direction, Spectrum spectrum):
+        return self.emission_with_state(point, direction, spectrum, new_plasma_state(self._plasma, point))
+
+    cpdef Spectrum emission_with_state(self, Point3D point, Vector3D direction, Spectrum spectrum, PlasmaState state):
 
         cdef double ne, ni, te, radiance
 
@@ -83,21 +87,29 @@ cdef class RecombinationLine(PlasmaModel):
         if self._target_species is None:
             self._populate_cache()
 
-        ne = self._plasma.get_electron_distribution().density(point.x, point.y, point.z)
+        ne = state.electron_density()
         if ne <= 0.0:
             return spectrum
 
-        te = self._plasma.get_electron_distribution().effective_temperature(point.x, point.y, point.z)
+        te = state.electron_temperature()
         if te <= 0.0:
             return spectrum
 
-        ni = self._target_species.distribution.density(point.x, point.y, point.z)
+        ni = state.species_density(self._target_species)
         if ni <= 0.0:
             return spectrum
 
         # add emission line to spectrum
         radiance = RECIP_4_PI * self._rates.evaluate(ne, te) * ne * ni
-        return self._lineshape.add_line(radiance, point, direction, spectrum)
+        return self._lineshape.add_line_with_state(radiance, point, direction, spectrum, state)
+
+    cpdef bint contributes(self, double min_wavelength, double max_wavelength) except -1:
+
+        # cache data on first run
+        if self._target_species is None:
+            self._populate_cache()
+
+        return self._lower_wavelength <= max_wavelength and self._upper_wavelength >= min_wavelength
 
     cdef int _populate_cache(self) except -1:
 
@@ -130,6 +142,9 @@ cdef class RecombinationLine(PlasmaModel):
         self._lineshape = self._lineshape_class(self._line, self._wavelength, self._target_species, self._plasma,
                                                 self._atomic_data, *self._lineshape_args, **self._lineshape_kwargs)
 
+        # spectral extent of the line, used to skip the rays outside of it
+        self._lower_wavelength, self._upper_wavelength = self._lineshape.spectral_range()
+
     def _change(self):
 
         # clear cache to force regeneration on first use
@@ -18,6 +18,7 @@
 
 from raysect.optical cimport Spectrum, Point3D, Vector3D
 from cherab.core cimport Plasma, AtomicData
+from cherab.core.plasma cimport PlasmaState, new_plasma_state
 from cherab.core.atomic cimport ThermalCXPEC
 from cherab.core.model.lineshape cimport GaussianLine, LineShapeModel
 from cherab.core.utility.constants cimport RECIP_4_PI
@@ -78,6 +79,9 @@ cdef class ThermalCXLine(PlasmaModel):
         return '<ThermalCXLine: element={}, charge={}, transition={}>'.format(self._line.element.name, self._line.charge, self._line.transition)
 
     cpdef Spectrum emission(self, Point3D point, Vector3D direction, Spectrum spectrum):
+        return self.emission_with_state(point, direction, spectrum, new_plasma_state(self._plasma, point))
+
+    cpdef Spectrum emission_with_state(self, Point3D point, Vector3D direction, Spectrum spectrum, PlasmaState state):
 
         cdef:
             double ne, te, receiver_density, donor_density, donor_temperature, weighted_rate, radiance
@@ -88,28 +92,36 @@ cdef class ThermalCXLine(PlasmaModel):
         if self._target_species is None:
             self._populate_cache()
 
-        ne = self._plasma.get_electron_distribution().density(point.x, point.y, point.z)
+        ne = state.electron_density()
         if ne <= 0.0:
             return spectrum
 
-        te = self._plasma.get_electron_distribution().effective_temperature(point.x, point.y, point.z)
+        te = state.electron_temperature()
         if te <= 0.0:
             return spectrum
 
-        receiver_density = self._target_species.distribution.density(point.x, point.y, point.z)
+        receiver_density = state.species_density(self._target_species)
         if receiver_density <= 0.0:
             return spectrum
 
         # obtain composite CX PEC by iterating over all possible CX donors
         weighted_rate = 0
         for species, rate in self._rates:
-            donor_density = species.distribution.density(point.x, point.y, point.z)
-            donor_temperature = species.distribution.effective_temperature(point.x, point.y, point.z)
+            donor_density = state.species_density(species)
+            donor_temperature = state.species_temperature(species)
             weighted_rate += donor_density * rate.evaluate(ne, te, donor_temperature)
 
         # add emission line to spectrum
         radiance = RECIP_4_PI * weighted_rate * receiver_density
-        return self._lineshape.add_line(radiance, point, direction, spectrum)
+        return self._lineshape.add_line_with_state(radiance, point, direction, spectrum, state)
+
+    cpdef bint contributes(self, double min_wavelength, double max_wavelength) except -1:
+
+        # cache data on first run
+        if self._target_species is None:
+            self._populate_cache()
+
+        return self._lower_wavelength <= max_wavelength and self._upper_wavelength >= min_wavelength
 
     cdef int _populate_cache(self) except -1:
 
@@ -154,6 +166,9 @@ cdef class ThermalCXLine(PlasmaModel):
         self._lineshape = self._lineshape_class(self._line, self._wavelength, self._target_species, self._plasma,
                                                 self._atomic_data, *self._lineshape_args, **self._lineshape_kwargs)
 
+        # spectral extent of the line, used to skip the rays outside of it
+        self._lower_wavelength, self._upper_wavelength = self._lineshape.spectral_range()
+
     def _change(self):
 
         # clear cache to force regeneration on first use
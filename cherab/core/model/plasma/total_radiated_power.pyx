@@ -19,6 +19,7 @@
 
 from raysect.optical cimport Spectrum, Point3D, Vector3D
 from cherab.core cimport Plasma, AtomicData
+from cherab.core.plasma cimport PlasmaState, new_plasma_state
 from cherab.core.utility.constants cimport RECIP_4_PI
 from cherab.core.atomic.elements import hydrogen, deuterium, tritium
 
@@ -70,6 +71,9 @@ cdef class TotalRadiatedPower(PlasmaModel):
         self._change()
 
     cpdef Spectrum emission(self, Point3D point, Vector3D direction, Spectrum spectrum):
+        return self.emission_with_state(point, direction, spectrum, new_plasma_state(self._plasma, point))
+
+    cpdef Spectrum emission_with_state(self, Point3D point, Vector3D direction, Spectrum spectrum, PlasmaState state):
 
         cdef:
             int i
@@ -81,21 +85,21 @@ cdef class TotalRadiatedPower(PlasmaModel):
         if not self._cache_loaded:
             self._populate_cache()
 
-        ne = self._plasma.get_electron_distribution().density(point.x, point.y, point.z)
+        ne = state.electron_density()
         if ne <= 0.0:
             return spectrum
 
-        te = self._plasma.get_electron_distribution().effective_temperature(point.x, point.y, point.z)
+        te = state.electron_temperature()
         if te <= 0.0:
             return spectrum
 
-        ni = self._line_rad_species.distribution.density(point.x, point.y, point.z)
+        ni = state.species_density(self._line_rad_species)
 
-        ni_upper = self._recom_species.distribution.density(point.x, point.y, point.z)
+        ni_upper = state.species_density(self._recom_species)
 
         nhyd = 0
         for hyd_species in self._hydrogen_species:
-            nhyd += hyd_species.distribution.density(point.x, point.y, point.z)
+            nhyd += state.species_density(hyd_species)
 
         # add emission to spectrum
         power_density = 0
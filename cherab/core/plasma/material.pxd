@@ -21,6 +21,7 @@ from raysect.optical.material.emitter cimport InhomogeneousVolumeEmitter
 
 from cherab.core.plasma cimport Plasma
 from cherab.core.atomic cimport AtomicData
+from cherab.core.plasma.state cimport PlasmaState
 
 
 cdef class PlasmaMaterial(InhomogeneousVolumeEmitter):
@@ -30,4 +31,5 @@ cdef class PlasmaMaterial(InhomogeneousVolumeEmitter):
         AtomicData _atomic_data
         AffineMatrix3D _local_to_plasma
         list _models
+        PlasmaState _state
 
@@ -20,6 +20,7 @@ from raysect.optical cimport World, Primitive, Ray, Spectrum, SpectralFunction,
 from raysect.optical.material.emitter cimport InhomogeneousVolumeEmitter
 from raysect.optical.material.emitter.inhomogeneous cimport VolumeIntegrator
 from cherab.core.plasma.model cimport PlasmaModel
+from cherab.core.plasma.state cimport PlasmaState
 
 
 cdef class PlasmaMaterial(InhomogeneousVolumeEmitter):
@@ -45,6 +46,10 @@ cdef class PlasmaMaterial(InhomogeneousVolumeEmitter):
 
         self._models = models
 
+        # plasma parameters at the current sample point, shared by all models
+        # a long-lived state, invalidated by plasma modifications
+        self._state = PlasmaState(plasma, Point3D(0, 0, 0))
+
     cpdef Spectrum emission_function(self, Point3D point, Vector3D direction, Spectrum spectrum,
                                      World world, Ray ray, Primitive primitive,
                                      AffineMatrix3D to_local, AffineMatrix3D to_world):
@@ -56,9 +61,13 @@ cdef class PlasmaMaterial(InhomogeneousVolumeEmitter):
             point = point.transform(self._local_to_plasma)
             direction = direction.transform(self._local_to_plasma)
 
-        # call each model and accumulate spectrum
+        # each plasma parameter is sampled at most once per point
+        self._state.set_point(point.x, point.y, point.z)
+
+        # call each model that can contribute to the spectral range and accumulate spectrum
         for model in self._models:
-            spectrum = model.emission(point, direction, spectrum)
+            if model.contributes(spectrum.min_wavelength, spectrum.max_wavelength):
+                spectrum = model.emission_with_state(point, direction, spectrum, self._state)
 
         return spectrum
 
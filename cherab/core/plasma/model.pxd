@@ -20,6 +20,7 @@ from raysect.optical cimport Spectrum, Point3D, Vector3D
 
 from cherab.core.plasma.node cimport Plasma
 from cherab.core.atomic cimport AtomicData
+from cherab.core.plasma.state cimport PlasmaState
 
 
 cdef class PlasmaModel:
@@ -31,3 +32,7 @@ cdef class PlasmaModel:
     cdef object __weakref__
 
     cpdef Spectrum emission(self, Point3D point, Vector3D direction, Spectrum spectrum)
+
+    cpdef Spectrum emission_with_state(self, Point3D point, Vector3D direction, Spectrum spectrum, PlasmaState state)
+
+    cpdef bint contributes(self, double min_wavelength, double max_wavelength) except -1
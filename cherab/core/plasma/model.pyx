@@ -25,7 +25,12 @@ cdef class PlasmaModel:
     for a particular point and viewing orientation in plasma space.
 
     A new emission model is implemented by inheriting from this class and specifying
-    the emission() function.
+    the emission() function. Models may also override emission_with_state() to read
+    the plasma parameters from the plasma state shared by all the models of the plasma.
+
+    Models with a limited spectral extent may override contributes(), PlasmaMaterial
+    skips the models that cannot contribute to the wavelength range of a ray before
+    any plasma parameter is sampled.
 
     If it is necessary to cache data to speed up the emission
     calculation and there is a risk the cached data may be made stale by changes to the
@@ -98,6 +103,39 @@ cdef class PlasmaModel:
 
         raise NotImplementedError('Virtual method must be implemented in a sub-class.')
 
+    cpdef Spectrum emission_with_state(self, Point3D point, Vector3D direction, Spectrum spectrum, PlasmaState state):
+        """
+        Calculate the emission for a point in the plasma in a specified direction,
+        reading the plasma parameters from a shared plasma state.
+
+        PlasmaMaterial calls this method with a PlasmaState sampled at the same point
+        for all of its models, so each plasma parameter is evaluated once per point
+        however many models require it. Models opt in to the shared state by overriding
+        this method. The default implementation ignores the state and calls emission().
+
+        :param point: Point in plasma space.
+        :param direction: Direction in plasma space.
+        :param spectrum: Spectrum to which emission should be added.
+        :param state: Plasma parameters sampled at the point.
+        :return: Updated Spectrum object.
+        """
+
+        return self.emission(point, direction, spectrum)
+
+    cpdef bint contributes(self, double min_wavelength, double max_wavelength) except -1:
+        """
+        Returns False if the model cannot add emission within the specified wavelength range.
+
+        The test must be cheap, it is performed for every sample point before the
+        emission is calculated. The default implementation always returns True.
+
+        :param min_wavelength: Lower bound of the wavelength range in nm.
+        :param max_wavelength: Upper bound of the wavelength range in nm.
+        :return: False if the emission of the model is negligible in the wavelength range.
+        """
+
+        return True
+
     def _change(self):
         """
         Called if the plasma properties or the atomic data source changes.
@@ -67,6 +67,7 @@ cdef class Plasma(Node):
         AffineMatrix3D _geometry_transform
         ModelManager _models
         VolumeIntegrator _integrator
+        double _max_temperature, _max_velocity, _max_b_field
 
     cdef object __weakref__
 
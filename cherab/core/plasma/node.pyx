@@ -17,6 +17,7 @@
 # under the Licence.
 
 # cython: language_level=3
+from libc.math cimport INFINITY
 from cherab.core.utility import Notifier
 
 from cherab.core.species import SpeciesNotFound
@@ -253,6 +254,8 @@ cdef class Plasma(Node):
     :param VolumeIntegrator integrator: The configurable method for doing
       volumetric integration through the plasma along a Ray's path. Defaults to
       a numerical integrator with 1mm step size, NumericalIntegrator(step=0.001).
+      AdaptiveVolumeIntegrator from cherab.core.math.integrators adapts the step size
+      to the local variation of the emission.
 
     :ivar AtomicData atomic_data: The atomic data provider class for this plasma.
       All plasma emission from this plasma will be calculated with the same provider.
@@ -269,6 +272,14 @@ cdef class Plasma(Node):
       to a Null transform.
     :ivar ModelManager models: The manager class that sets and provides access to the
       emission models for this plasma.
+    :ivar float max_temperature: Upper bound of the temperature of any plasma species in eV.
+      Together with max_velocity and max_b_field, it is used by the line emission models to
+      estimate the spectral extent of their lines, the models are skipped for rays whose
+      wavelength range lies outside of it. Defaults to infinity (no bound).
+    :ivar float max_velocity: Upper bound of the bulk velocity magnitude of any plasma
+      species in m/s. Defaults to infinity (no bound).
+    :ivar float max_b_field: Upper bound of the magnetic field strength in T.
+      Defaults to infinity (no bound).
 
 
     .. code-block:: pycon
@@ -344,6 +355,11 @@ cdef class Plasma(Node):
         # emission model integrator
         self._integrator = integrator
 
+        # bounds of the plasma parameters used to estimate the spectral extent of the emission lines
+        self._max_temperature = INFINITY
+        self._max_velocity = INFINITY
+        self._max_b_field = INFINITY
+
     @property
     def b_field(self):
         return self._b_field
@@ -461,6 +477,45 @@ cdef class Plasma(Node):
             ion_density += species.distribution.density(x, y, z)
         return ion_density
 
+    @property
+    def max_temperature(self):
+        return self._max_temperature
+
+    @max_temperature.setter
+    def max_temperature(self, object value):
+        self._max_temperature = self._validate_bound(value, 'max_temperature')
+        self._modified()
+
+    @property
+    def max_velocity(self):
+        return self._max_velocity
+
+    @max_velocity.setter
+    def max_velocity(self, object value):
+        self._max_velocity = self._validate_bound(value, 'max_velocity')
+        self._modified()
+
+    @property
+    def max_b_field(self):
+        return self._max_b_field
+
+    @max_b_field.setter
+    def max_b_field(self, object value):
+        self._max_b_field = self._validate_bound(value, 'max_b_field')
+        self._modified()
+
+    @staticmethod
+    def _validate_bound(object value, str name):
+
+        # None removes the bound
+        if value is None:
+            return INFINITY
+
+        value = float(value)
+        if not value >= 0:
+            raise ValueError('The {} bound must be non-negative.'.format(name))
+        return value
+
     @property
     def geometry(self):
         return self._geometry
@@ -0,0 +1,64 @@
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+
+from raysect.optical cimport Point3D, Vector3D
+
+from cherab.core.plasma.node cimport Plasma
+from cherab.core.species cimport Species
+
+
+cdef class _SpeciesState:
+
+    cdef:
+        unsigned long density_generation, temperature_generation, velocity_generation
+        double density, temperature
+        Vector3D velocity
+
+
+cdef class PlasmaState:
+
+    cdef:
+        readonly Plasma plasma
+        double _x, _y, _z
+        unsigned long _generation
+        unsigned long _ne_generation, _te_generation, _b_field_generation
+        double _ne, _te
+        Vector3D _b_field
+        dict _species
+
+    cdef object __weakref__
+
+    cdef void set_point(self, double x, double y, double z)
+
+    cpdef double electron_density(self) except? -1e999
+
+    cpdef double electron_temperature(self) except? -1e999
+
+    cpdef Vector3D b_field(self)
+
+    cpdef double species_density(self, Species species) except? -1e999
+
+    cpdef double species_temperature(self, Species species) except? -1e999
+
+    cpdef Vector3D species_velocity(self, Species species)
+
+    cdef _SpeciesState _species_state(self, Species species)
+
+
+cdef PlasmaState new_plasma_state(Plasma plasma, Point3D point)
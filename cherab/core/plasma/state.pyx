@@ -0,0 +1,207 @@
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+
+from raysect.optical cimport Point3D, Vector3D, new_point3d
+
+
+cdef class _SpeciesState:
+    """Cached parameters of a single plasma species."""
+
+    def __init__(self):
+
+        self.density_generation = 0
+        self.temperature_generation = 0
+        self.velocity_generation = 0
+
+
+cdef class PlasmaState:
+    """
+    Plasma parameters sampled at a single point in plasma space.
+
+    Each parameter is sampled from the plasma profiles on the first request and
+    the value is reused by all subsequent requests until the state is moved to
+    another point or the plasma is modified. PlasmaMaterial fills a single state for each emission sample and
+    passes it to the emission models (see PlasmaModel.emission_with_state()), so a
+    plasma profile is evaluated once per sample point rather than once per model.
+
+    :param Plasma plasma: The plasma to sample.
+    :param Point3D point: The sample point in plasma space. Defaults to the origin.
+
+    :ivar Plasma plasma: The sampled plasma.
+    :ivar Point3D point: The sample point in plasma space.
+    """
+
+    def __init__(self, Plasma plasma not None, Point3D point=None):
+
+        self.plasma = plasma
+        self._species = {}
+
+        # the cached values are valid only while their generation matches the state generation
+        self._generation = 1
+        self._ne_generation = 0
+        self._te_generation = 0
+        self._b_field_generation = 0
+
+        point = point or new_point3d(0, 0, 0)
+        self._x = point.x
+        self._y = point.y
+        self._z = point.z
+
+        plasma.notifier.add(self._modified)
+
+    @property
+    def point(self):
+        return new_point3d(self._x, self._y, self._z)
+
+    @point.setter
+    def point(self, Point3D value not None):
+        self.set_point(value.x, value.y, value.z)
+
+    cdef void set_point(self, double x, double y, double z):
+        """
+        Moves the state to a new sample point, invalidating all cached values.
+        """
+
+        self._x = x
+        self._y = y
+        self._z = z
+        self._generation += 1
+
+    def _modified(self):
+        """
+        Invalidates all cached values when the plasma is modified.
+        """
+
+        self._generation += 1
+
+    cpdef double electron_density(self) except? -1e999:
+        """
+        Returns the electron density at the sample point.
+
+        :return: Density in m^-3.
+        """
+
+        if self._ne_generation != self._generation:
+            self._ne = self.plasma.get_electron_distribution().density(self._x, self._y, self._z)
+            self._ne_generation = self._generation
+        return self._ne
+
+    cpdef double electron_temperature(self) except? -1e999:
+        """
+        Returns the electron temperature at the sample point.
+
+        :return: Temperature in eV.
+        """
+
+        if self._te_generation != self._generation:
+            self._te = self.plasma.get_electron_distribution().effective_temperature(self._x, self._y, self._z)
+            self._te_generation = self._generation
+        return self._te
+
+    cpdef Vector3D b_field(self):
+        """
+        Returns the magnetic field at the sample point.
+
+        :return: Magnetic field vector in T.
+        """
+
+        if self._b_field_generation != self._generation:
+            self._b_field = self.plasma.get_b_field().evaluate(self._x, self._y, self._z)
+            self._b_field_generation = self._generation
+        return self._b_field
+
+    cpdef double species_density(self, Species species) except? -1e999:
+        """
+        Returns the density of the plasma species at the sample point.
+
+        :param Species species: A plasma species.
+        :return: Density in m^-3.
+        """
+
+        cdef _SpeciesState state = self._species_state(species)
+
+        if state.density_generation != self._generation:
+            state.density = species.distribution.density(self._x, self._y, self._z)
+            state.density_generation = self._generation
+        return state.density
+
+    cpdef double species_temperature(self, Species species) except? -1e999:
+        """
+        Returns the effective temperature of the plasma species at the sample point.
+
+        :param Species species: A plasma species.
+        :return: Temperature in eV.
+        """
+
+        cdef _SpeciesState state = self._species_state(species)
+
+        if state.temperature_generation != self._generation:
+            state.temperature = species.distribution.effective_temperature(self._x, self._y, self._z)
+            state.temperature_generation = self._generation
+        return state.temperature
+
+    cpdef Vector3D species_velocity(self, Species species):
+        """
+        Returns the bulk velocity of the plasma species at the sample point.
+
+        :param Species species: A plasma species.
+        :return: Velocity vector in m/s.
+        """
+
+        cdef _SpeciesState state = self._species_state(species)
+
+        if state.velocity_generation != self._generation:
+            state.velocity = species.distribution.bulk_velocity(self._x, self._y, self._z)
+            state.velocity_generation = self._generation
+        return state.velocity
+
+    cdef _SpeciesState _species_state(self, Species species):
+
+        cdef _SpeciesState state
+
+        # species are immutable, so they can safely be used as keys
+        try:
+            state = self._species[species]
+        except KeyError:
+            state = _SpeciesState()
+            self._species[species] = state
+        return state
+
+
+cdef PlasmaState new_plasma_state(Plasma plasma, Point3D point):
+    """
+    Creates a plasma state at the given point, bypassing the Python constructor.
+
+    The state is meant to be used for a single evaluation and does not listen to
+    plasma modifications, use the constructor for a long-lived state.
+    """
+
+    cdef PlasmaState state
+
+    state = PlasmaState.__new__(PlasmaState)
+    state.plasma = plasma
+    state._species = {}
+    state._generation = 1
+    state._ne_generation = 0
+    state._te_generation = 0
+    state._b_field_generation = 0
+    state._x = point.x
+    state._y = point.y
+    state._z = point.z
+    return state
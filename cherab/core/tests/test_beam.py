@@ -20,13 +20,18 @@ import unittest
 
 import numpy as np
 
-from raysect.core import World, Vector3D, translate
+from scipy.constants import atomic_mass
+from raysect.core import World, Point3D, Vector3D, translate, rotate_y
+from raysect.optical import Spectrum
+from raysect.optical.material.emitter.inhomogeneous import NumericalIntegrator
 
-from cherab.core import Beam
+from cherab.core import Beam, Species, Maxwellian
 from cherab.core.atomic import AtomicData, BeamStoppingRate
-from cherab.core.atomic import deuterium
+from cherab.core.atomic import deuterium, neon
+from cherab.core.beam.material import BeamMaterial
+from cherab.core.beam.model import BeamModel
 from cherab.tools.plasmas.slab import build_constant_slab_plasma
-from cherab.core.model import SingleRayAttenuator
+from cherab.core.model import SingleRayAttenuator, precalculate_attenuation
 
 from cherab.core.utility import EvAmuToMS, EvToJ
 
@@ -53,6 +58,25 @@ class MockAtomicData(AtomicData):
         return ConstantBeamStoppingRate(1, 1.e-13)
 
 
+class RecordingBeamModel(BeamModel):
+    """Stores the arguments of the last emission() call for test purpose."""
+
+    def emission(self, beam_point, plasma_point, beam_direction, observation_direction, spectrum):
+
+        self.plasma_point = plasma_point
+        self.beam_direction = beam_direction
+        self.observation_direction = observation_direction
+        return spectrum
+
+
+class OutOfRangeBeamModel(RecordingBeamModel):
+    """Never contributes to the observed spectral range for test purpose."""
+
+    def contributes(self, min_wavelength, max_wavelength):
+
+        return False
+
+
 class TestBeam(unittest.TestCase):
 
     def setUp(self):
@@ -127,6 +151,121 @@ class TestBeam(unittest.TestCase):
         self.assertEqual(density_outside_beam, 0,
                          msg='Beam.density() gives a non-zero value outside beam.')
 
+    def test_beam_density_plasma_change(self):
+
+        z0 = 0.8
+
+        self.beam.density(0, 0, z0)
+
+        # adding an impurity must trigger the recalculation of the attenuation
+        impurity_density = 0.1 * self.plasma_density
+        impurity_distribution = Maxwellian(impurity_density, self.plasma_temperature, Vector3D(0, 0, 0),
+                                           neon.atomic_weight * atomic_mass)
+        self.plasma.composition.add(Species(neon, 10, impurity_distribution))
+
+        density_on_axis = self.beam.density(0, 0, z0)
+
+        # validating
+
+        speed = EvAmuToMS.to(self.beam.energy)
+        # constant stopping rate
+        stopping_rate = self.atomic_data.beam_stopping_rate(deuterium, deuterium, 1)(0, 0, 0)
+        attenuation_factor = np.exp(-z0 * (self.plasma_density + 10 * impurity_density) * stopping_rate / speed)
+
+        beam_particle_rate = self.beam.power / EvToJ.to(self.beam.energy * deuterium.atomic_weight)
+
+        sigma0_sqr = self.beam.sigma**2
+        sigma_x = np.sqrt(sigma0_sqr + (z0 * np.tan(np.deg2rad(self.beam.divergence_x)))**2)
+        sigma_y = np.sqrt(sigma0_sqr + (z0 * np.tan(np.deg2rad(self.beam.divergence_y)))**2)
+
+        test_density_on_axis = beam_particle_rate / speed / (2 * np.pi * sigma_x * sigma_y) * attenuation_factor
+
+        self.assertAlmostEqual(density_on_axis / test_density_on_axis, 1., delta=1.e-12,
+                               msg='Beam.density() gives a wrong value after the plasma composition has changed.')
+
+    def test_precalculate_attenuation(self):
+
+        # the half energy component shares the axis with the beam, the third energy component does not
+        beams = [self.beam]
+        for energy, transform in ((25000, translate(0.5, 0, 0)), (50000 / 3, translate(0.4, 0.1, 0))):
+            beam = Beam(transform=transform)
+            beam.atomic_data = self.atomic_data
+            beam.plasma = self.plasma
+            beam.attenuator = SingleRayAttenuator(clamp_to_zero=True)
+            beam.energy = energy
+            beam.power = 1e6
+            beam.temperature = 10
+            beam.element = deuterium
+            beam.parent = self.world
+            beam.sigma = 0.2
+            beam.divergence_x = 1.
+            beam.divergence_y = 2.
+            beam.length = 10.
+            beams.append(beam)
+
+        # reference densities from the lazy calculation
+        z = np.linspace(0, 10, 11)
+        reference = [[beam.density(0, 0, zi) for zi in z] for beam in beams]
+
+        for processes in (1, 2):
+            for beam in beams:
+                beam.attenuator._change()
+            precalculate_attenuation(beams, processes=processes)
+
+            for beam, reference_density in zip(beams, reference):
+                self.assertIsNotNone(beam.attenuator._density,
+                                     msg='precalculate_attenuation() did not store the attenuation.')
+                density = [beam.density(0, 0, zi) for zi in z]
+                np.testing.assert_allclose(density, reference_density, rtol=1.e-12)
+
+        with self.assertRaises(ValueError):
+            precalculate_attenuation(beams, processes=0)
+
+    def test_beam_transform_change(self):
+
+        self.beam.density(0, 0, 0.8)
+        self.assertIsNotNone(self.beam.attenuator._density)
+
+        # moving the beam must trigger the recalculation of the attenuation
+        self.beam.transform = translate(0.5, 0.1, 0)
+        self.assertIsNone(self.beam.attenuator._density,
+                          msg='The attenuation is not reset after the beam transform has changed.')
+
+    def test_material_transform_cache(self):
+
+        model = RecordingBeamModel()
+        material = BeamMaterial(self.beam, self.plasma, self.atomic_data, [model], NumericalIntegrator(0.01))
+        spectrum = Spectrum(400, 500, 1)
+        direction = Vector3D(1, 0, 0)
+
+        for beam_transform, plasma_transform in ((translate(0.5, 0, 0), translate(0, 0, 0)),
+                                                 (translate(0.2, 0.1, 0) * rotate_y(90), translate(0, 0, 0)),
+                                                 (translate(0.2, 0.1, 0) * rotate_y(90), translate(0, 0.3, 0.1))):
+            self.beam.transform = beam_transform
+            self.plasma.transform = plasma_transform
+            beam_to_plasma = self.beam.to(self.plasma)
+
+            for point in (Point3D(0, 0, 0.5), Point3D(0.1, -0.1, 1)):
+                material.emission_function(point, direction, spectrum, None, None, None, None, None)
+
+                beam_direction = self.beam.direction(point.x, point.y, point.z).transform(beam_to_plasma)
+                for value, test_value in ((model.plasma_point, point.transform(beam_to_plasma)),
+                                          (model.beam_direction, beam_direction),
+                                          (model.observation_direction, direction.transform(beam_to_plasma))):
+                    for v, test_v in zip(value, test_value):
+                        self.assertAlmostEqual(v, test_v, delta=1.e-12,
+                                               msg='BeamMaterial uses an outdated beam to plasma transform.')
+
+    def test_material_spectral_culling(self):
+
+        model = OutOfRangeBeamModel()
+        material = BeamMaterial(self.beam, self.plasma, self.atomic_data, [model], NumericalIntegrator(0.01))
+        spectrum = Spectrum(400, 500, 1)
+
+        material.emission_function(Point3D(0, 0, 0.5), Vector3D(1, 0, 0), spectrum, None, None, None, None, None)
+        self.assertFalse(hasattr(model, 'plasma_point'),
+                         msg='BeamMaterial calls a model that does not contribute to the spectral range.')
+
     def test_beam_direction(self):
         # setting up the model
 
@@ -95,5 +95,32 @@ class TestBremsstrahlung(unittest.TestCase):
                                    msg='BeamCXLine model gives a wrong value at {} nm.'.format(brems_spectrum.wavelengths[i]))
 
 
+    def test_tabulated_bremsstrahlung_model(self):
+
+        gaunt_factor = MaxwellianFreeFreeGauntFactor()
+
+        origin = Point3D(1.5, 0, 0)
+        direction = Vector3D(-1, 0, 0)
+
+        # electron temperatures inside and outside the range of the Gaunt factor table
+        for te in (2000., 2.e5):
+            world = World()
+            plasma_species = [(deuterium, 1, 1.e19, te, Vector3D(0, 0, 0)),
+                              (nitrogen, 7, 1.e18, te, Vector3D(0, 0, 0))]
+            plasma = build_constant_slab_plasma(length=1, width=1, height=1, electron_density=1e19,
+                                                electron_temperature=te, plasma_species=plasma_species)
+            plasma.parent = world
+            plasma.atomic_data = AtomicData()
+
+            plasma.models = [Bremsstrahlung(gaunt_factor=gaunt_factor)]
+            ray = Ray(origin=origin, direction=direction, min_wavelength=400., max_wavelength=800., bins=128)
+            test_samples = ray.trace(world).samples
+
+            plasma.models = [Bremsstrahlung(gaunt_factor=gaunt_factor, tabulated=True)]
+            for _ in range(2):  # second run uses the cached tables
+                brems_spectrum = ray.trace(world)
+                np.testing.assert_allclose(brems_spectrum.samples, test_samples, rtol=1.e-4,
+                                           err_msg='Tabulated Bremsstrahlung model gives wrong values at Te = {} eV.'.format(te))
+
 if __name__ == '__main__':
     unittest.main()
@@ -88,6 +88,26 @@ class MockAtomicData(AtomicData):
         return 529.27
 
 
+class CountingAtomicData(MockAtomicData):
+    """Fake atomic data counting the PEC evaluations for test purpose."""
+
+    def __init__(self):
+        super().__init__()
+        self.evaluations = 0
+
+    def impact_excitation_pec(self, ion, charge, transition):
+
+        atomic_data = self
+
+        class CountingPEC(ConstantImpactExcitationPEC):
+
+            def evaluate(self, density, temperature):
+                atomic_data.evaluations += 1
+                return self.value
+
+        return CountingPEC(1.4e-39)
+
+
 class TestExcitationLine(unittest.TestCase):
 
     def setUp(self):
@@ -162,6 +182,39 @@ class TestExcitationLine(unittest.TestCase):
             self.assertAlmostEqual(excit_spectrum.samples[i], spectrum.samples[i], delta=1e-8,
                                    msg='ExcitationLine model gives a wrong value at {} nm.'.format(spectrum.wavelengths[i]))
 
+    def test_spectral_culling(self):
+        # setting up the model
+        atomic_data = CountingAtomicData()
+        self.plasma.atomic_data = atomic_data
+        line = Line(carbon, 5, (8, 7))
+        model = ExcitationLine(line)
+        self.plasma.models = [model]
+        wavelength = atomic_data.wavelength(line.element, line.charge, line.transition)
+
+        # without plasma parameter bounds the model contributes to any spectral range
+        self.assertTrue(model.contributes(wavelength + 50, wavelength + 60))
+
+        self.plasma.max_temperature = 800.
+        self.plasma.max_velocity = 0.
+        self.plasma.max_b_field = 10.
+        self.assertTrue(model.contributes(wavelength - 1, wavelength + 1))
+        self.assertFalse(model.contributes(wavelength + 50, wavelength + 60))
+
+        # observing
+        origin = Point3D(1.5, 0, 0)
+        direction = Vector3D(-1, 0, 0)
+        ray = Ray(origin=origin, direction=direction, min_wavelength=wavelength + 50, max_wavelength=wavelength + 60, bins=64)
+        spectrum = ray.trace(self.world)
+
+        # the rates are not evaluated outside of the spectral range of the line
+        self.assertEqual(atomic_data.evaluations, 0)
+        self.assertEqual(spectrum.total(), 0)
+
+        ray = Ray(origin=origin, direction=direction, min_wavelength=wavelength - 1.5, max_wavelength=wavelength + 1.5, bins=64)
+        spectrum = ray.trace(self.world)
+        self.assertGreater(atomic_data.evaluations, 0)
+        self.assertGreater(spectrum.total(), 0)
+
 
 class TestRecombinationLine(unittest.TestCase):
 
@@ -471,6 +471,58 @@ class TestLineShapes(unittest.TestCase):
             self.assertAlmostEqual(test_spectrum[i], spectrum.samples[i], delta=1e-10,
                                    msg='BeamEmissionMultiplet.add_line() method gives a wrong value at {} nm.'.format(wavelengths[i]))
 
+    def test_spectral_range(self):
+        # setting up line shape models
+        line = Line(deuterium, 0, (3, 2))  # D-alpha line
+        target_species = self.plasma.composition.get(line.element, line.charge)
+        wavelength = 656.104
+        multiplet = [[656.0, 656.104, 656.3], [0.2, 0.5, 0.3]]
+        lineshapes = [GaussianLine(line, wavelength, target_species, self.plasma, self.atomic_data),
+                      MultipletLineShape(line, wavelength, target_species, self.plasma, self.atomic_data, multiplet),
+                      ZeemanTriplet(line, wavelength, target_species, self.plasma, self.atomic_data),
+                      ParametrisedZeemanTriplet(line, wavelength, target_species, self.plasma, self.atomic_data,
+                                                line_parameters=(0.0402068, 0.4384, 0.25))]
+        mse_line = BeamEmissionMultiplet(line, wavelength, self.beam, self.atomic_data, 0.56, 0.7, 0.3, 0.7)
+
+        # the range is unbounded if the plasma parameters are not bounded
+        for lineshape in lineshapes + [mse_line]:
+            lower, upper = lineshape.spectral_range()
+            self.assertLessEqual(lower, 0)
+            self.assertEqual(upper, np.inf)
+
+        # the bounds match the plasma parameters of the constant slab
+        self.plasma.max_temperature = 5.
+        self.plasma.max_velocity = 2.e4
+        self.plasma.max_b_field = 5.
+
+        point = Point3D(0.5, 0.5, 0.5)
+        beam_direction = self.beam.direction(point.x, point.y, point.z)
+        radiance = 1.0
+        for direction in (Vector3D(-1, 0, 0), Vector3D(1, 0, 0), Vector3D(-1, 1, 0)):
+            for lineshape in lineshapes + [mse_line]:
+                lower, upper = lineshape.spectral_range()
+                self.assertLess(upper - lower, 25.)
+
+                for min_wavelength, max_wavelength, inside in ((lower - 2, lower, False), (lower, upper, True), (upper, upper + 2, False)):
+                    spectrum = Spectrum(min_wavelength, max_wavelength, 64)
+                    if lineshape is mse_line:
+                        spectrum = mse_line.add_line(radiance, point, point, beam_direction, direction, spectrum)
+                    else:
+                        spectrum = lineshape.add_line(radiance, point, direction, spectrum)
+
+                    self.assertEqual(spectrum.total() > 0, inside,
+                                     msg='{}.spectral_range() gives a wrong range.'.format(type(lineshape).__name__))
+
+        # the Stark broadened line has no bounds, nor has the fine structure broadening if (1 + 2 gamma) < 0
+        stark_line = StarkBroadenedLine(line, wavelength, target_species, self.plasma, self.atomic_data)
+        self.assertEqual(stark_line.spectral_range(), (0, np.inf))
+        triplet = ParametrisedZeemanTriplet(line, wavelength, target_species, self.plasma, self.atomic_data,
+                                            line_parameters=(0.0402068, 0.4384, -0.5015))
+        self.assertEqual(triplet.spectral_range(), (0, np.inf))
+
+        with self.assertRaises(ValueError):
+            self.plasma.max_temperature = -1
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,108 @@
+# Copyright 2016-2023 Euratom
+# Copyright 2016-2023 United Kingdom Atomic Energy Authority
+# Copyright 2016-2023 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+import unittest
+
+from scipy.constants import electron_mass
+from raysect.core import Point3D, Vector3D
+
+from cherab.core import Maxwellian
+from cherab.core.plasma import PlasmaState
+from cherab.core.math import ConstantVector3D
+from cherab.tools.plasmas.slab import build_slab_plasma
+
+
+class CountingFunction3D:
+    """Constant 3D function counting its evaluations."""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self, x, y, z):
+        self.calls += 1
+        return self.value
+
+
+class TestPlasmaState(unittest.TestCase):
+
+    def setUp(self):
+
+        self.plasma = build_slab_plasma(peak_density=5e19, peak_temperature=2000, pedestal_top=0.5)
+        self.plasma.b_field = ConstantVector3D(Vector3D(0, 0, 2.5))
+
+    def assert_state(self, state, point):
+
+        electrons = self.plasma.electron_distribution
+        self.assertEqual(state.electron_density(), electrons.density(point.x, point.y, point.z))
+        self.assertEqual(state.electron_temperature(), electrons.effective_temperature(point.x, point.y, point.z))
+        self.assertEqual(state.b_field(), Vector3D(0, 0, 2.5))
+
+        for species in self.plasma.composition:
+            distribution = species.distribution
+            self.assertEqual(state.species_density(species), distribution.density(point.x, point.y, point.z))
+            self.assertEqual(state.species_temperature(species), distribution.effective_temperature(point.x, point.y, point.z))
+            self.assertEqual(state.species_velocity(species), distribution.bulk_velocity(point.x, point.y, point.z))
+
+    def test_sampling(self):
+
+        point = Point3D(0.2, 0.1, 0)
+        state = PlasmaState(self.plasma, point)
+        self.assertEqual(state.point, point)
+
+        # repeated requests return the cached values
+        for _ in range(2):
+            self.assert_state(state, point)
+
+        # moving the state to another point invalidates the cached values
+        point = Point3D(0.7, 0, 0.3)
+        state.point = point
+        self.assertEqual(state.point, point)
+        self.assert_state(state, point)
+
+    def test_evaluation_count(self):
+
+        density = CountingFunction3D(5e19)
+        temperature = CountingFunction3D(2000)
+        self.plasma.electron_distribution = Maxwellian(density, temperature, Vector3D(0, 0, 0), electron_mass)
+
+        state = PlasmaState(self.plasma, Point3D(0.2, 0.1, 0))
+
+        # several consumers reading the same point evaluate each profile once
+        for _ in range(3):
+            self.assertEqual(state.electron_density(), 5e19)
+            self.assertEqual(state.electron_temperature(), 2000)
+        self.assertEqual(density.calls, 1)
+        self.assertEqual(temperature.calls, 1)
+
+        state.point = Point3D(0.7, 0, 0.3)
+        for _ in range(3):
+            state.electron_density()
+        self.assertEqual(density.calls, 2)
+        self.assertEqual(temperature.calls, 1)
+
+        # a plasma change notification invalidates the cached values at the same point
+        self.plasma.b_field = ConstantVector3D(Vector3D(0, 0, 1.5))
+        for _ in range(3):
+            state.electron_density()
+            self.assertEqual(state.b_field(), Vector3D(0, 0, 1.5))
+        self.assertEqual(density.calls, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
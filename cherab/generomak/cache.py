@@ -0,0 +1,179 @@
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+"""
+Binary cache of the Generomak data files.
+
+The Generomak plasma profiles and first wall meshes are distributed as JSON and
+Wavefront OBJ files, parsing them is slow and every process loading the data pays
+this cost again. The cache is opt-in, it is enabled by passing cache=True to the
+Generomak loaders. On first use, the arrays parsed from a data file are stored in the
+cache directory as .npy files, one per array. The loaders then open these files as
+read-only memory maps: the data is read from disk lazily and the memory pages are
+shared between processes (e.g. forked workers) instead of being copied.
+
+Each data file has its own cache entry, a directory holding the .npy files and a
+meta.json file with the structure of the data (nested dictionaries of arrays and
+JSON values). The modification time and size of the data file are stored in the
+meta data, the entry is rebuilt if the data file has changed.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+
+DEFAULT_CACHE_PATH = os.path.expanduser('~/.cherab/generomak/cache')
+
+_CACHE_FORMAT_VERSION = 1
+
+
+def load_cached(path, convert, cache_path=None):
+    """
+    Reads a data file through the binary cache.
+
+    :param str path: Path to the data file.
+    :param callable convert: Function parsing the data file. Receives the file path and
+      returns a (possibly nested) dictionary of numpy arrays and JSON serialisable values.
+    :param str cache_path: Path to the cache directory. Defaults to DEFAULT_CACHE_PATH.
+
+    :return: The data dictionary. The arrays are read-only memory maps, unless the cache
+      directory is not writable.
+    """
+
+    cache_path = cache_path or DEFAULT_CACHE_PATH
+
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    source = {'version': _CACHE_FORMAT_VERSION, 'path': path,
+              'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+    entry = os.path.join(cache_path, hashlib.sha1(path.encode()).hexdigest())
+
+    data = _read_entry(entry, source)
+    if data is None:
+        data = convert(path)
+        if _write_entry(entry, source, data):
+            # reopen the written entry so the arrays are memory maps
+            data = _read_entry(entry, source) or data
+
+    return data
+
+
+def clear_cache(cache_path=None):
+    """
+    Deletes the binary cache of the Generomak data files.
+
+    :param str cache_path: Path to the cache directory. Defaults to DEFAULT_CACHE_PATH.
+    """
+
+    cache_path = cache_path or DEFAULT_CACHE_PATH
+    if os.path.isdir(cache_path):
+        shutil.rmtree(cache_path)
+
+
+def arrays_from_json(path):
+    """
+    Reads a JSON data file, converting the lists to numpy arrays.
+
+    :param str path: Path to the JSON file.
+    :return: The file content, with lists replaced by numpy arrays.
+    """
+
+    with open(path, 'r') as f:
+        content = json.load(f)
+
+    return _to_arrays(content)
+
+
+def _to_arrays(value):
+
+    if isinstance(value, dict):
+        return {k: _to_arrays(v) for k, v in value.items()}
+
+    if isinstance(value, list):
+        return np.array(value)
+
+    return value
+
+
+def _read_entry(entry, source):
+
+    try:
+        with open(os.path.join(entry, 'meta.json'), 'r') as f:
+            meta = json.load(f)
+        if meta['source'] != source:
+            return None
+        return _unflatten(meta['structure'], entry)
+
+    except (OSError, ValueError, KeyError):
+        # missing or corrupted cache entry
+        return None
+
+
+def _write_entry(entry, source, data):
+
+    # write to a temporary directory first, so concurrent readers never see a partial entry
+    try:
+        cache_path = os.path.dirname(entry)
+        os.makedirs(cache_path, exist_ok=True)
+        temp_entry = tempfile.mkdtemp(dir=cache_path)
+        try:
+            structure = _flatten(data, temp_entry, [0])
+            with open(os.path.join(temp_entry, 'meta.json'), 'w') as f:
+                json.dump({'source': source, 'structure': structure}, f)
+
+            # a stale entry must be removed before the new one can take its place
+            if os.path.isdir(entry):
+                shutil.rmtree(entry, ignore_errors=True)
+            os.rename(temp_entry, entry)
+        except BaseException:
+            shutil.rmtree(temp_entry, ignore_errors=True)
+            raise
+
+    except OSError:
+        # the cache is an optimisation only, an unwritable cache directory is not an error
+        return False
+
+    return True
+
+
+def _flatten(value, directory, counter):
+
+    if isinstance(value, dict):
+        return {'dict': {str(k): _flatten(v, directory, counter) for k, v in value.items()}}
+
+    if isinstance(value, np.ndarray):
+        name = 'a{}.npy'.format(counter[0])
+        counter[0] += 1
+        np.save(os.path.join(directory, name), value, allow_pickle=False)
+        return {'array': name}
+
+    return {'value': value}
+
+
+def _unflatten(structure, directory):
+
+    if 'dict' in structure:
+        return {k: _unflatten(v, directory) for k, v in structure['dict'].items()}
+
+    if 'array' in structure:
+        return np.load(os.path.join(directory, structure['array']), mmap_mode='r', allow_pickle=False)
+
+    return structure['value']
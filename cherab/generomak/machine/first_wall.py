@@ -2,10 +2,12 @@ import os
 
 from raysect.core import translate, rotate_z
 
-from raysect.primitive import import_obj
+from raysect.primitive import Mesh, import_obj
 
 from raysect.optical.library import RoughTungsten
 
+from cherab.generomak.cache import load_cached
+
 
 FIRST_WALL_COMPONENT = {}
 FIRST_WALL_COMPONENT["InnerWallLimiter"] = {"component_name": "InnerWallLimiter",
@@ -108,9 +110,45 @@ FIRST_WALL_COMPONENT["OuterWallLimiter"] = {"component_name": "OuterWallLimiter"
                                             "vertical_instances": 1}
 
 
+def _mesh_arrays(file_path):
+    """Parses a Wavefront OBJ mesh file into the arrays of the mesh."""
+
+    data = import_obj(file_path).data
+
+    arrays = {"vertices": data.vertices, "triangles": data.triangles}
+    if data.vertex_normals is not None:
+        arrays["normals"] = data.vertex_normals
+
+    return arrays
+
+
+def load_mesh(file_path, cache=False, cache_path=None):
+    """Loads a mesh from a Wavefront OBJ mesh file (.obj).
+
+       With the cache enabled, the vertex, triangle and normal arrays parsed from the file are
+       stored in the binary cache (see cherab.generomak.cache) and the mesh is built directly
+       from the memory mapped arrays, skipping the parsing of the OBJ file.
+
+       :param str file_path: Path to the Wavefront OBJ mesh file (.obj).
+       :param bool cache: Read the mesh through the binary cache (default=False).
+       :param str cache_path: Path to the cache directory. Defaults to
+                              cherab.generomak.cache.DEFAULT_CACHE_PATH.
+
+       :return: Raysect Mesh.
+    """
+
+    if not cache:
+        return import_obj(file_path)
+
+    arrays = load_cached(file_path, _mesh_arrays, cache_path)
+
+    return Mesh(arrays["vertices"], arrays["triangles"], arrays.get("normals"))
+
+
 def load_component_group(file_path, parent, material, component_name,
                          toroidal_step=0, toroidal_instances=1, initial_toroidal_shift=0,
-                         vertical_step=0, vertical_instances=1, initial_vertical_shift=0):
+                         vertical_step=0, vertical_instances=1, initial_vertical_shift=0,
+                         cache=False, cache_path=None):
     """Adds a group of first wall componenets. The group consists of identical components which are toroidally
        and vertically distributed. The components are instances of the mesh loaded from the given
        Wavefront OBJ mesh file (.obj) and have the same material. The distribution is on a 2 dimensional matrix
@@ -130,12 +168,15 @@ def load_component_group(file_path, parent, material, component_name,
        :param int vertical_instances: Number of components in the verical direction. Defaults to (0, 1).
        :param float initial_vertical_shift: Distance by which the whole group is translated in the z direction.
                                             Defaults to 0.
+       :param bool cache: Read the mesh through the binary cache (default=False).
+       :param str cache_path: Path to the cache directory. Defaults to
+                              cherab.generomak.cache.DEFAULT_CACHE_PATH.
 
         :return: Dictionary of the components in the group.
 
     """
 
-    original = import_obj(file_path)
+    original = load_mesh(file_path, cache, cache_path)
 
     component_group = {}
 
@@ -152,12 +193,15 @@ def load_component_group(file_path, parent, material, component_name,
     return component_group
 
 
-def load_first_wall(parent=None, material=RoughTungsten(0.1), mesh_folder=None):
+def load_first_wall(parent=None, material=RoughTungsten(0.1), mesh_folder=None, cache=False, cache_path=None):
     """ Load Generomak first wall components.
 
         :parameter Node parent: The parent node in the Raysect scene-graph.
         :param Material material: Instance of Raysect optical material given to the components within the group.
         :param str mesh_folder: Path to the folder containing the first wall components.
+        :param bool cache: Read the meshes through the binary cache (default=False).
+        :param str cache_path: Path to the cache directory. Defaults to
+                               cherab.generomak.cache.DEFAULT_CACHE_PATH.
 
         :return: Dictionary of the Generomak first wall component groups.
     """
@@ -178,7 +222,8 @@ def load_first_wall(parent=None, material=RoughTungsten(0.1), mesh_folder=None):
                                                 description["initial_toroidal_shift"],
                                                 description["vertical_step"],
                                                 description["vertical_instances"],
-                                                description["initial_vertical_shift"]
+                                                description["initial_vertical_shift"],
+                                                cache, cache_path
                                                 )
 
     return components
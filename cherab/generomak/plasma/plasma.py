@@ -39,15 +39,33 @@ from cherab.tools.plasmas.ionisation_balance import interpolators1d_from_element
 from cherab.openadas import OpenADAS
 
 from cherab.generomak.equilibrium import load_equilibrium
+from cherab.generomak.cache import load_cached, arrays_from_json
 
 
-def load_edge_profiles():
+def _load_json(path, cache=False, cache_path=None):
+    """Reads a JSON data file, through the binary cache if enabled."""
+
+    if cache:
+        return load_cached(path, arrays_from_json, cache_path)
+
+    with open(path, "r") as fhl:
+        return json.load(fhl)
+
+
+def load_edge_profiles(cache=False, cache_path=None):
     """
     Loads Generomak edge plasma profiles
 
     Return a single dictionary with available edge and plasma species temperature and
     density profiles. The profiles are saved on a 2D triangular mesh.
 
+    With the cache enabled, the data files are read through a binary cache (see
+    cherab.generomak.cache) and the profiles and mesh are returned as read-only numpy
+    memory maps shared between processes instead of lists.
+
+    :param bool cache: Read the data through the binary cache (default=False).
+    :param str cache_path: Path to the cache directory. Defaults to
+      cherab.generomak.cache.DEFAULT_CACHE_PATH.
     :return: dictionary with mesh, electron and plasma composition profiles
 
     .. code-block:: pycon
@@ -70,12 +88,10 @@ def load_edge_profiles():
 
     edge_data = RecursiveDict()
     path = os.path.join(profiles_dir, "mesh.json")
-    with open(path, "r") as fhl:
-        edge_data["mesh"] = json.load(fhl)
+    edge_data["mesh"] = _load_json(path, cache, cache_path)
 
     path = os.path.join(profiles_dir, "electrons.json")
-    with open(path, "r") as fhl:
-        edge_data["electron"] = json.load(fhl)
+    edge_data["electron"] = _load_json(path, cache, cache_path)
 
     saved_elements = (hydrogen, carbon)
 
@@ -83,25 +99,27 @@ def load_edge_profiles():
         for chrg in range(element.atomic_number + 1):
             path = os.path.join(profiles_dir, "{}{:d}.json".format(element.name, chrg))
 
-            with open(path, "r") as fhl:
-                file_data = json.load(fhl)
-                element_name = file_data["element"]
-                charge = file_data["charge"]
+            file_data = _load_json(path, cache, cache_path)
+            element_name = file_data["element"]
+            charge = file_data["charge"]
 
-                edge_data["composition"][element_name][charge] = file_data
+            edge_data["composition"][element_name][charge] = file_data
 
     return edge_data.freeze()
 
 
-def get_edge_interpolators():
+def get_edge_interpolators(cache=False, cache_path=None):
     """
     Provides Generomak edge profiles 2d interpolator
 
+    :param bool cache: Read the data through the binary cache (default=False).
+    :param str cache_path: Path to the cache directory. Defaults to
+      cherab.generomak.cache.DEFAULT_CACHE_PATH.
     :return: dictionary holding instances of Discrete2DMesh density
              and temperature interpolators for plasma species
     """
 
-    profiles = load_edge_profiles()
+    profiles = load_edge_profiles(cache, cache_path)
 
     mesh_interp = RecursiveDict()
 
@@ -163,13 +181,16 @@ def get_2d_distributions(profiles_2d=None):
     return dists.freeze()
 
 
-def get_edge_plasma(atomic_data=None, parent=None, name="Generomak edge plasma"):
+def get_edge_plasma(atomic_data=None, parent=None, name="Generomak edge plasma", cache=False, cache_path=None):
     """
     Provides Generomak default edge plasma.
 
     :param atomic_data: Instance of AtomicData, default is OpenADAS()
     :param parent: parent of the plasma node, defaults None
     :param name: name of the plasma node, defaults "Generomak edge plasma"
+    :param bool cache: Read the data through the binary cache (default=False).
+    :param str cache_path: Path to the cache directory. Defaults to
+      cherab.generomak.cache.DEFAULT_CACHE_PATH.
     :return: populated Plasma object
     """
 
@@ -177,13 +198,12 @@ def get_edge_plasma(atomic_data=None, parent=None, name="Generomak edge plasma")
     equilibrium = load_equilibrium()
 
     # get edge distributions
-    distributions = get_2d_distributions()
+    distributions = get_2d_distributions(get_edge_interpolators(cache, cache_path))
 
     # base plasma geometry on mesh vertices
     profiles_dir = os.path.join(os.path.dirname(__file__), "data/edge")
     path = os.path.join(profiles_dir, "mesh.json")
-    with open(path, "r") as fhl:
-        mesh = json.load(fhl)
+    mesh = _load_json(path, cache, cache_path)
 
     vertex_coords = np.asarray(mesh["vertex_coords"])
     r_range = (vertex_coords[:, 0].min(), vertex_coords[:, 0].max())
@@ -194,25 +214,30 @@ def get_edge_plasma(atomic_data=None, parent=None, name="Generomak edge plasma")
                       parent=parent, name=name)
 
 
-def load_core_profiles():
+def load_core_profiles(cache=False, cache_path=None):
     """
     Loads Generomak default core plasma profiles.
 
     Return a single dictionary with available core plasma species temperature and
     density profiles on a magnetic surface coordinate grid.
 
+    With the cache enabled, the data files are read through a binary cache (see
+    cherab.generomak.cache) and the profiles are returned as read-only numpy memory
+    maps shared between processes instead of lists.
+
+    :param bool cache: Read the data through the binary cache (default=False).
+    :param str cache_path: Path to the cache directory. Defaults to
+      cherab.generomak.cache.DEFAULT_CACHE_PATH.
     :return: dictionary with electron and plasma composition profiles
     """
     profiles_dir = os.path.join(os.path.dirname(__file__), "data/core")
 
     core_data = RecursiveDict()
     path = os.path.join(profiles_dir, "psi_norm.json")
-    with open(path, "r") as fhl:
-        core_data["psi_norm"] = json.load(fhl)["psi_norm"]
+    core_data["psi_norm"] = _load_json(path, cache, cache_path)["psi_norm"]
 
     path = os.path.join(profiles_dir, "electrons.json")
-    with open(path, "r") as fhl:
-        core_data["electron"] = json.load(fhl)
+    core_data["electron"] = _load_json(path, cache, cache_path)
 
     saved_elements = (hydrogen, carbon)
 
@@ -220,25 +245,27 @@ def load_core_profiles():
         for chrg in range(element.atomic_number + 1):
             path = os.path.join(profiles_dir, "{}{:d}.json".format(element.name, chrg))
 
-            with open(path, "r") as fhl:
-                file_data = json.load(fhl)
-                element_name = file_data["element"]
-                charge = file_data["charge"]
+            file_data = _load_json(path, cache, cache_path)
+            element_name = file_data["element"]
+            charge = file_data["charge"]
 
-                core_data["composition"][element_name][charge] = file_data
+            core_data["composition"][element_name][charge] = file_data
 
     return core_data.freeze()
 
 
-def get_core_interpolators():
+def get_core_interpolators(cache=False, cache_path=None):
     """
     Provides 1d interpolators for Generomak default core profiles.
 
+    :param bool cache: Read the data through the binary cache (default=False).
+    :param str cache_path: Path to the cache directory. Defaults to
+      cherab.generomak.cache.DEFAULT_CACHE_PATH.
     :return: dictionary holding 1D interpolators of density,
              temperature and velocity for plasma species
     """
 
-    profiles = load_core_profiles()
+    profiles = load_core_profiles(cache, cache_path)
 
     core_interp = RecursiveDict()
 
@@ -557,13 +584,16 @@ def get_core_distributions(profiles=None, equilibrium=None):
     return species.freeze()
 
 
-def get_core_plasma(atomic_data=None, parent=None, name="Generomak core plasma"):
+def get_core_plasma(atomic_data=None, parent=None, name="Generomak core plasma", cache=False, cache_path=None):
     """
     Provides Generomak default core plasma.
 
     :param atomic_data: Instance of AtomicData, default is OpenADAS()
     :param parent: parent of the plasma node, defaults None
     :param name: name of the plasma node, defaults "Generomak edge plasma"
+    :param bool cache: Read the data through the binary cache (default=False).
+    :param str cache_path: Path to the cache directory. Defaults to
+      cherab.generomak.cache.DEFAULT_CACHE_PATH.
     :return: populated Plasma object
     """
 
@@ -571,7 +601,7 @@ def get_core_plasma(atomic_data=None, parent=None, name="Generomak core plasma")
     equilibrium = load_equilibrium()
 
     # load core distributions
-    distributions = get_core_distributions(equilibrium=equilibrium)
+    distributions = get_core_distributions(get_core_interpolators(cache, cache_path), equilibrium=equilibrium)
 
     return get_plasma(equilibrium=equilibrium, distributions=distributions,
                       atomic_data=atomic_data, parent=parent, name=name)
@@ -0,0 +1,102 @@
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+import os
+import json
+import tempfile
+import unittest
+
+import numpy as np
+
+from cherab.generomak.cache import load_cached, clear_cache, arrays_from_json
+from cherab.generomak.machine.first_wall import load_mesh
+from cherab.generomak.plasma.plasma import load_core_profiles
+
+
+class TestGeneromakCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tempdir.name, 'cache')
+        self.path = os.path.join(self.tempdir.name, 'data.json')
+        self.content = {'element': 'carbon', 'charge': 1, 'density': [1., 2., 3.], 'mesh': {'triangles': [[0, 1, 2]]}}
+        with open(self.path, 'w') as f:
+            json.dump(self.content, f)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_cached_data(self):
+
+        for _ in range(2):
+            data = load_cached(self.path, arrays_from_json, self.cache_path)
+            self.assertEqual(data['element'], 'carbon')
+            self.assertEqual(data['charge'], 1)
+            self.assertIsInstance(data['density'], np.memmap)
+            np.testing.assert_array_equal(data['density'], self.content['density'])
+            np.testing.assert_array_equal(data['mesh']['triangles'], self.content['mesh']['triangles'])
+
+        self.assertEqual(len(os.listdir(self.cache_path)), 1)
+
+        # memory mapped arrays are read-only
+        with self.assertRaises(ValueError):
+            data['density'][0] = 0
+
+    def test_stale_cache(self):
+
+        load_cached(self.path, arrays_from_json, self.cache_path)
+
+        # updating the data file must invalidate the cached data
+        self.content['density'] = [4., 5.]
+        with open(self.path, 'w') as f:
+            json.dump(self.content, f)
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+        data = load_cached(self.path, arrays_from_json, self.cache_path)
+        np.testing.assert_array_equal(data['density'], [4., 5.])
+        self.assertEqual(len(os.listdir(self.cache_path)), 1)
+
+        clear_cache(self.cache_path)
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_core_profiles(self):
+
+        profiles = load_core_profiles(cache=True, cache_path=self.cache_path)
+        profiles_ref = load_core_profiles(cache=False)
+
+        np.testing.assert_array_equal(profiles['psi_norm'], profiles_ref['psi_norm'])
+        for key in ('temperature', 'density', 'vtor'):
+            np.testing.assert_array_equal(profiles['electron'][key], profiles_ref['electron'][key])
+            np.testing.assert_array_equal(profiles['composition']['carbon'][3][key],
+                                          profiles_ref['composition']['carbon'][3][key])
+
+    def test_mesh(self):
+
+        path = os.path.join(os.path.dirname(__file__), '..', 'machine', 'data', 'first_wall', 'TopInnerVerticalTarget.obj')
+
+        mesh_ref = load_mesh(path, cache=False)
+        for _ in range(2):
+            mesh = load_mesh(path, cache=True, cache_path=self.cache_path)
+            np.testing.assert_array_equal(mesh.data.vertices, mesh_ref.data.vertices)
+            np.testing.assert_array_equal(mesh.data.triangles, mesh_ref.data.triangles)
+            np.testing.assert_array_equal(mesh.data.vertex_normals, mesh_ref.data.vertex_normals)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,6 +19,8 @@
 
 
 import os
+import tempfile
+import multiprocessing
 import urllib.parse
 import urllib.request
 import numpy as np
@@ -32,42 +34,71 @@ from cherab.core.utility import RecursiveDict, PerCm3ToPerM3, Cm3ToM3
 OPENADAS_FILE_URL = 'http://open.adas.ac.uk/download/'
 
 
-def install_files(configuration, download=False, repository_path=None, adas_path=None):
+def install_files(configuration, download=False, repository_path=None, adas_path=None, processes=1):
+    """
+    Adds the rates defined in a set of ADAS files to the repository.
+
+    The ADAS files can be parsed in parallel by several processes. In this case, the files
+    are located (and downloaded if needed) by the main process, each file is then parsed
+    and converted by a worker process and the rates are merged into the repository in the
+    order of the configuration by the main process.
+
+    The rates are always installed this way if the repository is a rate container.
+
+    :param configuration: Dictionary in the form {<ADF file type>: <sequence of install arguments>},
+      e.g. {'adf11scd': ((hydrogen, 'adf11/scd12/scd12_h.dat'),)}. The last install argument
+      is the path of the ADAS file relative to ADAS root.
+    :param download: Attempt to download file if not present (Default=False).
+    :param repository_path: Path to the repository in which to install the rates (optional).
+    :param adas_path: Path to ADAS files repository (optional).
+    :param processes: Number of processes parsing the ADAS files (Default=1).
+    """
+
+    if processes < 1:
+        raise ValueError('The number of processes must be greater than zero.')
 
+    repository_path = repository_path or repository.DEFAULT_REPOSITORY_PATH
+
+    tasks = []
     for adf in configuration:
-        if adf.lower() == 'adf11scd':
-            for args in configuration[adf]:
-                install_adf11scd(*args, download=download, repository_path=repository_path, adas_path=adas_path)
-        if adf.lower() == 'adf11acd':
-            for args in configuration[adf]:
-                install_adf11acd(*args, download=download, repository_path=repository_path, adas_path=adas_path)
-        if adf.lower() == 'adf11ccd':
-            for args in configuration[adf]:
-                install_adf11ccd(*args, download=download, repository_path=repository_path, adas_path=adas_path)
-        if adf.lower() == 'adf11plt':
-            for args in configuration[adf]:
-                install_adf11plt(*args, download=download, repository_path=repository_path, adas_path=adas_path)
-        if adf.lower() == 'adf11prb':
-            for args in configuration[adf]:
-                install_adf11prb(*args, download=download, repository_path=repository_path, adas_path=adas_path)
-        if adf.lower() == 'adf11prc':
-            for args in configuration[adf]:
-                install_adf11prc(*args, download=download, repository_path=repository_path, adas_path=adas_path)
-        if adf.lower() == 'adf12':
-            for args in configuration[adf]:
-                install_adf12(*args, download=download, repository_path=repository_path, adas_path=adas_path)
-        if adf.lower() == 'adf15':
-            for args in configuration[adf]:
-                install_adf15(*args, download=download, repository_path=repository_path, adas_path=adas_path)
-        if adf.lower() == 'adf21':
-            for args in configuration[adf]:
-                install_adf21(*args, download=download, repository_path=repository_path, adas_path=adas_path)
-        if adf.lower() == 'adf22bmp':
-            for args in configuration[adf]:
-                install_adf22bmp(*args, download=download, repository_path=repository_path, adas_path=adas_path)
-        if adf.lower() == 'adf22bme':
-            for args in configuration[adf]:
-                install_adf22bme(*args, download=download, repository_path=repository_path, adas_path=adas_path)
+        if adf.lower() in _INSTALLERS:
+            tasks.extend((adf.lower(), tuple(args)) for args in configuration[adf])
+
+    if processes == 1 and not repository.is_container(repository_path):
+        for adf, args in tasks:
+            _INSTALLERS[adf](*args, download=download, repository_path=repository_path, adas_path=adas_path)
+        return
+
+    # locate and download the ADAS files before starting the workers
+    located_tasks = []
+    for adf, args in tasks:
+        path = _locate_adas_file(args[-1], download, adas_path, repository_path)
+        if not path:
+            raise ValueError("Could not locate the ADAS file '{}'.".format(args[-1]))
+        adas_root, file_path = os.path.split(os.path.abspath(path))
+        located_tasks.append((adf, args[:-1] + (file_path,), adas_root))
+
+    if processes == 1:
+        results = [_install_task(task) for task in located_tasks]
+    else:
+        with multiprocessing.get_context('fork').Pool(processes) as pool:
+            results = pool.map(_install_task, located_tasks)
+
+    files = {}
+    for result in results:
+        repository.merge_content(files, result)
+
+    repository.update_repository(files, repository_path)
+
+
+def _install_task(task):
+
+    adf, args, adas_path = task
+
+    # install the rates in a temporary JSON repository and return its content
+    with tempfile.TemporaryDirectory() as staging_path:
+        _INSTALLERS[adf](*args, download=False, repository_path=staging_path, adas_path=adas_path)
+        return repository.read_repository(staging_path)
 
 
 # todo: move print calls to logging
@@ -247,7 +278,8 @@ def install_adf12(donor_ion, donor_metastable, receiver_ion, receiver_charge, fi
     repository.update_beam_cx_rates(rates, repository_path)
 
 
-def install_adf15(element, ionisation, file_path, download=False, repository_path=None, adas_path=None, header_format=None):
+def install_adf15(element, ionisation, file_path, download=False, repository_path=None, adas_path=None, header_format=None,
+                  transitions=None):
     """
     Adds the rates in the ADF15 file to the repository.
 
@@ -257,6 +289,8 @@ def install_adf15(element, ionisation, file_path, download=False, repository_pat
     :param download: Attempt to download file if not present (Default=True).
     :param repository_path: Path to the repository in which to install the rates (optional).
     :param adas_path: Path to ADAS files repository (optional).
+    :param transitions: Sequence of transitions to install, if None (default) all the
+      transitions in the file are installed (optional).
     """
 
     print('Installing {}...'.format(file_path))
@@ -265,13 +299,13 @@ def install_adf15(element, ionisation, file_path, download=False, repository_pat
         raise ValueError('Could not locate the specified ADAS file.')
 
     # decode file and write out rates
-    rates, wavelengths = parse_adf15(element, ionisation, path, header_format=header_format)
+    rates, wavelengths = parse_adf15(element, ionisation, path, header_format=header_format, transitions=transitions)
 
     if 'thermalcx' in rates:
         cx_rates = rates.pop('thermalcx')
         # CX rates for Tdon = Trec (2D function of Ne, Te)
         # converting to 3D function of Ne, Te, Tdon
-        repository.update_pec_thermal_cx_rates(_thermalcx_adf15_2dto3d_converter(cx_rates))
+        repository.update_pec_thermal_cx_rates(_thermalcx_adf15_2dto3d_converter(cx_rates), repository_path)
 
     repository.update_pec_rates(rates, repository_path)
     repository.update_wavelengths(wavelengths, repository_path)
@@ -348,6 +382,21 @@ def install_adf22bme(beam_species, target_ion, target_charge, transition, file_p
     repository.update_beam_emission_rates(rate, repository_path)
 
 
+_INSTALLERS = {
+    'adf11scd': install_adf11scd,
+    'adf11acd': install_adf11acd,
+    'adf11ccd': install_adf11ccd,
+    'adf11plt': install_adf11plt,
+    'adf11prb': install_adf11prb,
+    'adf11prc': install_adf11prc,
+    'adf12': install_adf12,
+    'adf15': install_adf15,
+    'adf21': install_adf21,
+    'adf22bmp': install_adf22bmp,
+    'adf22bme': install_adf22bme,
+}
+
+
 def _locate_adas_file(file_path, download=False, adas_path=None, repository_path=None):
 
     path = None
@@ -361,7 +410,11 @@ def _locate_adas_file(file_path, download=False, adas_path=None, repository_path
 
     # download file?
     if not path and download:
-        target = os.path.join(repository_path, "_download_cache", file_path)
+        if repository.is_container(repository_path):
+            # the download cache of a rate container is kept alongside the container
+            target = os.path.join(os.path.dirname(os.path.abspath(repository_path)), "_download_cache", file_path)
+        else:
+            target = os.path.join(repository_path, "_download_cache", file_path)
 
         # is file in cache? if not download...
         if os.path.isfile(target):
@@ -16,19 +16,64 @@
 # See the Licence for the specific language governing permissions and limitations
 # under the Licence.
 
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
 from cherab.core import AtomicData
 from cherab.core.atomic.elements import Isotope
-from cherab.openadas.repository import DEFAULT_REPOSITORY_PATH
+from cherab.openadas.repository import DEFAULT_REPOSITORY_PATH, DEFAULT_CACHE_PATH
 
 from .rates import *
 from cherab.openadas import repository
 
 
+RateCacheInfo = namedtuple('RateCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def _memoise(method):
+    """
+    Returns the rate object from the rate cache of the OpenADAS instance if the same
+    rate has already been requested, otherwise creates it and stores in the cache.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+
+        if not self._rate_cache_size:
+            return method(self, *args, **kwargs)
+
+        key = (method.__name__, args, tuple(sorted(kwargs.items())), self._permit_extrapolation)
+        try:
+            rate = self._rate_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable arguments, cannot be cached
+            return method(self, *args, **kwargs)
+        else:
+            self._rate_cache.move_to_end(key)
+            self._rate_cache_hits += 1
+            return rate
+
+        rate = method(self, *args, **kwargs)
+        self._rate_cache_misses += 1
+        self._rate_cache[key] = rate
+        if len(self._rate_cache) > self._rate_cache_size:
+            # evict the least recently used rate
+            self._rate_cache.popitem(last=False)
+
+        return rate
+
+    return wrapper
+
+
 class OpenADAS(AtomicData):
     """
     OpenADAS atomic data source.
 
-    :param str data_path: OpenADAS local repository path.
+    :param str data_path: OpenADAS local repository path. Either a JSON repository
+                          directory or a single file rate container (see
+                          cherab.openadas.repository.pack_repository()).
     :param bool permit_extrapolation: If true, informs interpolation objects to allow extrapolation
                                       beyond the limits of the tabulated data. Default is False.
     :param bool missing_rates_return_null: If true, allows Null rate objects to be returned when
@@ -36,10 +81,20 @@ class OpenADAS(AtomicData):
     :param bool wavelength_element_fallback: If true, allows to use the element's wavelength when
                                              the isotope's wavelength is not available.
                                              Default is False.
+    :param bool cache: If true, the rate data parsed from the JSON files of the repository
+                       is stored in a binary cache and read from it on subsequent requests.
+                       A cached rate is re-read from JSON if the JSON file has been modified.
+                       Default is False.
+    :param str cache_path: Binary rate cache path. Defaults to ~/.cherab/openadas/cache.
+    :param int rate_cache_size: The maximum number of rate objects kept in the in-memory
+                                rate cache. Identical requests return the same rate object
+                                from the cache instead of creating a new one. When the cache
+                                is full, the least recently used rate is evicted.
+                                Default is 0 (the rate cache is disabled).
     """
 
     def __init__(self, data_path=None, permit_extrapolation=False, missing_rates_return_null=False,
-                 wavelength_element_fallback=False):
+                 wavelength_element_fallback=False, cache=False, cache_path=None, rate_cache_size=0):
 
         super().__init__()
         self._data_path = data_path or DEFAULT_REPOSITORY_PATH
@@ -50,10 +105,45 @@ class OpenADAS(AtomicData):
 
         self._wavelength_element_fallback = wavelength_element_fallback
 
+        self._cache_path = (cache_path or DEFAULT_CACHE_PATH) if cache else None
+
+        if rate_cache_size < 0:
+            raise ValueError('The rate cache size cannot be negative.')
+        self._rate_cache_size = rate_cache_size
+        self._rate_cache = OrderedDict()
+        self._rate_cache_hits = 0
+        self._rate_cache_misses = 0
+
     @property
     def data_path(self):
         return self._data_path
 
+    @property
+    def cache_path(self):
+        return self._cache_path
+
+    @property
+    def rate_cache_size(self):
+        return self._rate_cache_size
+
+    def rate_cache_info(self):
+        """
+        Returns the statistics of the in-memory rate cache.
+
+        :return: Named tuple (hits, misses, maxsize, currsize).
+        """
+
+        return RateCacheInfo(self._rate_cache_hits, self._rate_cache_misses, self._rate_cache_size, len(self._rate_cache))
+
+    def clear_rate_cache(self):
+        """
+        Removes all rate objects from the in-memory rate cache and resets the statistics.
+        """
+
+        self._rate_cache.clear()
+        self._rate_cache_hits = 0
+        self._rate_cache_misses = 0
+
     def wavelength(self, ion, charge, transition):
         """
         Spectral line wavelength for a given transition.
@@ -72,6 +162,7 @@ class OpenADAS(AtomicData):
 
         return repository.get_wavelength(ion, charge, transition, repository_path=self._data_path)
 
+    @_memoise
     def ionisation_rate(self, ion, charge):
         """
         Electron impact ionisation rate for a given species.
@@ -90,7 +181,8 @@ class OpenADAS(AtomicData):
 
         try:
             # read ionisation rate from json file in the repository
-            data = repository.get_ionisation_rate(ion, charge, repository_path=self._data_path)
+            data = repository.get_ionisation_rate(ion, charge, repository_path=self._data_path,
+                                                  cache_path=self._cache_path)
 
         except RuntimeError:
             if self._missing_rates_return_null:
@@ -99,6 +191,7 @@ class OpenADAS(AtomicData):
 
         return IonisationRate(data, extrapolate=self._permit_extrapolation)
 
+    @_memoise
     def recombination_rate(self, ion, charge):
         """
         Recombination rate for a given species.
@@ -117,7 +210,8 @@ class OpenADAS(AtomicData):
 
         try:
             # read recombination rate from json file in the repository
-            data = repository.get_recombination_rate(ion, charge, repository_path=self._data_path)
+            data = repository.get_recombination_rate(ion, charge, repository_path=self._data_path,
+                                                     cache_path=self._cache_path)
 
         except RuntimeError:
             if self._missing_rates_return_null:
@@ -126,6 +220,7 @@ class OpenADAS(AtomicData):
 
         return RecombinationRate(data, extrapolate=self._permit_extrapolation)
 
+    @_memoise
     def thermal_cx_rate(self, donor_element, donor_charge, receiver_element, receiver_charge):
         """
         Thermal charge exchange effective rate coefficient for a given donor and receiver species.
@@ -152,7 +247,8 @@ class OpenADAS(AtomicData):
             # read thermal CX rate from json file in the repository
             data = repository.get_thermal_cx_rate(donor_element, donor_charge,
                                                   receiver_element, receiver_charge,
-                                                  repository_path=self._data_path)
+                                                  repository_path=self._data_path,
+                                                  cache_path=self._cache_path)
 
         except RuntimeError:
             if self._missing_rates_return_null:
@@ -161,6 +257,7 @@ class OpenADAS(AtomicData):
 
         return ThermalCXRate(data, extrapolate=self._permit_extrapolation)
 
+    @_memoise
     def beam_cx_pec(self, donor_ion, receiver_ion, receiver_charge, transition):
         """
         Effective charge exchange photon emission coefficient for a given donor (beam)
@@ -192,7 +289,8 @@ class OpenADAS(AtomicData):
         try:
             # read element CX rate from json file in the repository
             data = repository.get_beam_cx_rates(donor_ion, receiver_ion_element, receiver_charge, transition,
-                                                repository_path=self._data_path)
+                                                repository_path=self._data_path,
+                                                cache_path=self._cache_path)
 
         except RuntimeError:
             if self._missing_rates_return_null:
@@ -209,6 +307,7 @@ class OpenADAS(AtomicData):
             rates.append(BeamCXPEC(donor_metastable, wavelength, rate_data, extrapolate=self._permit_extrapolation))
         return rates
 
+    @_memoise
     def beam_stopping_rate(self, beam_ion, plasma_ion, charge):
         """
         Beam stopping coefficient for a given beam and target species.
@@ -233,7 +332,8 @@ class OpenADAS(AtomicData):
 
         try:
             # read beam stopping rate from json file in the repository
-            data = repository.get_beam_stopping_rate(beam_ion, plasma_ion, charge, repository_path=self._data_path)
+            data = repository.get_beam_stopping_rate(beam_ion, plasma_ion, charge, repository_path=self._data_path,
+                                                     cache_path=self._cache_path)
 
         except RuntimeError:
             if self._missing_rates_return_null:
@@ -243,6 +343,7 @@ class OpenADAS(AtomicData):
         # load and interpolate data
         return BeamStoppingRate(data, extrapolate=self._permit_extrapolation)
 
+    @_memoise
     def beam_population_rate(self, beam_ion, metastable, plasma_ion, charge):
         """
         Beam population coefficient for a given beam and target species.
@@ -269,7 +370,8 @@ class OpenADAS(AtomicData):
         try:
             # read beam population rate from json file in the repository
             data = repository.get_beam_population_rate(beam_ion, metastable, plasma_ion, charge,
-                                                       repository_path=self._data_path)
+                                                       repository_path=self._data_path,
+                                                       cache_path=self._cache_path)
 
         except RuntimeError:
             if self._missing_rates_return_null:
@@ -279,6 +381,7 @@ class OpenADAS(AtomicData):
         # load and interpolate data
         return BeamPopulationRate(data, extrapolate=self._permit_extrapolation)
 
+    @_memoise
     def beam_emission_pec(self, beam_ion, plasma_ion, charge, transition):
         """
         The beam photon emission coefficient for a given beam and target species
@@ -306,7 +409,8 @@ class OpenADAS(AtomicData):
         try:
             # read beam emission PEC from json file in the repository
             data = repository.get_beam_emission_rate(beam_ion_element, plasma_ion, charge, transition,
-                                                     repository_path=self._data_path)
+                                                     repository_path=self._data_path,
+                                                     cache_path=self._cache_path)
 
         except RuntimeError:
             if self._missing_rates_return_null:
@@ -320,6 +424,7 @@ class OpenADAS(AtomicData):
         # load and interpolate data
         return BeamEmissionPEC(data, wavelength, extrapolate=self._permit_extrapolation)
 
+    @_memoise
     def impact_excitation_pec(self, ion, charge, transition):
         """
         Electron impact excitation photon emission coefficient for a given species.
@@ -340,7 +445,8 @@ class OpenADAS(AtomicData):
 
         try:
             # read electron impact excitation PEC from json file in the repository
-            data = repository.get_pec_excitation_rate(ion_element, charge, transition, repository_path=self._data_path)
+            data = repository.get_pec_excitation_rate(ion_element, charge, transition, repository_path=self._data_path,
+                                                      cache_path=self._cache_path)
 
         except RuntimeError:
             if self._missing_rates_return_null:
@@ -353,6 +459,7 @@ class OpenADAS(AtomicData):
 
         return ImpactExcitationPEC(wavelength, data, extrapolate=self._permit_extrapolation)
 
+    @_memoise
     def recombination_pec(self, ion, charge, transition):
         """
         Recombination photon emission coefficient for a given species.
@@ -373,7 +480,8 @@ class OpenADAS(AtomicData):
 
         try:
             # read free electron recombination PEC from json file in the repository
-            data = repository.get_pec_recombination_rate(ion_element, charge, transition, repository_path=self._data_path)
+            data = repository.get_pec_recombination_rate(ion_element, charge, transition, repository_path=self._data_path,
+                                                         cache_path=self._cache_path)
 
         except (FileNotFoundError, KeyError):
             if self._missing_rates_return_null:
@@ -386,6 +494,7 @@ class OpenADAS(AtomicData):
 
         return RecombinationPEC(wavelength, data, extrapolate=self._permit_extrapolation)
 
+    @_memoise
     def thermal_cx_pec(self, donor_element, donor_charge, receiver_element, receiver_charge, transition):
         """
         Thermal CX photon emission coefficient for a given species.
@@ -415,7 +524,8 @@ class OpenADAS(AtomicData):
             data = repository.get_pec_thermal_cx_rate(donor_element, donor_charge,
                                                       receiver_element, receiver_charge,
                                                       transition,
-                                                      repository_path=self._data_path)
+                                                      repository_path=self._data_path,
+                                                      cache_path=self._cache_path)
 
         except RuntimeError:
             if self._missing_rates_return_null:
@@ -428,6 +538,7 @@ class OpenADAS(AtomicData):
 
         return ThermalCXPEC(wavelength, data, extrapolate=self._permit_extrapolation)
 
+    @_memoise
     def line_radiated_power_rate(self, ion, charge):
         """
         Line radiated power coefficient for a given species.
@@ -447,7 +558,8 @@ class OpenADAS(AtomicData):
 
         try:
             # read total line radiated power rate from json file in the repository
-            data = repository.get_line_radiated_power_rate(ion, charge, repository_path=self._data_path)
+            data = repository.get_line_radiated_power_rate(ion, charge, repository_path=self._data_path,
+                                                           cache_path=self._cache_path)
 
         except RuntimeError:
             if self._missing_rates_return_null:
@@ -456,6 +568,7 @@ class OpenADAS(AtomicData):
 
         return LineRadiationPower(ion, charge, data, extrapolate=self._permit_extrapolation)
 
+    @_memoise
     def continuum_radiated_power_rate(self, ion, charge):
         """
         Recombination continuum radiated power coefficient for a given species.
@@ -475,7 +588,8 @@ class OpenADAS(AtomicData):
 
         try:
             # read continuum radiated power rate from json file in the repository
-            data = repository.get_continuum_radiated_power_rate(ion, charge, repository_path=self._data_path)
+            data = repository.get_continuum_radiated_power_rate(ion, charge, repository_path=self._data_path,
+                                                                cache_path=self._cache_path)
 
         except RuntimeError:
             if self._missing_rates_return_null:
@@ -484,6 +598,7 @@ class OpenADAS(AtomicData):
 
         return ContinuumPower(ion, charge, data, extrapolate=self._permit_extrapolation)
 
+    @_memoise
     def cx_radiated_power_rate(self, ion, charge):
         """
         Charge exchange radiated power coefficient for a given species.
@@ -503,7 +618,8 @@ class OpenADAS(AtomicData):
 
         try:
             # read CX radiated power rate from json file in the repository
-            data = repository.get_cx_radiated_power_rate(ion, charge, repository_path=self._data_path)
+            data = repository.get_cx_radiated_power_rate(ion, charge, repository_path=self._data_path,
+                                                         cache_path=self._cache_path)
 
         except RuntimeError:
             if self._missing_rates_return_null:
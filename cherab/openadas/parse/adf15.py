@@ -41,14 +41,19 @@ _L_LOOKUP = {
 }
 
 
-def parse_adf15(element, charge, adf_file_path, header_format=None):
+def parse_adf15(element, charge, adf_file_path, header_format=None, transitions=None):
     """
     Opens and parses ADAS ADF15 data files.
 
+    The data blocks of the file are indexed in a single pass, after which only the
+    numeric data of the requested blocks is read and converted.
+
     :param element: Element described by ADF file.
     :param charge: Charge state described by ADF file.
     :param adf_file_path: Path to ADF15 file from ADAS root.
-    :return: Dictionary containing rates.
+    :param transitions: Sequence of transitions to read, e.g. [(3, 2), (4, 2)].
+      If None (default), all the transitions in the file are read.
+    :return: Dictionaries containing the rates and the wavelengths of the read transitions.
     """
 
     if not isinstance(element, Element):
@@ -80,16 +85,32 @@ def parse_adf15(element, charge, adf_file_path, header_format=None):
         if not config:
             raise RuntimeError("Unable to parse ADF15 metadata.")
 
-        # process rate data
-        rates = RecursiveDict()
+    if transitions is not None:
+        transitions = set(transitions)
+
+    # process rate data
+    rates = RecursiveDict()
+    with open(adf_file_path, "rb") as file:
+
+        blocks = _index_blocks(file)
+
         for cls in ('excitation', 'recombination', 'thermalcx'):
             for element, charge_states in config[cls].items():
-                for charge, transitions in charge_states.items():
-                    for transition in transitions.keys():
-                        block_num = config[cls][element][charge][transition]
-                        rates[cls][element][charge][transition] = _extract_rate(file, block_num)
+                for charge, block_nums in charge_states.items():
+                    for transition, block_num in block_nums.items():
+                        if transitions is None or transition in transitions:
+                            rates[cls][element][charge][transition] = _extract_rate(file, blocks, block_num)
+
+    if transitions is None:
+        wavelengths = config['wavelength']
+    else:
+        wavelengths = RecursiveDict()
+        for element, charge_states in config['wavelength'].items():
+            for charge, transition_wavelengths in charge_states.items():
+                for transition, wavelength in transition_wavelengths.items():
+                    if transition in transitions:
+                        wavelengths[element][charge][transition] = wavelength
 
-    wavelengths = config['wavelength']
     return rates, wavelengths
 
 
@@ -247,91 +268,68 @@ def _scrape_metadata_full(file, element, charge):
     return config
 
 
-def _extract_rate(file, block_num):
+def _index_blocks(file):
     """
-    Reads and converts the rate data for the specified block.
+    Scans the block headers of the file and returns the location of the data blocks.
+
+    :return: Dictionary in the form {<block number>: (<data start>, <data end>, <number of
+      densities>, <number of temperatures>)}, where the data start and end are byte offsets.
     """
 
     # search from start of file
     file.seek(0)
 
-    wavelength_match = r"^\s*[0-9]*\.[0-9]* ?a? +.*$"
-    block_id_match = r"^\s*[0-9]*\.[0-9]* ?a?\s*([0-9]*)\s*([0-9]*).*/type *= *([a-zA-Z]*).*/isel *= * ([0-9]*)$"
+    block_id_match = re.compile(rb"^\s*[0-9]*\.[0-9]* ?a?\s*([0-9]*)\s*([0-9]*).*/type *= *([a-zA-Z]*).*/isel *= * ([0-9]*)\s*$",
+                                re.IGNORECASE)
 
-    for block in _group_by_block(file, wavelength_match):
-        match = re.match(block_id_match, block[0], re.IGNORECASE)
+    blocks = {}
+    block = None
+    offset = 0
+    for line in file:
 
-        if not match:
-            continue
+        # only block headers contain '/', skip the data lines without running the regex
+        match = block_id_match.match(line) if b'/' in line else None
+        if match:
+            if block:
+                blocks[block[0]] = (block[1], offset) + block[2:]
+            num_n, num_t, _, block_num = match.groups()
+            block = (int(block_num), offset + len(line), int(num_n), int(num_t))
 
-        if int(match.groups()[3]) == block_num:
-            # get number of n, T and rate data points:
-            num_n = int(match.groups()[0])
-            num_t = int(match.groups()[1])
-            num_r = num_n * num_t
-
-            block.pop(0)
-
-            # Load density values
-            nn = 0
-            density = []
-            while nn != num_n:
-                next_line = block.pop(0)
-                components = next_line.split()
-                for value in components:
-                    nn += 1
-                    density.append(float(value))
-
-            # Load temperature values
-            nt = 0
-            temperature = []
-            while nt != num_t:
-                next_line = block.pop(0)
-                components = next_line.split()
-                for value in components:
-                    nt += 1
-                    temperature.append(float(value))
-
-            # Load rate values
-            nr = 0
-            rates = []
-            while nr != num_r:
-                next_line = block.pop(0)
-                components = next_line.split()
-                for value in components:
-                    nr += 1
-                    rates.append(float(value))
-
-            density = np.array(density)
-            temperature = np.array(temperature)
-            rates = np.array(rates)
-            rates = rates.reshape((num_n, num_t))
-
-            # convert units from cm^-3 to m^-3
-            density = PerCm3ToPerM3.to(density)
-            rates = Cm3ToM3.to(rates)
-
-            return {'ne': density, 'te': temperature, 'rate': rates}
-
-    # If code gets to here, block wasn't found.
-    raise RuntimeError('Block number {} was not found in the ADF15 file.'.format(block_num))
-
-
-def _group_by_block(source_file, match_string):
-    """
-    Generator the splits the ADF15 file into blocks.
+        offset += len(line)
+
+    # the last block extends to the end of file, over-reading is harmless as the block size is known
+    if block:
+        blocks[block[0]] = (block[1], offset) + block[2:]
 
-    Groups lines of file into blocks based on precursor '  6561.9A   24...'
+    return blocks
 
-    Note: comment section not filtered out of last block, don't over-read!
+
+def _extract_rate(file, blocks, block_num):
+    """
+    Reads and converts the rate data for the specified block.
     """
 
-    buffer = []
-    for line in source_file:
-        if re.match(match_string, line, re.IGNORECASE):
-            if buffer:
-                yield buffer
-            buffer = [line]
-        else:
-            buffer.append(line)
-    yield buffer
+    try:
+        start, end, num_n, num_t = blocks[block_num]
+    except KeyError:
+        raise RuntimeError('Block number {} was not found in the ADF15 file.'.format(block_num))
+
+    num_r = num_n * num_t
+    num_values = num_n + num_t + num_r
+
+    # read the whole block at once and convert the values in bulk
+    file.seek(start)
+    values = file.read(end - start).split(None, num_values)[:num_values]
+    if len(values) != num_values:
+        raise RuntimeError('Block number {} of the ADF15 file is incomplete.'.format(block_num))
+    values = np.array(values).astype(np.float64)
+
+    density = values[:num_n]
+    temperature = values[num_n:num_n + num_t]
+    rates = values[num_n + num_t:].reshape((num_n, num_t))
+
+    # convert units from cm^-3 to m^-3
+    density = PerCm3ToPerM3.to(density)
+    rates = Cm3ToM3.to(rates)
+
+    return {'ne': density, 'te': temperature, 'rate': rates}
@@ -80,6 +80,9 @@ cdef class NullIonisationRate(CoreIonisationRate):
     cpdef double evaluate(self, double density, double temperature) except? -1e999:
         return 0.0
 
+    def evaluate_array(self, density, temperature):
+        return np.zeros(np.broadcast(density, temperature).shape)
+
 
 cdef class RecombinationRate(CoreRecombinationRate):
     """
@@ -138,6 +141,9 @@ cdef class NullRecombinationRate(CoreRecombinationRate):
     cpdef double evaluate(self, double density, double temperature) except? -1e999:
         return 0.0
 
+    def evaluate_array(self, density, temperature):
+        return np.zeros(np.broadcast(density, temperature).shape)
+
 
 cdef class ThermalCXRate(CoreThermalCXRate):
     """
@@ -194,3 +200,6 @@ cdef class NullThermalCXRate(CoreThermalCXRate):
 
     cpdef double evaluate(self, double density, double temperature) except? -1e999:
         return 0.0
+
+    def evaluate_array(self, density, temperature):
+        return np.zeros(np.broadcast(density, temperature).shape)
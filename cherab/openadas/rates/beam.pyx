@@ -112,6 +112,9 @@ cdef class NullBeamStoppingRate(CoreBeamStoppingRate):
     cpdef double evaluate(self, double energy, double density, double temperature) except? -1e999:
         return 0.0
 
+    def evaluate_array(self, energy, density, temperature):
+        return np.zeros(np.broadcast(energy, density, temperature).shape)
+
 
 cdef class BeamPopulationRate(CoreBeamPopulationRate):
     """
@@ -198,6 +201,9 @@ cdef class NullBeamPopulationRate(CoreBeamPopulationRate):
     cpdef double evaluate(self, double energy, double density, double temperature) except? -1e999:
         return 0.0
 
+    def evaluate_array(self, energy, density, temperature):
+        return np.zeros(np.broadcast(energy, density, temperature).shape)
+
 
 cdef class BeamEmissionPEC(CoreBeamEmissionPEC):
     """
@@ -284,3 +290,6 @@ cdef class NullBeamEmissionPEC(CoreBeamEmissionPEC):
 
     cpdef double evaluate(self, double energy, double density, double temperature) except? -1e999:
         return 0.0
+
+    def evaluate_array(self, energy, density, temperature):
+        return np.zeros(np.broadcast(energy, density, temperature).shape)
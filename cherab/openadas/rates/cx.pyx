@@ -150,3 +150,6 @@ cdef class NullBeamCXPEC(CoreBeamCXPEC):
 
     cpdef double evaluate(self, double energy, double temperature, double density, double z_effective, double b_field) except? -1e999:
         return 0.0
+
+    def evaluate_array(self, energy, temperature, density, z_effective, b_field):
+        return np.zeros(np.broadcast(energy, temperature, density, z_effective, b_field).shape)
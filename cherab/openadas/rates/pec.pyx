@@ -86,6 +86,9 @@ cdef class NullImpactExcitationPEC(CoreImpactExcitationPEC):
     cpdef double evaluate(self, double density, double temperature) except? -1e999:
         return 0.0
 
+    def evaluate_array(self, density, temperature):
+        return np.zeros(np.broadcast(density, temperature).shape)
+
 
 cdef class RecombinationPEC(CoreRecombinationPEC):
     """
@@ -149,6 +152,9 @@ cdef class NullRecombinationPEC(CoreRecombinationPEC):
     cpdef double evaluate(self, double density, double temperature) except? -1e999:
         return 0.0
 
+    def evaluate_array(self, density, temperature):
+        return np.zeros(np.broadcast(density, temperature).shape)
+
 
 cdef class ThermalCXPEC(CoreThermalCXPEC):
 
@@ -199,3 +205,6 @@ cdef class NullThermalCXPEC(CoreThermalCXPEC):
 
     cpdef double evaluate(self, double electron_density, double electron_temperature, double donor_temperature) except? -1e999:
         return 0.0
+
+    def evaluate_array(self, electron_density, electron_temperature, donor_temperature):
+        return np.zeros(np.broadcast(electron_density, electron_temperature, donor_temperature).shape)
@@ -84,6 +84,9 @@ cdef class NullLineRadiationPower(CoreLineRadiationPower):
     cpdef double evaluate(self, double electron_density, double electron_temperature) except? -1e999:
         return 0.0
 
+    def evaluate_array(self, electron_density, electron_temperature):
+        return np.zeros(np.broadcast(electron_density, electron_temperature).shape)
+
 
 cdef class ContinuumPower(CoreContinuumPower):
     """
@@ -146,6 +149,9 @@ cdef class NullContinuumPower(CoreContinuumPower):
     cpdef double evaluate(self, double electron_density, double electron_temperature) except? -1e999:
         return 0.0
 
+    def evaluate_array(self, electron_density, electron_temperature):
+        return np.zeros(np.broadcast(electron_density, electron_temperature).shape)
+
 
 cdef class CXRadiationPower(CoreCXRadiationPower):
     """
@@ -206,3 +212,6 @@ cdef class NullCXRadiationPower(CoreCXRadiationPower):
 
     cpdef double evaluate(self, double electron_density, double electron_temperature) except? -1e999:
         return 0.0
+
+    def evaluate_array(self, electron_density, electron_temperature):
+        return np.zeros(np.broadcast(electron_density, electron_temperature).shape)
@@ -21,5 +21,8 @@ from .pec import *
 from .atomic import *
 from .wavelength import *
 from .radiated_power import *
-from .utility import DEFAULT_REPOSITORY_PATH
+from .utility import DEFAULT_REPOSITORY_PATH, DEFAULT_CACHE_PATH
+from .cache import clear_cache
+from .container import CONTAINER_EXTENSION, is_container, pack_repository, read_repository, update_repository, \
+    container_writer, merge_content
 from .create import populate
@@ -23,7 +23,9 @@ import numpy as np
 
 from cherab.core.atomic import Element
 from cherab.core.utility import RecursiveDict
-from .utility import DEFAULT_REPOSITORY_PATH, valid_charge
+from .cache import load_rate
+from .container import container_writer
+from .utility import DEFAULT_REPOSITORY_PATH, valid_charge, convert_rate
 
 
 def add_ionisation_rate(species, charge, rate, repository_path=None):
@@ -52,6 +54,7 @@ def add_ionisation_rate(species, charge, rate, repository_path=None):
     }, repository_path)
 
 
+@container_writer
 def update_ionisation_rates(rates, repository_path=None):
     """
     Updates the ionisation rate files `/ionisation/<species>.json`
@@ -110,6 +113,7 @@ def add_recombination_rate(species, charge, rate, repository_path=None):
     }, repository_path)
 
 
+@container_writer
 def update_recombination_rates(rates, repository_path=None):
     """
     Updates the recombination rate files `/recombination/<species>.json`
@@ -169,6 +173,7 @@ def add_thermal_cx_rate(donor_element, donor_charge, receiver_element, rate, rep
     update_thermal_cx_rates(rates2update, repository_path)
 
 
+@container_writer
 def update_thermal_cx_rates(rates, repository_path=None):
     """
     Updates the thermal charge exchange rate files
@@ -254,7 +259,7 @@ def _update_and_write_adf11(species, rate_data, path):
                 json.dump(content, f, indent=2, sort_keys=True)
 
 
-def get_ionisation_rate(element, charge, repository_path=None):
+def get_ionisation_rate(element, charge, repository_path=None, cache_path=None):
     """
     Reads the ionisation rate for the given species and charge
     from the atomic data repository.
@@ -262,6 +267,8 @@ def get_ionisation_rate(element, charge, repository_path=None):
     :param element: Plasma species (Element/Isotope).
     :param charge: Charge of the plasma species.
     :param repository_path: Path to the atomic data repository.
+    :param cache_path: Path to the binary rate cache directory. If None (default),
+      the rates are always read from the JSON files.
 
     :return rate: Ionisation rate dictionary containing the following entries:
 
@@ -275,22 +282,15 @@ def get_ionisation_rate(element, charge, repository_path=None):
 
     path = os.path.join(repository_path, 'ionisation/{}.json'.format(element.symbol.lower()))
     try:
-        with open(path, 'r') as f:
-            content = json.load(f)
-        d = content[str(charge)]
+        d = load_rate(path, str(charge), convert_rate, cache_path)
     except (FileNotFoundError, KeyError):
         raise RuntimeError('Requested ionisation rate (element={}, charge={})'
                            ' is not available.'.format(element.symbol, charge))
 
-    # convert to numpy arrays
-    d['ne'] = np.array(d['ne'], np.float64)
-    d['te'] = np.array(d['te'], np.float64)
-    d['rate'] = np.array(d['rate'], np.float64)
-
     return d
 
 
-def get_recombination_rate(element, charge, repository_path=None):
+def get_recombination_rate(element, charge, repository_path=None, cache_path=None):
     """
     Reads the recombination rate for the given species and charge
     from the atomic data repository.
@@ -298,6 +298,8 @@ def get_recombination_rate(element, charge, repository_path=None):
     :param element: Plasma species (Element/Isotope).
     :param charge: Charge of the plasma species.
     :param repository_path: Path to the atomic data repository.
+    :param cache_path: Path to the binary rate cache directory. If None (default),
+      the rates are always read from the JSON files.
 
     :return rate: Recombination rate dictionary containing the following entries:
 
@@ -311,22 +313,15 @@ def get_recombination_rate(element, charge, repository_path=None):
 
     path = os.path.join(repository_path, 'recombination/{}.json'.format(element.symbol.lower()))
     try:
-        with open(path, 'r') as f:
-            content = json.load(f)
-        d = content[str(charge)]
+        d = load_rate(path, str(charge), convert_rate, cache_path)
     except (FileNotFoundError, KeyError):
         raise RuntimeError('Requested recombination rate (element={}, charge={})'
                            ' is not available.'.format(element.symbol, charge))
 
-    # convert to numpy arrays
-    d['ne'] = np.array(d['ne'], np.float64)
-    d['te'] = np.array(d['te'], np.float64)
-    d['rate'] = np.array(d['rate'], np.float64)
-
     return d
 
 
-def get_thermal_cx_rate(donor_element, donor_charge, receiver_element, receiver_charge, repository_path=None):
+def get_thermal_cx_rate(donor_element, donor_charge, receiver_element, receiver_charge, repository_path=None, cache_path=None):
     """
     Reads the thermal charge exchange rate for the given species and charge
     from the atomic data repository.
@@ -336,6 +331,8 @@ def get_thermal_cx_rate(donor_element, donor_charge, receiver_element, receiver_
     :param receiver_element: Element receiving the electron.
     :param receiver_charge: Charge of the receiving atom/ion.
     :param repository_path: Path to the atomic data repository.
+    :param cache_path: Path to the binary rate cache directory. If None (default),
+      the rates are always read from the JSON files.
 
     :return rate: Thermal CX rate dictionary containing the following entries:
 
@@ -351,17 +348,10 @@ def get_thermal_cx_rate(donor_element, donor_charge, receiver_element, receiver_
                                                      receiver_element.symbol.lower())
     path = os.path.join(repository_path, rate_path)
     try:
-        with open(path, 'r') as f:
-            content = json.load(f)
-        d = content[str(receiver_charge)]
+        d = load_rate(path, str(receiver_charge), convert_rate, cache_path)
     except (FileNotFoundError, KeyError):
         raise RuntimeError('Requested thermal charge-exchange rate (donor={}, donor charge={}, receiver={})'
                            ' is not available.'
                            ''.format(donor_element.symbol, donor_charge, receiver_element.symbol, receiver_charge))
 
-    # convert to numpy arrays
-    d['ne'] = np.array(d['ne'], np.float64)
-    d['te'] = np.array(d['te'], np.float64)
-    d['rate'] = np.array(d['rate'], np.float64)
-
     return d
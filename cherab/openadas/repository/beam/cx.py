@@ -20,6 +20,8 @@ import json
 import numpy as np
 from cherab.core.utility import RecursiveDict
 from cherab.core.atomic import Element
+from ..cache import load_rate
+from ..container import container_writer
 from ..utility import DEFAULT_REPOSITORY_PATH, valid_charge, encode_transition
 
 """
@@ -71,6 +73,7 @@ def add_beam_cx_rate(donor_ion, donor_metastable, receiver_ion, receiver_charge,
     }, repository_path)
 
 
+@container_writer
 def update_beam_cx_rates(rates, repository_path=None):
     """
     Updates the beam CX PEC files
@@ -207,7 +210,26 @@ def update_beam_cx_rates(rates, repository_path=None):
                     json.dump(content, f, indent=2, sort_keys=True)
 
 
-def get_beam_cx_rates(donor_ion, receiver_ion, receiver_charge, transition, repository_path=None):
+def _convert_rates(rates):
+
+    # sanitise data and convert to (more useful) numpy arrays rather than lists
+    for rate in rates.values():
+        rate['eb'] = np.array(rate['eb'], np.float64)
+        rate['ti'] = np.array(rate['ti'], np.float64)
+        rate['ni'] = np.array(rate['ni'], np.float64)
+        rate['z'] = np.array(rate['z'], np.float64)
+        rate['b'] = np.array(rate['b'], np.float64)
+        rate['qref'] = float(rate['qref'])
+        rate['qeb'] = np.array(rate['qeb'], np.float64)
+        rate['qti'] = np.array(rate['qti'], np.float64)
+        rate['qni'] = np.array(rate['qni'], np.float64)
+        rate['qz'] = np.array(rate['qz'], np.float64)
+        rate['qb'] = np.array(rate['qb'], np.float64)
+
+    return rates
+
+
+def get_beam_cx_rates(donor_ion, receiver_ion, receiver_charge, transition, repository_path=None, cache_path=None):
     """
     Reads a single beam CX PEC from the repository.
 
@@ -217,6 +239,8 @@ def get_beam_cx_rates(donor_ion, receiver_ion, receiver_charge, transition, repo
     :param receiver_charge: Charge of the receiving atom/ion.
     :param transition: Tuple containing (initial level, final level).
     :param repository_path: Path to the atomic data repository.
+    :param cache_path: Path to the binary rate cache directory. If None (default),
+      the rates are always read from the JSON files.
 
     :return rate: Beam CX PEC dictionary containing the following entries:
 
@@ -238,25 +262,9 @@ def get_beam_cx_rates(donor_ion, receiver_ion, receiver_charge, transition, repo
     repository_path = repository_path or DEFAULT_REPOSITORY_PATH
     path = os.path.join(repository_path, 'beam/cx/{}/{}/{}.json'.format(donor_ion.symbol.lower(), receiver_ion.symbol.lower(), receiver_charge))
     try:
-        with open(path, 'r') as f:
-            content = json.load(f)
-        rates = content[encode_transition(transition)]
+        rates = load_rate(path, encode_transition(transition), _convert_rates, cache_path)
     except (FileNotFoundError, KeyError):
         raise RuntimeError('Requested beam CX effective emission rates (donor={}, receiver={}, charge={}, transition={})'
                            ' are not available.'.format(donor_ion.symbol, receiver_ion.symbol, receiver_charge, transition))
 
-    # sanitise data and convert to (more useful) numpy arrays rather than lists
-    for rate in rates.values():
-        rate['eb'] = np.array(rate['eb'], np.float64)
-        rate['ti'] = np.array(rate['ti'], np.float64)
-        rate['ni'] = np.array(rate['ni'], np.float64)
-        rate['z'] = np.array(rate['z'], np.float64)
-        rate['b'] = np.array(rate['b'], np.float64)
-        rate['qref'] = float(rate['qref'])
-        rate['qeb'] = np.array(rate['qeb'], np.float64)
-        rate['qti'] = np.array(rate['qti'], np.float64)
-        rate['qni'] = np.array(rate['qni'], np.float64)
-        rate['qz'] = np.array(rate['qz'], np.float64)
-        rate['qb'] = np.array(rate['qb'], np.float64)
-
     return [(int(metastable), rate) for metastable, rate in rates.items()]
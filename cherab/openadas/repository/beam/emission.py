@@ -21,7 +21,9 @@ import json
 import numpy as np
 from cherab.core.utility import RecursiveDict
 from cherab.core.atomic import Element
-from ..utility import DEFAULT_REPOSITORY_PATH, valid_charge, encode_transition
+from ..cache import load_rate
+from ..container import container_writer
+from ..utility import DEFAULT_REPOSITORY_PATH, valid_charge, encode_transition, convert_beam_rate
 
 """
 Utilities for managing the local rate repository - PEC section.
@@ -67,6 +69,7 @@ def add_beam_emission_rate(beam_species, target_ion, target_charge, transition,
     }, repository_path)
 
 
+@container_writer
 def update_beam_emission_rates(rates, repository_path=None):
     """
     Updates the beam emission rate files:
@@ -172,7 +175,7 @@ def update_beam_emission_rates(rates, repository_path=None):
                     json.dump(content, f, indent=2, sort_keys=True)
 
 
-def get_beam_emission_rate(beam_species, target_ion, target_charge, transition, repository_path=None):
+def get_beam_emission_rate(beam_species, target_ion, target_charge, transition, repository_path=None, cache_path=None):
     """
     Reads a single beam emission rate from the repository.
 
@@ -181,6 +184,8 @@ def get_beam_emission_rate(beam_species, target_ion, target_charge, transition,
     :param target_charge: Charge of the target species.
     :param transition: Tuple containing (initial level, final level).
     :param repository_path: Path to the atomic data repository.
+    :param cache_path: Path to the binary rate cache directory. If None (default),
+      the rates are always read from the JSON files.
 
     :return rate: Beam emission rate dictionary containing the following entries:
 
@@ -200,18 +205,9 @@ def get_beam_emission_rate(beam_species, target_ion, target_charge, transition,
     repository_path = repository_path or DEFAULT_REPOSITORY_PATH
     path = os.path.join(repository_path, 'beam/emission/{}/{}/{}.json'.format(beam_species.symbol.lower(), target_ion.symbol.lower(), target_charge))
     try:
-        with open(path, 'r') as f:
-            content = json.load(f)
-        rate = content[encode_transition(transition)]
+        rate = load_rate(path, encode_transition(transition), convert_beam_rate, cache_path)
     except (FileNotFoundError, KeyError):
         raise RuntimeError('Requested beam emission rate (beam species={}, target ion={}, target charge={}, transition={})'
                            ' is not available.'.format(beam_species.symbol, target_ion.symbol, target_charge, transition))
 
-    # convert lists to numpy arrays
-    rate['e'] = np.array(rate['e'], np.float64)
-    rate['n'] = np.array(rate['n'], np.float64)
-    rate['t'] = np.array(rate['t'], np.float64)
-    rate['sen'] = np.array(rate['sen'], np.float64)
-    rate['st'] = np.array(rate['st'], np.float64)
-
     return rate
\ No newline at end of file
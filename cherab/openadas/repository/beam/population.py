@@ -20,13 +20,16 @@ import os
 import json
 import numpy as np
 from cherab.core.atomic import Element
-from ..utility import DEFAULT_REPOSITORY_PATH, valid_charge
+from ..cache import load_rate
+from ..container import container_writer
+from ..utility import DEFAULT_REPOSITORY_PATH, valid_charge, convert_beam_rate
 
 """
 Utilities for managing the local rate repository - beam population section.
 """
 
 
+@container_writer
 def add_beam_population_rate(beam_species, beam_metastable, target_ion, target_charge, rate, repository_path=None):
     """
     Adds a single beam population rate to the repository.
@@ -112,6 +115,7 @@ def add_beam_population_rate(beam_species, beam_metastable, target_ion, target_c
         json.dump(rate, f, indent=2, sort_keys=True)
 
 
+@container_writer
 def update_beam_population_rates(rates, repository_path=None):
     """
     Updates the beam population rate files
@@ -149,7 +153,7 @@ def update_beam_population_rates(rates, repository_path=None):
                     add_beam_population_rate(beam_species, beam_metastable, target_ion, target_charge, rate, repository_path)
 
 
-def get_beam_population_rate(beam_species, beam_metastable, target_ion, target_charge, repository_path=None):
+def get_beam_population_rate(beam_species, beam_metastable, target_ion, target_charge, repository_path=None, cache_path=None):
     """
     Reads a single beam population rate from the repository.
 
@@ -158,6 +162,8 @@ def get_beam_population_rate(beam_species, beam_metastable, target_ion, target_c
     :param target_ion: Target species (Element/Isotope).
     :param target_charge: Charge of the target species.
     :param repository_path: Path to the atomic data repository.
+    :param cache_path: Path to the binary rate cache directory. If None (default),
+      the rates are always read from the JSON files.
 
     :return rate: Beam population rate dictionary containing the following entries:
 
@@ -177,17 +183,9 @@ def get_beam_population_rate(beam_species, beam_metastable, target_ion, target_c
     repository_path = repository_path or DEFAULT_REPOSITORY_PATH
     path = os.path.join(repository_path, 'beam/population/{}/{}/{}/{}.json'.format(beam_species.symbol.lower(), beam_metastable, target_ion.symbol.lower(), target_charge))
     try:
-        with open(path, 'r') as f:
-            rate = json.load(f)
+        rate = load_rate(path, None, convert_beam_rate, cache_path)
     except FileNotFoundError:
         raise RuntimeError('Requested beam population rate (beam species={}, beam metastable={}, target ion={}, target charge={})'
                            ' is not available.'.format(beam_species.symbol, beam_metastable, target_ion.symbol, target_charge))
 
-    # convert lists to numpy arrays
-    rate['e'] = np.array(rate['e'], np.float64)
-    rate['n'] = np.array(rate['n'], np.float64)
-    rate['t'] = np.array(rate['t'], np.float64)
-    rate['sen'] = np.array(rate['sen'], np.float64)
-    rate['st'] = np.array(rate['st'], np.float64)
-
     return rate
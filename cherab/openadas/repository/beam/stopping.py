@@ -20,13 +20,16 @@ import os
 import json
 import numpy as np
 from cherab.core.atomic import Element
-from ..utility import DEFAULT_REPOSITORY_PATH, valid_charge
+from ..cache import load_rate
+from ..container import container_writer
+from ..utility import DEFAULT_REPOSITORY_PATH, valid_charge, convert_beam_rate
 
 """
 Utilities for managing the local rate repository - beam stopping section.
 """
 
 
+@container_writer
 def add_beam_stopping_rate(beam_species, target_ion, target_charge, rate, repository_path=None):
     """
     Adds a single beam stopping/excitation rate to the repository.
@@ -108,6 +111,7 @@ def add_beam_stopping_rate(beam_species, target_ion, target_charge, rate, reposi
         json.dump(rate, f, indent=2, sort_keys=True)
 
 
+@container_writer
 def update_beam_stopping_rates(rates, repository_path=None):
     """
     Updates the beam stopping rate files
@@ -142,7 +146,7 @@ def update_beam_stopping_rates(rates, repository_path=None):
                 add_beam_stopping_rate(beam_species, target_ion, target_charge, rate, repository_path)
 
 
-def get_beam_stopping_rate(beam_species, target_ion, target_charge, repository_path=None):
+def get_beam_stopping_rate(beam_species, target_ion, target_charge, repository_path=None, cache_path=None):
     """
     Reads a single beam stopping/excitation rate from the repository.
 
@@ -150,6 +154,8 @@ def get_beam_stopping_rate(beam_species, target_ion, target_charge, repository_p
     :param target_ion: Target species (Element/Isotope).
     :param target_charge: Charge of the target species.
     :param repository_path: Path to the atomic data repository.
+    :param cache_path: Path to the binary rate cache directory. If None (default),
+      the rates are always read from the JSON files.
 
     :return rate: Beam stopping rate dictionary containing the following entries:
 
@@ -169,17 +175,9 @@ def get_beam_stopping_rate(beam_species, target_ion, target_charge, repository_p
     repository_path = repository_path or DEFAULT_REPOSITORY_PATH
     path = os.path.join(repository_path, 'beam/stopping/{}/{}/{}.json'.format(beam_species.symbol.lower(), target_ion.symbol.lower(), target_charge))
     try:
-        with open(path, 'r') as f:
-            rate = json.load(f)
+        rate = load_rate(path, None, convert_beam_rate, cache_path)
     except FileNotFoundError:
         raise RuntimeError('Requested beam stopping rate (beam species={}, target ion={}, target charge={})'
                            ' is not available.'.format(beam_species.symbol, target_ion.symbol, target_charge))
 
-    # convert lists to numpy arrays
-    rate['e'] = np.array(rate['e'], np.float64)
-    rate['n'] = np.array(rate['n'], np.float64)
-    rate['t'] = np.array(rate['t'], np.float64)
-    rate['sen'] = np.array(rate['sen'], np.float64)
-    rate['st'] = np.array(rate['st'], np.float64)
-
     return rate
@@ -0,0 +1,169 @@
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+
+from .utility import DEFAULT_CACHE_PATH
+from .container import locate_container, read_container
+
+"""
+Binary cache of the rate data parsed from the local rate repository.
+
+Each cached rate is stored in a separate .npz file. The file name is derived from
+the absolute path of the JSON file in the repository and the key of the rate in
+this file. The modification time and size of the JSON file are stored alongside
+the rate data, a cached rate is discarded if the JSON file has changed.
+"""
+
+_CACHE_FORMAT_VERSION = 1
+
+
+def load_rate(path, key, convert, cache_path=None):
+    """
+    Reads a rate from the JSON file of the repository, using the binary cache if enabled.
+
+    If the repository is a rate container, the rate is read directly from the container
+    and the binary cache is not used.
+
+    :param str path: Path to the JSON file in the repository.
+    :param str key: Key of the rate in the JSON file, if None the whole file content is read.
+    :param callable convert: Function converting the rate data read from JSON to its final
+      form (e.g. lists to numpy arrays). Receives and returns the rate data dictionary.
+    :param str cache_path: Path to the rate cache directory. If None (default),
+      the cache is not used.
+
+    :return: The converted rate data dictionary.
+    :raises FileNotFoundError: If the JSON file does not exist.
+    :raises KeyError: If the requested key is not present in the JSON file.
+    """
+
+    container = locate_container(path)
+    if container is not None:
+        return convert(read_container(*container, key))
+
+    if cache_path is None:
+        return convert(_read_json(path, key))
+
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    source = {'version': _CACHE_FORMAT_VERSION, 'path': path, 'key': key,
+              'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+    cache_file = os.path.join(cache_path, _cache_file_name(path, key))
+
+    rate = _read_cache(cache_file, source)
+    if rate is None:
+        rate = convert(_read_json(path, key))
+        _write_cache(cache_file, source, rate)
+
+    return rate
+
+
+def clear_cache(cache_path=None):
+    """
+    Deletes all the cached rates.
+
+    :param str cache_path: Path to the rate cache directory. Defaults to DEFAULT_CACHE_PATH.
+    """
+
+    cache_path = cache_path or DEFAULT_CACHE_PATH
+    if os.path.isdir(cache_path):
+        shutil.rmtree(cache_path)
+
+
+def _read_json(path, key):
+
+    with open(path, 'r') as f:
+        content = json.load(f)
+
+    if key is None:
+        return content
+
+    return content[key]
+
+
+def _cache_file_name(path, key):
+
+    identity = json.dumps([path, key])
+    return hashlib.sha1(identity.encode()).hexdigest() + '.npz'
+
+
+def _read_cache(cache_file, source):
+
+    try:
+        with np.load(cache_file, allow_pickle=False) as data:
+            meta = json.loads(data['__meta__'].item())
+            if meta['source'] != source:
+                return None
+            return _unflatten(meta['structure'], data)
+
+    except (OSError, ValueError, KeyError):
+        # missing or corrupted cache file
+        return None
+
+
+def _write_cache(cache_file, source, rate):
+
+    arrays = {}
+    structure = _flatten(rate, arrays)
+    meta = json.dumps({'source': source, 'structure': structure})
+
+    # write to a temporary file first, so concurrent readers never see a partial file
+    try:
+        directory = os.path.dirname(cache_file)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_file = tempfile.mkstemp(suffix='.npz', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, __meta__=np.array(meta), **arrays)
+            os.replace(temp_file, cache_file)
+        except BaseException:
+            os.remove(temp_file)
+            raise
+
+    except OSError:
+        # the cache is an optimisation only, an unwritable cache directory is not an error
+        pass
+
+
+def _flatten(value, arrays):
+
+    if isinstance(value, dict):
+        return {'dict': {str(k): _flatten(v, arrays) for k, v in value.items()}}
+
+    if isinstance(value, np.ndarray):
+        name = 'a{}'.format(len(arrays))
+        arrays[name] = value
+        return {'array': name}
+
+    return {'value': value}
+
+
+def _unflatten(structure, data):
+
+    if 'dict' in structure:
+        return {k: _unflatten(v, data) for k, v in structure['dict'].items()}
+
+    if 'array' in structure:
+        return data[structure['array']]
+
+    return structure['value']
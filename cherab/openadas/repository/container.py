@@ -0,0 +1,380 @@
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+import os
+import json
+import mmap
+import struct
+import inspect
+import tempfile
+import functools
+import numpy as np
+
+from .utility import DEFAULT_REPOSITORY_PATH
+
+"""
+Single file container backend of the rate repository.
+
+The JSON repository stores the rates in many small JSON files in a directory tree.
+A container stores the content of all these files in a single file:
+
+    header  magic bytes, format version, offset and size of the index
+    data    the rate arrays as raw little-endian blocks, 64 byte aligned
+    index   JSON dictionary mapping the path of each repository file (e.g.
+            'ionisation/ne.json') to its content, with the arrays replaced by
+            references to the data blocks
+
+The index of a container is read once per process and kept in memory, so a rate is
+located with a dictionary lookup and its arrays are read from a memory map of the file.
+
+A container is used in place of the repository directory by passing its path as the
+repository path, e.g. OpenADAS(data_path='~/.cherab/openadas/repository.rates').
+Containers are created from a JSON repository with pack_repository(), or by installing
+rates in a repository path that is an existing container or has the .rates extension.
+"""
+
+CONTAINER_EXTENSION = '.rates'
+
+_MAGIC = b'CHERABRC'
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct('<8sIQQ')
+_ALIGNMENT = 64
+
+# containers opened by this process, path: (file signature, container)
+_containers = {}
+
+
+def is_container(repository_path=None):
+    """
+    Returns True if the repository path refers to a rate container.
+
+    :param str repository_path: Path to the atomic data repository.
+    """
+
+    repository_path = repository_path or DEFAULT_REPOSITORY_PATH
+    return os.path.isfile(repository_path) or repository_path.endswith(CONTAINER_EXTENSION)
+
+
+def locate_container(path):
+    """
+    Splits a repository file path pointing inside a rate container.
+
+    :param str path: Path to a repository file, e.g. '<repository>/ionisation/ne.json'.
+    :return: A (container path, repository file) tuple or None if the path does not lie
+      inside a container.
+    """
+
+    if os.path.exists(path):
+        return None
+
+    head = path
+    while True:
+        parent = os.path.dirname(head)
+        if parent == head or os.path.isdir(parent):
+            return None
+        if os.path.isfile(parent):
+            return parent, os.path.relpath(path, parent).replace(os.sep, '/')
+        head = parent
+
+
+def read_container(container_path, name, key=None):
+    """
+    Reads the content of a repository file from a rate container.
+
+    :param str container_path: Path to the container.
+    :param str name: Path of the file in the repository, e.g. 'ionisation/ne.json'.
+    :param str key: Key of the rate in the file, if None the whole file content is read.
+
+    :return: The file content, arrays are read-only views of the container memory map.
+    :raises FileNotFoundError: If the file is not present in the container.
+    :raises KeyError: If the requested key is not present in the file.
+    """
+
+    return _open_container(container_path).read(name, key)
+
+
+def read_repository(repository_path=None):
+    """
+    Reads the content of all the files of a repository.
+
+    :param str repository_path: Path to the JSON repository directory or rate container.
+    :return: Dictionary in the form {<file path in the repository>: <file content>}.
+    """
+
+    repository_path = repository_path or DEFAULT_REPOSITORY_PATH
+
+    if os.path.isfile(repository_path):
+        container = _open_container(repository_path)
+        return {name: container.read(name) for name in container.index}
+
+    files = {}
+    for directory, subdirectories, file_names in os.walk(repository_path):
+
+        # downloaded ADAS files are not part of the repository
+        if '_download_cache' in subdirectories:
+            subdirectories.remove('_download_cache')
+
+        for file_name in file_names:
+            if file_name.endswith('.json'):
+                path = os.path.join(directory, file_name)
+                with open(path, 'r') as f:
+                    files[os.path.relpath(path, repository_path).replace(os.sep, '/')] = json.load(f)
+
+    return files
+
+
+def update_repository(files, repository_path=None):
+    """
+    Merges the content of repository files into a repository.
+
+    The content of each file is merged with the existing content, the rates already
+    present in the repository are replaced. A rate container is rewritten as a whole.
+
+    :param dict files: Dictionary in the form {<file path in the repository>: <file content>}.
+    :param str repository_path: Path to the JSON repository directory or rate container.
+    """
+
+    repository_path = repository_path or DEFAULT_REPOSITORY_PATH
+
+    if is_container(repository_path):
+        content = read_repository(repository_path) if os.path.isfile(repository_path) else {}
+        merge_content(content, files)
+        write_container(content, repository_path)
+        return
+
+    for name, file_content in files.items():
+        path = os.path.join(repository_path, name)
+        try:
+            with open(path, 'r') as f:
+                content = json.load(f)
+        except FileNotFoundError:
+            content = {}
+        merge_content(content, _to_json(file_content))
+
+        # create directory structure if missing
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        with open(path, 'w') as f:
+            json.dump(content, f, indent=2, sort_keys=True)
+
+
+def container_writer(writer):
+    """
+    Decorator redirecting a JSON repository writer to a rate container.
+
+    If the repository path of the decorated writer (e.g. update_ionisation_rates())
+    refers to a rate container, the writer writes the rates to a temporary JSON
+    repository, the content of which is then merged into the container. A container is
+    rewritten as a whole, so many rates should be written with a single call. Otherwise,
+    the writer is called unchanged.
+
+    :param writer: Repository writer with a repository_path argument.
+    """
+
+    signature = inspect.signature(writer)
+
+    @functools.wraps(writer)
+    def wrapper(*args, **kwargs):
+
+        arguments = signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        repository_path = arguments.arguments['repository_path']
+
+        if not is_container(repository_path):
+            return writer(*arguments.args, **arguments.kwargs)
+
+        with tempfile.TemporaryDirectory() as staging_path:
+            arguments.arguments['repository_path'] = staging_path
+            writer(*arguments.args, **arguments.kwargs)
+            update_repository(read_repository(staging_path), repository_path)
+
+    return wrapper
+
+
+def pack_repository(repository_path=None, container_path=None):
+    """
+    Packs a JSON repository into a rate container.
+
+    :param str repository_path: Path to the JSON repository directory.
+    :param str container_path: Path to the container file. Defaults to the repository
+      path with the .rates extension.
+
+    .. code-block:: pycon
+
+       >>> from cherab.openadas import OpenADAS
+       >>> from cherab.openadas.repository import pack_repository
+       >>>
+       >>> pack_repository('/path/to/repository', '/path/to/repository.rates')
+       >>> adas = OpenADAS(data_path='/path/to/repository.rates')
+    """
+
+    repository_path = repository_path or DEFAULT_REPOSITORY_PATH
+    container_path = container_path or repository_path.rstrip('/\\') + CONTAINER_EXTENSION
+
+    if not os.path.isdir(repository_path):
+        raise ValueError('The repository path must be a JSON repository directory.')
+
+    write_container(read_repository(repository_path), container_path)
+
+
+def write_container(files, container_path):
+    """
+    Writes repository files to a new rate container.
+
+    :param dict files: Dictionary in the form {<file path in the repository>: <file content>}.
+    :param str container_path: Path to the container file, an existing file is replaced.
+    """
+
+    arrays = []
+    offset = [_align(_HEADER.size)]
+    index = {name: _pack(content, arrays, offset) for name, content in files.items()}
+    index = json.dumps(index).encode()
+    index_offset = offset[0]
+
+    # write to a temporary file first, so concurrent readers never see a partial container
+    directory = os.path.dirname(os.path.abspath(container_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(suffix=CONTAINER_EXTENSION, dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, index_offset, len(index)))
+            for array_offset, array in arrays:
+                f.seek(array_offset)
+                f.write(array.tobytes())
+            f.seek(index_offset)
+            f.write(index)
+        os.replace(temp_path, container_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+class _Container:
+
+    def __init__(self, path):
+
+        with open(path, 'rb') as f:
+            try:
+                magic, version, index_offset, index_size = _HEADER.unpack(f.read(_HEADER.size))
+            except struct.error:
+                magic = version = None
+            if magic != _MAGIC or version != _FORMAT_VERSION:
+                raise ValueError("The file '{}' is not a rate container.".format(path))
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.index = json.loads(self._buffer[index_offset:index_offset + index_size])
+
+    def read(self, name, key=None):
+
+        try:
+            structure = self.index[name]
+        except KeyError:
+            raise FileNotFoundError("The file '{}' is not present in the container.".format(name))
+
+        if key is not None:
+            structure = structure['dict'][key]
+
+        return self._unpack(structure)
+
+    def _unpack(self, structure):
+
+        if 'dict' in structure:
+            return {k: self._unpack(v) for k, v in structure['dict'].items()}
+
+        if 'array' in structure:
+            offset, dtype, shape = structure['array']
+            return np.frombuffer(self._buffer, dtype, int(np.prod(shape)), offset).reshape(shape)
+
+        return structure['value']
+
+
+def _open_container(path):
+
+    stat = os.stat(path)
+    signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    # reopen the container if the file has been replaced
+    path = os.path.abspath(path)
+    try:
+        container_signature, container = _containers[path]
+        if container_signature == signature:
+            return container
+    except KeyError:
+        pass
+
+    container = _Container(path)
+    _containers[path] = signature, container
+    return container
+
+
+def _align(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _pack(value, arrays, offset):
+
+    if isinstance(value, dict):
+        return {'dict': {str(k): _pack(v, arrays, offset) for k, v in value.items()}}
+
+    # numerical lists read from JSON are stored as arrays
+    if isinstance(value, list):
+        try:
+            array = np.array(value)
+        except ValueError:
+            # ragged nested lists
+            array = None
+        if array is not None and array.dtype.kind in 'iuf':
+            value = array
+
+    if isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value, dtype=value.dtype.newbyteorder('<'))
+        arrays.append((offset[0], array))
+        reference = {'array': [offset[0], array.dtype.str, list(array.shape)]}
+        offset[0] = _align(offset[0] + array.nbytes)
+        return reference
+
+    return {'value': value}
+
+
+def merge_content(target, source):
+    """
+    Recursively merges the content of repository files, the values in source replace
+    those in target.
+
+    :param dict target: Dictionary updated in place.
+    :param dict source: Dictionary merged into target.
+    """
+
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            merge_content(target[key], value)
+        else:
+            target[key] = value
+
+
+def _to_json(value):
+
+    if isinstance(value, dict):
+        return {k: _to_json(v) for k, v in value.items()}
+
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+
+    return value
@@ -22,7 +22,7 @@ from cherab.openadas.install import install_files
 from cherab.openadas import repository
 
 
-def populate(download=True, repository_path=None, adas_path=None):
+def populate(download=True, repository_path=None, adas_path=None, processes=1):
     """
     Populates the OpenADAS repository with a typical set of rates and wavelengths.
 
@@ -30,9 +30,13 @@ def populate(download=True, repository_path=None, adas_path=None):
     file from the OpenADAS website. This behaviour can be disabled by setting
     the download argument to False.
 
+    If the repository path is a rate container (an existing file or a path with the
+    .rates extension), the rates are stored in the container.
+
     :param download: Attempt to download the ADAS files if missing (default=True).
     :param repository_path: Alternate path for the OpenADAS repository (default=None).
     :param adas_path: Alternate path in which to search for ADAS files (default=None) .
+    :param processes: Number of processes parsing the ADAS files (default=1).
     """
 
     # install a common selection of open adas files
@@ -397,5 +401,7 @@ def populate(download=True, repository_path=None, adas_path=None):
         (13, 11): 388.12    # from ADAS comment, unknown source
     }
 
-    install_files(rates, download=download, repository_path=repository_path, adas_path=adas_path)
+    install_files(rates, download=download, repository_path=repository_path, adas_path=adas_path,
+                  processes=processes)
+
     repository.update_wavelengths(wavelengths, repository_path=repository_path)
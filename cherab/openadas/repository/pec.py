@@ -21,7 +21,9 @@ import json
 import numpy as np
 from cherab.core.utility import RecursiveDict
 from cherab.core.atomic import Element
-from .utility import DEFAULT_REPOSITORY_PATH, valid_charge, encode_transition
+from .cache import load_rate
+from .container import container_writer
+from .utility import DEFAULT_REPOSITORY_PATH, valid_charge, convert_rate, encode_transition
 
 """
 Utilities for managing the local rate repository - PEC section.
@@ -118,6 +120,7 @@ def add_pec_thermal_cx_rate(donor_element, donor_charge, receiver_element, recei
     update_pec_thermal_cx_rates(rates2update.freeze(), repository_path)
 
 
+@container_writer
 def update_pec_rates(rates, repository_path=None):
     """
     Updates excitation and recombination PEC files /pec/<class>/<element>/<charge>.json.
@@ -206,6 +209,7 @@ def update_pec_rates(rates, repository_path=None):
                     json.dump(content, f, indent=2, sort_keys=True)
 
 
+@container_writer
 def update_pec_thermal_cx_rates(rates, repository_path=None):
     """
     Updates thermal CX PEC files /pec/thermal_cx/<donor_element>/<donor_charge>/<receiver_element>/<receiver_charge>.json
@@ -299,7 +303,18 @@ def update_pec_thermal_cx_rates(rates, repository_path=None):
                         json.dump(content.freeze(), f, indent=2, sort_keys=True)
 
 
-def get_pec_excitation_rate(element, charge, transition, repository_path=None):
+def _convert_thermal_cx_rate(d):
+
+    # convert to numpy arrays
+    d['ne'] = np.array(d['ne'], np.float64)
+    d['te'] = np.array(d['te'], np.float64)
+    d['td'] = np.array(d['td'], np.float64)
+    d['rate'] = np.array(d['rate'], np.float64)
+
+    return d
+
+
+def get_pec_excitation_rate(element, charge, transition, repository_path=None, cache_path=None):
     """
     Reads the excitation PEC from the repository for the given
     element, charge and transition.
@@ -308,6 +323,8 @@ def get_pec_excitation_rate(element, charge, transition, repository_path=None):
     :param charge: Charge of the plasma species.
     :param transition: Tuple containing (initial level, final level).
     :param repository_path: Path to the atomic data repository.
+    :param cache_path: Path to the binary rate cache directory. If None (default),
+      the rates are always read from the JSON files.
 
     :return rate: Excitation PEC dictionary containing the following entries:
 
@@ -317,10 +334,10 @@ def get_pec_excitation_rate(element, charge, transition, repository_path=None):
 
     """
 
-    return _get_pec_rate('excitation', element, charge, transition, repository_path)
+    return _get_pec_rate('excitation', element, charge, transition, repository_path, cache_path)
 
 
-def get_pec_recombination_rate(element, charge, transition, repository_path=None):
+def get_pec_recombination_rate(element, charge, transition, repository_path=None, cache_path=None):
     """
     Reads the recombination PEC from the repository for the given
     element, charge and transition.
@@ -329,6 +346,8 @@ def get_pec_recombination_rate(element, charge, transition, repository_path=None
     :param charge: Charge of the plasma species.
     :param transition: Tuple containing (initial level, final level).
     :param repository_path: Path to the atomic data repository.
+    :param cache_path: Path to the binary rate cache directory. If None (default),
+      the rates are always read from the JSON files.
 
     :return rate: Recombination PEC dictionary containing the following entries:
 
@@ -338,30 +357,23 @@ def get_pec_recombination_rate(element, charge, transition, repository_path=None
 
     """
 
-    return _get_pec_rate('recombination', element, charge, transition, repository_path)
+    return _get_pec_rate('recombination', element, charge, transition, repository_path, cache_path)
 
 
-def _get_pec_rate(cls, element, charge, transition, repository_path=None):
+def _get_pec_rate(cls, element, charge, transition, repository_path=None, cache_path=None):
 
     repository_path = repository_path or DEFAULT_REPOSITORY_PATH
     path = os.path.join(repository_path, 'pec/{}/{}/{}.json'.format(cls, element.symbol.lower(), charge))
     try:
-        with open(path, 'r') as f:
-            content = json.load(f)
-        d = content[encode_transition(transition)]
+        d = load_rate(path, encode_transition(transition), convert_rate, cache_path)
     except (FileNotFoundError, KeyError):
         raise RuntimeError('Requested PEC rate (class={}, element={}, charge={}, transition={})'
                            ' is not available.'.format(cls, element.symbol, charge, transition))
 
-    # convert to numpy arrays
-    d['ne'] = np.array(d['ne'], np.float64)
-    d['te'] = np.array(d['te'], np.float64)
-    d['rate'] = np.array(d['rate'], np.float64)
-
     return d
 
 
-def get_pec_thermal_cx_rate(donor_element, donor_charge, receiver_element, receiver_charge, transition, repository_path=None):
+def get_pec_thermal_cx_rate(donor_element, donor_charge, receiver_element, receiver_charge, transition, repository_path=None, cache_path=None):
     """
     Reads the thermal charge exchange PEC from the repository for the given
     donor element, donor charge, receiver element, receiver charge and transition.
@@ -372,6 +384,8 @@ def get_pec_thermal_cx_rate(donor_element, donor_charge, receiver_element, recei
     :param receiver_charge: Electron receiver charge.
     :param transition: Tuple containing (initial level, final level).
     :param repository_path: Path to the atomic data repository.
+    :param cache_path: Path to the binary rate cache directory. If None (default),
+      the rates are always read from the JSON files.
 
     :return rate: Thermal CX PEC dictionary containing the following entries:
 
@@ -388,18 +402,10 @@ def get_pec_thermal_cx_rate(donor_element, donor_charge, receiver_element, recei
                                                              receiver_element.symbol.lower(), receiver_charge)
     path = os.path.join(repository_path, rate_path)
     try:
-        with open(path, 'r') as f:
-            content = json.load(f)
-        d = content[encode_transition(transition)]
+        d = load_rate(path, encode_transition(transition), _convert_thermal_cx_rate, cache_path)
     except (FileNotFoundError, KeyError):
         raise RuntimeError('Requested thermal charge-exchange PEC (donor={}, donor charge={}, receiver={}, receiver charge={})'
                            ' is not available.'
                            ''.format(donor_element.symbol, donor_charge, receiver_element.symbol, receiver_charge))
 
-    # convert to numpy arrays
-    d['ne'] = np.array(d['ne'], np.float64)
-    d['te'] = np.array(d['te'], np.float64)
-    d['td'] = np.array(d['td'], np.float64)
-    d['rate'] = np.array(d['rate'], np.float64)
-
     return d
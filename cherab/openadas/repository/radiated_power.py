@@ -24,7 +24,9 @@ import numpy as np
 
 from cherab.core.atomic import Element
 from cherab.core.utility import RecursiveDict
-from .utility import DEFAULT_REPOSITORY_PATH, valid_charge
+from .cache import load_rate
+from .container import container_writer
+from .utility import DEFAULT_REPOSITORY_PATH, valid_charge, convert_rate
 
 
 def add_line_power_rate(species, charge, rate, repository_path=None):
@@ -53,6 +55,7 @@ def add_line_power_rate(species, charge, rate, repository_path=None):
     }, repository_path)
 
 
+@container_writer
 def update_line_power_rates(rates, repository_path=None):
     """
     Update the files for the line radiated power rates:
@@ -112,6 +115,7 @@ def add_continuum_power_rate(species, charge, rate, repository_path=None):
     }, repository_path)
 
 
+@container_writer
 def update_continuum_power_rates(rates, repository_path=None):
     """
     Update the files for the continuum power rates:
@@ -172,6 +176,7 @@ def add_cx_power_rate(species, charge, rate, repository_path=None):
     }, repository_path)
 
 
+@container_writer
 def update_cx_power_rates(rates, repository_path=None):
     """
     Update the files for the CX radiation power rates
@@ -251,7 +256,7 @@ def _update_and_write_adf11(species, rate_data, path):
             json.dump(content, f, indent=2, sort_keys=True)
 
 
-def get_line_radiated_power_rate(element, charge, repository_path=None):
+def get_line_radiated_power_rate(element, charge, repository_path=None, cache_path=None):
     """
     Reads the line radiated power rate for the given species and charge
     from the atomic data repository.
@@ -259,6 +264,8 @@ def get_line_radiated_power_rate(element, charge, repository_path=None):
     :param element: Plasma species (Element/Isotope).
     :param charge: Charge of the plasma species.
     :param repository_path: Path to the atomic data repository.
+    :param cache_path: Path to the binary rate cache directory. If None (default),
+      the rates are always read from the JSON files.
 
     :return rate: Line radiated power rate dictionary containing the following entries:
 
@@ -272,22 +279,15 @@ def get_line_radiated_power_rate(element, charge, repository_path=None):
 
     path = os.path.join(repository_path, 'radiated_power/line/{}.json'.format(element.symbol.lower()))
     try:
-        with open(path, 'r') as f:
-            content = json.load(f)
-        d = content[str(charge)]
+        d = load_rate(path, str(charge), convert_rate, cache_path)
     except (FileNotFoundError, KeyError):
         raise RuntimeError('Requested radiated power rate (element={}, charge={})'
                            ' is not available.'.format(element.symbol, charge))
 
-    # convert to numpy arrays
-    d['ne'] = np.array(d['ne'], np.float64)
-    d['te'] = np.array(d['te'], np.float64)
-    d['rate'] = np.array(d['rate'], np.float64)
-
     return d
 
 
-def get_continuum_radiated_power_rate(element, charge, repository_path=None):
+def get_continuum_radiated_power_rate(element, charge, repository_path=None, cache_path=None):
     """
     Reads the continuum power rate for the given species and charge
     from the atomic data repository.
@@ -295,6 +295,8 @@ def get_continuum_radiated_power_rate(element, charge, repository_path=None):
     :param element: Plasma species (Element/Isotope).
     :param charge: Charge of the plasma species.
     :param repository_path: Path to the atomic data repository.
+    :param cache_path: Path to the binary rate cache directory. If None (default),
+      the rates are always read from the JSON files.
 
     :return rate: Continuum power rate dictionary containing the following entries:
 
@@ -308,22 +310,15 @@ def get_continuum_radiated_power_rate(element, charge, repository_path=None):
 
     path = os.path.join(repository_path, 'radiated_power/continuum/{}.json'.format(element.symbol.lower()))
     try:
-        with open(path, 'r') as f:
-            content = json.load(f)
-        d = content[str(charge)]
+        d = load_rate(path, str(charge), convert_rate, cache_path)
     except (FileNotFoundError, KeyError):
         raise RuntimeError('Requested radiated power rate (element={}, charge={})'
                            ' is not available.'.format(element.symbol, charge))
 
-    # convert to numpy arrays
-    d['ne'] = np.array(d['ne'], np.float64)
-    d['te'] = np.array(d['te'], np.float64)
-    d['rate'] = np.array(d['rate'], np.float64)
-
     return d
 
 
-def get_cx_radiated_power_rate(element, charge, repository_path=None):
+def get_cx_radiated_power_rate(element, charge, repository_path=None, cache_path=None):
     """
     Reads the CX radiation power rate for the given species and charge
     from the atomic data repository.
@@ -331,6 +326,8 @@ def get_cx_radiated_power_rate(element, charge, repository_path=None):
     :param element: Plasma species (Element/Isotope).
     :param charge: Charge of the plasma species.
     :param repository_path: Path to the atomic data repository.
+    :param cache_path: Path to the binary rate cache directory. If None (default),
+      the rates are always read from the JSON files.
 
     :return rate: CX radiation power rate dictionary containing the following entries:
 
@@ -344,16 +341,9 @@ def get_cx_radiated_power_rate(element, charge, repository_path=None):
 
     path = os.path.join(repository_path, 'radiated_power/cx/{}.json'.format(element.symbol.lower()))
     try:
-        with open(path, 'r') as f:
-            content = json.load(f)
-        d = content[str(charge)]
+        d = load_rate(path, str(charge), convert_rate, cache_path)
     except (FileNotFoundError, KeyError):
         raise RuntimeError('Requested radiated power rate (element={}, charge={})'
                            ' is not available.'.format(element.symbol, charge))
 
-    # convert to numpy arrays
-    d['ne'] = np.array(d['ne'], np.float64)
-    d['te'] = np.array(d['te'], np.float64)
-    d['rate'] = np.array(d['rate'], np.float64)
-
     return d
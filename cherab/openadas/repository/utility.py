@@ -17,12 +17,14 @@
 # under the Licence.
 
 import os
+import numpy as np
 
 """
 Utilities for managing the local rate repository.
 """
 
 DEFAULT_REPOSITORY_PATH = os.path.expanduser('~/.cherab/openadas/repository')
+DEFAULT_CACHE_PATH = os.path.expanduser('~/.cherab/openadas/cache')
 
 
 def encode_transition(transition):
@@ -50,4 +52,35 @@ def valid_charge(element, charge):
     return charge <= element.atomic_number
 
 
+def convert_rate(d):
+    """
+    Converts the electron density, electron temperature and rate data of a rate
+    read from the repository to numpy arrays.
+
+    :param d: Rate dictionary with 'ne', 'te' and 'rate' entries.
+    :return: The same dictionary with the entries converted to float64 arrays.
+    """
+
+    d['ne'] = np.array(d['ne'], np.float64)
+    d['te'] = np.array(d['te'], np.float64)
+    d['rate'] = np.array(d['rate'], np.float64)
+
+    return d
+
+
+def convert_beam_rate(d):
+    """
+    Converts the energy, density, temperature and rate data of a beam rate read
+    from the repository to numpy arrays.
+
+    :param d: Beam rate dictionary with 'e', 'n', 't', 'sen' and 'st' entries.
+    :return: The same dictionary with the entries converted to float64 arrays.
+    """
+
+    d['e'] = np.array(d['e'], np.float64)
+    d['n'] = np.array(d['n'], np.float64)
+    d['t'] = np.array(d['t'], np.float64)
+    d['sen'] = np.array(d['sen'], np.float64)
+    d['st'] = np.array(d['st'], np.float64)
 
+    return d
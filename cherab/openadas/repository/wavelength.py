@@ -20,6 +20,8 @@ import os
 import json
 from cherab.core.utility import RecursiveDict
 from cherab.core.atomic import Element
+from .cache import load_rate
+from .container import container_writer
 from .utility import DEFAULT_REPOSITORY_PATH, valid_charge, encode_transition
 
 """
@@ -51,6 +53,7 @@ def add_wavelength(element, charge, transition, wavelength, repository_path=None
     }, repository_path)
 
 
+@container_writer
 def update_wavelengths(wavelengths, repository_path=None):
     """
     Updates the wavelength files `/wavelength/<species>/<charge>.json`
@@ -120,9 +123,7 @@ def get_wavelength(element, charge, transition, repository_path=None):
     repository_path = repository_path or DEFAULT_REPOSITORY_PATH
     path = os.path.join(repository_path, 'wavelength/{}/{}.json'.format(element.symbol.lower(), charge))
     try:
-        with open(path, 'r') as f:
-            content = json.load(f)
-        return content[encode_transition(transition)]
+        return load_rate(path, encode_transition(transition), lambda wavelength: wavelength)
     except (FileNotFoundError, KeyError):
         raise RuntimeError('Requested wavelength (element={}, charge={}, transition={})'
                            ' is not available.'.format(element.symbol, charge, transition))
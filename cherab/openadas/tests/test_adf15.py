@@ -0,0 +1,92 @@
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from cherab.core.atomic import hydrogen
+from cherab.openadas.parse import parse_adf15
+
+
+def _format_values(values):
+
+    return [''.join(' {:.2E}'.format(v) for v in values[i:i + 8]) for i in range(0, len(values), 8)]
+
+
+class TestADF15(unittest.TestCase):
+
+    def setUp(self):
+
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, 'pec#h0.dat')
+
+        self.ne = np.logspace(8, 14, 5)
+        self.te = np.logspace(0, 4, 7)
+        self.blocks = [('EXCIT', (3, 2), 6561.9), ('EXCIT', (4, 2), 4860.1), ('RECOM', (3, 2), 6561.9)]
+        self.rates = [np.round(np.outer(self.ne, self.te) * 1.e-20 * (i + 1), 14) for i in range(len(self.blocks))]
+
+        lines = ['   {}    /H 0 /'.format(len(self.blocks))]
+        for isel, ((rate_type, _, wavelength), rate) in enumerate(zip(self.blocks, self.rates), 1):
+            lines.append('  {:.1f} A    5    7 /FILMEM = bnd   /TYPE = {} /INDM = T /ISEL = {:5d}'.format(wavelength, rate_type, isel))
+            lines += _format_values(self.ne)
+            lines += _format_values(self.te)
+            lines += _format_values(rate.flatten())
+        lines += ['C' + '-' * 70, 'C',
+                  'C  ISEL  WAVELENGTH      TRANSITION            TYPE',
+                  'C  ----  ----------  ------------------------  -----']
+        for isel, (rate_type, (upper, lower), wavelength) in enumerate(self.blocks, 1):
+            lines.append('C  {:4d}.    {:.1f}        N= {} - N= {}          {}'.format(isel, wavelength, upper, lower, rate_type))
+        lines.append('C')
+
+        with open(self.path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_parse(self):
+
+        rates, wavelengths = parse_adf15(hydrogen, 0, self.path)
+
+        for (rate_type, transition, wavelength), rate in zip(self.blocks, self.rates):
+            cls = 'excitation' if rate_type == 'EXCIT' else 'recombination'
+            data = rates[cls][hydrogen][0][transition]
+            np.testing.assert_allclose(data['ne'], self.ne * 1.e6, rtol=1.e-2)
+            np.testing.assert_allclose(data['te'], self.te, rtol=1.e-2)
+            np.testing.assert_allclose(data['rate'], rate * 1.e-6, rtol=1.e-2)
+            self.assertAlmostEqual(wavelengths[hydrogen][0][transition], wavelength / 10)
+
+        self.assertNotIn('thermalcx', rates)
+
+    def test_selected_transitions(self):
+
+        rates, wavelengths = parse_adf15(hydrogen, 0, self.path, transitions=[(4, 2)])
+
+        self.assertEqual(list(rates['excitation'][hydrogen][0]), [(4, 2)])
+        self.assertNotIn('recombination', rates)
+        np.testing.assert_allclose(rates['excitation'][hydrogen][0][(4, 2)]['rate'], self.rates[1] * 1.e-6, rtol=1.e-2)
+
+        # only the wavelengths of the selected transitions are returned
+        self.assertEqual(list(wavelengths[hydrogen][0]), [(4, 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+import unittest
+
+import numpy as np
+
+from cherab.core.atomic import neon, IonisationRate as CoreIonisationRate
+from cherab.openadas.rates import (IonisationRate, ImpactExcitationPEC, LineRadiationPower, BeamStoppingRate,
+                                   NullIonisationRate, NullBeamStoppingRate, NullBeamCXPEC)
+
+
+class ConstantIonisationRate(CoreIonisationRate):
+    """Rate implemented in Python for test purpose."""
+
+    def evaluate(self, density, temperature):
+        return density * temperature
+
+
+class TestEvaluateArray(unittest.TestCase):
+
+    def setUp(self):
+
+        ne = np.logspace(18, 21, 7)
+        te = np.logspace(0, 4, 9)
+        data = {'ne': ne, 'te': te, 'rate': np.outer(ne, te**0.5) * 1.e-33}
+
+        e = np.linspace(1.e4, 1.e5, 5)
+        n = np.logspace(18, 20, 4)
+        t = np.logspace(1, 3, 4)
+        stopping_data = {'e': e, 'n': n, 't': t, 'sen': np.outer(e, n) * 1.e-33, 'st': 1 + t * 1.e-3,
+                         'eref': 5.e4, 'nref': 1.e19, 'tref': 1.e2, 'sref': 1.}
+
+        self.rates = [IonisationRate(data), ImpactExcitationPEC(656.3, data), LineRadiationPower(neon, 1, data)]
+        self.stopping_rate = BeamStoppingRate(stopping_data)
+
+        # includes zero and negative values handled by evaluate()
+        self.density = np.array([0, -1.e19, 2.e18, 5.e19, 8.e20])
+        self.temperature = np.array([[1.5], [20.], [900.]])
+
+    def test_rates(self):
+
+        for rate in self.rates:
+            values = rate.evaluate_array(self.density, self.temperature)
+            self.assertEqual(values.shape, (3, 5))
+            for (i, j), value in np.ndenumerate(values):
+                self.assertEqual(value, rate.evaluate(self.density[j], self.temperature[i, 0]))
+
+            # scalar arguments and read-only arrays
+            density = self.density.copy()
+            density.flags.writeable = False
+            self.assertEqual(rate.evaluate_array(5.e19, 20.).shape, ())
+            self.assertEqual(rate.evaluate_array(density, 20.)[3], rate.evaluate(5.e19, 20.))
+
+    def test_beam_rate(self):
+
+        energy = np.linspace(2.e4, 9.e4, 4)[:, None, None]
+        density = np.logspace(18.2, 19.8, 3)[None, :, None]
+        temperature = np.array([20., 200.])
+        values = self.stopping_rate.evaluate_array(energy, density, temperature)
+        self.assertEqual(values.shape, (4, 3, 2))
+        for (i, j, k), value in np.ndenumerate(values):
+            self.assertEqual(value, self.stopping_rate.evaluate(energy[i, 0, 0], density[0, j, 0], temperature[k]))
+
+    def test_python_rate(self):
+
+        values = ConstantIonisationRate().evaluate_array(self.density, self.temperature)
+        np.testing.assert_array_equal(values, self.density * self.temperature)
+
+    def test_null_rates(self):
+
+        values = NullIonisationRate().evaluate_array(self.density, self.temperature)
+        np.testing.assert_array_equal(values, np.zeros((3, 5)))
+
+        values = NullBeamStoppingRate().evaluate_array(5.e4, self.density, self.temperature)
+        np.testing.assert_array_equal(values, np.zeros((3, 5)))
+
+        values = NullBeamCXPEC(1).evaluate_array(5.e4, 100., self.density, 1.5, 2.)
+        np.testing.assert_array_equal(values, np.zeros(5))
+
+
+if __name__ == "__main__":
+    unittest.main()
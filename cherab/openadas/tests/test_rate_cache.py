@@ -0,0 +1,147 @@
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from cherab.core.atomic import hydrogen, deuterium, neon
+from cherab.openadas import OpenADAS, repository
+
+
+class TestRateCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.repository_path = os.path.join(self.tempdir.name, 'repository')
+        self.cache_path = os.path.join(self.tempdir.name, 'cache')
+
+        self.ne = np.logspace(18, 21, 5)
+        self.te = np.logspace(0, 4, 7)
+        self.rate = np.outer(self.ne, self.te) * 1.e-35
+        repository.add_ionisation_rate(neon, 1, {'ne': self.ne, 'te': self.te, 'rates': self.rate},
+                                       repository_path=self.repository_path)
+
+        e = np.linspace(1.e4, 1.e5, 4)
+        n = np.logspace(18, 20, 3)
+        t = np.logspace(1, 3, 3)
+        self.stopping_rate = {'e': e, 'n': n, 't': t, 'sen': np.ones((4, 3)), 'st': np.ones(3),
+                              'eref': 5.e4, 'nref': 1.e19, 'tref': 1.e2, 'sref': 1.}
+        repository.add_beam_stopping_rate(deuterium, neon, 10, self.stopping_rate, repository_path=self.repository_path)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_cached_rate(self):
+
+        for _ in range(2):
+            data = repository.get_ionisation_rate(neon, 1, repository_path=self.repository_path,
+                                                  cache_path=self.cache_path)
+            np.testing.assert_array_equal(data['ne'], self.ne)
+            np.testing.assert_array_equal(data['te'], self.te)
+            np.testing.assert_array_equal(data['rate'], self.rate)
+
+        self.assertEqual(len(os.listdir(self.cache_path)), 1)
+
+        for _ in range(2):
+            data = repository.get_beam_stopping_rate(deuterium, neon, 10, repository_path=self.repository_path,
+                                                     cache_path=self.cache_path)
+            for key in ('e', 'n', 't', 'sen', 'st'):
+                np.testing.assert_array_equal(data[key], self.stopping_rate[key])
+            for key in ('eref', 'nref', 'tref', 'sref'):
+                self.assertEqual(data[key], self.stopping_rate[key])
+
+        self.assertEqual(len(os.listdir(self.cache_path)), 2)
+
+    def test_stale_cache(self):
+
+        repository.get_ionisation_rate(neon, 1, repository_path=self.repository_path, cache_path=self.cache_path)
+
+        # updating the repository file must invalidate the cached rate
+        repository.add_ionisation_rate(neon, 1, {'ne': self.ne, 'te': self.te, 'rates': 2 * self.rate},
+                                       repository_path=self.repository_path)
+        path = os.path.join(self.repository_path, 'ionisation/ne.json')
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+        data = repository.get_ionisation_rate(neon, 1, repository_path=self.repository_path, cache_path=self.cache_path)
+        np.testing.assert_array_equal(data['rate'], 2 * self.rate)
+
+    def test_missing_rate(self):
+
+        with self.assertRaises(RuntimeError):
+            repository.get_ionisation_rate(neon, 2, repository_path=self.repository_path, cache_path=self.cache_path)
+        with self.assertRaises(RuntimeError):
+            repository.get_ionisation_rate(hydrogen, 0, repository_path=self.repository_path, cache_path=self.cache_path)
+
+    def test_openadas(self):
+
+        adas = OpenADAS(data_path=self.repository_path, cache=True, cache_path=self.cache_path)
+        self.assertEqual(adas.cache_path, self.cache_path)
+        rate = adas.ionisation_rate(neon, 1)
+        rate_ref = OpenADAS(data_path=self.repository_path).ionisation_rate(neon, 1)
+        self.assertEqual(rate(1.e19, 100.), rate_ref(1.e19, 100.))
+        self.assertTrue(os.listdir(self.cache_path))
+
+        repository.clear_cache(self.cache_path)
+        self.assertFalse(os.path.exists(self.cache_path))
+
+        self.assertIsNone(OpenADAS(data_path=self.repository_path).cache_path)
+
+    def test_memoisation(self):
+
+        # OpenADAS requests the beam rates of the element, not the isotope
+        repository.add_beam_stopping_rate(hydrogen, neon, 10, self.stopping_rate, repository_path=self.repository_path)
+
+        adas = OpenADAS(data_path=self.repository_path, rate_cache_size=2)
+
+        rate = adas.ionisation_rate(neon, 1)
+        self.assertIs(adas.ionisation_rate(neon, 1), rate)
+        self.assertEqual(adas.rate_cache_info(), (1, 1, 2, 1))
+
+        stopping_rate = adas.beam_stopping_rate(hydrogen, neon, 10)
+        self.assertIs(adas.beam_stopping_rate(hydrogen, neon, 10), stopping_rate)
+
+        # missing rates are not cached
+        with self.assertRaises(RuntimeError):
+            adas.ionisation_rate(neon, 2)
+        self.assertEqual(adas.rate_cache_info().currsize, 2)
+
+        adas.clear_rate_cache()
+        self.assertEqual(adas.rate_cache_info(), (0, 0, 2, 0))
+        self.assertIsNot(adas.ionisation_rate(neon, 1), rate)
+
+        # the least recently used rate is evicted
+        adas = OpenADAS(data_path=self.repository_path, rate_cache_size=2, missing_rates_return_null=True)
+        rate = adas.ionisation_rate(neon, 1)
+        stopping_rate = adas.beam_stopping_rate(hydrogen, neon, 10)
+        adas.ionisation_rate(neon, 1)
+        adas.ionisation_rate(neon, 2)
+        self.assertIs(adas.ionisation_rate(neon, 1), rate)
+        self.assertIsNot(adas.beam_stopping_rate(hydrogen, neon, 10), stopping_rate)
+        self.assertEqual(adas.rate_cache_info(), (2, 4, 2, 2))
+
+        # the rate cache is disabled by default
+        adas = OpenADAS(data_path=self.repository_path)
+        self.assertIsNot(adas.ionisation_rate(neon, 1), adas.ionisation_rate(neon, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from cherab.core.atomic import hydrogen, neon
+from cherab.openadas import OpenADAS, repository
+from cherab.openadas.install import install_files
+
+
+# minimal ADF11 file with a single hydrogen rate table (log10 values)
+ADF11_TEMPLATE = """    1    3    4    1    1     /HYDROGEN/     GCR PROJECT
+-------------------------------------------------------------------
+ 10.00000 11.00000 12.00000
+  0.00000  1.00000  2.00000  3.00000
+-----------/ IPRT= 1  /--------/ IGRD= 1  /--------/ Z1= 1   / DATE= 10/04/12
+{}
+C-------------------------------------------------------------------
+C
+"""
+
+
+class TestRateContainer(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.repository_path = os.path.join(self.tempdir.name, 'repository')
+        self.container_path = os.path.join(self.tempdir.name, 'repository.rates')
+
+        self.ne = np.logspace(18, 21, 5)
+        self.te = np.logspace(0, 4, 7)
+        self.rate = np.outer(self.ne, self.te) * 1.e-35
+        repository.add_ionisation_rate(neon, 1, {'ne': self.ne, 'te': self.te, 'rates': self.rate},
+                                       repository_path=self.repository_path)
+        repository.add_recombination_rate(neon, 2, {'ne': self.ne, 'te': self.te, 'rates': 2 * self.rate},
+                                          repository_path=self.repository_path)
+
+        e = np.linspace(1.e4, 1.e5, 4)
+        n = np.logspace(18, 20, 3)
+        t = np.logspace(1, 3, 3)
+        self.stopping_rate = {'e': e, 'n': n, 't': t, 'sen': np.ones((4, 3)), 'st': np.ones(3),
+                              'eref': 5.e4, 'nref': 1.e19, 'tref': 1.e2, 'sref': 1.}
+        repository.add_beam_stopping_rate(hydrogen, neon, 10, self.stopping_rate, repository_path=self.repository_path)
+
+        repository.add_wavelength(neon, 1, ('2p5', '3s'), 150.5, repository_path=self.repository_path)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_pack_repository(self):
+
+        repository.pack_repository(self.repository_path, self.container_path)
+        self.assertTrue(repository.is_container(self.container_path))
+        self.assertFalse(repository.is_container(self.repository_path))
+
+        data = repository.get_ionisation_rate(neon, 1, repository_path=self.container_path)
+        np.testing.assert_array_equal(data['ne'], self.ne)
+        np.testing.assert_array_equal(data['te'], self.te)
+        np.testing.assert_array_equal(data['rate'], self.rate)
+
+        data = repository.get_recombination_rate(neon, 2, repository_path=self.container_path)
+        np.testing.assert_array_equal(data['rate'], 2 * self.rate)
+
+        data = repository.get_beam_stopping_rate(hydrogen, neon, 10, repository_path=self.container_path)
+        for key in ('e', 'n', 't', 'sen', 'st'):
+            np.testing.assert_array_equal(data[key], self.stopping_rate[key])
+        for key in ('eref', 'nref', 'tref', 'sref'):
+            self.assertEqual(data[key], self.stopping_rate[key])
+
+        self.assertEqual(repository.get_wavelength(neon, 1, ('2p5', '3s'), repository_path=self.container_path), 150.5)
+
+        # the container holds the same content as the JSON repository
+        content = repository.read_repository(self.container_path)
+        self.assertEqual(sorted(content), sorted(repository.read_repository(self.repository_path)))
+
+    def test_missing_rate(self):
+
+        repository.pack_repository(self.repository_path, self.container_path)
+
+        with self.assertRaises(RuntimeError):
+            repository.get_ionisation_rate(neon, 2, repository_path=self.container_path)
+        with self.assertRaises(RuntimeError):
+            repository.get_ionisation_rate(hydrogen, 0, repository_path=self.container_path)
+        with self.assertRaises(RuntimeError):
+            repository.get_wavelength(neon, 2, ('2p5', '3s'), repository_path=self.container_path)
+
+    def test_openadas(self):
+
+        repository.pack_repository(self.repository_path, self.container_path)
+
+        rate = OpenADAS(data_path=self.container_path).ionisation_rate(neon, 1)
+        rate_ref = OpenADAS(data_path=self.repository_path).ionisation_rate(neon, 1)
+        self.assertEqual(rate(1.e19, 100.), rate_ref(1.e19, 100.))
+
+        # the binary rate cache is not used with a container
+        cache_path = os.path.join(self.tempdir.name, 'cache')
+        OpenADAS(data_path=self.container_path, cache=True, cache_path=cache_path).ionisation_rate(neon, 1)
+        self.assertFalse(os.path.exists(cache_path))
+
+    def test_update_repository(self):
+
+        repository.pack_repository(self.repository_path, self.container_path)
+
+        # rates of the update replace existing rates, other rates are kept
+        update = {'ionisation/ne.json': {'1': {'ne': self.ne, 'te': self.te, 'rate': 3 * self.rate},
+                                         '2': {'ne': self.ne, 'te': self.te, 'rate': 4 * self.rate}}}
+        repository.update_repository(update, self.container_path)
+        repository.update_repository(update, self.repository_path)
+
+        for repository_path in (self.container_path, self.repository_path):
+            data = repository.get_ionisation_rate(neon, 1, repository_path=repository_path)
+            np.testing.assert_array_equal(data['rate'], 3 * self.rate)
+            data = repository.get_ionisation_rate(neon, 2, repository_path=repository_path)
+            np.testing.assert_array_equal(data['rate'], 4 * self.rate)
+            data = repository.get_recombination_rate(neon, 2, repository_path=repository_path)
+            np.testing.assert_array_equal(data['rate'], 2 * self.rate)
+
+    def test_writers(self):
+
+        # the rates are written directly to a new container
+        repository.add_ionisation_rate(neon, 1, {'ne': self.ne, 'te': self.te, 'rates': self.rate},
+                                       repository_path=self.container_path)
+        self.assertTrue(os.path.isfile(self.container_path))
+
+        repository.add_ionisation_rate(neon, 2, {'ne': self.ne, 'te': self.te, 'rates': 2 * self.rate},
+                                       repository_path=self.container_path)
+        repository.add_beam_stopping_rate(hydrogen, neon, 10, self.stopping_rate, repository_path=self.container_path)
+        repository.add_wavelength(neon, 1, ('2p5', '3s'), 150.5, repository_path=self.container_path)
+
+        data = repository.get_ionisation_rate(neon, 1, repository_path=self.container_path)
+        np.testing.assert_array_equal(data['rate'], self.rate)
+        data = repository.get_ionisation_rate(neon, 2, repository_path=self.container_path)
+        np.testing.assert_array_equal(data['rate'], 2 * self.rate)
+        data = repository.get_beam_stopping_rate(hydrogen, neon, 10, repository_path=self.container_path)
+        np.testing.assert_array_equal(data['sen'], self.stopping_rate['sen'])
+        self.assertEqual(repository.get_wavelength(neon, 1, ('2p5', '3s'), repository_path=self.container_path), 150.5)
+
+    def test_install_files(self):
+
+        adas_path = os.path.join(self.tempdir.name, 'adas')
+        os.makedirs(os.path.join(adas_path, 'adf11'))
+        for name, offset in (('scd.dat', 0), ('acd.dat', 1)):
+            table = '\n'.join(' '.join('{:.5f}'.format(-10 - offset - 0.1 * (i + j)) for j in range(3)) for i in range(4))
+            with open(os.path.join(adas_path, 'adf11', name), 'w') as f:
+                f.write(ADF11_TEMPLATE.format(table))
+
+        configuration = {'adf11scd': ((hydrogen, 'adf11/scd.dat'),), 'adf11acd': ((hydrogen, 'adf11/acd.dat'),)}
+
+        install_files(configuration, repository_path=self.repository_path, adas_path=adas_path)
+        install_files(configuration, repository_path=self.container_path, adas_path=adas_path, processes=2)
+
+        for getter, charge in ((repository.get_ionisation_rate, 0), (repository.get_recombination_rate, 1)):
+            data = getter(hydrogen, charge, repository_path=self.container_path)
+            data_ref = getter(hydrogen, charge, repository_path=self.repository_path)
+            for key in ('ne', 'te', 'rate'):
+                np.testing.assert_array_equal(data[key], data_ref[key])
+
+        with self.assertRaises(ValueError):
+            install_files(configuration, repository_path=self.container_path, adas_path=adas_path, processes=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -55,6 +55,47 @@ cdef class EFITEquilibrium:
     cpdef tuple _calculate_differentials(self, np.ndarray r, np.ndarray z, np.ndarray psi_grid)
 
 
+cdef class EFITFluxGrid:
+
+    cdef:
+        readonly EFITEquilibrium equilibrium
+        readonly double resolution
+        readonly str interpolation
+        readonly np.ndarray r, z, psi_normalised
+        np.ndarray _r_centres, _z_centres, _psin_centres, _inside_centres
+        Function2D _inside_lcfs
+        double _rmin, _zmin, _dr, _dz
+        int _nr, _nz, _order
+        double _cached_r, _cached_z
+        bint _cached_inside
+        int _ir[4]
+        int _iz[4]
+        double _wr[4]
+        double _wz[4]
+
+    cdef bint _locate(self, double r, double z) except -1
+
+
+cdef class EFITBakedProfile2D(Function2D):
+
+    cdef:
+        readonly EFITFluxGrid grid
+        readonly np.ndarray data
+        readonly double error
+        double[:, ::1] _data_mv
+        double _value_outside_lcfs
+
+
+cdef class EFITBakedVectorField2D(VectorFunction2D):
+
+    cdef:
+        readonly np.ndarray r, z, data
+        readonly double error
+        double[::1] _data_mv
+        double _rmin, _zmin, _dr, _dz
+        int _nr, _nz, _order
+
+
 cdef class EFITLCFSMask(Function2D):
 
     cdef:
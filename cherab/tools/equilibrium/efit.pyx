@@ -35,6 +35,9 @@ from cherab.core.math cimport PolygonMask2D
 from cherab.core.math cimport IsoMapper2D, AxisymmetricMapper, VectorAxisymmetricMapper
 from cherab.core.math cimport ClampOutput2D
 
+# step in normalised psi used to estimate the profile gradient at the LCFS
+cdef double LCFS_GRADIENT_STEP = 1.e-3
+
 cdef class EFITEquilibrium:
     r"""
     An object representing an EFIT equilibrium time-slice.
@@ -383,6 +386,52 @@ cdef class EFITEquilibrium:
 
         return VectorAxisymmetricMapper(self.map_vector2d(toroidal, poloidal, normal, value_outside_lcfs))
 
+    def flux_grid(self, double resolution=0.01, str interpolation='cubic'):
+        """
+        Creates an R-Z grid for baking flux surface profiles.
+
+        Profiles mapped with the returned EFITFluxGrid are resampled on the grid
+        once and evaluated with fast grid lookups, see EFITFluxGrid for details.
+
+        :param float resolution: The grid spacing in meters (default=0.01).
+        :param str interpolation: The interpolation type, 'linear' or 'cubic' (default='cubic').
+        :return: EFITFluxGrid object.
+
+        .. code-block:: pycon
+
+           >>> # bake the profiles of all species on the same grid
+           >>> grid = equilibrium.flux_grid(resolution=0.005)
+           >>> ne = grid.map3d(ne_data)
+           >>> te = grid.map3d(te_data)
+        """
+
+        return EFITFluxGrid(self, resolution, interpolation)
+
+    def bake_b_field(self, double resolution=0.01, str interpolation='linear'):
+        """
+        Samples the magnetic field on an R-Z grid to give a fast 3D magnetic field.
+
+        The b_field attribute evaluates the normalised psi, two flux derivatives, the
+        current flux profile and the LCFS mask for every sample. The baked field stores
+        the three field components at the grid nodes and interpolates them in a single
+        pass. The grid covers the whole EFIT grid, so the vacuum field outside the LCFS
+        is included. See EFITBakedVectorField2D for details.
+
+        :param float resolution: The grid spacing in meters (default=0.01).
+        :param str interpolation: The interpolation type, 'linear' or 'cubic' (default='linear').
+        :return: VectorAxisymmetricMapper object wrapping an EFITBakedVectorField2D.
+
+        .. code-block:: pycon
+
+           >>> plasma.b_field = equilibrium.bake_b_field(resolution=0.005)
+           >>>
+           >>> # estimated interpolation error in T
+           >>> plasma.b_field.function2d.error
+        """
+
+        return VectorAxisymmetricMapper(EFITBakedVectorField2D(self.b_field, self.r_range, self.z_range,
+                                                               resolution, interpolation))
+
 
 cdef class EFITLCFSMask(Function2D):
     """
@@ -544,3 +593,381 @@ cdef class FluxCoordToCartesian(VectorFunction2D):
             normal.set_length(self._normal.evaluate(psi))
 
         return new_vector3d(poloidal.x + normal.x, toroidal.y, poloidal.z + normal.z)
+
+
+cdef class EFITFluxGrid:
+    """
+    A rectilinear R-Z grid on which flux surface profiles are baked for fast evaluation.
+
+    A profile mapped with EFITEquilibrium.map2d() evaluates the normalised psi
+    interpolator, the LCFS mask and the 1D profile every time it is sampled. When many
+    profiles are mapped on the same equilibrium (e.g. densities, temperatures and
+    velocities of all plasma species) the same psi lookup is repeated for every profile.
+
+    This grid samples the normalised psi at its nodes once. The profiles mapped with
+    map2d() and map3d() are resampled on the nodes and interpolated bilinearly or
+    bicubically (Catmull-Rom). All profiles baked on the same grid share the LCFS test
+    and the interpolation weights: when they are evaluated in turn at the same point,
+    the weights are only calculated by the first profile.
+
+    The grid covers the bounding box of the LCFS polygon with a margin of two cells.
+    The accuracy of the baked profiles depends on the grid resolution, the error
+    attribute of each baked profile gives an estimate of the interpolation error.
+
+    :param EFITEquilibrium equilibrium: The equilibrium used to map the profiles.
+    :param float resolution: The grid spacing in meters (default=0.01).
+    :param str interpolation: The interpolation type, 'linear' or 'cubic' (default='cubic').
+
+    :ivar ndarray r: The grid radius axis values.
+    :ivar ndarray z: The grid height axis values.
+    :ivar ndarray psi_normalised: The normalised poloidal flux at the grid nodes.
+
+    .. code-block:: pycon
+
+       >>> grid = EFITFluxGrid(equilibrium, resolution=0.005)
+       >>> te = grid.map2d(te_data)
+       >>>
+       >>> # estimated interpolation error in eV
+       >>> te.error
+    """
+
+    def __init__(self, EFITEquilibrium equilibrium not None, double resolution=0.01, str interpolation='cubic'):
+
+        cdef:
+            int i, j
+            double[:, ::1] psin_mv, psin_centres_mv
+            np.uint8_t[:, ::1] inside_centres_mv
+
+        if resolution <= 0:
+            raise ValueError('The grid resolution must be greater than zero.')
+
+        if interpolation not in ('linear', 'cubic'):
+            raise ValueError("The interpolation type must be 'linear' or 'cubic'.")
+
+        self.equilibrium = equilibrium
+        self.resolution = resolution
+        self.interpolation = interpolation
+        self._order = 2 if interpolation == 'linear' else 4
+        self._inside_lcfs = equilibrium.inside_lcfs
+
+        # bounding box of the lcfs with a margin of two cells, limited to the EFIT grid
+        rmin = max(equilibrium.lcfs_polygon[:, 0].min() - 2 * resolution, equilibrium.r_range[0])
+        rmax = min(equilibrium.lcfs_polygon[:, 0].max() + 2 * resolution, equilibrium.r_range[1])
+        zmin = max(equilibrium.lcfs_polygon[:, 1].min() - 2 * resolution, equilibrium.z_range[0])
+        zmax = min(equilibrium.lcfs_polygon[:, 1].max() + 2 * resolution, equilibrium.z_range[1])
+
+        self._nr = max(2, int(np.ceil((rmax - rmin) / resolution)) + 1)
+        self._nz = max(2, int(np.ceil((zmax - zmin) / resolution)) + 1)
+        self.r = np.linspace(rmin, rmax, self._nr)
+        self.z = np.linspace(zmin, zmax, self._nz)
+        self._rmin = rmin
+        self._zmin = zmin
+        self._dr = (rmax - rmin) / (self._nr - 1)
+        self._dz = (zmax - zmin) / (self._nz - 1)
+
+        # normalised psi at the nodes
+        self.psi_normalised = np.empty((self._nr, self._nz))
+        psin_mv = self.psi_normalised
+        for i in range(self._nr):
+            for j in range(self._nz):
+                psin_mv[i, j] = equilibrium.psi_normalised.evaluate(self.r[i], self.z[j])
+
+        # normalised psi and lcfs mask at the cell centres, used for the error estimate
+        self._r_centres = 0.5 * (self.r[1:] + self.r[:-1])
+        self._z_centres = 0.5 * (self.z[1:] + self.z[:-1])
+        self._psin_centres = np.zeros((self._nr - 1, self._nz - 1))
+        self._inside_centres = np.zeros((self._nr - 1, self._nz - 1), dtype=np.uint8)
+        psin_centres_mv = self._psin_centres
+        inside_centres_mv = self._inside_centres
+        for i in range(self._nr - 1):
+            for j in range(self._nz - 1):
+                if self._inside_lcfs.evaluate(self._r_centres[i], self._z_centres[j]) > 0:
+                    inside_centres_mv[i, j] = 1
+                    psin_centres_mv[i, j] = equilibrium.psi_normalised.evaluate(self._r_centres[i], self._z_centres[j])
+
+        # no point cached yet, NaN never compares equal
+        self._cached_r = float('nan')
+        self._cached_z = float('nan')
+        self._cached_inside = False
+
+    def map2d(self, object profile, double value_outside_lcfs=0.0):
+        """
+        Maps a 1D profile onto the equilibrium and bakes it on the grid.
+
+        :param profile: A 1D function or 2xN array.
+        :param value_outside_lcfs: Value returned if point requested outside the LCFS (default=0.0).
+        :return: EFITBakedProfile2D object.
+        """
+
+        # convert data to a 1d function if not already a function object
+        if isinstance(profile, Function1D) or callable(profile):
+            profile = autowrap_function1d(profile)
+        else:
+            profile = np.array(profile, np.float64)
+            profile = Interpolator1DArray(profile[0, :], profile[1, :], 'cubic', 'none', 0)
+
+        return EFITBakedProfile2D(self, profile, value_outside_lcfs)
+
+    def map3d(self, object profile, double value_outside_lcfs=0.0):
+        """
+        Maps a 1D profile onto the equilibrium and bakes it on the grid to give a 3D profile.
+
+        :param profile: A 1D function or 2xN array.
+        :param value_outside_lcfs: Value returned if point requested outside the LCFS (default=0.0).
+        :return: Function3D object.
+        """
+
+        return AxisymmetricMapper(self.map2d(profile, value_outside_lcfs))
+
+    @cython.cdivision(True)
+    cdef bint _locate(self, double r, double z) except -1:
+        """
+        Calculates the interpolation indices and weights for the requested point.
+
+        Returns False if the point lies outside the LCFS. The result is cached, so the
+        profiles sharing the grid only calculate the weights once for the same point.
+        """
+
+        cdef:
+            double fr, fz
+            int ir, iz
+
+        if r == self._cached_r and z == self._cached_z:
+            return self._cached_inside
+
+        fr = (r - self._rmin) / self._dr
+        fz = (z - self._zmin) / self._dz
+        if not (0 <= fr <= self._nr - 1 and 0 <= fz <= self._nz - 1) or self._inside_lcfs.evaluate(r, z) <= 0:
+            self._cached_inside = False
+            self._cached_r = r
+            self._cached_z = z
+            return False
+
+        ir = min(<int> fr, self._nr - 2)
+        iz = min(<int> fz, self._nz - 2)
+        if self._order == 2:
+            _linear_weights(fr - ir, ir, self._ir, self._wr)
+            _linear_weights(fz - iz, iz, self._iz, self._wz)
+        else:
+            _cubic_weights(fr - ir, ir, self._nr, self._ir, self._wr)
+            _cubic_weights(fz - iz, iz, self._nz, self._iz, self._wz)
+
+        self._cached_inside = True
+        self._cached_r = r
+        self._cached_z = z
+        return True
+
+
+cdef inline void _linear_weights(double t, int index, int *indices, double *weights) noexcept nogil:
+
+    indices[0] = index
+    indices[1] = index + 1
+    weights[0] = 1 - t
+    weights[1] = t
+
+
+cdef inline void _cubic_weights(double t, int index, int n, int *indices, double *weights) noexcept nogil:
+
+    cdef double t2 = t * t, t3 = t2 * t
+
+    # Catmull-Rom spline, the edge values are repeated beyond the grid
+    indices[0] = max(index - 1, 0)
+    indices[1] = index
+    indices[2] = index + 1
+    indices[3] = min(index + 2, n - 1)
+    weights[0] = 0.5 * (-t3 + 2 * t2 - t)
+    weights[1] = 0.5 * (3 * t3 - 5 * t2 + 2)
+    weights[2] = 0.5 * (-3 * t3 + 4 * t2 + t)
+    weights[3] = 0.5 * (t3 - t2)
+
+
+cdef class EFITBakedProfile2D(Function2D):
+    """
+    A flux surface profile baked on an EFITFluxGrid.
+
+    Instances are created with EFITFluxGrid.map2d().
+
+    The node values outside the LCFS are extrapolated linearly from the profile at
+    psi_n = 1, so the interpolation is smooth up to the LCFS.
+
+    :param EFITFluxGrid grid: The grid the profile is baked on.
+    :param Function1D profile: The profile as a function of normalised psi.
+    :param value_outside_lcfs: Value returned if point requested outside the LCFS (default=0.0).
+
+    :ivar EFITFluxGrid grid: The grid the profile is baked on.
+    :ivar ndarray data: The profile values at the grid nodes.
+    :ivar float error: The maximum absolute difference between the baked profile and the
+      exact mapping, sampled at the centres of the grid cells inside the LCFS.
+    """
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def __init__(self, EFITFluxGrid grid not None, Function1D profile not None, double value_outside_lcfs=0.0):
+
+        cdef:
+            int i, j
+            double error, value_lcfs, gradient_lcfs
+            double[:, ::1] psin_mv, psin_centres_mv
+            np.uint8_t[:, ::1] inside_centres_mv
+
+        self.grid = grid
+        self._value_outside_lcfs = value_outside_lcfs
+
+        # beyond the LCFS the profile is extrapolated linearly, a constant continuation
+        # would add a kink to the node values and degrade the interpolation near the LCFS
+        value_lcfs = profile.evaluate(1.0)
+        gradient_lcfs = (value_lcfs - profile.evaluate(1.0 - LCFS_GRADIENT_STEP)) / LCFS_GRADIENT_STEP
+
+        self.data = np.empty((grid._nr, grid._nz))
+        self._data_mv = self.data
+        psin_mv = grid.psi_normalised
+        for i in range(grid._nr):
+            for j in range(grid._nz):
+                if psin_mv[i, j] <= 1.0:
+                    self._data_mv[i, j] = profile.evaluate(psin_mv[i, j])
+                else:
+                    self._data_mv[i, j] = value_lcfs + gradient_lcfs * (psin_mv[i, j] - 1.0)
+
+        # error estimate at the cell centres, where the interpolation error is the largest
+        error = 0
+        psin_centres_mv = grid._psin_centres
+        inside_centres_mv = grid._inside_centres
+        for i in range(grid._nr - 1):
+            for j in range(grid._nz - 1):
+                if inside_centres_mv[i, j]:
+                    error = max(error, abs(self.evaluate(grid._r_centres[i], grid._z_centres[j]) - profile.evaluate(psin_centres_mv[i, j])))
+        self.error = error
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    @cython.initializedcheck(False)
+    cdef double evaluate(self, double r, double z) except? -1e999:
+
+        cdef:
+            EFITFluxGrid grid = self.grid
+            int i, j
+            double value, row
+
+        if not grid._locate(r, z):
+            return self._value_outside_lcfs
+
+        value = 0
+        for i in range(grid._order):
+            row = 0
+            for j in range(grid._order):
+                row += grid._wz[j] * self._data_mv[grid._ir[i], grid._iz[j]]
+            value += grid._wr[i] * row
+        return value
+
+
+cdef class EFITBakedVectorField2D(VectorFunction2D):
+    """
+    A 2D vector function sampled on a rectilinear R-Z grid.
+
+    The three vector components are stored in a packed (3, nR, nZ) array. A single
+    index is calculated for each interpolation node and used to read all three
+    components, so the vector is interpolated in one pass.
+
+    Instances are usually created with EFITEquilibrium.bake_b_field().
+
+    :param VectorFunction2D field: The vector function to sample.
+    :param tuple r_range: The (min, max) radius range of the grid.
+    :param tuple z_range: The (min, max) height range of the grid.
+    :param float resolution: The grid spacing in meters (default=0.01).
+    :param str interpolation: The interpolation type, 'linear' or 'cubic' (default='linear').
+
+    :ivar ndarray r: The grid radius axis values.
+    :ivar ndarray z: The grid height axis values.
+    :ivar ndarray data: The vector components at the grid nodes, (3, nR, nZ) array.
+    :ivar float error: The maximum length of the difference between the baked and the sampled
+      vector function at the centres of the grid cells.
+    """
+
+    def __init__(self, object field, tuple r_range, tuple z_range, double resolution=0.01, str interpolation='linear'):
+
+        cdef:
+            int i, j
+            double error
+            Vector3D v
+            VectorFunction2D f
+            double[:, :, ::1] data_mv
+
+        if resolution <= 0:
+            raise ValueError('The grid resolution must be greater than zero.')
+
+        if interpolation not in ('linear', 'cubic'):
+            raise ValueError("The interpolation type must be 'linear' or 'cubic'.")
+
+        f = autowrap_vectorfunction2d(field)
+        rmin, rmax = r_range
+        zmin, zmax = z_range
+        if rmax <= rmin or zmax <= zmin:
+            raise ValueError('The grid ranges must be specified as (min, max) with max > min.')
+
+        self._order = 2 if interpolation == 'linear' else 4
+        self._nr = max(2, int(np.ceil((rmax - rmin) / resolution)) + 1)
+        self._nz = max(2, int(np.ceil((zmax - zmin) / resolution)) + 1)
+        self.r = np.linspace(rmin, rmax, self._nr)
+        self.z = np.linspace(zmin, zmax, self._nz)
+        self._rmin = rmin
+        self._zmin = zmin
+        self._dr = (rmax - rmin) / (self._nr - 1)
+        self._dz = (zmax - zmin) / (self._nz - 1)
+
+        self.data = np.empty((3, self._nr, self._nz))
+        data_mv = self.data
+        for i in range(self._nr):
+            for j in range(self._nz):
+                v = f.evaluate(self.r[i], self.z[j])
+                data_mv[0, i, j] = v.x
+                data_mv[1, i, j] = v.y
+                data_mv[2, i, j] = v.z
+        self._data_mv = self.data.reshape(-1)
+
+        # error estimate at the cell centres, where the interpolation error is the largest
+        error = 0
+        for ri in 0.5 * (self.r[1:] + self.r[:-1]):
+            for zj in 0.5 * (self.z[1:] + self.z[:-1]):
+                error = max(error, (self.evaluate(ri, zj) - f.evaluate(ri, zj)).length)
+        self.error = error
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    @cython.initializedcheck(False)
+    @cython.cdivision(True)
+    cdef Vector3D evaluate(self, double r, double z):
+
+        cdef:
+            double fr, fz, w, vx, vy, vz
+            int i, j, k, ir, iz, size
+            int r_indices[4]
+            int z_indices[4]
+            double r_weights[4]
+            double z_weights[4]
+
+        fr = (r - self._rmin) / self._dr
+        fz = (z - self._zmin) / self._dz
+        if not (0 <= fr <= self._nr - 1 and 0 <= fz <= self._nz - 1):
+            raise ValueError('The requested point (r={}, z={}) lies outside the grid.'.format(r, z))
+
+        ir = min(<int> fr, self._nr - 2)
+        iz = min(<int> fz, self._nz - 2)
+        if self._order == 2:
+            _linear_weights(fr - ir, ir, r_indices, r_weights)
+            _linear_weights(fz - iz, iz, z_indices, z_weights)
+        else:
+            _cubic_weights(fr - ir, ir, self._nr, r_indices, r_weights)
+            _cubic_weights(fz - iz, iz, self._nz, z_indices, z_weights)
+
+        # the components are stored a whole grid apart in the packed array
+        size = self._nr * self._nz
+        vx = vy = vz = 0
+        for i in range(self._order):
+            for j in range(self._order):
+                w = r_weights[i] * z_weights[j]
+                k = r_indices[i] * self._nz + z_indices[j]
+                vx += w * self._data_mv[k]
+                vy += w * self._data_mv[k + size]
+                vz += w * self._data_mv[k + 2 * size]
+
+        return new_vector3d(vx, vy, vz)
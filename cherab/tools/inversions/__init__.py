@@ -17,10 +17,10 @@
 # See the Licence for the specific language governing permissions and limitations
 # under the Licence.
 
-from .sart import invert_sart, invert_constrained_sart
+from .sart import invert_sart, invert_constrained_sart, invert_sparse_sart
 from .opencl import SartOpencl
-from .nnls import invert_regularised_nnls
-from .lstsq import invert_regularised_lstsq
-from .svd import invert_svd
+from .nnls import invert_regularised_nnls, RegularisedNnlsSolver
+from .lstsq import invert_regularised_lstsq, RegularisedLstsqSolver
+from .svd import invert_svd, SvdSolver
 from .voxels import Voxel, AxisymmetricVoxel, VoxelCollection, ToroidalVoxelGrid, UnityVoxelEmitter
 from .admt_utils import generate_derivative_operators, calculate_admt
@@ -28,6 +28,7 @@ __author__ = "Jack Lovell, Oak Ridge National Laboratory"
 
 from collections.abc import Mapping
 import numpy as np
+from scipy import sparse
 
 
 def generate_derivative_operators(voxel_vertices, grid_index_1d_to_2d_map,
@@ -44,7 +45,8 @@ def generate_derivative_operators(voxel_vertices, grid_index_1d_to_2d_map,
     spatially-arranged array of voxels to the 1D array.
 
     :return dict operators: a dictionary containing the derivative
-    operators: Dij for i, y ∊ (x, y) and Di for i ∊ (x, y).
+    operators: Dij for i, y ∊ (x, y) and Di for i ∊ (x, y). The operators
+    are NxN scipy.sparse CSR matrices.
 
     This function assumes that all voxels are rectilinear, with their
     axes aligned to the coordinate axes. Additionally, all voxels are
@@ -81,12 +83,6 @@ def generate_derivative_operators(voxel_vertices, grid_index_1d_to_2d_map,
 
     num_cells = voxel_vertices.shape[0]
     cell_centres = np.mean(voxel_vertices, axis=1)
-    # Individual derivative operators
-    Dx = np.zeros((num_cells, num_cells))
-    Dy = np.zeros((num_cells, num_cells))
-    Dxx = np.zeros((num_cells, num_cells))
-    Dxy = np.zeros((num_cells, num_cells))
-    Dyy = np.zeros((num_cells, num_cells))
     # TODO: for now, we assume all voxels have rectangular cross sections
     # which are approximately identical. As per Ingesson's notation, we
     # assume voxels are ordered from top left to bottom right, in column-major
@@ -99,165 +95,146 @@ def generate_derivative_operators(voxel_vertices, grid_index_1d_to_2d_map,
     dx = np.min(abs(dx[dx != 0])).item()
     dy = np.min(abs(dy[dy != 0])).item()
 
+    # Indices of the 3x3 neighbourhood of each cell in the 1D array, -1 if
+    # there is no neighbour. The neighbourhood is indexed [iy offset, ix offset]
+    # so that e.g. neighbours[:, BELOW, LEFT] is the cell below left of each cell.
+    cell_index_2d = np.array([grid_index_1d_to_2d_map[i] for i in range(num_cells)], dtype=int).reshape(num_cells, 2)
+    grid_index_2d = np.array(list(grid_index_2d_to_1d_map.keys()), dtype=int).reshape(-1, 2)
+    grid_index_1d = np.array(list(grid_index_2d_to_1d_map.values()), dtype=int)
+    origin = np.minimum(cell_index_2d.min(axis=0), grid_index_2d.min(axis=0, initial=0)) - 1
+    shape = np.maximum(cell_index_2d.max(axis=0), grid_index_2d.max(axis=0, initial=0)) - origin + 2
+    index_map = np.full(shape, -1, dtype=int)
+    index_map[tuple((grid_index_2d - origin).T)] = grid_index_1d
+    ix, iy = (cell_index_2d - origin).T
+    neighbours = np.empty((num_cells, 3, 3), dtype=int)
+    for j in range(3):
+        for i in range(3):
+            neighbours[:, j, i] = index_map[ix + i - 1, iy + j - 1]
+
     # Note that iy increases as y decreases (cells go from top to bottom),
     # which is the same as Ingesson's notation in equations 37-41
+    ABOVE, LEFT, CENTRE, BELOW, RIGHT = 0, 0, 1, 2, 2
+    n_left = neighbours[:, CENTRE, LEFT] >= 0
+    n_right = neighbours[:, CENTRE, RIGHT] >= 0
+    n_below = neighbours[:, BELOW, CENTRE] >= 0
+    n_above = neighbours[:, ABOVE, CENTRE] >= 0
+    at_left, at_right, at_bottom, at_top = ~n_left, ~n_right, ~n_below, ~n_above
+    top_left = at_top & at_left
+    top_right = at_top & at_right
+    bottom_left = at_bottom & at_left
+    bottom_right = at_bottom & at_right
+
+    # Individual derivative operators, as the coefficients of the 3x3 stencil of each cell
+    Dx = np.zeros((num_cells, 3, 3))
+    Dy = np.zeros((num_cells, 3, 3))
+    Dxx = np.zeros((num_cells, 3, 3))
+    Dxy = np.zeros((num_cells, 3, 3))
+    Dyy = np.zeros((num_cells, 3, 3))
+
     # Use the second version of the second derivative boundary formulae, so
-    # that we only need to consider nearest neighbours
-    for ith_cell in range(num_cells):
-        at_top, at_bottom, at_left, at_right = False, False, False, False
-        n_left, n_right, n_below, n_above = np.nan, np.nan, np.nan, np.nan
-        n_above_left, n_above_right, n_below_left, n_below_right = np.nan, np.nan, np.nan, np.nan
-        # get the 2D mesh coordinates of this cell
-        ix, iy = grid_index_1d_to_2d_map[ith_cell]
-
-        try:
-            n_left = grid_index_2d_to_1d_map[ix - 1, iy]  # left of n0
-        except KeyError:
-            at_left = True
-        else:
-            Dx[ith_cell, n_left] = -1 / 2
-            Dxx[ith_cell, n_left] = 1
-
-        try:
-            n_below_left = grid_index_2d_to_1d_map[ix - 1, iy + 1]  # below left of n0
-        except KeyError:
-            # KeyError does not necessarily mean bottom AND left
-            pass
-        else:
-            Dxy[ith_cell, n_below_left] = 1 / 4
-
-        try:
-            n_below = grid_index_2d_to_1d_map[ix, iy + 1]
-        except KeyError:
-            at_bottom = True
-        else:
-            Dy[ith_cell, n_below] = -1 / 2
-            Dyy[ith_cell, n_below] = 1
-
-        try:
-            n_below_right = grid_index_2d_to_1d_map[ix + 1, iy + 1]
-        except KeyError:
-            pass
-        else:
-            Dxy[ith_cell, n_below_right] = -1 / 4
-
-        try:
-            n_right = grid_index_2d_to_1d_map[ix + 1, iy]
-        except KeyError:
-            at_right = True
-        else:
-            Dx[ith_cell, n_right] = 1 / 2
-            Dxx[ith_cell, n_right] = 1
-
-        try:
-            n_above_right = grid_index_2d_to_1d_map[ix + 1, iy - 1]
-        except KeyError:
-            pass
-        else:
-            Dxy[ith_cell, n_above_right] = 1 / 4
-
-        try:
-            n_above = grid_index_2d_to_1d_map[ix, iy - 1]
-        except KeyError:
-            at_top = True
-        else:
-            Dy[ith_cell, n_above] = 1 / 2
-            Dyy[ith_cell, n_above] = 1
-
-        try:
-            n_above_left = grid_index_2d_to_1d_map[ix - 1, iy - 1]
-        except KeyError:
-            pass
-        else:
-            Dxy[ith_cell, n_above_left] = -1 / 4
-
-        top_left = at_top and at_left
-        top_right = at_top and at_right
-        bottom_left = at_bottom and at_left
-        bottom_right = at_bottom and at_right
-
-        Dxx[ith_cell, ith_cell] = -2
-        Dyy[ith_cell, ith_cell] = -2
-
-        if at_left:
-            Dx[ith_cell, ith_cell] = -1
-            Dx[ith_cell, n_right] = 1
-            Dxx[ith_cell, ith_cell] = -1
-            Dxx[ith_cell, n_right] = 1
-            if not (top_left or bottom_left):
-                Dxy[ith_cell, n_above_right] = 1 / 2
-                Dxy[ith_cell, n_below] = 1 / 2
-                Dxy[ith_cell, n_above] = -1 / 2
-                Dxy[ith_cell, n_below_right] = -1 / 2
-
-        if at_right:
-            Dx[ith_cell, n_left] = -1
-            Dx[ith_cell, ith_cell] = 1
-            Dxx[ith_cell, n_left] = -1
-            Dxx[ith_cell, ith_cell] = 1
-            if not (top_right or bottom_right):
-                Dxy[ith_cell, n_above] = 1 / 2
-                Dxy[ith_cell, n_below_left] = 1 / 2
-                Dxy[ith_cell, n_above_left] = -1 / 2
-                Dxy[ith_cell, n_below] = -1 / 2
-
-        if at_top:
-            Dy[ith_cell, n_below] = -1
-            Dy[ith_cell, ith_cell] = 1
-            Dyy[ith_cell, n_below] = -1
-            Dyy[ith_cell, ith_cell] = 1
-            if not (top_left or top_right):
-                Dxy[ith_cell, n_right] = 1 / 2
-                Dxy[ith_cell, n_below_left] = 1 / 2
-                Dxy[ith_cell, n_left] = -1 / 2
-                Dxy[ith_cell, n_below_right] = -1 / 2
-
-        if at_bottom:
-            Dy[ith_cell, n_above] = 1
-            Dy[ith_cell, ith_cell] = -1
-            Dyy[ith_cell, n_above] = 1
-            Dyy[ith_cell, ith_cell] = -1
-            if not (bottom_left or bottom_right):
-                Dxy[ith_cell, n_above_right] = 1 / 2
-                Dxy[ith_cell, n_left] = 1 / 2
-                Dxy[ith_cell, n_above_left] = -1 / 2
-                Dxy[ith_cell, n_right] = -1 / 2
-
-        if top_left:
-            Dxy[ith_cell, n_below] = 1
-            Dxy[ith_cell, n_right] = 1
-            Dxy[ith_cell, ith_cell] = -1
-            Dxy[ith_cell, n_below_right] = -1
-
-        if top_right:
-            Dxy[ith_cell, ith_cell] = 1
-            Dxy[ith_cell, n_below_left] = 1
-            Dxy[ith_cell, n_left] = -1
-            Dxy[ith_cell, n_below] = -1
-
-        if bottom_left:
-            Dxy[ith_cell, n_above_right] = 1
-            Dxy[ith_cell, ith_cell] = 1
-            Dxy[ith_cell, n_above] = -1
-            Dxy[ith_cell, n_right] = -1
-
-        if bottom_right:
-            Dxy[ith_cell, n_above] = 1
-            Dxy[ith_cell, n_left] = 1
-            Dxy[ith_cell, ith_cell] = -1
-            Dxy[ith_cell, n_above_left] = -1
-
-    Dx = Dx / dx
-    Dy = Dy / dy
-    Dxx = Dxx / dx**2
-    Dyy = Dyy / dy**2
-    Dxy = Dxy / (dx * dy)
+    # that we only need to consider nearest neighbours.
+    # The coefficients are assigned in order, boundary formulae overwrite
+    # the interior formulae.
+    Dx[:, CENTRE, LEFT] = -1 / 2
+    Dx[:, CENTRE, RIGHT] = 1 / 2
+    Dxx[:, CENTRE, LEFT] = 1
+    Dxx[:, CENTRE, RIGHT] = 1
+    Dy[:, BELOW, CENTRE] = -1 / 2
+    Dy[:, ABOVE, CENTRE] = 1 / 2
+    Dyy[:, BELOW, CENTRE] = 1
+    Dyy[:, ABOVE, CENTRE] = 1
+    Dxy[:, BELOW, LEFT] = 1 / 4
+    Dxy[:, BELOW, RIGHT] = -1 / 4
+    Dxy[:, ABOVE, RIGHT] = 1 / 4
+    Dxy[:, ABOVE, LEFT] = -1 / 4
+    Dxx[:, CENTRE, CENTRE] = -2
+    Dyy[:, CENTRE, CENTRE] = -2
+
+    Dx[at_left, CENTRE, CENTRE] = -1
+    Dx[at_left, CENTRE, RIGHT] = 1
+    Dxx[at_left, CENTRE, CENTRE] = -1
+    Dxx[at_left, CENTRE, RIGHT] = 1
+    mask = at_left & ~(top_left | bottom_left)
+    Dxy[mask, ABOVE, RIGHT] = 1 / 2
+    Dxy[mask, BELOW, CENTRE] = 1 / 2
+    Dxy[mask, ABOVE, CENTRE] = -1 / 2
+    Dxy[mask, BELOW, RIGHT] = -1 / 2
+
+    Dx[at_right, CENTRE, LEFT] = -1
+    Dx[at_right, CENTRE, CENTRE] = 1
+    Dxx[at_right, CENTRE, LEFT] = -1
+    Dxx[at_right, CENTRE, CENTRE] = 1
+    mask = at_right & ~(top_right | bottom_right)
+    Dxy[mask, ABOVE, CENTRE] = 1 / 2
+    Dxy[mask, BELOW, LEFT] = 1 / 2
+    Dxy[mask, ABOVE, LEFT] = -1 / 2
+    Dxy[mask, BELOW, CENTRE] = -1 / 2
+
+    Dy[at_top, BELOW, CENTRE] = -1
+    Dy[at_top, CENTRE, CENTRE] = 1
+    Dyy[at_top, BELOW, CENTRE] = -1
+    Dyy[at_top, CENTRE, CENTRE] = 1
+    mask = at_top & ~(top_left | top_right)
+    Dxy[mask, CENTRE, RIGHT] = 1 / 2
+    Dxy[mask, BELOW, LEFT] = 1 / 2
+    Dxy[mask, CENTRE, LEFT] = -1 / 2
+    Dxy[mask, BELOW, RIGHT] = -1 / 2
+
+    Dy[at_bottom, ABOVE, CENTRE] = 1
+    Dy[at_bottom, CENTRE, CENTRE] = -1
+    Dyy[at_bottom, ABOVE, CENTRE] = 1
+    Dyy[at_bottom, CENTRE, CENTRE] = -1
+    mask = at_bottom & ~(bottom_left | bottom_right)
+    Dxy[mask, ABOVE, RIGHT] = 1 / 2
+    Dxy[mask, CENTRE, LEFT] = 1 / 2
+    Dxy[mask, ABOVE, LEFT] = -1 / 2
+    Dxy[mask, CENTRE, RIGHT] = -1 / 2
+
+    Dxy[top_left, BELOW, CENTRE] = 1
+    Dxy[top_left, CENTRE, RIGHT] = 1
+    Dxy[top_left, CENTRE, CENTRE] = -1
+    Dxy[top_left, BELOW, RIGHT] = -1
+
+    Dxy[top_right, CENTRE, CENTRE] = 1
+    Dxy[top_right, BELOW, LEFT] = 1
+    Dxy[top_right, CENTRE, LEFT] = -1
+    Dxy[top_right, BELOW, CENTRE] = -1
+
+    Dxy[bottom_left, ABOVE, RIGHT] = 1
+    Dxy[bottom_left, CENTRE, CENTRE] = 1
+    Dxy[bottom_left, ABOVE, CENTRE] = -1
+    Dxy[bottom_left, CENTRE, RIGHT] = -1
+
+    Dxy[bottom_right, ABOVE, CENTRE] = 1
+    Dxy[bottom_right, CENTRE, LEFT] = 1
+    Dxy[bottom_right, CENTRE, CENTRE] = -1
+    Dxy[bottom_right, ABOVE, LEFT] = -1
+
+    Dx = _stencil_to_sparse(Dx, neighbours) / dx
+    Dy = _stencil_to_sparse(Dy, neighbours) / dy
+    Dxx = _stencil_to_sparse(Dxx, neighbours) / dx**2
+    Dyy = _stencil_to_sparse(Dyy, neighbours) / dy**2
+    Dxy = _stencil_to_sparse(Dxy, neighbours) / (dx * dy)
 
     # Package all operators up into a dictionary
     operators = dict(Dx=Dx, Dy=Dy, Dxx=Dxx, Dyy=Dyy, Dxy=Dxy)
     return operators
 
 
+def _stencil_to_sparse(stencil, neighbours):
+    """
+    Convert the 3x3 stencil coefficients of each cell to a sparse operator.
+
+    Coefficients referring to non-existent neighbours are discarded.
+    """
+    num_cells = stencil.shape[0]
+    rows = np.repeat(np.arange(num_cells), 9)
+    columns = neighbours.ravel()
+    values = stencil.ravel()
+    keep = (columns >= 0) & (values != 0)
+    return sparse.csr_matrix((values[keep], (rows[keep], columns[keep])), shape=(num_cells, num_cells))
+
+
 def calculate_admt(voxel_radii, derivative_operators, psi_at_voxels, dx, dy, anisotropy=10):
     r"""
     Calculate the ADMT regularisation operator.
@@ -273,7 +250,8 @@ def calculate_admt(voxel_radii, derivative_operators, psi_at_voxels, dx, dy, ani
     :param float anisotropy: the ratio of the smoothing in the parallel
     and perpendicular directions.
 
-    :return ndarray admt: the ADMT regularisation operator.
+    :return csr_matrix admt: the ADMT regularisation operator as a
+    scipy.sparse CSR matrix.
 
     The degree of anisotropy dictates the relative suppression of
     gradients in the directions parallel and perpendicular to the
@@ -345,11 +323,11 @@ def calculate_admt(voxel_radii, derivative_operators, psi_at_voxels, dx, dy, ani
         + (Dperp - Dpar) * (dpsidxdy * dpsidx + dpsidxx * dpsidy)
         + ddiff_term_cy + dnorm_term_cy + toroidal_term_cy
     ) / normalisation
-    cx = np.diag(cx)
-    cy = np.diag(cy)
-    cxx = np.diag(cxx)
-    cyy = np.diag(cyy)
-    cxy = np.diag(cxy)
+    cx = sparse.diags(cx)
+    cy = sparse.diags(cy)
+    cxx = sparse.diags(cxx)
+    cyy = sparse.diags(cyy)
+    cxy = sparse.diags(cxy)
     admt_operator = cx @ Dx + cy @ Dy + cxx @ Dxx + 2 * cxy @ Dxy + cyy @ Dyy
-    admt_operator *= np.sqrt(dx * dy)
+    admt_operator = sparse.csr_matrix(admt_operator * np.sqrt(dx * dy))
     return admt_operator
@@ -18,6 +18,118 @@
 # under the Licence.
 
 import numpy as np
+from scipy import sparse
+
+
+def _extended_matrix(w_matrix, alpha, tikhonov_matrix):
+    """
+    Extends the sensitivity matrix with the scaled Tikhonov regularisation matrix.
+
+    The matrices may be scipy.sparse matrices, the extended matrix is always dense.
+    """
+
+    m, n = w_matrix.shape
+
+    # Extend W to have form ...
+    c_matrix = np.zeros((m+n, n))
+    c_matrix[0:m, :] = _dense(w_matrix)
+
+    if tikhonov_matrix is None:
+        c_matrix[m:, :] = alpha * np.identity(n)
+    else:
+        c_matrix[m:, :] = _dense(alpha * tikhonov_matrix)
+
+    return c_matrix
+
+
+def _dense(matrix):
+    """
+    Returns a dense array of a dense or scipy.sparse matrix.
+    """
+
+    if sparse.issparse(matrix):
+        return matrix.toarray()
+
+    return np.asarray(matrix)
+
+
+class RegularisedLstsqSolver:
+    r"""
+    Solves :math:`\mathbf{b} = \mathbf{W} \mathbf{x}` for many measurement vectors
+    :math:`\mathbf{b}` with the same sensitivity matrix and Tikhonov regularisation.
+
+    The singular value decomposition of the extended matrix is calculated once on initialisation,
+    so each subsequent inversion costs only a few matrix products. The solution is identical to that
+    of `invert_regularised_lstsq()`.
+
+    :param np.ndarray w_matrix: The sensitivity matrix describing the coupling between the
+      detectors and the voxels. Must be an array with shape :math:`(N_d, N_s)`.
+    :param float alpha: The regularisation hyperparameter :math:`\alpha` which determines
+      the regularisation strength of the tikhonov matrix.
+    :param np.ndarray tikhonov_matrix: The tikhonov regularisation matrix operator, an array
+      or a scipy.sparse matrix with shape :math:`(N_s, N_s)`. If None, the identity matrix is used.
+
+    .. code-block:: pycon
+
+       >>> from cherab.tools.inversions import RegularisedLstsqSolver
+       >>> solver = RegularisedLstsqSolver(w_matrix, tikhonov_matrix=tikhonov_matrix)
+       >>> x, rvec = solver(b_time_series)  # b_time_series has shape (N_t, N_d)
+    """
+
+    def __init__(self, w_matrix, alpha=0.01, tikhonov_matrix=None):
+
+        c_matrix = _extended_matrix(w_matrix, alpha, tikhonov_matrix)
+        m_ext, n = c_matrix.shape
+        self._m = w_matrix.shape[0]
+        self._c_matrix = c_matrix
+
+        u_matrix, singular_values, vt_matrix = np.linalg.svd(c_matrix, full_matrices=False)
+
+        # same cut-off for small singular values as in numpy.linalg.lstsq(rcond=None)
+        cutoff = np.finfo(float).eps * max(m_ext, n) * singular_values.max()
+        rank_mask = singular_values > cutoff
+        self._rank = np.count_nonzero(rank_mask)
+
+        inv_singular_values = np.zeros_like(singular_values)
+        inv_singular_values[rank_mask] = 1 / singular_values[rank_mask]
+
+        # only the first N_d rows of the extended measurement vector are non-zero
+        self._pseudo_inverse = (vt_matrix.T * inv_singular_values) @ u_matrix[:self._m].T
+
+    @property
+    def rank(self):
+        """
+        The effective rank of the extended matrix.
+        """
+        return self._rank
+
+    def __call__(self, b_vector):
+        """
+        Solves the regularised problem for one or many measurement vectors.
+
+        :param np.ndarray b_vector: The measured power/radiance vector with shape :math:`(N_d)`
+          or a stack of measurement vectors with shape :math:`(N_t, N_d)`.
+        :return: (x, residuals), the solution with shape :math:`(N_s)` or :math:`(N_t, N_s)` and the sums of
+          squared residuals. As in numpy.linalg.lstsq, the residuals are empty if the extended matrix is rank deficient.
+        """
+
+        b_vector = np.asarray(b_vector, dtype=float)
+        single = b_vector.ndim == 1
+        b_matrix = np.atleast_2d(b_vector)
+
+        x_matrix = b_matrix @ self._pseudo_inverse.T
+
+        if self._rank == self._c_matrix.shape[1]:
+            d_matrix = np.zeros((b_matrix.shape[0], self._c_matrix.shape[0]))
+            d_matrix[:, :self._m] = b_matrix
+            residuals = np.sum((x_matrix @ self._c_matrix.T - d_matrix)**2, axis=1)
+        else:
+            residuals = np.zeros((0,))
+
+        if single:
+            return x_matrix[0], residuals
+
+        return x_matrix, residuals
 
 
 def invert_regularised_lstsq(w_matrix, b_vector, alpha=0.01, tikhonov_matrix=None):
@@ -28,13 +140,16 @@ def invert_regularised_lstsq(w_matrix, b_vector, alpha=0.01, tikhonov_matrix=Non
     This is a thin wrapper around numpy.linalg.lstsq, which modifies
     the arguments to include the supplied Tikhonov regularisation matrix.
 
+    To invert many measurement vectors with the same sensitivity matrix, use
+    `RegularisedLstsqSolver`, which caches the matrix decomposition.
+
     :param np.ndarray w_matrix: The sensitivity matrix describing the coupling between the
       detectors and the voxels. Must be an array with shape :math:`(N_d, N_s)`.
     :param np.ndarray b_vector: The measured power/radiance vector with shape :math:`(N_d)`.
     :param float alpha: The regularisation hyperparameter :math:`\alpha` which determines
       the regularisation strength of the tikhonov matrix.
     :param np.ndarray tikhonov_matrix: The tikhonov regularisation matrix operator, an array
-      with shape :math:`(N_s, N_s)`. If None, the identity matrix is used.
+      or a scipy.sparse matrix with shape :math:`(N_s, N_s)`. If None, the identity matrix is used.
     :return: (x, residuals), the solution and residual vectors.
 
     .. code-block:: pycon
@@ -45,15 +160,7 @@ def invert_regularised_lstsq(w_matrix, b_vector, alpha=0.01, tikhonov_matrix=Non
 
     m, n = w_matrix.shape
 
-    if tikhonov_matrix is None:
-        tikhonov_matrix = np.identity(n)
-
-    tikhonov_matrix = alpha * tikhonov_matrix
-
-    # Extend W to have form ...
-    c_matrix = np.zeros((m+n, n))
-    c_matrix[0:m, :] = w_matrix[:, :]
-    c_matrix[m:, :] = tikhonov_matrix[:, :]
+    c_matrix = _extended_matrix(w_matrix, alpha, tikhonov_matrix)
 
     # Extend b to have form ...
     d_vector = np.zeros(m+n)
@@ -17,9 +17,133 @@
 # See the Licence for the specific language governing permissions and limitations
 # under the Licence.
 
+import multiprocessing
 import numpy as np
 import scipy
 
+from .lstsq import _extended_matrix
+
+
+def _solve_reduced_nnls(r_matrix, qtb_vector, extra_norm_squared, nnls_kwargs):
+    """
+    Solves the NNLS problem reduced with the QR decomposition of the extended matrix.
+
+    The values are normalised by max(qtb_vector) to avoid possible issues with the nnls termination criteria.
+    """
+
+    vmax = np.abs(qtb_vector).max()
+    if vmax == 0:
+        return np.zeros(r_matrix.shape[1]), np.sqrt(extra_norm_squared)
+
+    x_vector, rnorm = scipy.optimize.nnls(r_matrix / vmax, qtb_vector / vmax, **nnls_kwargs)
+
+    # the part of the measurement vector orthogonal to the range of the extended matrix
+    rnorm = np.sqrt((rnorm * vmax)**2 + extra_norm_squared)
+
+    return x_vector, rnorm
+
+
+# the factorisation shared with the worker processes
+_worker_state = {}
+
+
+def _init_worker(r_matrix, nnls_kwargs):
+    _worker_state['r_matrix'] = r_matrix
+    _worker_state['nnls_kwargs'] = nnls_kwargs
+
+
+def _worker_solve(args):
+    qtb_vector, extra_norm_squared = args
+    return _solve_reduced_nnls(_worker_state['r_matrix'], qtb_vector, extra_norm_squared, _worker_state['nnls_kwargs'])
+
+
+class RegularisedNnlsSolver:
+    r"""
+    Solves :math:`\mathbf{b} = \mathbf{W} \mathbf{x}` for many measurement vectors
+    :math:`\mathbf{b}` with the same sensitivity matrix and Tikhonov regularisation,
+    subject to :math:`\mathbf{x} \geq 0`.
+
+    The QR decomposition of the extended matrix :math:`\mathbf{C} = \mathbf{Q}\mathbf{R}` is calculated
+    once on initialisation. Each measurement vector is then inverted by solving the equivalent
+    reduced NNLS problem :math:`\min \| \mathbf{R} \mathbf{x} - \mathbf{Q}^T \mathbf{d} \|`
+    with the square :math:`(N_s, N_s)` matrix :math:`\mathbf{R}`, instead of the full :math:`(N_d + N_s, N_s)`
+    problem solved in `invert_regularised_nnls()`.
+
+    The independent NNLS problems can be distributed over a pool of processes.
+
+    :param np.ndarray w_matrix: The sensitivity matrix describing the coupling between the
+      detectors and the voxels. Must be an array with shape :math:`(N_d, N_s)`.
+    :param float alpha: The regularisation hyperparameter :math:`\alpha` which determines
+      the regularisation strength of the tikhonov matrix.
+    :param np.ndarray tikhonov_matrix: The tikhonov regularisation matrix operator, an array
+      or a scipy.sparse matrix with shape :math:`(N_s, N_s)`. If None, the identity matrix is used.
+    :param int processes: The number of worker processes used to invert a stack of measurement
+      vectors. Defaults to 1, the inversions are performed in the calling process.
+    :param \**kwargs: Keyword arguments passed to scipy.optimize.nnls.
+
+    .. code-block:: pycon
+
+       >>> from cherab.tools.inversions import RegularisedNnlsSolver
+       >>> solver = RegularisedNnlsSolver(w_matrix, tikhonov_matrix=tikhonov_matrix, processes=8)
+       >>> x, norm = solver(b_time_series)  # b_time_series has shape (N_t, N_d)
+    """
+
+    def __init__(self, w_matrix, alpha=0.01, tikhonov_matrix=None, processes=1, **kwargs):
+
+        if processes < 1:
+            raise ValueError("The number of processes must be at least 1.")
+
+        c_matrix = _extended_matrix(w_matrix, alpha, tikhonov_matrix)
+        self._m = w_matrix.shape[0]
+        self._processes = processes
+        self._nnls_kwargs = kwargs
+
+        q_matrix, self._r_matrix = np.linalg.qr(c_matrix, mode='reduced')
+
+        # only the first N_d rows of the extended measurement vector are non-zero
+        self._qt_matrix = q_matrix[:self._m].T
+
+    @property
+    def processes(self):
+        """
+        The number of worker processes used to invert a stack of measurement vectors.
+        """
+        return self._processes
+
+    def __call__(self, b_vector):
+        """
+        Solves the regularised NNLS problem for one or many measurement vectors.
+
+        :param np.ndarray b_vector: The measured power/radiance vector with shape :math:`(N_d)`
+          or a stack of measurement vectors with shape :math:`(N_t, N_d)`.
+        :return: (x, norm), the solution with shape :math:`(N_s)` or :math:`(N_t, N_s)`
+          and the residual norm(s).
+        """
+
+        b_vector = np.asarray(b_vector, dtype=float)
+        single = b_vector.ndim == 1
+        b_matrix = np.atleast_2d(b_vector)
+
+        qtb_matrix = b_matrix @ self._qt_matrix.T
+        extra_norm_squared = np.maximum(np.sum(b_matrix**2, axis=1) - np.sum(qtb_matrix**2, axis=1), 0)
+
+        tasks = list(zip(qtb_matrix, extra_norm_squared))
+
+        if self._processes > 1 and len(tasks) > 1:
+            with multiprocessing.Pool(min(self._processes, len(tasks)), initializer=_init_worker,
+                                      initargs=(self._r_matrix, self._nnls_kwargs)) as pool:
+                results = pool.map(_worker_solve, tasks)
+        else:
+            results = [_solve_reduced_nnls(self._r_matrix, qtb, extra, self._nnls_kwargs) for qtb, extra in tasks]
+
+        x_matrix = np.array([result[0] for result in results])
+        rnorm = np.array([result[1] for result in results])
+
+        if single:
+            return x_matrix[0], rnorm[0]
+
+        return x_matrix, rnorm
+
 
 def invert_regularised_nnls(w_matrix, b_vector, alpha=0.01, tikhonov_matrix=None, **kwargs):
     r"""
@@ -32,13 +156,16 @@ def invert_regularised_nnls(w_matrix, b_vector, alpha=0.01, tikhonov_matrix=None
     The values of w_matrix, b_vector and alpha * tikhonov_matrix are notmalised
     by max(b_vector) before passing them to scipy.optimize.nnls().
 
+    To invert many measurement vectors with the same sensitivity matrix, use
+    `RegularisedNnlsSolver`, which caches the matrix decomposition.
+
     :param np.ndarray w_matrix: The sensitivity matrix describing the coupling between the
       detectors and the voxels. Must be an array with shape :math:`(N_d, N_s)`.
     :param np.ndarray b_vector: The measured power/radiance vector with shape :math:`(N_d)`.
     :param float alpha: The regularisation hyperparameter :math:`\alpha` which determines
       the regularisation strength of the tikhonov matrix.
     :param np.ndarray tikhonov_matrix: The tikhonov regularisation matrix operator, an array
-      with shape :math:`(N_s, N_s)`. If None, the identity matrix is used.
+      or a scipy.sparse matrix with shape :math:`(N_s, N_s)`. If None, the identity matrix is used.
     :param \**kwargs: Keyword arguments passed to scipy.optimize.nnls.
     :return: (x, norm), the solution vector and the residual norm.
 
@@ -50,15 +177,7 @@ def invert_regularised_nnls(w_matrix, b_vector, alpha=0.01, tikhonov_matrix=None
 
     m, n = w_matrix.shape
 
-    if tikhonov_matrix is None:
-        tikhonov_matrix = np.identity(n)
-
-    tikhonov_matrix = alpha * tikhonov_matrix
-
-    # Extend W to have form ...
-    c_matrix = np.zeros((m+n, n))
-    c_matrix[0:m, :] = w_matrix[:, :]
-    c_matrix[m:, :] = tikhonov_matrix[:, :]
+    c_matrix = _extended_matrix(w_matrix, alpha, tikhonov_matrix)
 
     # Extend b to have form ...
     d_vector = np.zeros(m+n)
@@ -18,8 +18,10 @@
 # under the Licence.
 
 import numpy as np
+from scipy.sparse import issparse, csr_matrix, csc_matrix
 cimport numpy as np
 cimport cython
+from cython.parallel cimport prange
 
 
 @cython.boundscheck(False)
@@ -107,6 +109,8 @@ cpdef invert_sart(geometry_matrix, measurement_vector, object initial_guess=None
     y_hat_vector = np.dot(geometry_matrix, solution)
     y_hat_vector_mv = y_hat_vector
 
+    measurement_squared = np.dot(measurement_vector, measurement_vector)
+
     for k in range(max_iterations):
 
         for jth_cell in range(n_sources):
@@ -142,7 +146,6 @@ cpdef invert_sart(geometry_matrix, measurement_vector, object initial_guess=None
         y_hat_vector = np.dot(geometry_matrix, solution_new)
         y_hat_vector_mv = y_hat_vector
 
-        measurement_squared = np.dot(measurement_vector, measurement_vector)
         y_hat_squared = np.dot(y_hat_vector, y_hat_vector)
         convergence.append((measurement_squared - y_hat_squared) / measurement_squared)
 
@@ -248,6 +251,8 @@ cpdef invert_constrained_sart(geometry_matrix, laplacian_matrix, measurement_vec
     y_hat_vector = np.dot(geometry_matrix, solution)
     y_hat_vector_mv = y_hat_vector
 
+    measurement_squared = np.dot(measurement_vector, measurement_vector)
+
     for k in range(max_iterations):
 
         grad_penalty = np.dot(laplacian_matrix, solution) * beta_laplace
@@ -287,7 +292,6 @@ cpdef invert_constrained_sart(geometry_matrix, laplacian_matrix, measurement_vec
         y_hat_vector = np.dot(geometry_matrix, solution_new)
         y_hat_vector_mv = y_hat_vector
 
-        measurement_squared = np.dot(measurement_vector, measurement_vector)
         y_hat_squared = np.dot(y_hat_vector, y_hat_vector)
         convergence.append((measurement_squared - y_hat_squared) / measurement_squared)
 
@@ -300,3 +304,204 @@ cpdef invert_constrained_sart(geometry_matrix, laplacian_matrix, measurement_vec
                 break
 
     return solution, convergence
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _csr_dot(const np.int64_t[:] indptr, const np.int64_t[:] indices, const double[:] data,
+                   const double[:] vector, double[:] result) noexcept nogil:
+    """
+    Multiplies the CSR matrix by the vector in parallel over the matrix rows.
+    """
+
+    cdef:
+        Py_ssize_t i, ptr
+        double value
+
+    for i in prange(result.shape[0], schedule='static'):
+        value = 0
+        for ptr in range(indptr[i], indptr[i + 1]):
+            value = value + data[ptr] * vector[indices[ptr]]
+        result[i] = value
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef void _sparse_sart_update(const np.int64_t[:] indptr, const np.int64_t[:] indices, const double[:] data,
+                              const double[:] cell_ray_densities, const double[:] obs_diff_vector,
+                              const double[:] solution, double[:] solution_new, double relaxation) noexcept nogil:
+    """
+    Updates all cells of the solution in parallel using the CSC geometry matrix.
+    """
+
+    cdef:
+        Py_ssize_t jth_cell, ptr
+        double obs_diff, x_j_new
+
+    for jth_cell in prange(solution.shape[0], schedule='static'):
+
+        x_j_new = solution[jth_cell]
+
+        # It is possible that some cells will have no rays passing through them.
+        if cell_ray_densities[jth_cell] > 0.0:
+            obs_diff = 0
+            for ptr in range(indptr[jth_cell], indptr[jth_cell + 1]):
+                obs_diff = obs_diff + data[ptr] * obs_diff_vector[indices[ptr]]
+            x_j_new = x_j_new + relaxation / cell_ray_densities[jth_cell] * obs_diff
+
+        # Don't allow negativity
+        if x_j_new < 0:
+            x_j_new = 0.0
+
+        solution_new[jth_cell] = x_j_new
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef invert_sparse_sart(geometry_matrix, measurement_vector, object initial_guess=None, int max_iterations=250,
+                         double relaxation=1.0, double conv_tol=1.0E-4, object callback=None):
+    r"""
+    Performs a SART inversion on the specified measurement vector(s) using a sparse geometry matrix.
+
+    Implements the same algorithm as `invert_sart()`, but the geometry matrix is stored in the
+    compressed sparse column and row formats, so the computational cost of each iteration scales with
+    the number of non-zero elements of the geometry matrix. The cell update and the forward modelling
+    are parallelised with OpenMP if the package is built with the `--openmp` flag.
+
+    The measurement vector can be a 2D array of shape :math:`(N_t, N_d)`, e.g. a time series
+    of bolometer frames. In this case, each measurement vector is inverted independently with its
+    own convergence criterion, while the geometry matrix is converted and normalised only once.
+
+    :param geometry_matrix: The sensitivity matrix describing the coupling between the detectors
+      and the voxels. Can be a `scipy.sparse` matrix or a dense array with shape :math:`(N_d, N_s)`.
+    :param np.ndarray measurement_vector: The measured power/radiance vector with shape :math:`(N_d)`
+      or a stack of measurement vectors with shape :math:`(N_t, N_d)`.
+    :param initial_guess: An optional initial guess, can be an array of shape :math:`(N_s)`,
+      :math:`(N_t, N_s)` or a constant value that will be used to seed the algorithm.
+    :param int max_iterations: The maximum number of iterations to run the SART algorithm before returning
+      a result, defaults to `max_iterations=250`.
+    :param float relaxation: The relaxation hyperparameter, defaults to `relaxation=1`. Consult the reference
+      papers for more information on this hyperparameter.
+    :param float conv_tol: The convergence limit at which the algorithm will be terminated, unless the maximum
+      number of iterations has been reached. The convergence is calculated as the normalised squared difference
+      between the measurement and solution vectors.
+    :param callback: An optional callable with the signature `callback(index, iteration, solution, convergence)`,
+      which is called after each iteration. Here, `index` is the index of the measurement vector in the stack
+      (0 for a single vector), `solution` is the current solution vector and `convergence` is the list with the
+      convergence history. If the callback returns True, the iterations for this measurement vector are stopped.
+    :return: A tuple with the inverted solution vector :math:`\mathbf{x}` as an ndarray with shape :math:`(N_s)`,
+      and the list with the convergence history. If a stack of measurement vectors is provided, a tuple
+      with the array of solutions with shape :math:`(N_t, N_s)` and the list of convergence histories.
+
+    .. code-block:: pycon
+
+       >>> from cherab.tools.inversions import invert_sparse_sart
+       >>> solutions, convergence = invert_sparse_sart(sparse_weight_matrix, observations_time_series)
+    """
+
+    cdef:
+        int m_observations, n_sources, n_vectors, ith_obs, k, index
+        double measurement_squared, y_hat_squared
+        list convergence, convergences
+        np.ndarray measurements, solutions, solution, solution_new, y_hat_vector, obs_diff_vector
+        np.ndarray cell_ray_densities, ray_lengths, inv_ray_lengths
+        np.int64_t[:] csr_indptr_mv, csr_indices_mv, csc_indptr_mv, csc_indices_mv
+        double[:] csr_data_mv, csc_data_mv, cell_ray_densities_mv, inv_ray_lengths_mv
+        double[:] obs_vector_mv, solution_mv, solution_new_mv, y_hat_vector_mv, obs_diff_vector_mv
+
+    if issparse(geometry_matrix):
+        csr_geometry = csr_matrix(geometry_matrix, dtype=np.float64)
+    else:
+        csr_geometry = csr_matrix(np.asarray(geometry_matrix, dtype=np.float64))
+    csr_geometry.sum_duplicates()
+    csc_geometry = csc_matrix(csr_geometry)
+
+    m_observations, n_sources = csr_geometry.shape  # (M, N) matrix
+
+    measurements = np.asarray(measurement_vector, dtype=np.float64)
+    if measurements.ndim == 1:
+        measurements = measurements[None, :]
+    if measurements.ndim != 2 or measurements.shape[1] != m_observations:
+        raise ValueError("The measurement vector must have shape (N_d) or (N_t, N_d), where N_d = {}.".format(m_observations))
+    n_vectors = measurements.shape[0]
+
+    if initial_guess is None:
+        solutions = np.zeros((n_vectors, n_sources)) + np.exp(-1)
+    elif isinstance(initial_guess, (float, int)):
+        solutions = np.zeros((n_vectors, n_sources)) + initial_guess
+    else:
+        solutions = np.zeros((n_vectors, n_sources)) + np.asarray(initial_guess, dtype=np.float64)
+
+    csr_indptr_mv = csr_geometry.indptr.astype(np.int64)
+    csr_indices_mv = csr_geometry.indices.astype(np.int64)
+    csr_data_mv = csr_geometry.data
+    csc_indptr_mv = csc_geometry.indptr.astype(np.int64)
+    csc_indices_mv = csc_geometry.indices.astype(np.int64)
+    csc_data_mv = csc_geometry.data
+
+    # A_(+,j)  - the total length of all rays passing through jth cell, equivalent to ray density
+    cell_ray_densities = np.asarray(csc_geometry.sum(axis=0)).ravel()
+    cell_ray_densities_mv = cell_ray_densities
+
+    # A_(i,+)  - the total length of each ray, zero length rays are excluded from the update
+    ray_lengths = np.asarray(csr_geometry.sum(axis=1)).ravel()
+    inv_ray_lengths = np.zeros(m_observations)
+    inv_ray_lengths[ray_lengths != 0] = 1 / ray_lengths[ray_lengths != 0]
+    inv_ray_lengths_mv = inv_ray_lengths
+
+    solution_new = np.zeros(n_sources)
+    solution_new_mv = solution_new
+    y_hat_vector = np.zeros(m_observations)
+    y_hat_vector_mv = y_hat_vector
+    obs_diff_vector = np.zeros(m_observations)
+    obs_diff_vector_mv = obs_diff_vector
+
+    convergences = []
+
+    for index in range(n_vectors):
+
+        solution = solutions[index]
+        solution_mv = solution
+        obs_vector_mv = measurements[index]
+
+        # Create an array to monitor the convergence
+        convergence = []
+
+        measurement_squared = np.dot(measurements[index], measurements[index])
+
+        _csr_dot(csr_indptr_mv, csr_indices_mv, csr_data_mv, solution_mv, y_hat_vector_mv)
+
+        for k in range(max_iterations):
+
+            # fraction of ray length/volume multiplied by the observation error
+            for ith_obs in range(m_observations):
+                obs_diff_vector_mv[ith_obs] = inv_ray_lengths_mv[ith_obs] * (obs_vector_mv[ith_obs] - y_hat_vector_mv[ith_obs])
+
+            with nogil:
+                _sparse_sart_update(csc_indptr_mv, csc_indices_mv, csc_data_mv, cell_ray_densities_mv,
+                                    obs_diff_vector_mv, solution_mv, solution_new_mv, relaxation)
+
+                # Calculate how quickly the code is converging
+                _csr_dot(csr_indptr_mv, csr_indices_mv, csr_data_mv, solution_new_mv, y_hat_vector_mv)
+
+            y_hat_squared = np.dot(y_hat_vector, y_hat_vector)
+            convergence.append((measurement_squared - y_hat_squared) / measurement_squared)
+
+            # Set the new solution to be the old solution and get ready to repeat
+            solution_mv[:] = solution_new_mv[:]
+
+            if callback is not None and callback(index, k, solution, convergence):
+                break
+
+            # Check for convergence
+            if k > 0:
+                if np.abs(convergence[k]-convergence[k-1]) < conv_tol:
+                    break
+
+        convergences.append(convergence)
+
+    if np.ndim(measurement_vector) == 1:
+        return solutions[0], convergences[0]
+
+    return solutions, convergences
@@ -21,6 +21,41 @@ import numpy as np
 from scipy import linalg
 
 
+class SvdSolver:
+    """
+    Performs Singular Value Decomposition (SVD) inversions of many measurement vectors
+    with the same sensitivity matrix.
+
+    The Moore-Penrose pseudo-inverse of the sensitivity matrix is calculated once on
+    initialisation and reused for all subsequent inversions.
+
+    :param np.ndarray w_matrix: The sensitivity matrix describing the coupling between the
+      detectors and the voxels. Must be an array with shape :math:`(N_d, N_s)`.
+
+    .. code-block:: pycon
+
+       >>> from cherab.tools.inversions import SvdSolver
+       >>> solver = SvdSolver(w_matrix)
+       >>> x = solver(b_time_series)  # b_time_series has shape (N_t, N_d)
+    """
+
+    def __init__(self, w_matrix):
+
+        # Compute the Moore-Penrose pseudo-inverse of a matrix from SVD
+        self._inverse_w_matrix = linalg.pinv(w_matrix)
+
+    def __call__(self, b_vector):
+        """
+        Inverts one or many measurement vectors.
+
+        :param np.ndarray b_vector: The measured power/radiance vector with shape :math:`(N_d)`
+          or a stack of measurement vectors with shape :math:`(N_t, N_d)`.
+        :return: The solution vector x as an ndarray with shape :math:`(N_s)` or :math:`(N_t, N_s)`.
+        """
+
+        return np.asarray(b_vector) @ self._inverse_w_matrix.T
+
+
 def invert_svd(w_matrix, b_vector):
     """
     Performs a Singular Value Decomposition (SVD) operation inversion.
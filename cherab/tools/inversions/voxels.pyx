@@ -18,6 +18,7 @@
 # under the Licence.
 
 cimport cython
+import multiprocessing
 import numpy as np
 cimport numpy as np
 from libc.math cimport floor
@@ -55,6 +56,9 @@ cdef class Voxel(Node):
     def volume(self):
         raise NotImplementedError()
 
+    cpdef np.ndarray sample_points(self, int grid_samples=10):
+        raise NotImplementedError()
+
     cpdef double emissivity_from_function(self, emission_function, int grid_samples=10):
         raise NotImplementedError()
 
@@ -376,29 +380,22 @@ cdef class AxisymmetricVoxel(Voxel):
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.initializedcheck(False)
-    cpdef double emissivity_from_function(self, emission_function, int grid_samples=10):
+    cpdef np.ndarray sample_points(self, int grid_samples=10):
         """
-        Calculate the average emissivity in the voxel.
-
-        :param callable emission_function: a function defining the emissivity
-            in (r, ϕ, z) space
-        :param int grid_samples: the number of samples of the emissivitiy to use
-            to calculate the average
+        Sample points uniformly distributed over the voxel cross section.
 
-        :return float emissivity: the average emissivity in the voxel cross section
+        :param int grid_samples: the number of points to sample.
 
-        Note that while the emissivity function is a 3D function, for
-        Axisymmetric voxels the return value should be independent of
-        toroidal angle ϕ.
+        :return: an Nx3 array of the (r, ϕ, z) coordinates of the sampled points,
+          with ϕ = 0.
         """
         cdef:
             double[::1] cumulative_areas
-            double x1, y1, x2, y2, x3, y3, triangle_area, total_area, emissivity
-            int num_triangles, triangle_j, v1_i, v2_i, v3_i, tri_index
+            double[:, ::1] points_mv
+            double x1, y1, x2, y2, x3, y3, triangle_area, total_area
+            int num_triangles, triangle_j, v1_i, v2_i, v3_i, tri_index, i
             Point3D v1_p, v2_p, v3_p, sample_point
-            Function3D emiss_function
-
-        emiss_function = autowrap_function3d(emission_function)
+            np.ndarray points
 
         # Sample uniformly over the cross section.
         # Raysect already allows us to uniformly sample over a triangle,
@@ -430,8 +427,9 @@ cdef class AxisymmetricVoxel(Voxel):
             else:
                 cumulative_areas[triangle_j] = (cumulative_areas[triangle_j - 1] + triangle_area)
 
-        emissivity = 0
-        for _ in range(grid_samples):
+        points = np.zeros((grid_samples, 3))
+        points_mv = points
+        for i in range(grid_samples):
 
             # Sample a random triangle, with the probability of picking each
             # triangle weighted by its area
@@ -453,13 +451,80 @@ cdef class AxisymmetricVoxel(Voxel):
 
             sample_point = point_triangle(v1_p, v2_p, v3_p)
 
-            emissivity += emiss_function.evaluate(sample_point.x, 0, sample_point.z)
+            points_mv[i, 0] = sample_point.x
+            points_mv[i, 2] = sample_point.z
+
+        return points
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    @cython.initializedcheck(False)
+    cpdef double emissivity_from_function(self, emission_function, int grid_samples=10):
+        """
+        Calculate the average emissivity in the voxel.
+
+        :param callable emission_function: a function defining the emissivity
+            in (r, ϕ, z) space
+        :param int grid_samples: the number of samples of the emissivitiy to use
+            to calculate the average
+
+        :return float emissivity: the average emissivity in the voxel cross section
+
+        Note that while the emissivity function is a 3D function, for
+        Axisymmetric voxels the return value should be independent of
+        toroidal angle ϕ.
+        """
+        cdef:
+            double[:, ::1] points
+            double emissivity
+            int i
+            Function3D emiss_function
+
+        emiss_function = autowrap_function3d(emission_function)
+
+        points = self.sample_points(grid_samples)
+
+        emissivity = 0
+        for i in range(grid_samples):
+            emissivity += emiss_function.evaluate(points[i, 0], 0, points[i, 2])
 
         emissivity /= grid_samples
 
         return emissivity
 
 
+# the emission function and sample points shared with the worker processes
+_worker_state = {}
+
+
+def _init_worker(emission_function, points):
+    _worker_state['emission_function'] = emission_function
+    _worker_state['points'] = points
+
+
+def _worker_evaluate(args):
+    start, end = args
+    return _evaluate_function3d(_worker_state['emission_function'], _worker_state['points'][start:end])
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+cdef np.ndarray _evaluate_function3d(Function3D function, const double[:, :] points):
+
+    cdef:
+        int i
+        np.ndarray values
+        double[::1] values_mv
+
+    values = np.empty(points.shape[0])
+    values_mv = values
+    for i in range(points.shape[0]):
+        values_mv[i] = function.evaluate(points[i, 0], points[i, 1], points[i, 2])
+
+    return values
+
+
 class VoxelCollection(Node):
     """
     The base class for collections of voxels.
@@ -528,33 +593,90 @@ class VoxelCollection(Node):
         for voxel in self._voxels:
             voxel.parent = None
 
-    def emissivities_from_function(self, emission_function, int grid_samples=10):
+    def sampling_grid(self, int grid_samples=10):
+        """
+        Returns the sample points and weights of all voxels in the collection.
+
+        The sample points of every voxel are concatenated into flat arrays, so
+        that the average emissivities of all voxels can be obtained from a single
+        bulk evaluation of the emission function. The grid is generated on the
+        first call for each value of grid_samples and cached on the collection,
+        so repeated calls reuse the same sample points.
+
+        :param int grid_samples: Number of samples per voxel.
+        :return: A tuple of (points, voxel_indices, weights), where points is an
+          Nx3 array of (x, y, z) or (r, ϕ, z) sample coordinates depending on the
+          voxel type, voxel_indices holds the index of the voxel each point belongs
+          to and weights holds the weight of each point in the voxel average.
+        :rtype: tuple
+        """
+
+        try:
+            cache = self._sampling_grid_cache
+        except AttributeError:
+            cache = self._sampling_grid_cache = {}
+
+        if grid_samples not in cache:
+
+            if grid_samples < 1:
+                raise ValueError("The number of grid samples must be at least 1.")
+
+            points = np.concatenate([voxel.sample_points(grid_samples) for voxel in self._voxels])
+            voxel_indices = np.repeat(np.arange(self.count), grid_samples)
+            weights = np.full(points.shape[0], 1 / grid_samples)
+
+            for array in (points, voxel_indices, weights):
+                array.flags.writeable = False
+
+            cache[grid_samples] = (points, voxel_indices, weights)
+
+        return cache[grid_samples]
+
+    def emissivities_from_function(self, emission_function, int grid_samples=10, vectorised=False, processes=1):
         """
         Returns an array of sampled emissivities at each voxel location.
 
+        The sample points of all voxels are generated once per grid_samples value
+        and cached on the collection (see sampling_grid()). The emission function
+        is then evaluated in bulk over all sample points.
+
         Note that the results will be nonsense if you mix an emission function
         and VoxelCollection with incompatible symmetries.
 
         :param Function3D emission_function: Emission function to sample over.
         :param int grid_samples: Number of emission samples to average over.
+        :param bool vectorised: If True, emission_function is called once with the
+          arrays of the sample point coordinates and must return an array of
+          emissivities (e.g. a function built from NumPy ufuncs). Defaults to False.
+        :param int processes: The number of worker processes used to evaluate a
+          non-vectorised emission function. Defaults to 1, the function is evaluated
+          in the calling process.
         :rtype: np.ndarray
         """
-        cdef:
-            double[::1] emissivities_mv
-            int i
-            Voxel voxel
 
-        emission_function = autowrap_function3d(emission_function)
+        if processes < 1:
+            raise ValueError("The number of processes must be at least 1.")
 
-        emissivities = np.zeros(self.count)
-        emissivities_mv = emissivities
+        points, voxel_indices, weights = self.sampling_grid(grid_samples)
+
+        if vectorised:
+            values = np.asarray(emission_function(points[:, 0], points[:, 1], points[:, 2]), dtype=np.float64)
+            values = np.broadcast_to(values, (points.shape[0],))
+
+        else:
+            emission_function = autowrap_function3d(emission_function)
+
+            if processes > 1 and points.shape[0] > 1:
+                chunks = np.array_split(np.arange(points.shape[0]), processes)
+                # Function3D objects are not guaranteed to be picklable, the worker
+                # processes are forked so that they inherit the function and the points
+                context = multiprocessing.get_context('fork')
+                with context.Pool(processes, initializer=_init_worker, initargs=(emission_function, points)) as pool:
+                    values = np.concatenate(pool.map(_worker_evaluate, [(chunk[0], chunk[-1] + 1) for chunk in chunks if chunk.size]))
+            else:
+                values = _evaluate_function3d(emission_function, points)
 
-        for i in range(self.count):
-            voxel = self._voxels[i]
-            emissivities_mv[i] = voxel.emissivity_from_function(
-                emission_function, grid_samples
-            )
-        return emissivities
+        return np.bincount(voxel_indices, weights=weights * values, minlength=self.count)
 
 
 class ToroidalVoxelGrid(VoxelCollection):
@@ -18,6 +18,7 @@
 # under the Licence.
 
 from .bolometry import BolometerCamera, BolometerFoil, BolometerSlit, BolometerIRVB
+from .render import observe_jointly
 from .calcam import load_calcam_calibration
 from .intersections import find_wall_intersection
 from .spectroscopy import SpectroscopicSightLine, SpectroscopicFibreOptic
@@ -20,6 +20,7 @@
 from enum import Enum
 import functools
 import numpy as np
+from scipy.sparse import csr_matrix, vstack
 
 from raysect.core import Node, translate, rotate_basis, Point3D, Vector3D, Ray as CoreRay, Primitive, World
 from raysect.core.math.sampler import TargettedHemisphereSampler, RectangleSampler3D
@@ -32,6 +33,7 @@ from raysect.optical.material.material import NullMaterial
 from raysect.optical.material import AbsorbingSurface
 
 from cherab.tools.inversions.voxels import VoxelCollection
+from cherab.tools.observers.render import observe_jointly
 
 
 R_2_PI = 1 / (2 * np.pi)
@@ -191,6 +193,92 @@ class BolometerCamera(Node):
 
         return observations
 
+    def calculate_sensitivity_matrix(self, voxel_collection, ray_count=10000, render_engine=None):
+        r"""
+        Calculates the sensitivity matrix of all detectors in this camera on the specified voxel collection.
+
+        Unlike calling `calculate_sensitivity()` for each detector in turn, all detectors
+        are traced in a single render engine run, so the render workers stay busy across
+        the whole camera. The units of the matrix rows follow the units of each detector,
+        see `BolometerFoil.calculate_sensitivity()`.
+
+        Each :class:`BolometerFoil` contributes one row to the matrix. Each :class:`BolometerIRVB`
+        contributes one row per pixel, with the pixels in row-major (C) order.
+
+        :param VoxelCollection voxel_collection: The voxel collection on which to calculate
+          the sensitivities.
+        :param int ray_count: The number of rays per detector (or IRVB pixel) to use in the
+          calculation. This should be at least >= 10000 for decent statistics.
+        :param render_engine: The render engine to use for the calculation. If None (default),
+          the render engine of the first detector is used.
+        :return: A tuple (sensitivity, errors) of sparse matrices with shape
+          (number of detectors, number of voxels) containing the sensitivities and
+          their statistical errors.
+
+        .. code-block:: pycon
+
+           >>> sensitivity, errors = bolometer_camera.calculate_sensitivity_matrix(voxel_collection)
+           >>> sensitivity.toarray()
+        """
+        # This method exploits ToroidalVoxelCollection.set_active("all"), which
+        # makes each voxel emit a different wavelength of light. By observing
+        # the voxel collection with a spectral pipeline we can thus distinguish
+        # the amount of emission from each individual voxel.
+        if not isinstance(voxel_collection, VoxelCollection):
+            raise TypeError("voxel_collection must be of type VoxelCollection")
+
+        voxel_collection.set_active("all")
+
+        pipelines = []
+        cached_states = []
+        for detector in self._foil_detectors:
+
+            if isinstance(detector, BolometerIRVB):
+                pipeline = detector._SPECTRAL_PIPELINES[detector._units]()
+            elif detector.units == "Power":
+                pipeline = SpectralPowerPipeline0D(display_progress=False)
+            elif detector.units == "Radiance":
+                pipeline = SpectralRadiancePipeline0D(display_progress=False)
+            else:
+                raise ValueError("Sensitivity units can only be of type 'Power' or 'Radiance'.")
+            pipelines.append(pipeline)
+
+            cached_states.append((detector.min_wavelength, detector.max_wavelength, detector.spectral_bins,
+                                  detector.pipelines, detector.pixel_samples))
+
+            detector.pipelines = [pipeline]
+            detector.min_wavelength = 1
+            detector.max_wavelength = voxel_collection.count + 1
+            detector.spectral_bins = voxel_collection.count
+            detector.pixel_samples = ray_count
+
+        try:
+            observe_jointly(self._foil_detectors, render_engine)
+
+        finally:
+            for detector, (min_wavelength, max_wavelength, bins, cached_pipelines, pixel_samples) in zip(self._foil_detectors, cached_states):
+                detector.max_wavelength = max_wavelength
+                detector.min_wavelength = min_wavelength
+                detector.spectral_bins = bins
+                detector.pipelines = cached_pipelines
+                detector.pixel_samples = pixel_samples
+
+        sensitivities = []
+        errors = []
+        for pipeline in pipelines:
+            if isinstance(pipeline, (SpectralPowerPipeline0D, SpectralRadiancePipeline0D)):
+                sensitivities.append(csr_matrix(pipeline.samples.mean))
+                errors.append(csr_matrix(pipeline.samples.errors()))
+            else:
+                sensitivities.append(csr_matrix(pipeline.frame.mean.reshape(-1, voxel_collection.count)))
+                errors.append(csr_matrix(pipeline.frame.errors().reshape(-1, voxel_collection.count)))
+
+        if not sensitivities:
+            empty = csr_matrix((0, voxel_collection.count))
+            return empty, empty.copy()
+
+        return vstack(sensitivities, format='csr'), vstack(errors, format='csr')
+
 
 class BolometerSlit(Node):
     """
@@ -21,6 +21,8 @@ from raysect.core import Node
 from raysect.core.workflow import RenderEngine
 from raysect.optical.observer import Observer0D
 
+from cherab.tools.observers.render import observe_jointly
+
 
 class Observer0DGroup(Node):
     """
@@ -127,12 +129,18 @@ class Observer0DGroup(Node):
         else:
             raise TypeError("The names attribute must be a list or tuple.")
 
-    def observe(self):
+    def observe(self, render_engine=None):
         """
         Starts the observation.
+
+        The render tasks of all observers are submitted to a single render engine run
+        and the results are routed back to the pipelines of each observer
+        (see observe_jointly()), so the render workers are kept busy across the whole group.
+
+        :param RenderEngine render_engine: The render engine used for the joint run.
+          If None (default), the render engine of the first observer is used.
         """
-        for observer in self._observers:
-            observer.observe()
+        observe_jointly(self._observers, render_engine)
 
     # _ObserverBase attributes and properties
     @property
@@ -0,0 +1,101 @@
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+from raysect.core import World
+
+
+def observe_jointly(observers, render_engine=None):
+    """
+    Performs observation with multiple observers in a single render engine run.
+
+    Calling observe() for each observer in turn starts a separate render job for every
+    observer, with its own worker spin-up and synchronisation barrier. This function
+    instead collects the render tasks of all observers into one list, submits them to
+    the render engine at once and routes the results back to the pipelines of the
+    observer that generated each task. The results are identical to those obtained by
+    calling observe() for each observer.
+
+    All Raysect observers (0D, 1D and 2D) are supported. The observers may differ in
+    their spectral settings and pipelines, but must be connected to the same World.
+
+    :param list observers: A list of observers.
+    :param render_engine: The render engine used for the joint run. If None (default),
+      the render engine of the first observer is used.
+
+    .. code-block:: pycon
+
+       >>> from cherab.tools.observers import observe_jointly
+       >>> observe_jointly([sightline_1, sightline_2, fibre_optic])
+    """
+
+    observers = list(observers)
+    if not observers:
+        return
+
+    world = observers[0].root
+    for observer in observers:
+        # must be connected to a world node to be able to perform a ray trace
+        if not isinstance(observer.root, World):
+            raise TypeError("Observer {} is not connected to a scene graph containing a World object.".format(observer.name))
+        if observer.root is not world:
+            raise ValueError("All observers must be connected to the same World.")
+
+    render_engine = render_engine or observers[0].render_engine
+
+    templates = []
+    tasks = []
+    rendered = []
+    for index, observer in enumerate(observers):
+
+        # generate spectral configuration and ray templates
+        slices = observer._slice_spectrum()
+        observer_templates = observer._generate_templates(slices)
+        templates.append(observer_templates)
+
+        # initialise pipelines for rendering
+        observer._initialise_pipelines(observer.min_wavelength, observer.max_wavelength, observer.spectral_bins,
+                                       slices, observer.quiet)
+
+        # if there is no work to perform for this observer, the render is considered "complete"
+        observer_tasks = observer._generate_tasks()
+        if not observer_tasks:
+            if not observer.quiet:
+                print("Render complete - No render tasks were generated.")
+            continue
+
+        observer._initialise_statistics(observer_tasks)
+        rendered.append(observer)
+
+        for slice_id in range(len(observer_templates)):
+            tasks.extend((index, slice_id, task) for task in observer_tasks)
+
+    def render(task):
+        index, slice_id, observer_task = task
+        return index, slice_id, observers[index]._render_pixel(observer_task, slice_id, templates[index][slice_id])
+
+    def update(result):
+        index, slice_id, packed_result = result
+        observers[index]._update_state(packed_result, slice_id)
+
+    if tasks:
+        render_engine.run(tasks, render, update)
+
+    # close pipelines and statistics
+    for observer in rendered:
+        observer._finalise_pipelines()
+        observer._finalise_statistics()
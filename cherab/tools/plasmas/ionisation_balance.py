@@ -19,7 +19,6 @@
 
 
 import numpy as np
-from scipy.optimize import lsq_linear
 from collections.abc import Iterable
 from raysect.core.math.function.float import Function1D, Function2D, Interpolator1DArray, Interpolator2DArray
 
@@ -29,6 +28,10 @@ from cherab.core.math import AxisymmetricMapper
 from cherab.tools.equilibrium import EFITEquilibrium
 
 
+# upper limit for the logarithm of the density ratio of neighbouring charge states
+_MAX_LOG_RATIO = 700
+
+
 def _parameters_to_numpy(*parameters, free_variable=None):
     """
     Check the consistency of parameters.
@@ -181,185 +184,76 @@ def get_rates_tcx(atomic_data: AtomicData, donor: Element, donor_charge, receive
     return coef_tcx
 
 
-def _fractional_abundance_point(element: Element, n_e, t_e, coef_ion, coef_recom, coef_tcx=None, tcx_donor_density=0):
+def _evaluate_rates(rates, charges, n_e, t_e):
     """
-    Calculate fractional abundance of charge states of the specified element, for the specified temperature and density using
-    steady state ionization balance.
-
-    If tcx_donor is specified, the balance equation will take into accout effects
-    of charge exchage with specified donor. The results are returned as fractional abundances i.e. ratio of the individual
-    ionic charge state density to the overall element density.
+    Evaluate the rate functions of the specified ion charges for all (n_e, t_e) points.
 
-    :param atomic_data: Any cherab AtomicData source
-    :param element: Any cherab Element
-    :param n_e: Electron density in m^-3 to calculate the balance for
-    :param t_e: Electron temperature in eV to calculate the balance for
-    :param coef_ion: Dictionary with ionization rates
-    :param coef_recom: Dictionary with recombination rates
-    :param coef_tcx: Optional, dictionary with thermal cx rates
-    :param tcx_donor: Optional, any cherab element. Specifies donating species in tcx collisions.
-    :param tcx_donor_density: Optional, mandatory if tcx_donor parameter passed. Specifies density of donors in m^-3
-    :param tcx_donor_charge: Optional, specifies the charge of the donor. Default is 0.
-    :return: array with fractional abundances of ionic charges. Array indexes correspond to ion charge state.
+    :param rates: Dictionary of the form {charge: rate}
+    :param charges: Iterable with ion charges to evaluate the rates for
+    :param n_e: 1D array of electron density values in m^-3
+    :param t_e: 1D array of electron temperature values in eV
+    :return: 2D array, dim 0 corresponds to the ion charges, dim 1 to the (n_e, t_e) points
     """
 
-    # atomic number to determine ionisation matrix shape
-    atomic_number = element.atomic_number
-
-    matbal = np.zeros((atomic_number + 1, atomic_number + 1))  # create ionisation balance matrix
-
-    # fill the 1st and last rows of the fractional abundance matrix
-    matbal[0, 0] -= coef_ion[0](n_e, t_e)
-    matbal[0, 1] += coef_recom[1](n_e, t_e)
-    matbal[-1, -1] -= coef_recom[atomic_number](n_e, t_e)
-    matbal[-1, -2] += coef_ion[atomic_number - 1](n_e, t_e)
+    values = np.empty((len(charges), n_e.size))
+    for index, charge in enumerate(charges):
+        values[index] = rates[charge].evaluate_array(n_e, t_e)
 
-    if coef_tcx is not None:
-        matbal[0, 1] += tcx_donor_density / n_e * coef_tcx[1](n_e, t_e)
-        matbal[-1, -1] -= tcx_donor_density / n_e * coef_tcx[atomic_number](n_e, t_e)
-
-    # fill rest of the lines
-    for i in range(1, atomic_number):
-        matbal[i, i - 1] += coef_ion[i - 1](n_e, t_e)
-        matbal[i, i] -= (coef_ion[i](n_e, t_e) + coef_recom[i](n_e, t_e))
-        matbal[i, i + 1] += coef_recom[i + 1](n_e, t_e)
-        if coef_tcx is not None:
-            matbal[i, i] -= tcx_donor_density / n_e * coef_tcx[i](n_e, t_e)
-            matbal[i, i + 1] += tcx_donor_density / n_e * coef_tcx[i + 1](n_e, t_e)
-
-    # for some reason calculation of stage abundance seems to yield better results than calculation of fractional abun.
-    matbal = matbal * n_e  # multiply by ne to calculate abundance instead of fractional abundance
-
-    # add sum constraints. Sum of all stages should be equal to electron density
-    matbal = np.concatenate((matbal, np.ones((1, matbal.shape[1]))), axis=0)
-
-    # construct RHS of the balance steady-state equation
-    rhs = np.zeros((matbal.shape[0]))
-    rhs[-1] = n_e
-
-    abundance = lsq_linear(matbal, rhs, bounds=(0, n_e))["x"]
+    return values
 
-    # normalize to ne to get fractional abundance
-    frac_abundance = abundance / n_e
 
-    return frac_abundance
-
-
-def _from_element_density_point(atomic_data: AtomicData, element: Element, element_density, n_e, t_e,
-                                tcx_donor: Element = None, tcx_donor_n=None, tcx_donor_charge=0,
-                                coef_ion=None, coef_recom=None, coef_tcx=None):
+def _fractional_abundance_batch(element: Element, n_e, t_e, coef_ion, coef_recom, coef_tcx=None,
+                                tcx_donor_density=None):
     """
-    Calculate density of charge states of the specified element, for the specified electron temperature,
-    electron density and absolute element density using steady state ionization balance.
+    Calculate fractional abundance of charge states of the specified element for many (n_e, t_e) points at once
+    using steady state ionization balance.
 
-    If tcx_donor is specified, the balance equation will take into account effects of charge exchange
-    with the specified donor. The results are returned as density in m^-3.
+    The balance matrix of the ionisation chain is tridiagonal and the steady state solution satisfies
+    n_{i+1} / n_i = S_i / (alpha_{i+1} + n_d / n_e * CX_{i+1}) for each pair of neighbouring charge states.
+    The system is therefore solved for all points simultaneously by the forward elimination of the
+    tridiagonal system, which reduces to the cumulative product of these ratios. The product
+    is calculated in logarithmic space to avoid the overflow for heavy elements.
 
-    :param atomic_data: Any cherab AtomicData source
     :param element: Any cherab Element
-    :param element_density: Density of the element in m^-3
-    :param n_e: Electron density in m^-3 to calculate the balance for
-    :param t_e: Electron temperature in eV to calculate the balance for
-    :param tcx_donor: Optional, specifies donating species in tcx collisions.
-    :param tcx_donor_n: Optional, mandatory if tcx_donor parameter passed. Specifies density of donors in m^-3
-    :param tcx_donor_charge: Optional, specifies the charge of the donor. Default is 0.
-    :param coef_ion: Optional, ionization rates. If not passed rates will be loaded (slow).
-    :param coef_recom: Optional, recombination rates. If not passed rates will be loaded (slow).
-    :param coef_tcx: Optional, thermal cx rates. If not passed rates will be loaded (slow).
-    :return: array with densities in m^-3 of ion charge states. Array indexes correspond to ion charge state.
-    """
-
-    # load atomic data for the element
-    if coef_ion is None:
-        coef_ion = get_rates_ionisation(atomic_data, element)  # get ionisation rate interpolators
-    if coef_recom is None:
-        coef_recom = get_rates_recombination(atomic_data, element)  # get recombination rate interpolators
-
-    # get tcx rate interpolators if requested
-    if tcx_donor is not None and coef_tcx is None:
-        coef_tcx = get_rates_tcx(atomic_data, tcx_donor, tcx_donor_charge, element)
-    else:
-        coef_tcx = None
-
-    # calculate fractional abundance for the element
-    fractional_abundance = _fractional_abundance_point(element, n_e, t_e, coef_ion, coef_recom, coef_tcx,
-                                                       tcx_donor_n)
-
-    # convert fractional abundance to densities
-    abundance = fractional_abundance * element_density
-
-    # warn user if plasma neutrality is violated due to too low electron density for the specified element density
-    n_e_fromions = np.sum(abundance)
-    if n_e_fromions > n_e:
-        print("Plasma neutrality violated, {0} density too large".format(element.name))
-
-    return abundance
-
-
-def _match_element_density_point(atomic_data: AtomicData, element: Element, n_species, n_e, t_e,
-                                 tcx_donor: Element = None,
-                                 tcx_donor_density=None, tcx_donor_charge=0, coef_ion=None, coef_recom=None,
-                                 coef_tcx=None):
+    :param n_e: 1D array of electron density values in m^-3
+    :param t_e: 1D array of electron temperature values in eV
+    :param coef_ion: Dictionary with ionization rates
+    :param coef_recom: Dictionary with recombination rates
+    :param coef_tcx: Optional, dictionary with thermal cx rates
+    :param tcx_donor_density: Optional, 1D array of donor density values in m^-3, mandatory if coef_tcx is passed.
+    :return: 2D array with fractional abundances, dim 0 corresponds to ion charge state,
+     dim 1 corresponds to the (n_e, t_e) points.
     """
-    Calculate density of charge states of the specified element, for the specified
-    electron temperature and density.
-
-    Ratio of densities of ionization stages of the element follows the steady state
-    balance calculation for given electron properties. The absolute density of the
-    element is determined to match the plasma neutrality (electron density) together
-    with the other (provided) ion species densities. It is useful for example to fill
-    in the bulk (e.g. hydrogen isotope or even helium) plasma element once rest of
-    the impurities are known.
 
-    :param atomic_data: Any cherab AtomicData source
-    :param element: Any cherab element to calculate matching density for
-    :param n_species: list of arrays or dictionaries with ion densities of the rest of the plasma elements
-    :param n_e: electron density in m^-3
-    :param t_e: electron temperature in eV
-    :param tcx_donor: Optional, specifies donating species in tcx collisions.
-    :param tcx_donor_density: Optional, mandatory if tcx_donor parameter passed. Specifies density of donors in m^-3
-    :param tcx_donor_charge: Optional, specifies the charge of the donor. Default is 0.
-    :param coef_ion: Optional, ionization rates. If not passed rates will be loaded (slow).
-    :param coef_recom: Optional, recombination rates. If not passed rates will be loaded (slow).
-    :param coef_tcx: Optional, thermal cx rates. If not passed rates will be loaded (slow).
-    :return: array with densities in m^-3 of ion charge states. Array indexes correspond to ion charge state.
-    """
+    atomic_number = element.atomic_number
 
-    # load atomic data for the element
-    if coef_ion is None:
-        coef_ion = get_rates_ionisation(atomic_data, element)  # get ionisation rate interpolators
-    if coef_recom is None:
-        coef_recom = get_rates_recombination(atomic_data, element)  # get recombination rate interpolators
+    n_e = np.asarray(n_e, dtype=float).ravel()
+    t_e = np.asarray(t_e, dtype=float).ravel()
 
-    # get tcx rate interpolators if requested
-    if tcx_donor is not None and coef_tcx is None:
-        coef_tcx = get_rates_tcx(atomic_data, tcx_donor, tcx_donor_charge, element)
-    else:
-        coef_tcx = None
-    # calculate fractional abundance for given electron properties
-    fractional_abundance = _fractional_abundance_point(element, n_e, t_e, coef_ion, coef_recom, coef_tcx,
-                                                       tcx_donor_density)
+    ionisation = _evaluate_rates(coef_ion, range(atomic_number), n_e, t_e)
+    recombination = _evaluate_rates(coef_recom, range(1, atomic_number + 1), n_e, t_e)
 
-    # calculate contributions of other species to the electron density
-    element_n_e = n_e
-    for abundance in n_species:
-        for index, value in enumerate(abundance):
-            element_n_e -= index * value
+    if coef_tcx is not None:
+        tcx_donor_density = np.asarray(tcx_donor_density, dtype=float).ravel()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            donor_ratio = np.where(n_e > 0, tcx_donor_density / n_e, 0)
+        recombination += donor_ratio * _evaluate_rates(coef_tcx, range(1, atomic_number + 1), n_e, t_e)
 
-    # avoid negative densities due to passed n_e being too small
-    if element_n_e < 0:
-        element_n_e = 0
+    # logarithms of the ratios of neighbouring charge state densities,
+    # the ratio is limited to avoid inf - inf in the case of zero rates
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_ratio = np.log(ionisation) - np.log(recombination)
+    log_ratio = np.nan_to_num(log_ratio, nan=-_MAX_LOG_RATIO, posinf=_MAX_LOG_RATIO, neginf=-_MAX_LOG_RATIO)
+    np.clip(log_ratio, -_MAX_LOG_RATIO, _MAX_LOG_RATIO, out=log_ratio)
 
-    # calculate mean charge of the bulk element
-    z_mean = 0
-    for index, value in enumerate(fractional_abundance):
-        z_mean += index * value
+    log_abundance = np.zeros((atomic_number + 1, n_e.size))
+    np.cumsum(log_ratio, axis=0, out=log_abundance[1:])
+    log_abundance -= log_abundance.max(axis=0)
 
-    # calculate elenent density and normalize the fractional abundance
-    element_n_i = element_n_e / z_mean
-    densities = fractional_abundance * element_n_i
+    abundance = np.exp(log_abundance)
+    abundance /= abundance.sum(axis=0)
 
-    return densities
+    return abundance
 
 
 def _fractional_abundance(atomic_data: AtomicData, element: Element, n_e,
@@ -397,13 +291,9 @@ def _fractional_abundance(atomic_data: AtomicData, element: Element, n_e,
     else:
         coef_tcx = None
 
-    density = np.zeros((element.atomic_number + 1, *n_e.shape))
-    for index in np.ndindex(*n_e.shape):
-        density[(Ellipsis, *index)] = _fractional_abundance_point(element, n_e[index], t_e[index],
-                                                                  coef_ion, coef_recom, coef_tcx,
-                                                                  tcx_donor_n[index])
+    density = _fractional_abundance_batch(element, n_e, t_e, coef_ion, coef_recom, coef_tcx, tcx_donor_n)
 
-    return density
+    return density.reshape((element.atomic_number + 1, *n_e.shape))
 
 
 def fractional_abundance(atomic_data: AtomicData, element: Element, n_e,
@@ -467,12 +357,17 @@ def _from_elementdensity(atomic_data: AtomicData, element: Element, element_dens
     else:
         coef_tcx = None
 
-    density = np.zeros((element.atomic_number + 1, *n_e_profile.shape))
-    for index in np.ndindex(*n_e_profile.shape):
-        density[(Ellipsis, *index)] = _from_element_density_point(atomic_data, element, element_density[index],
-                                                                  n_e_profile[index], t_e_profile[index], tcx_donor,
-                                                                  tcx_donor_n_profile[index], tcx_donor_charge,
-                                                                  coef_ion, coef_recom, coef_tcx)
+    fractional_abundance = _fractional_abundance_batch(element, n_e_profile, t_e_profile, coef_ion, coef_recom,
+                                                       coef_tcx, tcx_donor_n_profile)
+    fractional_abundance = fractional_abundance.reshape((element.atomic_number + 1, *n_e_profile.shape))
+
+    # convert fractional abundance to densities
+    density = fractional_abundance * element_density
+
+    # warn user if plasma neutrality is violated due to too low electron density for the specified element density
+    n_e_fromions = np.sum(density, axis=0)
+    if np.any(n_e_fromions > n_e_profile):
+        print("Plasma neutrality violated, {0} density too large".format(element.name))
 
     return density
 
@@ -544,15 +439,26 @@ def _match_plasma_neutrality(atomic_data: AtomicData, element: Element, n_specie
 
     number_chargestates = element.atomic_number + 1
 
-    density = np.zeros((number_chargestates, *n_e_profile.shape))
-    for index in np.ndindex(*n_e_profile.shape):
-        spec_list = []
-        for spec in n_species:
-            spec_list.append(spec[(Ellipsis, *index)])
-        density[(Ellipsis, *index)] = _match_element_density_point(atomic_data, element, spec_list, n_e_profile[index],
-                                                                   t_e_profile[index], tcx_donor,
-                                                                   tcx_donor_n_profile[index],
-                                                                   tcx_donor_charge, coef_ion, coef_recom, coef_tcx)
+    # calculate fractional abundance for given electron properties
+    fractional_abundance = _fractional_abundance_batch(element, n_e_profile, t_e_profile, coef_ion, coef_recom,
+                                                       coef_tcx, tcx_donor_n_profile)
+    fractional_abundance = fractional_abundance.reshape((number_chargestates, *n_e_profile.shape))
+
+    # calculate contributions of other species to the electron density
+    element_n_e = np.array(n_e_profile, dtype=float)
+    for spec in n_species:
+        charges = np.arange(spec.shape[0]).reshape((-1,) + (1,) * (spec.ndim - 1))
+        element_n_e -= np.sum(charges * spec, axis=0)
+
+    # avoid negative densities due to passed n_e being too small
+    element_n_e[element_n_e < 0] = 0
+
+    # calculate mean charge of the bulk element
+    charges = np.arange(number_chargestates).reshape((-1,) + (1,) * n_e_profile.ndim)
+    z_mean = np.sum(charges * fractional_abundance, axis=0)
+
+    # calculate element density and normalize the fractional abundance
+    density = fractional_abundance * (element_n_e / z_mean)
 
     return density
 
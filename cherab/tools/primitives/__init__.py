@@ -19,3 +19,4 @@
 from .annulus_mesh import generate_annulus_mesh_segments
 from .toroidal_mesh import toroidal_mesh_from_polygon
 from .axisymmetric_mesh import axisymmetric_mesh_from_polygon
+from .plasma_mesh import plasma_mesh_from_polygon, plasma_mesh_from_equilibrium, plasma_mesh_from_profile
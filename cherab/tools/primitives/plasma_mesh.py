@@ -0,0 +1,250 @@
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+import numpy as np
+from scipy.spatial import ConvexHull
+
+from .toroidal_mesh import toroidal_mesh_from_polygon
+
+
+# mitres longer than this (in units of the offset distance) are cut square at convex
+# corners and clamped to this length at concave corners
+_MITRE_LIMIT = 2.0
+
+
+def plasma_mesh_from_polygon(polygon, margin=0.01, toroidal_extent=360., num_toroidal_segments=500):
+    """
+    Generates a close-fitting Raysect Mesh primitive enclosing a plasma boundary polygon.
+
+    The polygon is expanded outwards by the margin and extruded in the toroidal
+    direction with toroidal_mesh_from_polygon(). The margin is increased by the
+    sagitta of the toroidal facets, so the mesh fully contains the volume of revolution
+    of the expanded polygon. The returned mesh is intended to be used as the geometry
+    of a Plasma or Beam, restricting the volume integration to the region where
+    the plasma emits.
+
+    :param object polygon: An object which can be converted to a numpy array with shape
+                           [N,2] specifying the boundary polygon in the R-Z plane.
+                           Both windings are accepted and the polygon may be closed.
+    :param float margin: Distance by which the polygon is expanded (in meters).
+                         Should be small compared to the features of the polygon.
+                         Defaults to 0.01.
+    :param float toroidal_extent: Angular extent of the mesh in toroidal direction
+                                  (in degrees). Defaults to 360.
+    :param int num_toroidal_segments: The number of repeating toroidal segments
+                                      per given `toroidal_extent`. Defaults to 500.
+
+    :return: A watertight Raysect Mesh primitive.
+
+    .. code-block:: pycon
+
+        >>> from cherab.tools.primitives import plasma_mesh_from_polygon
+        >>>
+        >>> plasma.geometry = plasma_mesh_from_polygon(equilibrium.lcfs_polygon, margin=0.02)
+    """
+
+    if margin < 0:
+        raise ValueError("The 'margin' must be non-negative.")
+
+    if num_toroidal_segments < 1:
+        raise ValueError("The 'num_toroidal_segments' must be positive.")
+
+    polygon = _simplify_polygon(polygon)
+
+    # distance between the toroidal facets and the circle through their vertices
+    r_max = polygon[:, 0].max() + margin
+    sagitta = r_max * (1 - np.cos(np.deg2rad(toroidal_extent / num_toroidal_segments) / 2))
+
+    polygon = _offset_polygon(polygon, margin + sagitta)
+    polygon[:, 0] = np.maximum(polygon[:, 0], 0)
+
+    # the mesh is oriented correctly for the clockwise winding
+    polygon = np.ascontiguousarray(polygon[::-1])
+
+    return toroidal_mesh_from_polygon(polygon, toroidal_extent, num_toroidal_segments=num_toroidal_segments)
+
+
+def plasma_mesh_from_equilibrium(equilibrium, boundary='lcfs', margin=0.01, toroidal_extent=360.,
+                                 num_toroidal_segments=500):
+    """
+    Generates a close-fitting Raysect Mesh primitive from the boundary of an EFIT equilibrium.
+
+    A margin of a few cm around the LCFS is usually appropriate for a plasma whose profiles
+    are mapped with EFITEquilibrium.map2d() or map3d(), since these are zero outside the LCFS.
+    Use the limiter polygon if the profiles extend into the scrape-off layer.
+
+    :param EFITEquilibrium equilibrium: The equilibrium.
+    :param str boundary: The boundary polygon, 'lcfs' (default) or 'limiter'.
+    :param float margin: Distance by which the boundary is expanded (in meters).
+                         Defaults to 0.01.
+    :param float toroidal_extent: Angular extent of the mesh in toroidal direction
+                                  (in degrees). Defaults to 360.
+    :param int num_toroidal_segments: The number of repeating toroidal segments
+                                      per given `toroidal_extent`. Defaults to 500.
+
+    :return: A watertight Raysect Mesh primitive.
+
+    .. code-block:: pycon
+
+        >>> from cherab.tools.primitives import plasma_mesh_from_equilibrium
+        >>>
+        >>> plasma.geometry = plasma_mesh_from_equilibrium(equilibrium, margin=0.02)
+    """
+
+    if boundary == 'lcfs':
+        polygon = equilibrium.lcfs_polygon
+    elif boundary == 'limiter':
+        polygon = equilibrium.limiter_polygon
+        if polygon is None:
+            raise ValueError("The equilibrium does not have a limiter polygon.")
+    else:
+        raise ValueError("The 'boundary' must be 'lcfs' or 'limiter', not '{}'.".format(boundary))
+
+    return plasma_mesh_from_polygon(polygon, margin=margin, toroidal_extent=toroidal_extent,
+                                    num_toroidal_segments=num_toroidal_segments)
+
+
+def plasma_mesh_from_profile(profile, r_range, z_range, resolution=0.01, threshold=0., margin=0.01,
+                             toroidal_extent=360., num_toroidal_segments=500):
+    """
+    Generates a Raysect Mesh primitive enclosing the region where a 2D profile is non-zero.
+
+    The profile is sampled on a regular R-Z grid and the mesh is built from the convex
+    hull of the nodes where the profile exceeds the threshold. The hull is expanded by
+    the margin plus the diagonal of a grid cell, so that the support between the grid nodes
+    is enclosed as well. For a profile mapped with EFITEquilibrium.map2d() the
+    plasma_mesh_from_equilibrium() function gives a tighter fit.
+
+    :param profile: A 2D function or a Python function of (r, z), e.g. a density profile.
+    :param tuple r_range: The (min, max) range of the sampled region in R (in meters).
+    :param tuple z_range: The (min, max) range of the sampled region in Z (in meters).
+    :param float resolution: The sampling resolution (in meters). Defaults to 0.01.
+    :param float threshold: The profile is considered non-zero above this value.
+                            Defaults to 0.
+    :param float margin: Distance by which the support is expanded (in meters).
+                         Defaults to 0.01.
+    :param float toroidal_extent: Angular extent of the mesh in toroidal direction
+                                  (in degrees). Defaults to 360.
+    :param int num_toroidal_segments: The number of repeating toroidal segments
+                                      per given `toroidal_extent`. Defaults to 500.
+
+    :return: A watertight Raysect Mesh primitive.
+
+    .. code-block:: pycon
+
+        >>> from cherab.tools.primitives import plasma_mesh_from_profile
+        >>>
+        >>> plasma.geometry = plasma_mesh_from_profile(ne_2d, equilibrium.r_range, equilibrium.z_range)
+    """
+
+    if resolution <= 0:
+        raise ValueError("The 'resolution' must be positive.")
+
+    nr = max(int(np.ceil((r_range[1] - r_range[0]) / resolution)), 1) + 1
+    nz = max(int(np.ceil((z_range[1] - z_range[0]) / resolution)), 1) + 1
+    r = np.linspace(r_range[0], r_range[1], nr)
+    z = np.linspace(z_range[0], z_range[1], nz)
+
+    points = [(ri, zj) for ri in r for zj in z if profile(ri, zj) > threshold]
+    if len(points) < 3:
+        raise ValueError("The profile is non-zero at less than three sampling points, "
+                         "try a finer resolution.")
+
+    points = np.array(points)
+    try:
+        hull = ConvexHull(points)
+    except Exception:
+        raise ValueError("The support of the profile is degenerate, try a finer resolution.")
+
+    # the grid step along the diagonal bounds the distance to the missed support
+    step = np.hypot(r[1] - r[0] if nr > 1 else 0, z[1] - z[0] if nz > 1 else 0)
+
+    return plasma_mesh_from_polygon(points[hull.vertices], margin=margin + step, toroidal_extent=toroidal_extent,
+                                    num_toroidal_segments=num_toroidal_segments)
+
+
+def _simplify_polygon(polygon):
+    """
+    Returns the polygon without repeated vertices and with anti-clockwise winding.
+    """
+
+    polygon = np.array(polygon, dtype=np.float64)
+
+    if polygon.ndim != 2 or polygon.shape[1] != 2:
+        raise ValueError("The 'polygon' must have [N, 2] shape.")
+
+    # remove zero length edges, including the closing edge of a closed polygon
+    keep = np.any(polygon != np.roll(polygon, -1, axis=0), axis=1)
+    polygon = polygon[keep]
+
+    if polygon.shape[0] < 3:
+        raise ValueError("The 'polygon' must contain at least three distinct vertices.")
+
+    r, z = polygon[:, 0], polygon[:, 1]
+    area = 0.5 * np.sum(r * np.roll(z, -1) - np.roll(r, -1) * z)
+    if area == 0:
+        raise ValueError("The 'polygon' must have a non-zero area.")
+
+    return polygon if area > 0 else polygon[::-1].copy()
+
+
+def _offset_polygon(polygon, distance):
+    """
+    Expands an anti-clockwise polygon outwards by the given distance.
+
+    The offset edges are joined with mitres. At sharp convex corners the mitre is cut
+    square, at sharp concave corners the mitre vertex is clamped to the mitre limit.
+    """
+
+    if distance == 0:
+        return polygon.copy()
+
+    edges = np.roll(polygon, -1, axis=0) - polygon
+    edges /= np.hypot(edges[:, 0], edges[:, 1])[:, None]
+    normals = np.stack((edges[:, 1], -edges[:, 0]), axis=1)
+
+    vertices = []
+    for i in range(polygon.shape[0]):
+
+        n1, n2 = normals[i - 1], normals[i]
+        bisector = n1 + n2
+        length = np.hypot(*bisector)
+
+        # the mitre vertex lies on both offset edges
+        if length > 2 / _MITRE_LIMIT:
+            vertices.append(polygon[i] + 2 * distance * bisector / length**2)
+            continue
+
+        # sharp concave corner, the mitre vertex would run far out along a narrow notch,
+        # so it is moved back along the bisector to the mitre limit
+        if edges[i - 1, 0] * edges[i, 1] - edges[i - 1, 1] * edges[i, 0] < 0:
+            vertices.append(polygon[i] + _MITRE_LIMIT * distance * bisector / length)
+            continue
+
+        # sharp convex corner, the offset edges are cut by a line at the offset distance
+        # perpendicular to the bisector; a reversal of the edge direction is cut across the edge
+        if length > 1.e-12:
+            bisector /= length
+        else:
+            bisector = edges[i - 1]
+
+        for n, edge in ((n1, edges[i - 1]), (n2, -edges[i])):
+            t = distance * (1 - np.dot(n, bisector)) / np.dot(edge, bisector)
+            vertices.append(polygon[i] + distance * n + t * edge)
+
+    return np.array(vertices)
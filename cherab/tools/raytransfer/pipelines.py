@@ -28,21 +28,32 @@ array may contain ~ 10,000 spectral bins but the wavelengths for all of them are
 Spectral pipelines from Raysect still can be used, but they are slower compared to ray
 transfer pipelines. Standard error is not calculated in these pipelines, only the mean value.
 Dispersive rendering and adaptive sampling features are removed to improve the performance.
+
+A single sightline usually crosses only a tiny fraction of the light sources (voxels),
+so the ray transfer matrix is typically very sparse. If the `sparse` mode is enabled,
+the pipelines store only non-zero elements of the matrix and return it as
+a `scipy.sparse.csr_matrix`. In this mode, the memory consumed by the pixel processors scales
+with the number of light sources crossed by the rays, not with the total number of light sources.
 """
 
 import numpy as np
+from scipy.sparse import csr_matrix
 from raysect.optical.observer.base import Pipeline0D, Pipeline1D, Pipeline2D, PixelProcessor
 
 
 class RayTransferPipelineBase():
 
-    def __init__(self, name=None, kind='power'):
+    def __init__(self, name=None, kind='power', sparse=False):
 
         self.name = name
         self._matrix = None
         self._samples = 0
         self._bins = 0
+        self._rows = []
+        self._columns = []
+        self._values = []
         self.kind = kind
+        self.sparse = sparse
 
     @property
     def kind(self):
@@ -65,10 +76,57 @@ class RayTransferPipelineBase():
         else:
             raise ValueError("The kind property must be 'power' or 'radiance'.")
 
+    @property
+    def sparse(self):
+        """
+        If True, the ray transfer matrix is accumulated in a sparse form and returned
+        as a `scipy.sparse.csr_matrix`. Only non-zero elements of the matrix are
+        stored and transferred from the render workers.
+        """
+        return self._sparse
+
+    @sparse.setter
+    def sparse(self, value):
+        self._sparse = bool(value)
+
     @property
     def matrix(self):
         return self._matrix
 
+    def _new_pixel_processor(self):
+        if self._sparse:
+            if self._kind == 'power':
+                return SparsePowerRayTransferPixelProcessor()
+            return SparseRadianceRayTransferPixelProcessor()
+
+        if self._kind == 'power':
+            return PowerRayTransferPixelProcessor(self._bins)
+        return RadianceRayTransferPixelProcessor(self._bins)
+
+    def _reset_sparse_buffers(self):
+        self._rows = []
+        self._columns = []
+        self._values = []
+
+    def _add_sparse_row(self, row, packed_result):
+        indices, values = packed_result
+        self._rows.append(np.full(indices.size, row, dtype=np.int64))
+        self._columns.append(indices)
+        self._values.append(values)
+
+    def _build_sparse_matrix(self, shape):
+        if self._values:
+            rows = np.concatenate(self._rows)
+            columns = np.concatenate(self._columns)
+            values = np.concatenate(self._values)
+        else:
+            rows = columns = np.zeros(0, dtype=np.int64)
+            values = np.zeros(0)
+        self._reset_sparse_buffers()
+        matrix = csr_matrix((values, (rows, columns)), shape=shape)  # duplicates are summed up
+        matrix.sum_duplicates()
+        return matrix
+
 
 class RayTransferPipeline0D(Pipeline0D, RayTransferPipelineBase):
     """
@@ -84,8 +142,11 @@ class RayTransferPipeline0D(Pipeline0D, RayTransferPipelineBase):
         for the product of the ray transfer matrix and the emission profile.
         Note that if the sensitivity of the detector is 1 (e.g. `PinholeCamera`, `VectorCamera`),
         the 'power' and 'radiance' give the same results.
+    :param bool sparse: If True, only non-zero elements of the ray transfer matrix are stored
+        and the matrix is returned as a `scipy.sparse.csr_matrix`. Default is False.
 
     :ivar np.ndarray matrix: Ray transfer matrix, a 1D array of size :math:`N_{bin}`.
+        In the sparse mode, a `csr_matrix` of shape :math:`(1, N_{bin})`.
 
     .. code-block:: pycon
 
@@ -93,26 +154,32 @@ class RayTransferPipeline0D(Pipeline0D, RayTransferPipelineBase):
        >>> pipeline = RayTransferPipeline0D(kind='radiance')
     """
 
-    def __init__(self, name='RayTransferPipeline0D', kind='power'):
+    def __init__(self, name='RayTransferPipeline0D', kind='power', sparse=False):
 
-        RayTransferPipelineBase.__init__(self, name, kind)
+        RayTransferPipelineBase.__init__(self, name, kind, sparse)
 
     def initialise(self, min_wavelength, max_wavelength, spectral_bins, spectral_slices, quiet):
         self._samples = 0
         self._bins = spectral_bins
-        self._matrix = np.zeros(spectral_bins)
+        if self._sparse:
+            self._reset_sparse_buffers()
+            self._matrix = csr_matrix((1, spectral_bins))
+        else:
+            self._matrix = np.zeros(spectral_bins)
 
     def pixel_processor(self, slice_id):
-        if self._kind == 'power':
-            return PowerRayTransferPixelProcessor(self._bins)
-        else:
-            return RadianceRayTransferPixelProcessor(self._bins)
+        return self._new_pixel_processor()
 
     def update(self, slice_id, packed_result, pixel_samples):
         self._samples += pixel_samples
-        self._matrix += packed_result[0]
+        if self._sparse:
+            self._add_sparse_row(0, packed_result)
+        else:
+            self._matrix += packed_result[0]
 
     def finalise(self):
+        if self._sparse:
+            self._matrix = self._build_sparse_matrix((1, self._bins))
         self._matrix /= self._samples
 
 
@@ -130,8 +197,11 @@ class RayTransferPipeline1D(Pipeline1D, RayTransferPipelineBase):
         for the product of the ray transfer matrix and the emission profile.
         Note that if the sensitivity of the detector is 1 (e.g. `PinholeCamera`, `VectorCamera`),
         the 'power' and 'radiance' give the same results.
+    :param bool sparse: If True, only non-zero elements of the ray transfer matrix are stored
+        and the matrix is returned as a `scipy.sparse.csr_matrix`. Default is False.
 
     :ivar np.ndarray matrix: Ray transfer matrix, a 2D array of shape :math:`(N_{pixel}, N_{bin})`.
+        In the sparse mode, a `csr_matrix` of the same shape.
 
     .. code-block:: pycon
 
@@ -139,28 +209,33 @@ class RayTransferPipeline1D(Pipeline1D, RayTransferPipelineBase):
        >>> pipeline = RayTransferPipeline1D(kind='radiance')
     """
 
-    def __init__(self, name='RayTransferPipeline1D', kind='power'):
+    def __init__(self, name='RayTransferPipeline1D', kind='power', sparse=False):
 
-        RayTransferPipelineBase.__init__(self, name, kind)
+        RayTransferPipelineBase.__init__(self, name, kind, sparse)
         self._pixels = None
 
     def initialise(self, pixels, pixel_samples, min_wavelength, max_wavelength, spectral_bins, spectral_slices, quiet):
         self._pixels = pixels
         self._samples = pixel_samples
         self._bins = spectral_bins
-        self._matrix = np.zeros((pixels, spectral_bins))
+        if self._sparse:
+            self._reset_sparse_buffers()
+            self._matrix = csr_matrix((pixels, spectral_bins))
+        else:
+            self._matrix = np.zeros((pixels, spectral_bins))
 
     def pixel_processor(self, pixel, slice_id):
-        if self._kind == 'power':
-            return PowerRayTransferPixelProcessor(self._bins)
-        else:
-            return RadianceRayTransferPixelProcessor(self._bins)
+        return self._new_pixel_processor()
 
     def update(self, pixel, slice_id, packed_result):
-        self._matrix[pixel] = packed_result[0] / self._samples
+        if self._sparse:
+            self._add_sparse_row(pixel, packed_result)
+        else:
+            self._matrix[pixel] = packed_result[0] / self._samples
 
     def finalise(self):
-        pass
+        if self._sparse:
+            self._matrix = self._build_sparse_matrix((self._pixels, self._bins)) / self._samples
 
 
 class RayTransferPipeline2D(Pipeline2D, RayTransferPipelineBase):
@@ -177,8 +252,12 @@ class RayTransferPipeline2D(Pipeline2D, RayTransferPipelineBase):
         for the product of the ray transfer matrix and the emission profile.
         Note that if the sensitivity of the detector is 1 (e.g. `PinholeCamera`, `VectorCamera`),
         the 'power' and 'radiance' give the same results.
+    :param bool sparse: If True, only non-zero elements of the ray transfer matrix are stored
+        and the matrix is returned as a `scipy.sparse.csr_matrix`. Default is False.
 
     :ivar np.ndarray matrix: Ray transfer matrix, a 3D array of shape :math:`(N_x, N_y, N_{bin})`.
+        In the sparse mode, a `csr_matrix` of shape :math:`(N_x N_y, N_{bin})`, in which
+        the pixel :math:`(x, y)` corresponds to the row :math:`x N_y + y`.
 
     .. code-block:: pycon
 
@@ -186,28 +265,34 @@ class RayTransferPipeline2D(Pipeline2D, RayTransferPipelineBase):
        >>> pipeline = RayTransferPipeline2D(kind='radiance')
     """
 
-    def __init__(self, name='RayTransferPipeline2D', kind='power'):
+    def __init__(self, name='RayTransferPipeline2D', kind='power', sparse=False):
 
-        RayTransferPipelineBase.__init__(self, name, kind)
+        RayTransferPipelineBase.__init__(self, name, kind, sparse)
         self._pixels = None
 
     def initialise(self, pixels, pixel_samples, min_wavelength, max_wavelength, spectral_bins, spectral_slices, quiet):
         self._pixels = pixels
         self._samples = pixel_samples
         self._bins = spectral_bins
-        self._matrix = np.zeros((pixels[0], pixels[1], spectral_bins))
+        if self._sparse:
+            self._reset_sparse_buffers()
+            self._matrix = csr_matrix((pixels[0] * pixels[1], spectral_bins))
+        else:
+            self._matrix = np.zeros((pixels[0], pixels[1], spectral_bins))
 
     def pixel_processor(self, x, y, slice_id):
-        if self._kind == 'power':
-            return PowerRayTransferPixelProcessor(self._bins)
-        else:
-            return RadianceRayTransferPixelProcessor(self._bins)
+        return self._new_pixel_processor()
 
     def update(self, x, y, slice_id, packed_result):
-        self._matrix[x, y] = packed_result[0] / self._samples
+        if self._sparse:
+            self._add_sparse_row(x * self._pixels[1] + y, packed_result)
+        else:
+            self._matrix[x, y] = packed_result[0] / self._samples
 
     def finalise(self):
-        pass
+        if self._sparse:
+            shape = (self._pixels[0] * self._pixels[1], self._bins)
+            self._matrix = self._build_sparse_matrix(shape) / self._samples
 
 
 class RayTransferPixelProcessorBase(PixelProcessor):
@@ -238,3 +323,47 @@ class PowerRayTransferPixelProcessor(RayTransferPixelProcessorBase):
 
     def add_sample(self, spectrum, sensitivity):
         self._matrix += spectrum.samples * sensitivity
+
+
+class SparseRayTransferPixelProcessorBase(PixelProcessor):
+    """
+    Base class for PixelProcessor that stores only non-zero elements
+    of the ray transfer matrix for each pixel.
+    """
+
+    def __init__(self):
+        self._indices = []
+        self._values = []
+
+    def _add_values(self, samples):
+        indices = np.flatnonzero(samples)
+        if indices.size:
+            self._indices.append(indices)
+            self._values.append(samples[indices])
+
+    def pack_results(self):
+        if not self._values:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+
+        indices, inverse = np.unique(np.concatenate(self._indices), return_inverse=True)
+        values = np.bincount(inverse, weights=np.concatenate(self._values), minlength=indices.size)
+
+        return indices, values
+
+
+class SparseRadianceRayTransferPixelProcessor(SparseRayTransferPixelProcessorBase):
+    """
+    PixelProcessor that stores non-zero elements of ray transfer matrix in the units of [m] for each pixel.
+    """
+
+    def add_sample(self, spectrum, sensitivity):
+        self._add_values(spectrum.samples)
+
+
+class SparsePowerRayTransferPixelProcessor(SparseRayTransferPixelProcessorBase):
+    """
+    PixelProcessor that stores non-zero elements of ray transfer matrix in the units of [m^3 sr] for each pixel.
+    """
+
+    def add_sample(self, spectrum, sensitivity):
+        self._add_values(spectrum.samples * sensitivity)
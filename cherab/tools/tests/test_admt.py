@@ -18,6 +18,7 @@
 
 import unittest
 import numpy as np
+from scipy import sparse
 import matplotlib.pyplot as plt
 
 from raysect.core import Point2D
@@ -216,6 +217,18 @@ class TestADMT(unittest.TestCase):
                                     / (4 * dxdy))
                 self.assertEqual(eq_deriv, deriv, msg="Failed for ({}, {})".format(xi, yj))
 
+    def test_sparse_operators(self):
+        """The operators are sparse, with at most 9 non-zeros per row"""
+        for name, operator in self.DERIVATIVE_OPERATORS.items():
+            self.assertTrue(sparse.issparse(operator), msg="{} is not sparse".format(name))
+            self.assertEqual(operator.shape, (9, 9))
+            self.assertLessEqual(np.diff(operator.indptr).max(), 9)
+        voxel_radii = np.asarray(self.VOXEL_COORDS)[:, 0]
+        admt_operator = calculate_admt(voxel_radii, self.DERIVATIVE_OPERATORS,
+                                       self.VOXEL_COORDS[:, 0] + self.VOXEL_COORDS[:, 1],
+                                       self.DX, self.DY)
+        self.assertTrue(sparse.issparse(admt_operator))
+
     def test_invalid_coords(self):
         """Test for invalid voxel_coords input"""
         with self.assertRaises(TypeError):
@@ -0,0 +1,93 @@
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+
+import unittest
+
+import numpy as np
+
+from raysect.core import Point3D, Vector3D, translate, rotate_basis
+from raysect.core.math.random import seed
+from raysect.core.workflow import SerialEngine
+from raysect.optical import World
+
+from cherab.tools.inversions import ToroidalVoxelGrid
+from cherab.tools.observers import BolometerCamera, BolometerSlit, BolometerFoil
+
+
+class TestBolometerCamera(unittest.TestCase):
+
+    def setUp(self):
+
+        self.world = World()
+
+        # 2 x 2 rectangular voxels, R = [1, 2] m, z = [-0.5, 0.5] m
+        voxel_coords = []
+        for r in (1, 1.5):
+            for z in (-0.5, 0):
+                voxel_coords.append([(r, z), (r, z + 0.5), (r + 0.5, z + 0.5), (r + 0.5, z)])
+        self.voxels = ToroidalVoxelGrid(voxel_coords, parent=self.world)
+
+        # the camera looks along the -x direction towards the voxels
+        transform = translate(2.5, 0, 0) * rotate_basis(Vector3D(-1, 0, 0), Vector3D(0, 0, 1))
+        self.camera = BolometerCamera(parent=self.world, transform=transform)
+        slit = BolometerSlit("slit", Point3D(0, 0, 0), Vector3D(1, 0, 0), 0.002, Vector3D(0, 1, 0), 0.004,
+                             parent=self.camera)
+        for i, offset in enumerate((-0.002, 0.002)):
+            foil = BolometerFoil("foil {}".format(i), Point3D(offset, 0, -0.02), Vector3D(1, 0, 0), 0.001,
+                                 Vector3D(0, 1, 0), 0.002, slit, parent=self.camera)
+            foil.render_engine = SerialEngine()
+            self.camera.add_foil_detector(foil)
+
+    def test_sensitivity_matrix(self):
+
+        # the batched calculation must match the per-foil calculation with the same random samples
+        seed(1234567890)
+        reference = [foil.calculate_sensitivity(self.voxels, ray_count=1000) for foil in self.camera]
+
+        seed(1234567890)
+        sensitivity, errors = self.camera.calculate_sensitivity_matrix(self.voxels, ray_count=1000,
+                                                                       render_engine=SerialEngine())
+
+        self.assertEqual(sensitivity.shape, (len(self.camera), self.voxels.count))
+        self.assertEqual(errors.shape, (len(self.camera), self.voxels.count))
+        self.assertTrue(np.any(sensitivity.toarray() > 0))
+        np.testing.assert_allclose(sensitivity.toarray(), reference, rtol=1.e-12)
+
+    def test_sensitivity_matrix_restores_detectors(self):
+
+        states = [(foil.min_wavelength, foil.max_wavelength, foil.spectral_bins, foil.pipelines, foil.pixel_samples)
+                  for foil in self.camera]
+
+        self.camera.calculate_sensitivity_matrix(self.voxels, ray_count=100, render_engine=SerialEngine())
+
+        for foil, (min_wavelength, max_wavelength, bins, pipelines, pixel_samples) in zip(self.camera, states):
+            self.assertEqual(foil.min_wavelength, min_wavelength)
+            self.assertEqual(foil.max_wavelength, max_wavelength)
+            self.assertEqual(foil.spectral_bins, bins)
+            self.assertEqual(foil.pixel_samples, pixel_samples)
+            self.assertListEqual(list(foil.pipelines), list(pipelines))
+
+    def test_sensitivity_matrix_invalid_voxels(self):
+
+        with self.assertRaises(TypeError):
+            self.camera.calculate_sensitivity_matrix(None)
+
+
+if __name__ == '__main__':
+    unittest.main()
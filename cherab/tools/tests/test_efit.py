@@ -0,0 +1,151 @@
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+import unittest
+
+import numpy as np
+
+from cherab.tools.equilibrium import example_equilibrium
+from cherab.core.math import VectorAxisymmetricMapper
+from cherab.tools.equilibrium.efit import EFITFluxGrid, EFITBakedVectorField2D
+
+
+class TestEFITFluxGrid(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.equilibrium = example_equilibrium()
+
+    def setUp(self):
+        self.te = np.array([[0, 0.1, 0.2, 0.4, 0.7, 1.0], [1000, 900, 700, 400, 200, 50.]])
+        self.ne = np.array([[0, 0.5, 1.0], [5.e19, 4.e19, 1.e19]])
+
+        rng = np.random.default_rng(0)
+        self.r = rng.uniform(*self.equilibrium.r_range, 2000)
+        self.z = rng.uniform(*self.equilibrium.z_range, 2000)
+
+    def test_map2d(self):
+
+        exact = self.equilibrium.map2d(self.te, value_outside_lcfs=-1)
+        for interpolation in ('linear', 'cubic'):
+            grid = self.equilibrium.flux_grid(0.01, interpolation)
+            baked = grid.map2d(self.te, value_outside_lcfs=-1)
+
+            self.assertEqual(baked.data.shape, (grid.r.size, grid.z.size))
+            self.assertGreater(baked.error, 0)
+            self.assertLess(baked.error, 5)
+
+            # the error estimate is the maximum deviation at the centres of the cells inside the LCFS
+            deviation = 0
+            for rc in 0.5 * (grid.r[1:] + grid.r[:-1]):
+                for zc in 0.5 * (grid.z[1:] + grid.z[:-1]):
+                    if self.equilibrium.inside_lcfs(rc, zc):
+                        deviation = max(deviation, abs(baked(rc, zc) - exact(rc, zc)))
+            self.assertAlmostEqual(deviation, baked.error, delta=1.e-10 * self.te[1].max(),
+                                   msg='Baked profile error estimate does not match the deviation at the cell centres.')
+
+            for r, z in zip(self.r, self.z):
+                if self.equilibrium.inside_lcfs(r, z):
+                    self.assertAlmostEqual(baked(r, z), exact(r, z), delta=0.01 * self.te[1].max(),
+                                           msg='Baked profile deviates from the exact mapping by more than 1% of the peak value.')
+                else:
+                    self.assertEqual(baked(r, z), -1, msg='Baked profile returns a wrong value outside the LCFS.')
+
+    def test_resolution(self):
+
+        linear = self.equilibrium.flux_grid(0.01, 'linear').map2d(self.te)
+        cubic = self.equilibrium.flux_grid(0.01, 'cubic').map2d(self.te)
+        fine = self.equilibrium.flux_grid(0.005, 'cubic').map2d(self.te)
+
+        self.assertLess(cubic.error, linear.error)
+        self.assertLess(fine.error, cubic.error)
+
+    def test_shared_grid(self):
+
+        # profiles evaluated in turn at the same point share the interpolation weights
+        grid = EFITFluxGrid(self.equilibrium, 0.01)
+        te = grid.map2d(self.te)
+        ne = grid.map2d(self.ne)
+        te_ref = EFITFluxGrid(self.equilibrium, 0.01).map2d(self.te)
+        ne_ref = EFITFluxGrid(self.equilibrium, 0.01).map2d(self.ne)
+
+        for r, z in zip(self.r, self.z):
+            self.assertEqual(te(r, z), te_ref(r, z))
+            self.assertEqual(ne(r, z), ne_ref(r, z))
+
+    def test_map3d(self):
+
+        grid = self.equilibrium.flux_grid(0.01)
+        te2d = grid.map2d(self.te)
+        te3d = grid.map3d(self.te)
+        for r, z in zip(self.r[:100], self.z[:100]):
+            self.assertAlmostEqual(te3d(r / np.sqrt(2), r / np.sqrt(2), z), te2d(r, z), delta=1.e-10)
+
+    def test_invalid_arguments(self):
+
+        with self.assertRaises(ValueError):
+            self.equilibrium.flux_grid(0)
+        with self.assertRaises(ValueError):
+            self.equilibrium.flux_grid(0.01, 'quadratic')
+
+
+class TestEFITBakedVectorField2D(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.equilibrium = example_equilibrium()
+
+    def test_bake_b_field(self):
+
+        b_field = self.equilibrium.bake_b_field(0.01)
+        baked = b_field.function2d
+        exact = VectorAxisymmetricMapper(self.equilibrium.b_field)
+
+        self.assertIsInstance(b_field, VectorAxisymmetricMapper)
+        self.assertIsInstance(baked, EFITBakedVectorField2D)
+        self.assertEqual(baked.data.shape, (3, baked.r.size, baked.z.size))
+        self.assertGreater(baked.error, 0)
+
+        rng = np.random.default_rng(0)
+        for r, z, phi in zip(rng.uniform(*self.equilibrium.r_range, 1000), rng.uniform(*self.equilibrium.z_range, 1000),
+                             rng.uniform(0, 2 * np.pi, 1000)):
+            x, y = r * np.cos(phi), r * np.sin(phi)
+            self.assertLess((b_field(x, y, z) - exact(x, y, z)).length, 2 * baked.error,
+                            msg='Baked magnetic field deviates from the exact field by more than the error estimate.')
+
+    def test_nodes(self):
+
+        # the interpolation returns the sampled values at the grid nodes
+        baked = EFITBakedVectorField2D(self.equilibrium.b_field, self.equilibrium.r_range, self.equilibrium.z_range,
+                                       0.02, 'cubic')
+        for i, j in ((1, 2), (10, 20), (40, 100)):
+            v = list(self.equilibrium.b_field(baked.r[i], baked.z[j]))
+            np.testing.assert_allclose(list(baked(baked.r[i], baked.z[j])), v, rtol=1.e-12, atol=1.e-12)
+            np.testing.assert_array_equal(baked.data[:, i, j], v)
+
+    def test_outside_grid(self):
+
+        baked = self.equilibrium.bake_b_field(0.02).function2d
+        with self.assertRaises(ValueError):
+            baked(self.equilibrium.r_range[1] + 0.1, 0)
+        with self.assertRaises(ValueError):
+            self.equilibrium.bake_b_field(-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,7 +27,8 @@ from raysect.core.math.function.float import Function1D, Function2D, Interpolato
 from cherab.core.atomic import neon, hydrogen, helium
 from cherab.core.math import AxisymmetricMapper
 from cherab.openadas import OpenADAS
-from cherab.tools.plasmas.ionisation_balance import (fractional_abundance, from_elementdensity, match_plasma_neutrality,
+from cherab.tools.plasmas.ionisation_balance import (get_rates_ionisation, get_rates_recombination, get_rates_tcx,
+                                                     fractional_abundance, from_elementdensity, match_plasma_neutrality,
                                                      interpolators1d_fractional, interpolators1d_from_elementdensity,
                                                      interpolators1d_match_plasma_neutrality,
                                                      interpolators2d_fractional, interpolators2d_from_elementdensity,
@@ -294,6 +295,29 @@ class TestIonizationBalance1D(unittest.TestCase):
         fraction_sum = self.sumup_fractions(abundance_fractional)
         self.assertTrue(np.allclose(fraction_sum, 1, atol=self.TOLERANCE))
 
+    def test_fractional_1d_balance_equations(self):
+        """
+        test that the fractional abundance satisfies the steady state balance equations
+        """
+        abundance_fractional = fractional_abundance(self.atomic_data, self.element, self.n_e_profile_1d,
+                                                    self.t_e_profile_1d, self.tcx_donor,
+                                                    self.n_tcx_donor_profile_1d, 0)
+
+        coef_ion = get_rates_ionisation(self.atomic_data, self.element)
+        coef_recom = get_rates_recombination(self.atomic_data, self.element)
+        coef_tcx = get_rates_tcx(self.atomic_data, self.tcx_donor, 0, self.element)
+
+        atomic_number = self.element.atomic_number
+        for index, (n_e, t_e, n_d) in enumerate(zip(self.n_e_profile_1d, self.t_e_profile_1d,
+                                                     self.n_tcx_donor_profile_1d)):
+            fractions = np.array([abundance_fractional[charge][index] for charge in range(atomic_number + 1)])
+            for charge in range(atomic_number):
+                # net flux between neighbouring charge states must vanish
+                ionisation = coef_ion[charge](n_e, t_e) * fractions[charge]
+                recombination = (coef_recom[charge + 1](n_e, t_e) +
+                                 n_d / n_e * coef_tcx[charge + 1](n_e, t_e)) * fractions[charge + 1]
+                self.assertTrue(np.isclose(ionisation, recombination, rtol=1e-8, atol=1e-300))
+
     def test_fractional_1d_from_1d_tcx(self):
         """
         test calculation of 1d fractional profiles with 1d iterables as inputs
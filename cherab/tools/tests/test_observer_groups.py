@@ -1,6 +1,8 @@
 import unittest
 
-from raysect.core.workflow import RenderEngine
+from raysect.core.workflow import RenderEngine, SerialEngine
+from raysect.optical import World, ConstantSF, translate
+from raysect.optical.material import UniformSurfaceEmitter
 from raysect.optical.observer import Observer0D, SightLine, FibreOptic, Pixel, TargettedPixel, PowerPipeline0D, SpectralPowerPipeline0D
 from raysect.primitive import Sphere
 
@@ -287,6 +289,41 @@ class SightLineGroupTestCase(Observer0DGroupTestCase):
             group.sensitivity = [1] * (len(group) + 1)
 
 
+    def test_observe(self):
+
+        class CountingEngine(SerialEngine):
+
+            def __init__(self):
+                super().__init__()
+                self.runs = 0
+
+            def run(self, *args, **kwargs):
+                self.runs += 1
+                return super().run(*args, **kwargs)
+
+        world = World()
+        Sphere(10, parent=world, material=UniformSurfaceEmitter(ConstantSF(1.0)))
+
+        group = SightLineGroup(parent=world, observers=self.observers)
+        group.pixel_samples = 10
+        group.quiet = True
+        group.sensitivity = [1, 2, 3]
+        for i, sightline in enumerate(group.observers):
+            sightline.transform = translate(i, 0, 0)
+
+        reference = []
+        for sightline in group.observers:
+            sightline.observe()
+            reference.append(sightline.pipelines[0].value.mean)
+
+        # all sightlines must be rendered in a single run
+        engine = CountingEngine()
+        group.observe(render_engine=engine)
+        self.assertEqual(engine.runs, 1)
+        for sightline, value in zip(group.observers, reference):
+            self.assertAlmostEqual(sightline.pipelines[0].value.mean, value, delta=1.e-12 * value)
+
+
 class FibreOpticTestCase(Observer0DGroupTestCase):
     _GROUP_CLASS = FibreOpticGroup
 
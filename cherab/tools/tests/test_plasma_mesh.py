@@ -0,0 +1,130 @@
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+import unittest
+
+import numpy as np
+from raysect.core import Point3D
+
+from cherab.tools.equilibrium import example_equilibrium
+from cherab.tools.primitives import plasma_mesh_from_polygon, plasma_mesh_from_equilibrium, plasma_mesh_from_profile
+from cherab.tools.primitives.plasma_mesh import _offset_polygon, _MITRE_LIMIT
+
+
+class TestPlasmaMesh(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.equilibrium = example_equilibrium()
+
+    def assert_contains(self, mesh, r, z, phi=0.):
+        self.assertTrue(mesh.contains(Point3D(r * np.cos(phi), r * np.sin(phi), z)))
+
+    def assert_not_contains(self, mesh, r, z, phi=0.):
+        self.assertFalse(mesh.contains(Point3D(r * np.cos(phi), r * np.sin(phi), z)))
+
+    def test_polygon(self):
+
+        square = [[1, -0.5], [2, -0.5], [2, 0.5], [1, 0.5]]
+
+        # both windings and closed polygons give the same geometry
+        for polygon in (square, square[::-1], square + square[:1]):
+            mesh = plasma_mesh_from_polygon(polygon, margin=0.1, num_toroidal_segments=32)
+            for phi in np.linspace(0, 2 * np.pi, 13):
+                self.assert_contains(mesh, 1.5, 0., phi)
+                self.assert_contains(mesh, 1.99, 0.49, phi)
+                self.assert_contains(mesh, 2.09, 0., phi)
+                self.assert_contains(mesh, 1.5, -0.59, phi)
+                self.assert_not_contains(mesh, 2.2, 0., phi)
+                self.assert_not_contains(mesh, 0.8, 0., phi)
+                self.assert_not_contains(mesh, 1.5, 0.7, phi)
+
+        mesh = plasma_mesh_from_polygon(square, margin=0.1, toroidal_extent=90, num_toroidal_segments=8)
+        self.assert_contains(mesh, 1.5, 0., np.pi / 4)
+        self.assert_not_contains(mesh, 1.5, 0., -np.pi / 4)
+
+        with self.assertRaises(ValueError):
+            plasma_mesh_from_polygon(square, margin=-0.1)
+        with self.assertRaises(ValueError):
+            plasma_mesh_from_polygon([[1, 0], [2, 0], [1, 0]])
+
+    def test_sharp_corners(self):
+
+        # a narrow notch (near-reversal concave corner) and a narrow spike (convex corner)
+        polygon = np.array([[1, -0.5], [2, -0.5], [2, 0.5], [1.51, 0.5], [1.5, -0.3], [1.49, 0.5],
+                            [1.2, 0.5], [1.2, 1.5], [1.19, 0.5], [1, 0.5]])
+        distance = 0.01
+        offset = _offset_polygon(polygon, distance)
+
+        # the vertices of the offset polygon stay within the mitre limit of the corners
+        for vertex in offset:
+            nearest = np.hypot(*(polygon - vertex).T).min()
+            self.assertLessEqual(nearest, _MITRE_LIMIT * distance * (1 + 1.e-9),
+                                 msg='An offset vertex runs away from the sharp corner.')
+
+        mesh = plasma_mesh_from_polygon(polygon, margin=distance, num_toroidal_segments=64)
+        self.assert_contains(mesh, 1.5, -0.31)
+        self.assert_contains(mesh, 1.195, 1.4)
+        self.assert_not_contains(mesh, 1.5, 0.6)
+        self.assert_not_contains(mesh, 1.2, 1.6)
+
+    def test_equilibrium(self):
+
+        margin = 0.02
+        mesh = plasma_mesh_from_equilibrium(self.equilibrium, margin=margin, num_toroidal_segments=64)
+
+        # the plasma inside the LCFS must be enclosed by the mesh
+        rng = np.random.default_rng(0)
+        r = rng.uniform(*self.equilibrium.r_range, 2000)
+        z = rng.uniform(*self.equilibrium.z_range, 2000)
+        phi = rng.uniform(0, 2 * np.pi, 2000)
+        for ri, zi, phii in zip(r, z, phi):
+            if self.equilibrium.inside_lcfs(ri, zi):
+                self.assert_contains(mesh, ri, zi, phii)
+
+        # the mesh follows the LCFS within the margin
+        lcfs = self.equilibrium.lcfs_polygon
+        r_min, r_max = lcfs[:, 0].min(), lcfs[:, 0].max()
+        z_axis = lcfs[np.argmax(lcfs[:, 0]), 1]
+        self.assert_contains(mesh, r_max + 0.5 * margin, z_axis)
+        self.assert_not_contains(mesh, r_max + 2 * margin, z_axis)
+        self.assert_not_contains(mesh, r_min - 2 * margin, 0.)
+
+        limiter_mesh = plasma_mesh_from_equilibrium(self.equilibrium, boundary='limiter', num_toroidal_segments=64)
+        limiter = self.equilibrium.limiter_polygon
+        self.assert_contains(limiter_mesh, limiter[:, 0].max(), limiter[np.argmax(limiter[:, 0]), 1])
+
+        with self.assertRaises(ValueError):
+            plasma_mesh_from_equilibrium(self.equilibrium, boundary='wall')
+
+    def test_profile(self):
+
+        profile = self.equilibrium.map2d([[0, 1], [1, 0]])
+        mesh = plasma_mesh_from_profile(profile, self.equilibrium.r_range, self.equilibrium.z_range,
+                                        resolution=0.05, num_toroidal_segments=64)
+
+        for r, z in self.equilibrium.lcfs_polygon:
+            self.assert_contains(mesh, r, z)
+        self.assert_not_contains(mesh, self.equilibrium.r_range[1], 0.)
+
+        with self.assertRaises(ValueError):
+            plasma_mesh_from_profile(lambda r, z: 0., self.equilibrium.r_range, self.equilibrium.z_range, resolution=0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -288,6 +288,32 @@ class TestRayTransferPipeline0D(unittest.TestCase):
         matrix, _ = pixel_processor.pack_results()  # not multiplied by sensitivity
         self.assertTrue(np.all(matrix == spectral_value))
 
+    def test_sparse(self):
+        """
+        Test if the sparse mode gives the same matrix as the dense one.
+        """
+        nbins = 10
+        sensitivity = 2.
+        spectrum = Spectrum(1., 2., nbins)
+        spectrum.samples[[2, 7]] = 1.
+
+        dense_pipeline = RayTransferPipeline0D(kind='power')
+        sparse_pipeline = RayTransferPipeline0D(kind='power', sparse=True)
+        for pipeline in (dense_pipeline, sparse_pipeline):
+            pipeline.initialise(0, 0, nbins, 0, 0)
+            for slice_id in range(2):
+                pixel_processor = pipeline.pixel_processor(slice_id)
+                for _ in range(3):
+                    pixel_processor.add_sample(spectrum, sensitivity)
+                pipeline.update(slice_id, pixel_processor.pack_results(), 3)
+            pipeline.finalise()
+
+        indices, values = sparse_pipeline.pixel_processor(0).pack_results()
+        self.assertTrue(indices.size == 0 and values.size == 0)
+        self.assertTrue(sparse_pipeline.matrix.shape == (1, nbins))
+        self.assertTrue(sparse_pipeline.matrix.nnz == 2)
+        self.assertTrue(np.allclose(sparse_pipeline.matrix.toarray()[0], dense_pipeline.matrix))
+
 
 class TestRayTransferPipeline1D(unittest.TestCase):
     """
@@ -340,6 +366,32 @@ class TestRayTransferPipeline1D(unittest.TestCase):
         matrix, _ = pixel_processor.pack_results()  # not multiplied by sensitivity
         self.assertTrue(np.all(matrix == spectral_value))
 
+    def test_sparse(self):
+        """
+        Test if the sparse mode gives the same matrix as the dense one.
+        """
+        nbins = 10
+        pixels = 4
+        samples = 2
+        spectrum = Spectrum(1., 2., nbins)
+
+        dense_pipeline = RayTransferPipeline1D(kind='radiance')
+        sparse_pipeline = RayTransferPipeline1D(kind='radiance', sparse=True)
+        for pipeline in (dense_pipeline, sparse_pipeline):
+            pipeline.initialise(pixels, samples, 0, 0, nbins, 1, 0)
+            for pixel in range(pixels):
+                pixel_processor = pipeline.pixel_processor(pixel, 0)
+                for i in range(samples):
+                    spectrum.samples[:] = 0
+                    spectrum.samples[pixel + i] = pixel + 1.
+                    pixel_processor.add_sample(spectrum, 1.)
+                pipeline.update(pixel, 0, pixel_processor.pack_results())
+            pipeline.finalise()
+
+        self.assertTrue(sparse_pipeline.matrix.shape == (pixels, nbins))
+        self.assertTrue(sparse_pipeline.matrix.nnz == pixels * samples)
+        self.assertTrue(np.allclose(sparse_pipeline.matrix.toarray(), dense_pipeline.matrix))
+
 
 class TestRayTransferPipeline2D(unittest.TestCase):
     """
@@ -392,6 +444,32 @@ class TestRayTransferPipeline2D(unittest.TestCase):
         matrix, _ = pixel_processor.pack_results()  # not multiplied by sensitivity
         self.assertTrue(np.all(matrix == spectral_value))
 
+    def test_sparse(self):
+        """
+        Test if the sparse mode gives the same matrix as the dense one.
+        """
+        nbins = 10
+        pixels = (3, 2)
+        samples = 1
+        spectrum = Spectrum(1., 2., nbins)
+
+        dense_pipeline = RayTransferPipeline2D(kind='power')
+        sparse_pipeline = RayTransferPipeline2D(kind='power', sparse=True)
+        for pipeline in (dense_pipeline, sparse_pipeline):
+            pipeline.initialise(pixels, samples, 0, 0, nbins, 1, 0)
+            for x in range(pixels[0]):
+                for y in range(pixels[1]):
+                    spectrum.samples[:] = 0
+                    spectrum.samples[x + y] = 1.
+                    pixel_processor = pipeline.pixel_processor(x, y, 0)
+                    pixel_processor.add_sample(spectrum, 0.5)
+                    pipeline.update(x, y, 0, pixel_processor.pack_results())
+            pipeline.finalise()
+
+        self.assertTrue(sparse_pipeline.matrix.shape == (pixels[0] * pixels[1], nbins))
+        self.assertTrue(np.allclose(sparse_pipeline.matrix.toarray().reshape(pixels[0], pixels[1], nbins),
+                                    dense_pipeline.matrix))
+
 
 if __name__ == '__main__':
     unittest.main()
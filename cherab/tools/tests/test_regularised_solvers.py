@@ -0,0 +1,99 @@
+# Copyright 2016-2018 Euratom
+# Copyright 2016-2018 United Kingdom Atomic Energy Authority
+# Copyright 2016-2018 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+import unittest
+import numpy as np
+from scipy import sparse
+from cherab.tools.inversions import (invert_regularised_nnls, invert_regularised_lstsq, invert_svd,
+                                     RegularisedNnlsSolver, RegularisedLstsqSolver, SvdSolver)
+
+
+class TestRegularisedSolvers(unittest.TestCase):
+    """
+    Test cases for the solvers inverting stacks of measurement vectors.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.w_matrix = rng.uniform(0, 1, (30, 20))
+        self.tikhonov_matrix = np.identity(20) - np.eye(20, k=1)
+        true_emissivity = rng.uniform(0, 1, (4, 20))
+        true_emissivity[:, 5:10] = 0
+        self.measurements = true_emissivity @ self.w_matrix.T
+
+    def test_lstsq(self):
+        solver = RegularisedLstsqSolver(self.w_matrix, alpha=0.1, tikhonov_matrix=self.tikhonov_matrix)
+        solutions, residuals = solver(self.measurements)
+        self.assertTrue(solutions.shape == (4, 20) and residuals.shape == (4,))
+        for measurement, solution, residual in zip(self.measurements, solutions, residuals):
+            solution_ref, residual_ref = invert_regularised_lstsq(self.w_matrix, measurement, alpha=0.1,
+                                                                  tikhonov_matrix=self.tikhonov_matrix)
+            self.assertTrue(np.allclose(solution, solution_ref))
+            self.assertTrue(np.allclose(residual, residual_ref))
+
+    def test_nnls(self):
+        solver = RegularisedNnlsSolver(self.w_matrix, alpha=0.1, tikhonov_matrix=self.tikhonov_matrix)
+        solutions, norms = solver(self.measurements)
+        self.assertTrue(solutions.shape == (4, 20) and norms.shape == (4,))
+        for measurement, solution, norm in zip(self.measurements, solutions, norms):
+            solution_ref, norm_ref = invert_regularised_nnls(self.w_matrix, measurement, alpha=0.1,
+                                                             tikhonov_matrix=self.tikhonov_matrix)
+            self.assertTrue(np.allclose(solution, solution_ref, atol=1.e-8))
+            self.assertTrue(np.isclose(norm, norm_ref))
+
+        solution, norm = solver(self.measurements[0])
+        self.assertTrue(np.allclose(solution, solutions[0]) and np.isclose(norm, norms[0]))
+
+    def test_nnls_processes(self):
+        solutions_ref, norms_ref = RegularisedNnlsSolver(self.w_matrix, alpha=0.1)(self.measurements)
+        solutions, norms = RegularisedNnlsSolver(self.w_matrix, alpha=0.1, processes=2)(self.measurements)
+        self.assertTrue(np.allclose(solutions, solutions_ref) and np.allclose(norms, norms_ref))
+
+        self.assertRaises(ValueError, RegularisedNnlsSolver, self.w_matrix, processes=0)
+
+    def test_sparse_tikhonov_matrix(self):
+        tikhonov_matrix = sparse.csr_matrix(self.tikhonov_matrix)
+        measurement = self.measurements[0]
+
+        solution, residual = invert_regularised_lstsq(self.w_matrix, measurement, alpha=0.1, tikhonov_matrix=tikhonov_matrix)
+        solution_ref, residual_ref = invert_regularised_lstsq(self.w_matrix, measurement, alpha=0.1,
+                                                              tikhonov_matrix=self.tikhonov_matrix)
+        self.assertTrue(np.allclose(solution, solution_ref) and np.allclose(residual, residual_ref))
+
+        solution, norm = invert_regularised_nnls(self.w_matrix, measurement, alpha=0.1, tikhonov_matrix=tikhonov_matrix)
+        solution_ref, norm_ref = invert_regularised_nnls(self.w_matrix, measurement, alpha=0.1,
+                                                         tikhonov_matrix=self.tikhonov_matrix)
+        self.assertTrue(np.allclose(solution, solution_ref) and np.isclose(norm, norm_ref))
+
+        solutions, _ = RegularisedLstsqSolver(self.w_matrix, alpha=0.1, tikhonov_matrix=tikhonov_matrix)(self.measurements)
+        solutions_ref, _ = RegularisedLstsqSolver(self.w_matrix, alpha=0.1, tikhonov_matrix=self.tikhonov_matrix)(self.measurements)
+        self.assertTrue(np.allclose(solutions, solutions_ref))
+
+        solutions, _ = RegularisedNnlsSolver(sparse.csr_matrix(self.w_matrix), alpha=0.1,
+                                             tikhonov_matrix=tikhonov_matrix)(self.measurements)
+        solutions_ref, _ = RegularisedNnlsSolver(self.w_matrix, alpha=0.1, tikhonov_matrix=self.tikhonov_matrix)(self.measurements)
+        self.assertTrue(np.allclose(solutions, solutions_ref))
+
+    def test_svd(self):
+        solutions = SvdSolver(self.w_matrix)(self.measurements)
+        for measurement, solution in zip(self.measurements, solutions):
+            self.assertTrue(np.allclose(solution, invert_svd(self.w_matrix, measurement)))
+
+
+if __name__ == '__main__':
+    unittest.main()
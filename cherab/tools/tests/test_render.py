@@ -0,0 +1,100 @@
+# Copyright 2016-2024 Euratom
+# Copyright 2016-2024 United Kingdom Atomic Energy Authority
+# Copyright 2016-2024 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+
+import unittest
+
+import numpy as np
+
+from raysect.core.workflow import SerialEngine
+from raysect.optical import World, ConstantSF, translate
+from raysect.optical.material import UniformSurfaceEmitter
+from raysect.optical.observer import SightLine, PinholeCamera, PowerPipeline0D, SpectralPowerPipeline0D, PowerPipeline2D
+from raysect.primitive import Sphere
+
+from cherab.tools.observers import observe_jointly
+
+
+class CountingEngine(SerialEngine):
+
+    def __init__(self):
+        super().__init__()
+        self.runs = 0
+
+    def run(self, *args, **kwargs):
+        self.runs += 1
+        return super().run(*args, **kwargs)
+
+
+class TestObserveJointly(unittest.TestCase):
+
+    def setUp(self):
+
+        self.world = World()
+        Sphere(10, parent=self.world, material=UniformSurfaceEmitter(ConstantSF(1.0)))
+
+        # observers with different dimensions, spectral settings and pipelines
+        self.sightline_1 = SightLine(pipelines=[PowerPipeline0D()], parent=self.world, transform=translate(1, 0, 0))
+        self.sightline_2 = SightLine(pipelines=[SpectralPowerPipeline0D(display_progress=False)], parent=self.world)
+        self.camera = PinholeCamera((4, 4), pipelines=[PowerPipeline2D(display_progress=False)], parent=self.world)
+
+        spectral_settings = [(400, 500, 1), (600, 800, 20), (500, 700, 5)]
+        for observer, (min_wavelength, max_wavelength, bins) in zip((self.sightline_1, self.sightline_2, self.camera),
+                                                                     spectral_settings):
+            observer.min_wavelength = min_wavelength
+            observer.max_wavelength = max_wavelength
+            observer.spectral_bins = bins
+            observer.pixel_samples = 10
+            observer.quiet = True
+        self.observers = [self.sightline_1, self.sightline_2, self.camera]
+
+    def _values(self):
+        return (self.sightline_1.pipelines[0].value.mean,
+                self.sightline_2.pipelines[0].samples.mean.copy(),
+                self.camera.pipelines[0].frame.mean.copy())
+
+    def test_observe_jointly(self):
+
+        for observer in self.observers:
+            observer.render_engine = SerialEngine()
+            observer.observe()
+        reference = self._values()
+
+        # all observers must be rendered in a single run with the same results as observe()
+        engine = CountingEngine()
+        observe_jointly(self.observers, render_engine=engine)
+        self.assertEqual(engine.runs, 1)
+
+        for value, reference_value in zip(self._values(), reference):
+            np.testing.assert_allclose(value, reference_value, rtol=1.e-12)
+
+    def test_observe_jointly_different_worlds(self):
+
+        sightline = SightLine(pipelines=[PowerPipeline0D()], parent=World())
+        with self.assertRaises(ValueError):
+            observe_jointly([self.sightline_1, sightline])
+
+    def test_observe_jointly_no_world(self):
+
+        sightline = SightLine(pipelines=[PowerPipeline0D()])
+        with self.assertRaises(TypeError):
+            observe_jointly([self.sightline_1, sightline])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# Copyright 2016-2018 Euratom
+# Copyright 2016-2018 United Kingdom Atomic Energy Authority
+# Copyright 2016-2018 Centro de Investigaciones Energéticas, Medioambientales y Tecnológicas
+#
+# Licensed under the EUPL, Version 1.1 or – as soon they will be approved by the
+# European Commission - subsequent versions of the EUPL (the "Licence");
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+#
+# https://joinup.ec.europa.eu/software/page/eupl5
+#
+# Unless required by applicable law or agreed to in writing, software distributed
+# under the Licence is distributed on an "AS IS" basis, WITHOUT WARRANTIES OR
+# CONDITIONS OF ANY KIND, either express or implied.
+#
+# See the Licence for the specific language governing permissions and limitations
+# under the Licence.
+
+import unittest
+import os
+import numpy as np
+from scipy.sparse import csr_matrix
+from cherab.tools.inversions import invert_sart, invert_sparse_sart
+
+
+class TestSparseSart(unittest.TestCase):
+    """
+    Test cases for invert_sparse_sart solver.
+    """
+
+    def setUp(self):
+        # geometry matrix in float32, shape: (npixel_x, npixel_y, nsource)
+        gm = np.load(os.path.join(os.path.dirname(__file__), 'data/geometry_matrix.npy'))
+        self.gm = gm.reshape((gm.shape[0] * gm.shape[1], gm.shape[2])).astype(np.float64)
+        # receiver in float32, shape: (npixel_x, npixel_y)
+        receiver = np.load(os.path.join(os.path.dirname(__file__), 'data/receiver.npy'))
+        self.receiver = receiver.flatten().astype(np.float64)
+
+    def test_inversion(self):
+        solution_ref, convergence_ref = invert_sart(self.gm, self.receiver, max_iterations=50)
+        solution, convergence = invert_sparse_sart(csr_matrix(self.gm), self.receiver, max_iterations=50)
+        self.assertTrue(np.allclose(solution, solution_ref))
+        self.assertTrue(np.allclose(convergence, convergence_ref))
+
+    def test_inversion_stack(self):
+        measurements = np.array([self.receiver, 2 * self.receiver, 0.5 * self.receiver])
+        solutions, convergences = invert_sparse_sart(csr_matrix(self.gm), measurements, max_iterations=50)
+        self.assertTrue(solutions.shape == (3, self.gm.shape[1]))
+        self.assertTrue(len(convergences) == 3)
+        for measurement, solution in zip(measurements, solutions):
+            solution_ref, _ = invert_sparse_sart(self.gm, measurement, max_iterations=50)
+            self.assertTrue(np.allclose(solution, solution_ref))
+
+    def test_callback(self):
+        iterations = []
+
+        def callback(index, iteration, solution, convergence):
+            iterations.append(iteration)
+            return iteration == 4
+
+        _, convergence = invert_sparse_sart(self.gm, self.receiver, conv_tol=0, callback=callback)
+        self.assertTrue(iterations == [0, 1, 2, 3, 4])
+        self.assertTrue(len(convergence) == 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -475,6 +475,32 @@ class TestVoxelCalculations(unittest.TestCase):
             max_relative_error = 0.0225  # Measured with seed(1234567890)
             self.assertAlmostEqual(emiss, expected_emiss, delta=emiss * max_relative_error)
 
+    def test_collection_emissivities(self):
+
+        def emiss_function(r, phi, z):
+            return r * z + np.exp(-r)
+
+        polygons = RECTANGULAR_VOXEL_COORDS + ARBITRARY_VOXEL_COORDS
+
+        # The bulk evaluation must match the per-voxel calculation with the same random samples
+        seed(1234567890)
+        expected_emiss = [AxisymmetricVoxel(polygon).emissivity_from_function(emiss_function, 100)
+                          for polygon in polygons]
+        seed(1234567890)
+        voxel_grid = ToroidalVoxelGrid(polygons)
+        emiss = voxel_grid.emissivities_from_function(emiss_function, 100)
+        self.assertTrue(np.allclose(emiss, expected_emiss, rtol=1.e-14))
+
+        # The sample points are cached, so the vectorised and parallel paths see the same samples
+        emiss_vectorised = voxel_grid.emissivities_from_function(emiss_function, 100, vectorised=True)
+        self.assertTrue(np.allclose(emiss_vectorised, emiss, rtol=1.e-14))
+        emiss_parallel = voxel_grid.emissivities_from_function(emiss_function, 100, processes=2)
+        self.assertTrue(np.allclose(emiss_parallel, emiss, rtol=1.e-14))
+
+        points, voxel_indices, weights = voxel_grid.sampling_grid(100)
+        self.assertEqual(points.shape, (100 * len(polygons), 3))
+        self.assertTrue(np.allclose(np.bincount(voxel_indices, weights), 1))
+
 
 class TestVoxelInputs(unittest.TestCase):
     """Test input validation for voxels"""
@@ -13,6 +13,7 @@ multiprocessing.set_start_method('fork')
 force = False
 profile = False
 line_profile = False
+openmp = False
 install_rates = False
 
 if "--force" in sys.argv:
@@ -27,6 +28,10 @@ if "--line-profile" in sys.argv:
     line_profile = True
     del sys.argv[sys.argv.index("--line-profile")]
 
+if "--openmp" in sys.argv:
+    openmp = True
+    del sys.argv[sys.argv.index("--openmp")]
+
 if "--install-rates" in sys.argv:
     install_rates = True
     del sys.argv[sys.argv.index("--install-rates")]
@@ -34,6 +39,7 @@ if "--install-rates" in sys.argv:
 source_paths = ["cherab", "demos"]
 compilation_includes = [".", numpy.get_include()]
 compilation_args = ["-O3", "-Wno-unreachable-code-fallthrough"]
+linking_args = []
 cython_directives = {"language_level": 3}
 macros = [("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")]
 setup_path = path.dirname(path.abspath(__file__))
@@ -47,6 +53,9 @@ if line_profile:
     cython_directives["linetrace"] = True
 if profile:
     cython_directives["profile"] = True
+if openmp:
+    compilation_args.append("-fopenmp")
+    linking_args.append("-fopenmp")
 
 
 extensions = []
@@ -62,6 +71,7 @@ for package in source_paths:
                         [pyx_file],
                         include_dirs=compilation_includes,
                         extra_compile_args=compilation_args,
+                        extra_link_args=linking_args,
                         define_macros=macros,
                     ),
                 )